@@ -1,11 +1,28 @@
 import argparse
 import csv
+import glob
 import json
 import logging
 import math
+import os
 import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, cast
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+    cast,
+)
+
+import numpy as np
 
 import io_contracts
 from dynoai.constants import (
@@ -602,31 +619,20 @@ def detect_csv_format(path: str | Path) -> str:
     return best if scores[best] > 0 else "unknown"
 
 
-def load_generic_csv(path: str | Path) -> List[Dict[str, Optional[float]]]:
-    """Loads data from a generic or PowerVision-style CSV log file.
+def _resolve_generic_columns(
+    headers: List[str],
+) -> Tuple[Dict[str, Optional[str]], List[str]]:
+    """Map generic/PowerVision headers to channel roles.
 
-    Enhancements:
-    - Expanded header synonyms (PowerVision, descriptive exports).
-    - AFR fallback: derive AFR from lambda columns when AFR is missing/invalid (e.g., constant 5.1).
-    - Torque derivation: if torque column absent but horsepower present, compute torque = HP * 5252 / RPM.
-    """
-    target = io_contracts.safe_path(str(path))
-    with open(
-        target, newline="", encoding="utf-8-sig"
-    ) as f:  # Use utf-8-sig for BOM safety
-        reader = csv.DictReader(f)
-
-        def normalize_header(h: str) -> str:
-            return h.lower().strip()
+    Shared by the row and columnar generic loaders so both see exactly the
+    same header-candidate matching.
 
-        reader.fieldnames = [
-            normalize_header(fn) if fn else "" for fn in (reader.fieldnames or [])
-        ]
-        rows: List[Dict[str, str]] = list(reader)
-    if not rows:
-        raise RuntimeError("Empty CSV file.")
+    Returns:
+        (columns, lambda_cols) where ``columns`` maps role -> header (or None).
 
-    headers: List[str] = list(rows[0].keys())
+    Raises:
+        RuntimeError: If RPM, MAP or a torque/HP source is missing.
+    """
 
     # Convenience wrapper for find_column_by_candidates using current headers
     def find_col(candidates: Sequence[str]) -> Optional[str]:
@@ -699,6 +705,58 @@ def load_generic_csv(path: str | Path) -> List[Dict[str, Optional[float]]]:
             f"Missing required columns for generic format: {', '.join(missing)}"
         )
 
+
+    columns: Dict[str, Optional[str]] = {
+        "rpm": col_rpm,
+        "map": col_map,
+        "torque": col_torque,
+        "hp": col_hp,
+        "afr_cmd": col_afr_cmd,
+        "afr_meas": col_afr_meas,
+        "iat": col_iat,
+        "batt": col_batt,
+        "tps": col_tps,
+    }
+    return columns, lambda_cols
+
+
+def load_generic_csv(path: str | Path) -> List[Dict[str, Optional[float]]]:
+    """Loads data from a generic or PowerVision-style CSV log file.
+
+    Enhancements:
+    - Expanded header synonyms (PowerVision, descriptive exports).
+    - AFR fallback: derive AFR from lambda columns when AFR is missing/invalid (e.g., constant 5.1).
+    - Torque derivation: if torque column absent but horsepower present, compute torque = HP * 5252 / RPM.
+    """
+    target = io_contracts.safe_path(str(path))
+    with open(
+        target, newline="", encoding="utf-8-sig"
+    ) as f:  # Use utf-8-sig for BOM safety
+        reader = csv.DictReader(f)
+
+        def normalize_header(h: str) -> str:
+            return h.lower().strip()
+
+        reader.fieldnames = [
+            normalize_header(fn) if fn else "" for fn in (reader.fieldnames or [])
+        ]
+        rows: List[Dict[str, str]] = list(reader)
+    if not rows:
+        raise RuntimeError("Empty CSV file.")
+
+    headers: List[str] = list(rows[0].keys())
+
+    columns, lambda_cols = _resolve_generic_columns(headers)
+    col_rpm = columns["rpm"]
+    col_map = columns["map"]
+    col_torque = columns["torque"]
+    col_hp = columns["hp"]
+    col_afr_cmd = columns["afr_cmd"]
+    col_afr_meas = columns["afr_meas"]
+    col_iat = columns["iat"]
+    col_batt = columns["batt"]
+    col_tps = columns["tps"]
+
     recs: List[Dict[str, Optional[float]]] = []
 
     def afr_invalid(v: Optional[float]) -> bool:
@@ -783,40 +841,12 @@ def load_generic_csv(path: str | Path) -> List[Dict[str, Optional[float]]]:
     return recs
 
 
-def load_winpep_csv(path: str | Path) -> List[Dict[str, Optional[float]]]:
-    """Load WinPEP/WinPEP8 CSV or TXT (tab/comma delimited) with header sniffing.
+def _resolve_winpep_columns(headers: List[str]) -> Dict[str, Optional[str]]:
+    """Map WinPEP headers to channel roles (shared by row and columnar loaders).
 
-    - Uses csv.Sniffer to detect delimiter (tab, comma, semicolon).
-    - Falls back to comma if sniffer fails.
-    - Accepts typical WinPEP headers with substring matching.
+    Raises:
+        RuntimeError: If RPM, MAP or torque columns are missing.
     """
-    # Read a sample for sniffing
-    target = io_contracts.safe_path(str(path))
-    sample = ""
-    try:
-        with open(target, "r", newline="", encoding="utf-8-sig") as f:
-            sample = f.read(8192)
-    except UnicodeDecodeError:
-        with open(target, "r", newline="", encoding="cp1252") as f:
-            sample = f.read(8192)
-
-    # Detect dialect (delimiter)
-    dialect = None
-    try:
-        sniffer = csv.Sniffer()
-        dialect = sniffer.sniff(sample, delimiters=",\t;")
-    except Exception:
-        pass  # fallback to default
-
-    # Now parse file with detected dialect
-    with open(target, newline="", encoding="utf-8-sig") as f:
-        reader = csv.DictReader(f, dialect=dialect) if dialect else csv.DictReader(f)
-        rows: List[Dict[str, str]] = list(reader)  # raw strings from CSV/TXT
-    if not rows:
-        raise RuntimeError("Empty WinPEP CSV.")
-
-    headers: List[str] = list(rows[0].keys())
-
     col_rpm = find_column_by_candidates(headers, ["rpm"])
     col_map = find_column_by_candidates(headers, ["map", "kpa"])
     col_torque = find_column_by_candidates(headers, ["torque"])
@@ -870,9 +900,7 @@ def load_winpep_csv(path: str | Path) -> List[Dict[str, Optional[float]]]:
             missing.append("Torque")
 
         # Get available column names for user reference
-        available_cols = (
-            ", ".join(f"'{col}'" for col in rows[0].keys()) if rows else "none"
-        )
+        available_cols = ", ".join(f"'{col}'" for col in headers) or "none"
 
         raise RuntimeError(
             f"Missing required columns in WinPEP CSV: {', '.join(missing)}\n\n"
@@ -885,6 +913,78 @@ def load_winpep_csv(path: str | Path) -> List[Dict[str, Optional[float]]]:
             f"  - Torque: 'torque', 'tq', 'ft-lb'"
         )
 
+    return {
+        "rpm": col_rpm,
+        "map": col_map,
+        "torque": col_torque,
+        "hp": col_hp,
+        "afr_cmd_f": col_afr_cmd_f,
+        "afr_cmd_r": col_afr_cmd_r,
+        "afr_meas_f": col_afr_meas_f,
+        "afr_meas_r": col_afr_meas_r,
+        "knock_f": col_knock_f,
+        "knock_r": col_knock_r,
+        "iat": col_iat,
+        "batt": col_batt,
+        "tps": col_tps,
+    }
+
+
+def _sniff_dialect(target: Path) -> Optional[Any]:
+    """Detect the delimiter of a WinPEP export, or None to use the default."""
+    # Read a sample for sniffing
+    sample = ""
+    try:
+        with open(target, "r", newline="", encoding="utf-8-sig") as f:
+            sample = f.read(8192)
+    except UnicodeDecodeError:
+        with open(target, "r", newline="", encoding="cp1252") as f:
+            sample = f.read(8192)
+
+    # Detect dialect (delimiter)
+    dialect = None
+    try:
+        sniffer = csv.Sniffer()
+        dialect = sniffer.sniff(sample, delimiters=",\t;")
+    except Exception:
+        pass  # fallback to default
+    return dialect
+
+
+def load_winpep_csv(path: str | Path) -> List[Dict[str, Optional[float]]]:
+    """Load WinPEP/WinPEP8 CSV or TXT (tab/comma delimited) with header sniffing.
+
+    - Uses csv.Sniffer to detect delimiter (tab, comma, semicolon).
+    - Falls back to comma if sniffer fails.
+    - Accepts typical WinPEP headers with substring matching.
+    """
+    target = io_contracts.safe_path(str(path))
+    dialect = _sniff_dialect(target)
+
+    # Now parse file with detected dialect
+    with open(target, newline="", encoding="utf-8-sig") as f:
+        reader = csv.DictReader(f, dialect=dialect) if dialect else csv.DictReader(f)
+        rows: List[Dict[str, str]] = list(reader)  # raw strings from CSV/TXT
+    if not rows:
+        raise RuntimeError("Empty WinPEP CSV.")
+
+    headers: List[str] = list(rows[0].keys())
+
+    columns = _resolve_winpep_columns(headers)
+    col_rpm = columns["rpm"]
+    col_map = columns["map"]
+    col_torque = columns["torque"]
+    col_hp = columns["hp"]
+    col_afr_cmd_f = columns["afr_cmd_f"]
+    col_afr_cmd_r = columns["afr_cmd_r"]
+    col_afr_meas_f = columns["afr_meas_f"]
+    col_afr_meas_r = columns["afr_meas_r"]
+    col_knock_f = columns["knock_f"]
+    col_knock_r = columns["knock_r"]
+    col_iat = columns["iat"]
+    col_batt = columns["batt"]
+    col_tps = columns["tps"]
+
     recs: List[Dict[str, Optional[float]]] = []
     for row in rows:
         rpm = safe_float(row.get(col_rpm))
@@ -933,10 +1033,331 @@ def load_winpep_csv(path: str | Path) -> List[Dict[str, Optional[float]]]:
     return recs
 
 
+# --- Columnar (struct-of-arrays) ingestion ---
+
+RECORD_FIELDS: Tuple[str, ...] = (
+    "rpm",
+    "kpa",
+    "tq",
+    "hp",
+    "tps",
+    "iat",
+    "batt",
+    "afr_cmd_f",
+    "afr_cmd_r",
+    "afr_meas_f",
+    "afr_meas_r",
+    "afr_err_f_pct",
+    "afr_err_r_pct",
+    "knock_f",
+    "knock_r",
+)
+
+
+class RecordBatch:
+    """Struct-of-arrays form of the records produced by the CSV loaders.
+
+    Holds one float64 array per channel in ``RECORD_FIELDS``. Missing values
+    are NaN where the row loaders use None. Every downstream stage
+    (``dyno_bin_aggregate``, ``anomaly_diagnostics``) accepts a batch directly,
+    so large logs never have to be materialised as one dict per row.
+    """
+
+    __slots__ = ("columns",)
+
+    def __init__(self, columns: Dict[str, np.ndarray]) -> None:
+        lengths = {len(col) for col in columns.values()}
+        if len(lengths) > 1:
+            raise ValueError(f"RecordBatch columns differ in length: {lengths}")
+        n = lengths.pop() if lengths else 0
+        self.columns: Dict[str, np.ndarray] = {
+            name: np.asarray(columns.get(name, np.full(n, np.nan)), dtype=np.float64)
+            for name in RECORD_FIELDS
+        }
+
+    @classmethod
+    def from_records(
+        cls, recs: Sequence[Dict[str, Optional[float]]]
+    ) -> "RecordBatch":
+        """Build a batch from row dicts (None becomes NaN)."""
+        return cls(
+            {
+                name: np.fromiter(
+                    (np.nan if r.get(name) is None else r[name] for r in recs),
+                    dtype=np.float64,
+                    count=len(recs),
+                )
+                for name in RECORD_FIELDS
+            }
+        )
+
+    def __len__(self) -> int:
+        return len(self.columns["rpm"])
+
+    def __getitem__(self, name: str) -> np.ndarray:
+        return self.columns[name]
+
+    def values(self, name: str) -> List[Optional[float]]:
+        """Return a column as Python floats with None for missing values."""
+        return [None if v != v else v for v in self.columns[name].tolist()]
+
+
+Records = Union[Sequence[Dict[str, Optional[float]]], RecordBatch]
+
+
+def _read_header(target: Path, dialect: Optional[Any] = None) -> List[str]:
+    with open(target, newline="", encoding="utf-8-sig") as f:
+        reader = csv.reader(f, dialect=dialect) if dialect else csv.reader(f)
+        return next(reader, [])
+
+
+def _read_numeric_columns(
+    target: Path,
+    fieldnames: List[str],
+    wanted: Sequence[str],
+    dialect: Optional[Any] = None,
+) -> Dict[str, np.ndarray]:
+    """Parse the named columns of a delimited log into float64 arrays.
+
+    Values are converted with ``safe_float`` semantics: anything that is not a
+    finite number becomes NaN. Like ``csv.DictReader``, a duplicated header
+    resolves to its last occurrence.
+    """
+    import pandas as pd
+
+    index = {name: i for i, name in enumerate(fieldnames)}
+    positions = sorted({index[name] for name in wanted})
+    opts: Dict[str, Any] = {"sep": ","}
+    if dialect is not None:
+        opts = {
+            "sep": dialect.delimiter,
+            "quotechar": dialect.quotechar or '"',
+            "doublequote": dialect.doublequote,
+            "skipinitialspace": dialect.skipinitialspace,
+            "escapechar": dialect.escapechar,
+        }
+
+    raw: Dict[int, np.ndarray]
+    try:
+        frame = pd.read_csv(
+            target,
+            header=None,
+            skiprows=1,
+            usecols=positions,
+            encoding="utf-8-sig",
+            float_precision="round_trip",
+            **opts,
+        )
+        raw = {}
+        for pos in positions:
+            series = frame[pos]
+            if pd.api.types.is_numeric_dtype(series) and not (
+                pd.api.types.is_bool_dtype(series)
+            ):
+                raw[pos] = series.to_numpy(dtype=np.float64, copy=True)
+            else:
+                raw[pos] = _safe_float_array(series.tolist())
+    except pd.errors.EmptyDataError:
+        raw = {pos: np.empty(0, dtype=np.float64) for pos in positions}
+    except (pd.errors.ParserError, ValueError):
+        # Ragged rows: fall back to the csv module, which tolerates them.
+        with open(target, newline="", encoding="utf-8-sig") as f:
+            reader = csv.reader(f, dialect=dialect) if dialect else csv.reader(f)
+            next(reader, None)
+            rows = [row for row in reader if row]
+        raw = {
+            pos: _safe_float_array([row[pos] if pos < len(row) else None for row in rows])
+            for pos in positions
+        }
+
+    columns: Dict[str, np.ndarray] = {}
+    for name in wanted:
+        arr = raw[index[name]]
+        arr[~np.isfinite(arr)] = np.nan
+        columns[name] = arr
+    return columns
+
+
+def _safe_float_array(values: Sequence[Any]) -> np.ndarray:
+    out = np.full(len(values), np.nan)
+    for i, x in enumerate(values):
+        value = safe_float(x)
+        if value is not None:
+            out[i] = value
+    return out
+
+
+def _afr_error_pct(cmd: np.ndarray, meas: np.ndarray) -> np.ndarray:
+    err = np.full(len(cmd), np.nan)
+    ok = ~np.isnan(cmd) & (meas > 0)
+    err[ok] = (cmd[ok] - meas[ok]) / meas[ok] * 100.0
+    return err
+
+
+def load_generic_columns(path: str | Path) -> RecordBatch:
+    """Columnar counterpart of ``load_generic_csv``.
+
+    Applies the same header matching, gating, torque-from-HP derivation and
+    lambda fallbacks, but on whole columns, and returns a ``RecordBatch``.
+    """
+    target = io_contracts.safe_path(str(path))
+    fieldnames = [h.lower().strip() for h in _read_header(target)]
+    if not fieldnames:
+        raise RuntimeError("Empty CSV file.")
+    headers = list(dict.fromkeys(fieldnames))
+    columns, lambda_cols = _resolve_generic_columns(headers)
+
+    wanted = [c for c in columns.values() if c] + lambda_cols
+    data = _read_numeric_columns(target, fieldnames, list(dict.fromkeys(wanted)))
+    n = len(next(iter(data.values())))
+    if n == 0:
+        raise RuntimeError("Empty CSV file.")
+
+    missing = np.full(n, np.nan)
+
+    def col(role: str) -> np.ndarray:
+        header = columns[role]
+        return data[header] if header else missing
+
+    rpm = col("rpm")
+    kpa = col("map")
+    horsepower = col("hp")
+    torque = col("torque").copy()
+
+    keep = (rpm >= 400) & (rpm <= 8000) & (kpa >= 10) & (kpa <= 110)
+
+    # Torque derivation fallback
+    derive = np.isnan(torque) & ~np.isnan(horsepower) & (rpm > 0)
+    torque[derive] = (horsepower[derive] * TORQUE_HP_CONVERSION) / rpm[derive]
+    keep &= ~np.isnan(torque)
+
+    def afr_invalid(v: np.ndarray) -> np.ndarray:
+        return (
+            np.isnan(v)
+            | (v < AFR_RANGE_MIN)
+            | (v > AFR_RANGE_MAX)
+            | (np.abs(v - INVALID_AFR_SENTINEL) < 1e-6)
+        )
+
+    def first_valid_lambda(candidates: Sequence[str]) -> np.ndarray:
+        found = np.full(n, np.nan)
+        for lc in candidates:
+            lam = data[lc]
+            take = np.isnan(found) & (lam >= 0.6) & (lam <= 1.3)
+            found[take] = lam[take]
+        return found
+
+    # Measured / commanded AFR fallbacks via lambda
+    afr_meas = col("afr_meas").copy()
+    lam_meas = first_valid_lambda(lambda_cols)
+    use = afr_invalid(afr_meas) & ~np.isnan(lam_meas)
+    afr_meas[use] = lam_meas[use] * STOICH_AFR_GASOLINE
+
+    afr_cmd = col("afr_cmd").copy()
+    lam_cmd = first_valid_lambda(
+        [lc for lc in lambda_cols if any(k in lc for k in ["desired", "target", "cmd"])]
+    )
+    use = afr_invalid(afr_cmd) & ~np.isnan(lam_cmd)
+    afr_cmd[use] = lam_cmd[use] * STOICH_AFR_GASOLINE
+
+    afr_err_pct = _afr_error_pct(afr_cmd, afr_meas)[keep]
+    afr_cmd = afr_cmd[keep]
+    afr_meas = afr_meas[keep]
+    zeros = np.zeros(int(keep.sum()))
+    return RecordBatch(
+        {
+            "rpm": rpm[keep],
+            "kpa": kpa[keep],
+            "tq": torque[keep],
+            "hp": horsepower[keep],
+            "tps": col("tps")[keep],
+            "iat": col("iat")[keep],
+            "batt": col("batt")[keep],
+            "afr_cmd_f": afr_cmd,
+            "afr_cmd_r": afr_cmd.copy(),
+            "afr_meas_f": afr_meas,
+            "afr_meas_r": afr_meas.copy(),
+            "afr_err_f_pct": afr_err_pct,
+            "afr_err_r_pct": afr_err_pct.copy(),
+            "knock_f": zeros,
+            "knock_r": zeros.copy(),  # Generic format has no knock data
+        }
+    )
+
+
+def load_winpep_columns(path: str | Path) -> RecordBatch:
+    """Columnar counterpart of ``load_winpep_csv`` returning a ``RecordBatch``."""
+    target = io_contracts.safe_path(str(path))
+    dialect = _sniff_dialect(target)
+    fieldnames = _read_header(target, dialect)
+    if not fieldnames:
+        raise RuntimeError("Empty WinPEP CSV.")
+    columns = _resolve_winpep_columns(list(dict.fromkeys(fieldnames)))
+
+    wanted = list(dict.fromkeys(c for c in columns.values() if c))
+    data = _read_numeric_columns(target, fieldnames, wanted, dialect)
+    n = len(next(iter(data.values())))
+    if n == 0:
+        raise RuntimeError("Empty WinPEP CSV.")
+
+    missing = np.full(n, np.nan)
+
+    def col(role: str) -> np.ndarray:
+        header = columns[role]
+        return data[header] if header else missing
+
+    keep = ~(np.isnan(col("rpm")) | np.isnan(col("map")) | np.isnan(col("torque")))
+    afr_cmd_f, afr_meas_f = col("afr_cmd_f"), col("afr_meas_f")
+    afr_cmd_r, afr_meas_r = col("afr_cmd_r"), col("afr_meas_r")
+    return RecordBatch(
+        {
+            "rpm": col("rpm")[keep],
+            "kpa": col("map")[keep],
+            "tq": col("torque")[keep],
+            "hp": col("hp")[keep],
+            "tps": col("tps")[keep],
+            "afr_cmd_f": afr_cmd_f[keep],
+            "afr_cmd_r": afr_cmd_r[keep],
+            "afr_meas_f": afr_meas_f[keep],
+            "afr_meas_r": afr_meas_r[keep],
+            "afr_err_f_pct": _afr_error_pct(afr_cmd_f, afr_meas_f)[keep],
+            "afr_err_r_pct": _afr_error_pct(afr_cmd_r, afr_meas_r)[keep],
+            "knock_f": col("knock_f")[keep],
+            "knock_r": col("knock_r")[keep],
+            "iat": col("iat")[keep],
+            "batt": col("batt")[keep],
+        }
+    )
+
+
+def _iter_record_fields(
+    recs: Records, fields: Sequence[Tuple[str, Optional[float]]]
+) -> Iterator[Tuple[Optional[float], ...]]:
+    """Yield per-record value tuples for ``(key, default)`` pairs.
+
+    Row dicts use ``dict.get(key, default)``; a ``RecordBatch`` is walked
+    column-wise without building a dict per row.
+    """
+    if isinstance(recs, RecordBatch):
+        yield from zip(*(recs.values(key) for key, _ in fields))
+    else:
+        for r in recs:
+            yield tuple(r.get(key, default) for key, default in fields)
+
+
+# Reasonable ranges used by dyno_bin_aggregate to validate records
+AGG_IAT_RANGE = (30.0, 300.0)  # Fahrenheit
+AGG_MAP_RANGE = (10.0, 110.0)  # kPa
+AGG_TPS_RANGE = (0.0, 100.0)  # Percent
+AGG_AFR_RANGE = (9.0, 18.0)  # Reasonable AFR range
+AGG_MIN_WEIGHT = 5.0  # Torque/HP below this is treated as unloaded
+
+
 def dyno_bin_aggregate(
-    recs: Sequence[Dict[str, Optional[float]]],
+    recs: Records,
     cyl: str = "f",
     use_hp_weight: bool = False,
+    vectorized: bool = False,
 ) -> Tuple[
     List[List[Optional[float]]],  # AFR Error Grid
     List[List[float]],
@@ -949,12 +1370,21 @@ def dyno_bin_aggregate(
     """
     Aggregate AFR error data by bin with diagnostics.
 
-    Thread-safety: This function is NOT thread-safe. It assumes single-threaded
-    execution. If concurrent processing is needed, external synchronization
-    (locks, queues) must be used around calls to this function.
+    Thread-safety: Reentrant. All state is local to the call and module-level
+    tables are only read, so concurrent calls (e.g. analyses on the API's
+    worker pool) need no synchronization. ``recs`` must not be mutated while
+    a call is reading it.
+
+    Accepts either row dicts or a columnar ``RecordBatch``. With
+    ``vectorized=True`` the NumPy implementation is used; it produces
+    bit-identical grids and the same diagnostics counters.
 
     Returns: (grid, knock_max, iat_max, coverage, diagnostics, tq_grid, hp_grid)
     """
+    if vectorized:
+        batch = recs if isinstance(recs, RecordBatch) else RecordBatch.from_records(recs)
+        return _dyno_bin_aggregate_vectorized(batch, cyl, use_hp_weight)
+
     sums: List[List[float]] = [[0.0 for _ in KPA_BINS] for _ in RPM_BINS]
     weights: List[List[float]] = [[0.0 for _ in KPA_BINS] for _ in RPM_BINS]
     tq_sums: List[List[float]] = [[0.0 for _ in KPA_BINS] for _ in RPM_BINS]
@@ -978,61 +1408,74 @@ def dyno_bin_aggregate(
         "total_records_processed": 0,
     }
 
-    # Define reasonable ranges for validation
-    IAT_RANGE = (30.0, 300.0)  # Fahrenheit
-    MAP_RANGE = (10.0, 110.0)  # kPa
-    TPS_RANGE = (0.0, 100.0)  # Percent
-    AFR_RANGE = (9.0, 18.0)  # Reasonable AFR range
-
     afr_err_key = "afr_err_f_pct" if cyl == "f" else "afr_err_r_pct"
     afr_cmd_key = "afr_cmd_f" if cyl == "f" else "afr_cmd_r"
     afr_meas_key = "afr_meas_f" if cyl == "f" else "afr_meas_r"
     knock_key = "knock_f" if cyl == "f" else "knock_r"
-
-    for r in recs:
+    weight_key = "hp" if use_hp_weight else "tq"
+
+    fields: List[Tuple[str, Optional[float]]] = [
+        (afr_cmd_key, None),
+        (afr_err_key, None),
+        (afr_meas_key, None),
+        ("iat", None),
+        ("kpa", None),
+        ("tps", None),
+        ("rpm", None),
+        ("tq", None),
+        ("hp", None),
+        (knock_key, None),
+        (weight_key, 0.0),
+    ]
+    for (
+        afr_cmd,
+        afr_err,
+        afr_meas,
+        iat,
+        kpa,
+        tps,
+        rpm_raw,
+        tq_val,
+        hp_val,
+        kret,
+        weight_raw,
+    ) in _iter_record_fields(recs, fields):
         diagnostics["total_records_processed"] += 1
 
         # Check if we have AFR command data
-        afr_cmd = r.get(afr_cmd_key)
         if afr_cmd is None:
             diagnostics["no_requested_afr"] += 1
             continue
 
-        afr_err = r.get(afr_err_key)
-        afr_meas = r.get(afr_meas_key)
-
         # Check for bad AFR data
         if afr_err is None or afr_meas is None:
             diagnostics["bad_afr_or_request_afr"] += 1
             continue
 
         # Validate AFR values are in reasonable range
-        if not (AFR_RANGE[0] <= afr_cmd <= AFR_RANGE[1]) or not (
-            AFR_RANGE[0] <= afr_meas <= AFR_RANGE[1]
+        if not (AGG_AFR_RANGE[0] <= afr_cmd <= AGG_AFR_RANGE[1]) or not (
+            AGG_AFR_RANGE[0] <= afr_meas <= AGG_AFR_RANGE[1]
         ):
             diagnostics["bad_afr_or_request_afr"] += 1
             continue
 
         # Validate temperature (IAT)
-        iat = r.get("iat")
-        if iat is not None and not (IAT_RANGE[0] <= iat <= IAT_RANGE[1]):
+        if iat is not None and not (AGG_IAT_RANGE[0] <= iat <= AGG_IAT_RANGE[1]):
             diagnostics["temp_out_of_range"] += 1
             continue
 
         # Validate MAP
-        kpa = r.get("kpa")
-        if kpa is not None and not (MAP_RANGE[0] <= kpa <= MAP_RANGE[1]):
+        if kpa is not None and not (AGG_MAP_RANGE[0] <= kpa <= AGG_MAP_RANGE[1]):
             diagnostics["map_out_of_range"] += 1
             continue
 
         # Validate TPS
-        tps = r.get("tps")
-        if tps is not None and not (TPS_RANGE[0] <= tps <= TPS_RANGE[1]):
+        if tps is not None and not (AGG_TPS_RANGE[0] <= tps <= AGG_TPS_RANGE[1]):
             diagnostics["tps_out_of_range"] += 1
             continue
 
-        rpm_value = cast(float, r["rpm"])  # ensured non-None by load_winpep_csv
-        kpa_value = cast(float, r["kpa"])  # ensured non-None by load_winpep_csv
+        rpm_value = cast(float, rpm_raw)  # ensured non-None by load_winpep_csv
+        kpa_value = cast(float, kpa)  # ensured non-None by load_winpep_csv
         rpm_bin = nearest_bin(rpm_value, RPM_BINS)
         kpa_bin = nearest_bin(kpa_value, KPA_BINS)
         # Performance: Use O(1) dict lookup instead of O(n) list.index()
@@ -1040,12 +1483,9 @@ def dyno_bin_aggregate(
         kpa_index = KPA_INDEX[kpa_bin]
 
         # Weight by torque or HP to emphasize loaded points; ignore near-zero values
-        if use_hp_weight:
-            weight = max(0.0, cast(float, r.get("hp", 0.0)))
-        else:
-            weight = max(0.0, cast(float, r.get("tq", 0.0)))
+        weight = max(0.0, cast(float, weight_raw))
 
-        if weight < 5.0:
+        if weight < AGG_MIN_WEIGHT:
             continue
 
         # Data accepted!
@@ -1057,9 +1497,9 @@ def dyno_bin_aggregate(
                 "AGG (%s): Accepted row #%d. RPM=%.0f, KPA=%.1f, TQ=%.1f, AFR_Err=%.2f, Weight=%.1f",
                 cyl,
                 diagnostics["accepted_wb"],
-                r["rpm"],
-                r["kpa"],
-                r["tq"],
+                rpm_value,
+                kpa_value,
+                tq_val,
                 afr_err,
                 weight,
             )
@@ -1069,11 +1509,9 @@ def dyno_bin_aggregate(
         weights[rpm_index][kpa_index] += weight
 
         # Safely add to torque and HP sums
-        tq_val = r.get("tq")
         if tq_val is not None:
             tq_sums[rpm_index][kpa_index] += tq_val * weight
 
-        hp_val = r.get("hp")
         if hp_val is not None:
             hp_sums[rpm_index][kpa_index] += hp_val * weight
 
@@ -1081,10 +1519,8 @@ def dyno_bin_aggregate(
         bin_values[rpm_index][kpa_index].append(afr_err)
 
         # Track max knock and max IAT for gating/suggestions
-        kret = r.get(knock_key)
         if kret is not None:
             knock_max[rpm_index][kpa_index] = max(knock_max[rpm_index][kpa_index], kret)
-        iat = r.get("iat")
         # Safely track the maximum IAT value seen for this cell.
         if iat is not None:
             current_iat = iat_max[rpm_index][kpa_index]
@@ -1120,6 +1556,161 @@ def dyno_bin_aggregate(
     return grid, knock_max, iat_max, coverage, diagnostics, tq_grid, hp_grid
 
 
+def _in_range(values: np.ndarray, bounds: Tuple[float, float]) -> np.ndarray:
+    return (values >= bounds[0]) & (values <= bounds[1])
+
+
+def _nearest_bin_index(values: np.ndarray, bins: Sequence[int]) -> np.ndarray:
+    """Vectorized ``nearest_bin`` returning bin indices.
+
+    ``argmin`` picks the first minimum, matching the tie-breaking of the
+    scalar loop (lower bin wins on an exact midpoint).
+    """
+    edges = np.asarray(bins, dtype=np.float64)
+    return np.abs(edges[None, :] - values[:, None]).argmin(axis=1)
+
+
+def _per_cell_median(
+    cells: np.ndarray, values: np.ndarray, n_cells: int
+) -> np.ndarray:
+    """Median of ``values`` grouped by cell index, computed like ``median()``."""
+    order = np.lexsort((values, cells))
+    ordered = values[order]
+    counts = np.bincount(cells, minlength=n_cells)
+    starts = np.cumsum(counts) - counts
+    out = np.full(n_cells, np.nan)
+    has = counts > 0
+    upper = ordered[(starts + counts // 2)[has]]
+    lower = ordered[(starts + (counts - 1) // 2)[has]]
+    out[has] = np.where(counts[has] % 2 == 1, upper, (lower + upper) / 2.0)
+    return out
+
+
+def _dyno_bin_aggregate_vectorized(
+    batch: RecordBatch, cyl: str, use_hp_weight: bool
+) -> Tuple[
+    List[List[Optional[float]]],
+    List[List[float]],
+    List[List[Optional[float]]],
+    List[List[int]],
+    Dict[str, Any],
+    List[List[Optional[float]]],
+    List[List[Optional[float]]],
+]:
+    """NumPy implementation of ``dyno_bin_aggregate``.
+
+    Gating is done with boolean masks in the same order as the scalar loop so
+    every diagnostics counter matches. Cell sums use ``np.bincount``, which
+    accumulates in record order, so results are bit-identical to the scalar
+    path.
+    """
+    afr_cmd = batch["afr_cmd_f" if cyl == "f" else "afr_cmd_r"]
+    afr_err = batch["afr_err_f_pct" if cyl == "f" else "afr_err_r_pct"]
+    afr_meas = batch["afr_meas_f" if cyl == "f" else "afr_meas_r"]
+    knock = batch["knock_f" if cyl == "f" else "knock_r"]
+    iat, kpa, tps, rpm = batch["iat"], batch["kpa"], batch["tps"], batch["rpm"]
+    tq, hp = batch["tq"], batch["hp"]
+
+    no_requested = np.isnan(afr_cmd)
+    pending = ~no_requested
+    bad_afr = pending & (
+        np.isnan(afr_err)
+        | ~_in_range(afr_cmd, AGG_AFR_RANGE)
+        | ~_in_range(afr_meas, AGG_AFR_RANGE)
+    )
+    pending &= ~bad_afr
+    temp_out = pending & ~np.isnan(iat) & ~_in_range(iat, AGG_IAT_RANGE)
+    pending &= ~temp_out
+    map_out = pending & ~np.isnan(kpa) & ~_in_range(kpa, AGG_MAP_RANGE)
+    pending &= ~map_out
+    tps_out = pending & ~np.isnan(tps) & ~_in_range(tps, AGG_TPS_RANGE)
+    pending &= ~tps_out
+
+    weight_src = hp if use_hp_weight else tq
+    # max(0.0, w) >= AGG_MIN_WEIGHT only when w itself is; NaN never passes.
+    accepted = (
+        pending
+        & (weight_src >= AGG_MIN_WEIGHT)
+        & ~np.isnan(rpm)
+        & ~np.isnan(kpa)
+    )
+
+    diagnostics: Dict[str, Any] = {
+        "accepted_wb": int(accepted.sum()),
+        "temp_out_of_range": int(temp_out.sum()),
+        "map_out_of_range": int(map_out.sum()),
+        "tps_out_of_range": int(tps_out.sum()),
+        "ve_out_of_range": 0,  # Reserved for future use if VE validation is added
+        "bad_afr_or_request_afr": int(bad_afr.sum()),
+        "no_requested_afr": int(no_requested.sum()),
+        "total_records_processed": len(batch),
+    }
+
+    n_rpm, n_kpa = len(RPM_BINS), len(KPA_BINS)
+    n_cells = n_rpm * n_kpa
+    cells = _nearest_bin_index(rpm[accepted], RPM_BINS) * n_kpa + _nearest_bin_index(
+        kpa[accepted], KPA_BINS
+    )
+    weight = weight_src[accepted]
+    err = afr_err[accepted]
+
+    def cell_sum(values: np.ndarray, valid: Optional[np.ndarray] = None) -> np.ndarray:
+        if valid is None:
+            return np.bincount(cells, weights=values, minlength=n_cells)
+        return np.bincount(cells[valid], weights=values[valid], minlength=n_cells)
+
+    sums = cell_sum(err * weight)
+    weights = cell_sum(weight)
+    tq_acc, hp_acc = tq[accepted], hp[accepted]
+    tq_sums = cell_sum(tq_acc * weight, ~np.isnan(tq_acc))
+    hp_sums = cell_sum(hp_acc * weight, ~np.isnan(hp_acc))
+    coverage = np.bincount(cells, minlength=n_cells)
+
+    knock_acc = knock[accepted]
+    knock_max = np.zeros(n_cells)
+    has_knock = ~np.isnan(knock_acc)
+    np.maximum.at(knock_max, cells[has_knock], knock_acc[has_knock])
+    knock_max += 0.0  # normalise -0.0; the scalar path never stores it
+
+    iat_acc = iat[accepted]
+    iat_max = np.full(n_cells, -np.inf)
+    has_iat = ~np.isnan(iat_acc)
+    np.maximum.at(iat_max, cells[has_iat], iat_acc[has_iat])
+
+    covered = weights > 0.0
+    grid = np.full(n_cells, np.nan)
+    grid[covered] = sums[covered] / weights[covered]
+    tq_grid = np.full(n_cells, np.nan)
+    has_tq = covered & (tq_sums > 0.0)
+    tq_grid[has_tq] = tq_sums[has_tq] / weights[has_tq]
+    hp_grid = np.full(n_cells, np.nan)
+    has_hp = covered & (hp_sums > 0.0)
+    hp_grid[has_hp] = hp_sums[has_hp] / weights[has_hp]
+
+    # MAD per cell: median of |x - median(x)| using a sort-by-cell pass
+    medians = _per_cell_median(cells, err, n_cells)
+    mad_flat = _per_cell_median(cells, np.abs(err - medians[cells]), n_cells)
+    mad_flat[~covered] = np.nan
+
+    def to_grid(flat: np.ndarray) -> List[List[Optional[float]]]:
+        values = flat.reshape(n_rpm, n_kpa).tolist()
+        return [[None if v != v else v for v in row] for row in values]
+
+    iat_max[np.isneginf(iat_max)] = np.nan
+    coverage_grid: List[List[int]] = coverage.reshape(n_rpm, n_kpa).tolist()
+    diagnostics["per_bin_stats"] = {"mad": to_grid(mad_flat), "hits": coverage_grid}
+
+    return (
+        to_grid(grid),
+        knock_max.reshape(n_rpm, n_kpa).tolist(),
+        to_grid(iat_max),
+        coverage_grid,
+        diagnostics,
+        to_grid(tq_grid),
+        to_grid(hp_grid),
+    )
+
+
 def grid_map(
     func: Callable[[float], float],
     grid: List[List[Optional[float]]],
@@ -1366,7 +1957,7 @@ def avg_band(
 
 
 def anomaly_diagnostics(
-    recs: Sequence[Dict[str, Optional[float]]],
+    recs: Records,
     afr_err_f: List[List[Optional[float]]],
     afr_err_r: List[List[Optional[float]]],
     ve_delta_grid: List[List[Optional[float]]],
@@ -1486,15 +2077,24 @@ def anomaly_diagnostics(
     # Build arrays of (afr_err, batt) during positive torque
     afr_errs: List[float] = []
     batts: List[float] = []
-    for rec in recs:
-        if rec["tq"] is not None and rec["tq"] > 5.0 and rec["batt"] is not None:
-            # combine f/r errors if present
-            if rec["afr_err_f_pct"] is not None:
-                afr_errs.append(rec["afr_err_f_pct"])
-                batts.append(rec["batt"])
-            if rec["afr_err_r_pct"] is not None:
-                afr_errs.append(rec["afr_err_r_pct"])
-                batts.append(rec["batt"])
+    if isinstance(recs, RecordBatch):
+        loaded = (recs["tq"] > 5.0) & ~np.isnan(recs["batt"])
+        # Interleave front/rear per record to keep the row-wise ordering
+        errs = np.column_stack([recs["afr_err_f_pct"], recs["afr_err_r_pct"]])
+        volts = np.column_stack([recs["batt"], recs["batt"]])
+        pick = loaded[:, None] & ~np.isnan(errs)
+        afr_errs = errs[pick].tolist()
+        batts = volts[pick].tolist()
+    else:
+        for rec in recs:
+            if rec["tq"] is not None and rec["tq"] > 5.0 and rec["batt"] is not None:
+                # combine f/r errors if present
+                if rec["afr_err_f_pct"] is not None:
+                    afr_errs.append(rec["afr_err_f_pct"])
+                    batts.append(rec["batt"])
+                if rec["afr_err_r_pct"] is not None:
+                    afr_errs.append(rec["afr_err_r_pct"])
+                    batts.append(rec["batt"])
     if len(afr_errs) >= 10:
         # Pearson correlation
         mean_afr_error = sum(afr_errs) / len(afr_errs)
@@ -1600,12 +2200,25 @@ def write_diagnostics(
     )
 
 
-def main() -> int:
+def build_arg_parser() -> argparse.ArgumentParser:
+    """Build the CLI parser; its option names double as ``run_analysis`` keys."""
     ap = argparse.ArgumentParser(
         description="Dyno-mode AI tuner v1.2 (VE apply + diagnostics)"
     )
-    ap.add_argument("--csv", required=True, help="WinPEP8 export CSV path.")
+    source = ap.add_mutually_exclusive_group(required=True)
+    source.add_argument("--csv", help="WinPEP8 export CSV path.")
+    source.add_argument(
+        "--batch",
+        help="Directory or glob of CSV logs; each is analyzed into its own "
+        "subdirectory of --outdir.",
+    )
     ap.add_argument("--outdir", default=".", help="Output directory.")
+    ap.add_argument(
+        "--jobs",
+        type=int,
+        default=None,
+        help="Worker processes for --batch (default: CPU count).",
+    )
     ap.add_argument(
         "--verbose", "-v", action="store_true", help="Enable verbose debug logging."
     )
@@ -1645,6 +2258,16 @@ def main() -> int:
         default=-1.0,
         help="Additional rear retard (deg) when IAT >=120F in rule band (negative).",
     )
+    ap.add_argument(
+        "--columnar",
+        action="store_true",
+        help="Parse the log into per-channel NumPy arrays (faster, lower memory on large logs).",
+    )
+    ap.add_argument(
+        "--vectorized",
+        action="store_true",
+        help="Use the NumPy bin aggregation (bit-identical to the default path).",
+    )
     ap.add_argument(
         "--base_front",
         help="Front VE base CSV (9x5 bins). If provided, tool emits updated absolute VE tables.",
@@ -1653,54 +2276,85 @@ def main() -> int:
         "--base_rear",
         help="Rear VE base CSV (optional; if omitted, base_front is reused).",
     )
-    args = ap.parse_args()
+    return ap
+
+
+def _print_progress(percent: int, message: str) -> None:
+    print(f"PROGRESS:{percent}:{message}")
+    sys.stdout.flush()
 
-    # Configure logging level based on --verbose flag
-    logging.basicConfig(
-        level=logging.DEBUG if args.verbose else logging.INFO,
-        format="%(levelname)s: %(message)s",
-    )
+
+def run_analysis(
+    config: Union[Dict[str, Any], argparse.Namespace],
+    progress: Optional[Callable[[int, str], None]] = None,
+) -> Dict[str, Any]:
+    """Run the full VE analysis pipeline in-process and return the manifest.
+
+    This is the importable form of the CLI: ``config`` uses the CLI option
+    names (``csv``, ``outdir``, ``clamp``, ``smooth_passes`` ...) and omitted
+    keys take the CLI defaults. All outputs, including ``manifest.json``, are
+    written to ``config["outdir"]``; callers running several analyses at once
+    must give each its own output directory.
+
+    Args:
+        config: Analysis options (dict or parsed CLI namespace).
+        progress: Optional ``(percent, message)`` callback. Defaults to the
+            ``PROGRESS:<pct>:<message>`` stdout lines the CLI emits.
+
+    Returns:
+        The finished manifest dict.
+
+    Raises:
+        ValueError: If an option is unknown or a path is unsafe.
+        FileNotFoundError: If the input CSV does not exist.
+        Exception: Any pipeline failure, re-raised after the failure manifest
+            has been written to the output directory.
+    """
+    if isinstance(config, argparse.Namespace):
+        args = config
+    else:
+        if "csv" not in config:
+            raise ValueError("Analysis config requires 'csv'")
+        args = build_arg_parser().parse_args(["--csv", str(config["csv"])])
+        unknown = sorted(set(config) - set(vars(args)))
+        if unknown:
+            raise ValueError(f"Unknown analysis option(s): {', '.join(unknown)}")
+        for key, value in config.items():
+            setattr(args, key, str(value) if isinstance(value, Path) else value)
+    report = progress or _print_progress
 
     # Validate input CSV path (prevent path traversal)
     try:
-        csv_path = io_contracts.safe_path(args.csv)
+        csv_path = io_contracts.safe_path(str(args.csv))
     except ValueError as e:
-        print(f"[ERROR] Invalid CSV path: {e}", file=sys.stderr)
-        return 1
+        raise ValueError(f"Invalid CSV path: {e}") from e
 
     # Validate output directory path (prevent path traversal)
     try:
-        outdir = io_contracts.safe_path(args.outdir)
+        outdir = io_contracts.safe_path(str(args.outdir))
     except ValueError as e:
-        print(f"[ERROR] Invalid output directory: {e}", file=sys.stderr)
-        return 1
+        raise ValueError(f"Invalid output directory: {e}") from e
 
     # Validate base VE table paths if provided
     base_front_path = None
     base_rear_path = None
     if args.base_front:
         try:
-            base_front_path = io_contracts.safe_path(args.base_front)
+            base_front_path = io_contracts.safe_path(str(args.base_front))
         except ValueError as e:
-            print(f"[ERROR] Invalid base front VE table path: {e}", file=sys.stderr)
-            return 1
+            raise ValueError(f"Invalid base front VE table path: {e}") from e
     if args.base_rear:
         try:
-            base_rear_path = io_contracts.safe_path(args.base_rear)
+            base_rear_path = io_contracts.safe_path(str(args.base_rear))
         except ValueError as e:
-            print(f"[ERROR] Invalid base rear VE table path: {e}", file=sys.stderr)
-            return 1
+            raise ValueError(f"Invalid base rear VE table path: {e}") from e
 
     outdir.mkdir(parents=True, exist_ok=True)
 
     run_id = io_contracts.make_run_id()
 
-    # Check if input CSV exists before proceeding
-    try:
-        input_info: Dict[str, Any] = io_contracts.csv_schema_check(str(csv_path))
-    except FileNotFoundError as e:
-        print(f"[ERROR] {e}", file=sys.stderr)
-        return 1
+    # Check if input CSV exists before proceeding (raises FileNotFoundError)
+    input_info: Dict[str, Any] = io_contracts.csv_schema_check(str(csv_path))
     args_cfg = {
         "smooth_passes": args.smooth_passes,
         "clamp": args.clamp,
@@ -1711,6 +2365,9 @@ def main() -> int:
     base_tables = {"front": args.base_front, "rear": args.base_rear}
     # Make a copy of the args for the manifest
     args_cfg = vars(args).copy()
+    # batch-only options are not part of a single run's configuration
+    for key in ("batch", "jobs"):
+        args_cfg.pop(key, None)
     # don't store file handles in the manifest
     if "csv" in args_cfg and hasattr(args_cfg["csv"], "name"):
         args_cfg["csv"] = args_cfg["csv"].name
@@ -1726,24 +2383,30 @@ def main() -> int:
     last_stage = "init"
     try:
         last_stage = "load"
-        print("PROGRESS:10:Loading and parsing CSV...")
-        sys.stdout.flush()
+        report(10, "Loading and parsing CSV...")
 
         file_format = detect_csv_format(str(csv_path))
         print(f"INFO: Detected CSV format: {file_format}")
 
+        load_winpep: Callable[[str], Records] = (
+            load_winpep_columns if args.columnar else load_winpep_csv
+        )
+        load_generic: Callable[[str], Records] = (
+            load_generic_columns if args.columnar else load_generic_csv
+        )
+        recs: Records
         if file_format == "winpep":
-            recs = load_winpep_csv(str(csv_path))
+            recs = load_winpep(str(csv_path))
         elif file_format in [
             "generic",
             "powervision",
         ]:  # Handle both generic and powervision
-            recs = load_generic_csv(str(csv_path))
+            recs = load_generic(str(csv_path))
         else:
             # Fallback or error
             try:
                 print("WARN: Unknown CSV format, attempting to load as WinPEP...")
-                recs = load_winpep_csv(str(csv_path))
+                recs = load_winpep(str(csv_path))
             except RuntimeError as e:
                 raise RuntimeError(
                     "Failed to parse CSV. Format is not recognized as WinPEP or Generic.\n"
@@ -1751,8 +2414,7 @@ def main() -> int:
                 )
 
         last_stage = "aggregate"
-        print("PROGRESS:30:Aggregating front cylinder data...")
-        sys.stdout.flush()
+        report(30, "Aggregating front cylinder data...")
         (
             afr_err_f,
             knock_f,
@@ -1761,9 +2423,13 @@ def main() -> int:
             diag_f,
             tq_f,
             hp_f,
-        ) = dyno_bin_aggregate(recs, cyl="f", use_hp_weight=args.weighting == "hp")
-        print("PROGRESS:50:Aggregating rear cylinder data...")
-        sys.stdout.flush()
+        ) = dyno_bin_aggregate(
+            recs,
+            cyl="f",
+            use_hp_weight=args.weighting == "hp",
+            vectorized=args.vectorized,
+        )
+        report(50, "Aggregating rear cylinder data...")
         (
             afr_err_r,
             knock_r,
@@ -1772,7 +2438,12 @@ def main() -> int:
             diag_r,
             tq_r,
             hp_r,
-        ) = dyno_bin_aggregate(recs, cyl="r", use_hp_weight=args.weighting == "hp")
+        ) = dyno_bin_aggregate(
+            recs,
+            cyl="r",
+            use_hp_weight=args.weighting == "hp",
+            vectorized=args.vectorized,
+        )
 
         # Combine front and rear cylinder data for primary outputs
         ve_delta = combine_front_rear(afr_err_f, afr_err_r)
@@ -1788,13 +2459,11 @@ def main() -> int:
                                 afr_err_r[ri][ki] or 0.0
                             ) + args.rear_bias
 
-        print("PROGRESS:70:Smoothing and clamping VE corrections...")
-        sys.stdout.flush()
+        report(70, "Smoothing and clamping VE corrections...")
         ve_smooth = kernel_smooth(ve_delta, passes=max(0, min(5, args.smooth_passes)))
         ve_clamped = clamp_grid(ve_smooth, args.clamp)
 
-        print("PROGRESS:80:Generating spark advance suggestions...")
-        sys.stdout.flush()
+        report(80, "Generating spark advance suggestions...")
         spark_f = spark_suggestion(knock_f, iat_f)
         spark_r = spark_suggestion(knock_r, iat_r)
         spark_r = enforce_rear_rule(
@@ -1805,8 +2474,7 @@ def main() -> int:
         )
 
         last_stage = "export"
-        print("PROGRESS:90:Writing output files...")
-        sys.stdout.flush()
+        report(90, "Writing output files...")
         write_matrix_csv(
             outdir / "VE_Correction_Delta_DYNO.csv", RPM_BINS, KPA_BINS, ve_clamped
         )
@@ -1934,8 +2602,7 @@ def main() -> int:
             )
 
         last_stage = "diagnostics"
-        print("PROGRESS:95:Running anomaly diagnostics...")
-        sys.stdout.flush()
+        report(95, "Running anomaly diagnostics...")
         anomalies = anomaly_diagnostics(
             recs,
             afr_err_f=afr_err_f,
@@ -1958,6 +2625,13 @@ def main() -> int:
             "rows_read": len(recs),
             "bins_total": len(RPM_BINS) * len(KPA_BINS),
             "bins_covered": sum(1 for row in cov_f for value in row if value > 0),
+            # Bins covered by either cylinder ("bins_covered" is front only)
+            "bins_covered_any": sum(
+                1
+                for row_f, row_r in zip(cov_f, cov_r)
+                for value_f, value_r in zip(row_f, row_r)
+                if value_f > 0 or value_r > 0
+            ),
             "front_accepted": diag_f["accepted_wb"],
             "rear_accepted": diag_r["accepted_wb"],
         }
@@ -1966,8 +2640,7 @@ def main() -> int:
         # Always attempt to generate visualizations if the script exists
         vis_script_path = Path(__file__).parent / "visualize_coverage_all.py"
         if vis_script_path.exists():
-            print("\nPROGRESS:98:Generating coverage visualizations...")
-            sys.stdout.flush()
+            report(98, "Generating coverage visualizations...")
 
             # We need to find the primary coverage file to pass to the script
             coverage_file_path = outdir / "Coverage_Front.csv"
@@ -2011,18 +2684,17 @@ def main() -> int:
         io_contracts.write_manifest_pair(manifest, str(outdir), run_id)
 
     except Exception as e:
-        print(f"[ERROR] {e}", file=sys.stderr)
         # Update manifest with error state
         if manifest:
             io_contracts.finish_manifest(
                 manifest, ok=False, last_stage=last_stage, message=str(e)
             )
             io_contracts.write_manifest_pair(manifest, str(outdir), run_id)
-        sys.exit(1)
+        raise
 
     finally:
         if manifest and manifest.get("timing", {}).get("end") is None:
-            # This block is for cases where sys.exit might be called before finish_manifest
+            # This block is for cases where we exit before finish_manifest
             io_contracts.finish_manifest(
                 manifest, ok=False, last_stage=last_stage, message="Incomplete run"
             )
@@ -2035,9 +2707,171 @@ def main() -> int:
             if not val_ok:
                 print(f"[WARNING] Output validation failed: {val_msg}", file=sys.stderr)
 
-    print("PROGRESS:100:Done.")
-    sys.stdout.flush()
-    print("Dyno AI Tuner v1.2 outputs written to:", outdir)
+    report(100, "Done.")
+    return manifest
+
+
+def find_batch_inputs(source: str | Path) -> List[Path]:
+    """Resolve a directory (its ``*.csv`` files) or glob pattern to log files."""
+    source_path = Path(source)
+    if source_path.is_dir():
+        candidates = source_path.glob("*.csv")
+    else:
+        candidates = (Path(p) for p in glob.glob(str(source)))
+    return sorted(p for p in candidates if p.is_file())
+
+
+def _batch_run_dirs(files: Sequence[Path], outdir: Path) -> List[Path]:
+    """One output directory per log, named after the file stem."""
+    seen: Dict[str, int] = {}
+    run_dirs = []
+    for path in files:
+        count = seen.get(path.stem, 0)
+        seen[path.stem] = count + 1
+        name = path.stem if count == 0 else f"{path.stem}_{count + 1}"
+        run_dirs.append(outdir / name)
+    return run_dirs
+
+
+def _run_batch_item(
+    csv_path: str, run_outdir: str, options: Dict[str, Any]
+) -> Dict[str, Any]:
+    """Analyze one log of a batch; never raises so one bad file can't stop the rest."""
+    started = time.perf_counter()
+    result: Dict[str, Any] = {"csv": csv_path, "outdir": run_outdir, "ok": False}
+    try:
+        config = dict(options, csv=csv_path, outdir=run_outdir)
+        manifest = run_analysis(config, progress=lambda _pct, _msg: None)
+        stats = manifest.get("stats") or {}
+        result.update(
+            ok=True,
+            run_id=manifest.get("run_id"),
+            rows_read=stats.get("rows_read"),
+            bins_covered=stats.get("bins_covered_any"),
+            front_accepted=stats.get("front_accepted"),
+            rear_accepted=stats.get("rear_accepted"),
+        )
+    except Exception as e:
+        result["error"] = str(e)
+    result["seconds"] = round(time.perf_counter() - started, 3)
+    return result
+
+
+def run_batch(
+    files: Sequence[str | Path],
+    outdir: str | Path,
+    options: Optional[Dict[str, Any]] = None,
+    max_workers: Optional[int] = None,
+    progress: Optional[Callable[[int, str], None]] = None,
+) -> Dict[str, Any]:
+    """Analyze many logs in parallel, one worker process per log.
+
+    Each log is run through ``run_analysis`` with the same ``options`` and
+    writes its outputs and manifest pair into ``outdir/<file stem>``, so the
+    per-run results are the same as running the files one at a time. An
+    aggregate ``batch_summary.json`` (per-file timing, accepted rows and bins
+    covered by either cylinder) is written to ``outdir``.
+
+    Args:
+        files: CSV logs to analyze.
+        outdir: Parent directory for the per-run output directories.
+        options: ``run_analysis`` options shared by every run (no ``csv`` or
+            ``outdir``).
+        max_workers: Worker processes (default: CPU count). ``1`` runs the
+            files serially in this process.
+        progress: Optional ``(percent, message)`` callback.
+
+    Returns:
+        The batch summary dict.
+    """
+    options = dict(options or {})
+    for key in ("csv", "outdir", "batch", "jobs"):
+        options.pop(key, None)
+    report = progress or _print_progress
+
+    try:
+        outdir_path = io_contracts.safe_path(str(outdir))
+    except ValueError as e:
+        raise ValueError(f"Invalid output directory: {e}") from e
+    outdir_path.mkdir(parents=True, exist_ok=True)
+
+    paths = [Path(f) for f in files]
+    jobs = [
+        (str(path), str(run_dir), options)
+        for path, run_dir in zip(paths, _batch_run_dirs(paths, outdir_path))
+    ]
+    workers = max(1, min(max_workers or os.cpu_count() or 1, len(jobs) or 1))
+
+    started = time.perf_counter()
+    results: List[Dict[str, Any]] = []
+    if workers == 1:
+        for job in jobs:
+            results.append(_run_batch_item(*job))
+            report(len(results) * 100 // len(jobs), f"Analyzed {job[0]}")
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [pool.submit(_run_batch_item, *job) for job in jobs]
+            for future in as_completed(futures):
+                result = future.result()
+                results.append(result)
+                report(len(results) * 100 // len(jobs), f"Analyzed {result['csv']}")
+    # Report in input order regardless of completion order
+    order = {job[0]: i for i, job in enumerate(jobs)}
+    results.sort(key=lambda r: order[r["csv"]])
+
+    succeeded = [r for r in results if r["ok"]]
+    summary: Dict[str, Any] = {
+        "tool_version": "1.2",
+        "created": io_contracts.utc_now_iso(),
+        "workers": workers,
+        "wall_seconds": round(time.perf_counter() - started, 3),
+        "files_total": len(results),
+        "files_succeeded": len(succeeded),
+        "files_failed": len(results) - len(succeeded),
+        "rows_read": sum(r.get("rows_read") or 0 for r in succeeded),
+        "runs": results,
+    }
+    io_contracts.write_json_atomic(summary, str(outdir_path / "batch_summary.json"))
+    return summary
+
+
+def main() -> int:
+    args = build_arg_parser().parse_args()
+
+    # Configure logging level based on --verbose flag
+    logging.basicConfig(
+        level=logging.DEBUG if args.verbose else logging.INFO,
+        format="%(levelname)s: %(message)s",
+    )
+
+    if args.batch:
+        files = find_batch_inputs(args.batch)
+        if not files:
+            print(f"[ERROR] No CSV logs found for: {args.batch}", file=sys.stderr)
+            return 1
+        try:
+            summary = run_batch(files, args.outdir, vars(args), max_workers=args.jobs)
+        except Exception as e:
+            print(f"[ERROR] {e}", file=sys.stderr)
+            return 1
+        for run in summary["runs"]:
+            if not run["ok"]:
+                print(f"[ERROR] {run['csv']}: {run['error']}", file=sys.stderr)
+        print(
+            f"Dyno AI Tuner v1.2 batch: {summary['files_succeeded']}/"
+            f"{summary['files_total']} runs in {summary['wall_seconds']}s, "
+            "outputs written to:",
+            io_contracts.safe_path(args.outdir),
+        )
+        return 0 if summary["files_failed"] == 0 else 1
+
+    try:
+        run_analysis(args)
+    except Exception as e:
+        print(f"[ERROR] {e}", file=sys.stderr)
+        return 1
+
+    print("Dyno AI Tuner v1.2 outputs written to:", io_contracts.safe_path(args.outdir))
     return 0
 
 
@@ -8,11 +8,11 @@ import json
 import os
 import subprocess
 import sys
-import threading
 import uuid
 from datetime import datetime
 from pathlib import Path
 from queue import Queue
+from typing import Callable, Optional
 
 from dotenv import load_dotenv
 from flask import Flask, jsonify, request, send_file
@@ -292,104 +292,102 @@ def allowed_file(filename: str) -> bool:
     return "." in filename and filename.rsplit(".", 1)[1].lower() in ALLOWED_EXTENSIONS
 
 
+def _toolkit_root() -> Path:
+    """Directory holding ai_tuner_toolkit_dyno_v1_2.py (bundle dir when frozen)."""
+    if hasattr(sys, "_MEIPASS"):
+        return Path(sys._MEIPASS)
+    return Path(__file__).parent.parent
+
+
+def _toolkit_config(csv_path: Path, output_dir: Path, params: dict = None) -> dict:
+    """Map API tuning parameters onto toolkit CLI option names."""
+    config = {"csv": str(csv_path), "outdir": str(output_dir)}
+    if params:
+        for key in ("smooth_passes", "clamp", "rear_bias", "rear_rule_deg", "hot_extra"):
+            if key in params:
+                config[key] = params[key]
+    else:
+        # Default parameters
+        config.update({"clamp": 15.0, "smooth_passes": 2})
+    return config
+
+
 def run_dyno_analysis(
     csv_path: Path,
     output_dir: Path,
     run_id: str,
     params: dict = None,
     progress_queue: Queue = None,
+    progress_callback: Optional[Callable[[int, str], None]] = None,
 ) -> dict:
     """
     Run the DynoAI analysis toolkit on a CSV file with progress tracking
 
+    The toolkit pipeline runs in-process via ``run_analysis``; callers should
+    schedule this on the analysis engine so concurrency stays bounded.
+
     Args:
         csv_path: Path to input CSV file
         output_dir: Directory to write outputs
         run_id: Unique identifier for this analysis run
         params: Optional dict of tuning parameters
         progress_queue: Optional queue for progress updates
+        progress_callback: Optional ``(percent, message)`` callback
 
     Returns:
         dict: Manifest data from analysis
     """
-    # Check if running in standalone/PyInstaller mode
-    is_standalone = os.environ.get("DYNOAI_STANDALONE") or hasattr(sys, "_MEIPASS")
-
-    if is_standalone:
-        # In standalone mode, use bundled resources
-        if hasattr(sys, "_MEIPASS"):
-            project_root = Path(sys._MEIPASS)
-        else:
-            project_root = Path(__file__).parent.parent
-        script_path = project_root / "ai_tuner_toolkit_dyno_v1_2.py"
-        python_exe = sys.executable
-    else:
-        # Development mode - use project root and venv
-        project_root = Path(__file__).parent.parent
-        os.chdir(project_root)
-        script_path = project_root / "ai_tuner_toolkit_dyno_v1_2.py"
-
-        # Find Python executable
-        venv_python = project_root / ".venv/Scripts/python.exe"
-        if not venv_python.exists():
-            venv_python = project_root / ".venv/bin/python"  # Unix/Mac
-        if not venv_python.exists():
-            venv_python = Path("python")  # Fallback to system Python
-        python_exe = str(venv_python)
-
-    # Verify script exists
-    if not script_path.exists():
-        from api.errors import AnalysisError
+    from api.errors import AnalysisError, ManifestError
+    from api.services.analysis_engine import get_toolkit
 
+    script_path = _toolkit_root() / "ai_tuner_toolkit_dyno_v1_2.py"
+    if not script_path.exists():
         raise AnalysisError(
             f"Autotune script not found at {script_path}", stage="setup"
         )
 
-    # Build command with optional parameters
-    cmd = [
-        str(python_exe),
-        str(script_path),
-        "--csv",
-        str(csv_path),
-        "--outdir",
-        str(output_dir),
-    ]
-
-    # Add optional parameters if provided
-    if params:
-        if "smooth_passes" in params:
-            cmd.extend(["--smooth_passes", str(params["smooth_passes"])])
-        if "clamp" in params:
-            cmd.extend(["--clamp", str(params["clamp"])])
-        if "rear_bias" in params:
-            cmd.extend(["--rear_bias", str(params["rear_bias"])])
-        if "rear_rule_deg" in params:
-            cmd.extend(["--rear_rule_deg", str(params["rear_rule_deg"])])
-        if "hot_extra" in params:
-            cmd.extend(["--hot_extra", str(params["hot_extra"])])
-
-        # Decel Fuel Management options
-        if params.get("decel_management"):
-            cmd.append("--decel-management")
-            if "decel_severity" in params:
-                cmd.extend(["--decel-severity", str(params["decel_severity"])])
-            if "decel_rpm_min" in params:
-                cmd.extend(["--decel-rpm-min", str(params["decel_rpm_min"])])
-            if "decel_rpm_max" in params:
-                cmd.extend(["--decel-rpm-max", str(params["decel_rpm_max"])])
-
-        # Per-Cylinder Auto-Balancing options
-        if params.get("balance_cylinders"):
-            cmd.append("--balance-cylinders")
-            if "balance_mode" in params:
-                cmd.extend(["--balance-mode", str(params["balance_mode"])])
-            if "balance_max_correction" in params:
-                cmd.extend(
-                    ["--balance-max-correction", str(params["balance_max_correction"])]
-                )
+    toolkit = get_toolkit(_toolkit_root())
+    if not hasattr(toolkit, "run_analysis"):
+        # Older bundled toolkit without the in-process API
+        manifest = _run_dyno_analysis_subprocess(
+            script_path, csv_path, output_dir, params
+        )
     else:
-        # Default parameters
-        cmd.extend(["--clamp", "15", "--smooth_passes", "2"])
+
+        def report(percent: int, message: str) -> None:
+            if progress_callback:
+                progress_callback(percent, message)
+            if progress_queue is not None:
+                progress_queue.put({"progress": percent, "message": message})
+
+        try:
+            manifest = toolkit.run_analysis(
+                _toolkit_config(csv_path, output_dir, params), progress=report
+            )
+        except (ValueError, FileNotFoundError) as e:
+            raise AnalysisError(str(e), stage="setup") from e
+        except Exception as e:
+            raise AnalysisError(str(e), stage="analysis") from e
+
+    if not manifest:
+        raise ManifestError(
+            "Manifest file not generated",
+            manifest_path=str(output_dir / "manifest.json"),
+        )
+
+    # Record analysis in session timeline (Time Machine)
+    _record_timeline_event(csv_path, output_dir, manifest)
+    return manifest
+
+
+def _run_dyno_analysis_subprocess(
+    script_path: Path, csv_path: Path, output_dir: Path, params: dict = None
+) -> dict:
+    """Fallback: run the toolkit CLI in a child interpreter."""
+    config = _toolkit_config(csv_path, output_dir, params)
+    cmd = [sys.executable, str(script_path)]
+    for key, value in config.items():
+        cmd.extend([f"--{key}", str(value)])
 
     result = subprocess.run(cmd, capture_output=True, text=True)
 
@@ -420,9 +418,11 @@ def run_dyno_analysis(
         )
 
     with open(manifest_path, "r") as f:
-        manifest = json.load(f)
+        return json.load(f)
 
-    # Record analysis in session timeline (Time Machine)
+
+def _record_timeline_event(csv_path: Path, output_dir: Path, manifest: dict) -> None:
+    """Snapshot the VE correction into the session timeline (best effort)."""
     try:
         from api.services.session_logger import SessionLogger
 
@@ -443,8 +443,6 @@ def run_dyno_analysis(
         # Don't fail the analysis if timeline logging fails
         print(f"[!] Warning: Could not record timeline event: {e}")
 
-    return manifest
-
 
 def convert_manifest_to_frontend_format(manifest: dict, run_id: str) -> dict:
     """
@@ -587,16 +585,25 @@ def analyze():
             "message": "Starting analysis...",
             "filename": filename,
             "params": params,
+            "tuning_options": tuning_options,
             "started_at": datetime.utcnow().isoformat(),
         }
 
-        # Run analysis in background thread
-        def run_analysis_thread():
+        def update_progress(percent: int, message: str) -> None:
+            active_jobs[run_id]["progress"] = percent
+            active_jobs[run_id]["message"] = message
+
+        # Run analysis on the bounded in-process worker pool
+        def run_analysis_job():
             try:
                 active_jobs[run_id]["status"] = "running"
                 active_jobs[run_id]["message"] = "Running analysis..."
                 manifest = run_dyno_analysis(
-                    upload_path, output_dir, run_id, params, tuning_options
+                    upload_path,
+                    output_dir,
+                    run_id,
+                    params,
+                    progress_callback=update_progress,
                 )
                 active_jobs[run_id]["manifest"] = manifest
                 active_jobs[run_id]["status"] = "completed"
@@ -606,8 +613,9 @@ def analyze():
                 active_jobs[run_id]["error"] = str(e)
                 active_jobs[run_id]["message"] = f"Error: {str(e)}"
 
-        thread = threading.Thread(target=run_analysis_thread, daemon=True)
-        thread.start()
+        from api.services.analysis_engine import get_analysis_engine
+
+        get_analysis_engine().submit(output_dir, run_analysis_job)
 
         return (
             jsonify(
@@ -59,6 +59,11 @@ class StorageConfig:
             os.environ.get("DYNOAI_PUBLIC_EXPORT_DIR", "data/public_export")
         )
     )
+    nextgen_cache_folder: Path = field(
+        default_factory=lambda: Path(
+            os.environ.get("DYNOAI_NEXTGEN_CACHE_DIR", "data/cache/nextgen")
+        )
+    )
     max_content_length: int = field(
         default_factory=lambda: _get_int_env("DYNOAI_MAX_UPLOAD_MB", 50) * 1024 * 1024
     )
@@ -197,6 +202,15 @@ class AnalysisConfig:
     default_hot_extra: float = field(
         default_factory=lambda: float(os.environ.get("DYNOAI_HOT_EXTRA", "-1.0"))
     )
+    max_workers: int = field(
+        default_factory=lambda: _get_int_env("DYNOAI_ANALYSIS_WORKERS", 2)
+    )
+    nextgen_cache_max_entries: int = field(
+        default_factory=lambda: _get_int_env("DYNOAI_NEXTGEN_CACHE_MAX_ENTRIES", 200)
+    )
+    nextgen_cache_max_mb: int = field(
+        default_factory=lambda: _get_int_env("DYNOAI_NEXTGEN_CACHE_MAX_MB", 500)
+    )
 
 
 @dataclass
@@ -519,6 +533,7 @@ class AppConfig:
                 "output_folder": str(self.storage.output_folder),
                 "runs_folder": str(self.storage.runs_folder),
                 "public_export_folder": str(self.storage.public_export_folder),
+                "nextgen_cache_folder": str(self.storage.nextgen_cache_folder),
                 "max_content_length": self.storage.max_content_length,
             },
             "jetstream": self.jetstream.to_dict(mask_key=not include_secrets),
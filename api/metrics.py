@@ -95,6 +95,13 @@ file_upload_bytes = Histogram(
     ],
 )
 
+# NextGen result cache metrics
+nextgen_cache_total = Counter(
+    "dynoai_nextgen_cache_total",
+    "NextGen result and stage cache lookups",
+    ["stage", "result"],  # result/normalize/modes/surfaces, hit/miss
+)
+
 # System metrics
 active_sessions = Gauge(
     "dynoai_active_sessions",
@@ -274,6 +281,20 @@ def record_file_upload(size_bytes: int):
     file_upload_bytes.observe(size_bytes)
 
 
+def record_nextgen_cache(result: str, stage: str = "result"):
+    """
+    Record a NextGen cache lookup.
+
+    Args:
+        result: "hit" or "miss"
+        stage: "result" for whole payloads, otherwise the pipeline stage
+    """
+    if not _metrics_enabled:
+        return
+
+    nextgen_cache_total.labels(stage=stage, result=result).inc()
+
+
 def set_active_sessions(count: int):
     """
     Set the number of active tuning sessions.
@@ -306,6 +327,7 @@ if __name__ == "__main__":
     print("  - dynoai_virtual_tuning_sessions_total")
     print("  - dynoai_virtual_tuning_iterations")
     print("  - dynoai_file_upload_bytes")
+    print("  - dynoai_nextgen_cache_total")
     print("  - dynoai_active_sessions")
     print("  - dynoai_app (info)")
     print("\nEndpoint: /metrics")
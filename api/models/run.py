@@ -9,7 +9,17 @@ Models:
 from datetime import datetime
 from typing import Optional
 
-from sqlalchemy import JSON, Column, DateTime, Float, ForeignKey, Integer, String, Text
+from sqlalchemy import (
+    JSON,
+    Column,
+    DateTime,
+    Float,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    Text,
+)
 from sqlalchemy.orm import declarative_base, relationship
 
 Base = declarative_base()
@@ -24,6 +34,13 @@ class Run(Base):
     """
 
     __tablename__ = "runs"
+    __table_args__ = (
+        # Run history listing: newest first, id breaks created_at ties so
+        # keyset pagination can resume from (created_at, id)
+        Index("ix_runs_created_id", "created_at", "id"),
+        Index("ix_runs_status_created_id", "status", "created_at", "id"),
+        Index("ix_runs_source_created_id", "source", "created_at", "id"),
+    )
 
     # Primary key
     id = Column(
@@ -47,7 +64,7 @@ class Run(Base):
     )
 
     # Timestamps
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False, index=True)
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
     completed_at = Column(DateTime, nullable=True)
 
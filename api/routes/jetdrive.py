@@ -21,10 +21,10 @@ import os
 import re
 import socket
 import struct
-import subprocess
 import sys
 import threading
 import time
+from concurrent.futures import TimeoutError as FuturesTimeoutError
 from datetime import datetime
 from math import isfinite
 from pathlib import Path
@@ -609,8 +609,7 @@ def analyze_run():
                 500,
             )
 
-        # Build command
-        cmd = [sys.executable, str(script_path), "--run-id", run_id]
+        autotune_kwargs: dict[str, Any] = {"run_id": run_id}
     except Exception as e:
         logger.error(f"Error in analyze_run setup: {e}", exc_info=True)
         import traceback
@@ -621,11 +620,11 @@ def analyze_run():
         return jsonify({"success": False, "error": error_detail}), 500
 
     if mode == "simulate":
-        cmd.append("--simulate")
+        autotune_kwargs["simulate"] = True
     elif mode == "csv":
         if not csv_path:
             return jsonify({"error": "Missing 'csv_path' for CSV mode"}), 400
-        cmd.extend(["--csv", csv_path])
+        autotune_kwargs["csv_path"] = project_root / csv_path
     elif mode == "simulator_pull":
         # Save simulator pull data first
         logger.info(f"Analyzing with simulator_pull mode for run_id={run_id}")
@@ -762,7 +761,7 @@ def analyze_run():
             return jsonify({"error": f"Failed to save simulator data: {str(e)}"}), 500
 
         # Now analyze the saved CSV
-        cmd.extend(["--csv", csv_path])
+        autotune_kwargs["csv_path"] = project_root / csv_path
     else:
         valid_modes = ["simulate", "csv", "simulator_pull"]
         return (
@@ -774,9 +773,14 @@ def analyze_run():
             400,
         )
 
-    # Pass AFR targets as JSON string if provided
+    # AFR targets arrive keyed by MAP as strings (JSON keys are always strings)
     if afr_targets:
-        cmd.extend(["--afr-targets", json.dumps(afr_targets)])
+        try:
+            autotune_kwargs["afr_targets"] = {
+                int(k): float(v) for k, v in afr_targets.items()
+            }
+        except (AttributeError, TypeError, ValueError) as e:
+            logger.warning(f"Invalid AFR targets, using defaults: {e}")
 
     # Run analysis
     # Note: Keep simulator active flag set during analysis
@@ -784,29 +788,33 @@ def analyze_run():
     was_simulator_active = _is_simulator_active()
 
     try:
-        result = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-            cwd=str(project_root),
-            env={**dict(__import__("os").environ), "PYTHONPATH": str(project_root)},
-            timeout=60,
+        from api.services.analysis_engine import (
+            OutputDirBusyError,
+            get_analysis_engine,
+            get_jetdrive_autotune,
         )
 
-        if result.returncode != 0:
+        # Run on the shared analysis pool, in a warm worker process that is
+        # stopped at the deadline instead of running on unowned.
+        run_dir = project_root / "runs" / run_id
+        autotune = get_jetdrive_autotune(project_root)
+        try:
+            get_analysis_engine().run_isolated(
+                run_dir,
+                autotune,
+                "run_autotune",
+                output_dir=run_dir,
+                timeout=60,
+                **autotune_kwargs,
+            )
+        except (OutputDirBusyError, ValueError, FileNotFoundError) as e:
             # Restore simulator active state if it was active before
             if was_simulator_active:
                 _set_simulator_active(True)
 
             return (
-                jsonify(
-                    {
-                        "success": False,
-                        "error": result.stderr or "Analysis failed",
-                        "stdout": result.stdout,
-                    }
-                ),
-                500,
+                jsonify({"success": False, "error": str(e) or "Analysis failed"}),
+                409 if isinstance(e, OutputDirBusyError) else 500,
             )
 
         # Load results using safe path
@@ -879,7 +887,7 @@ def analyze_run():
         }
         return jsonify(response_data)
 
-    except subprocess.TimeoutExpired:
+    except FuturesTimeoutError:
         # Restore simulator active state if it was active before
         if was_simulator_active:
             _set_simulator_active(True)
@@ -2038,8 +2046,7 @@ def _live_capture_loop(requested_provider_id: int | None = None):
             # Power Core CPU and Atmospheric Probe are separate providers but we want both
             validator.record_sample(s)  # Don't filter - accept all samples
 
-            # Route through queue manager for aggregation
-            queue_mgr.on_sample(s)
+            # Aggregation is fed whole frames via queue_mgr.on_batch
 
             # Resolve ChannelInfo metadata to get unit codes
             prov = providers_by_id.get(s.provider_id)
@@ -2161,7 +2168,12 @@ def _live_capture_loop(requested_provider_id: int | None = None):
         # Track statistics for diagnostics
         sample_count = [0]  # Use list to allow modification in nested function
         last_sample_time = [None]
-        stats_dict = {"total_frames": 0, "dropped_frames": 0, "non_provider_frames": 0}
+        stats_dict = {
+            "total_frames": 0,
+            "dropped_frames": 0,
+            "callback_errors": 0,
+            "non_provider_frames": 0,
+        }
 
         def on_sample_with_stats(s: JetDriveSample):
             sample_count[0] += 1
@@ -2190,6 +2202,7 @@ def _live_capture_loop(requested_provider_id: int | None = None):
                     recv_timeout=2.0,  # 2 second timeout for receiving data
                     debug=True,  # Enable debug logging
                     return_stats=True,  # Return statistics
+                    on_batch=queue_mgr.on_batch,  # One ring push per frame
                 )
                 if stats:
                     stats_dict.update(stats)
@@ -2227,6 +2240,11 @@ def _live_capture_loop(requested_provider_id: int | None = None):
                     f"Received {stats_dict['non_provider_frames']} frames from other providers"
                 )
 
+            if stats_dict.get("callback_errors", 0) > 0:
+                logger.warning(
+                    f"Live queue failed to take {stats_dict['callback_errors']} frames"
+                )
+
             if sample_count[0] == 0 and stats_dict.get("total_frames", 0) > 0:
                 logger.warning(
                     "Frames received but no valid samples parsed. Provider ID may not match."
@@ -4568,6 +4586,7 @@ def start_simulator():
         ecu_config = data.get("virtual_ecu")
         if ecu_config and ecu_config.get("enabled", False):
             from api.services.virtual_ecu import (
+                DEFAULT_LOOKUP_TABLE_STEPS,
                 VirtualECU,
                 create_afr_target_table,
                 create_baseline_ve_table,
@@ -4622,6 +4641,7 @@ def start_simulator():
                     "barometric_pressure_inhg", 29.92
                 ),
                 ambient_temp_f=ecu_config.get("ambient_temp_f", 75.0),
+                lookup_table_steps=DEFAULT_LOOKUP_TABLE_STEPS,
             )
 
             logger.info(
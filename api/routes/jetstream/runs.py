@@ -80,8 +80,9 @@ def list_runs():
       - Jetstream
     summary: List runs with optional filtering
     description: |
-      Returns a paginated list of analysis runs. Can filter by status and source.
-      Supports pagination with limit and offset parameters.
+      Returns a paginated list of analysis runs, newest first. Can filter by
+      status and source. Supports pagination with limit and offset parameters,
+      or with the next_cursor of the previous page (constant cost per page).
     parameters:
       - name: status
         in: query
@@ -110,6 +111,11 @@ def list_runs():
         default: 0
         minimum: 0
         description: Number of runs to skip (for pagination)
+      - name: cursor
+        in: query
+        type: string
+        required: false
+        description: next_cursor from the previous page
     responses:
       200:
         description: List of runs
@@ -123,6 +129,9 @@ def list_runs():
             total:
               type: integer
               description: Total number of runs matching filter
+            next_cursor:
+              type: string
+              description: Cursor for the next page (null on the last page)
         examples:
           application/json:
             runs:
@@ -132,8 +141,9 @@ def list_runs():
                 jetstream_id: "JS-ALPHA-001"
                 created_at: "2025-11-25T14:30:00Z"
             total: 42
+            next_cursor: null
       400:
-        description: Invalid status or pagination parameter
+        description: Invalid status, pagination parameter or cursor
         schema:
           $ref: '#/definitions/Error'
     """
@@ -157,12 +167,16 @@ def list_runs():
 
     # Get runs from manager
     run_manager = get_run_manager()
-    result = run_manager.list_runs(
-        status=status,
-        source=source_filter,
-        limit=limit,
-        offset=offset,
-    )
+    try:
+        result = run_manager.list_runs(
+            status=status,
+            source=source_filter,
+            limit=limit,
+            offset=offset,
+            cursor=request.args.get("cursor"),
+        )
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
 
     return jsonify(result), 200
 
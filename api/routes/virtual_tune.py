@@ -48,7 +48,7 @@ def start_tuning_session():
     Response:
     {
         "success": true,
-        "session_id": "tune_1234567890_5678",
+        "session_id": "tune_1234567890_5f3a9c2e",
         "status": "running",
         "config": {...}
     }
@@ -189,7 +189,7 @@ def get_session_status(session_id: str):
 
     Response:
     {
-        "session_id": "tune_1234567890_5678",
+        "session_id": "tune_1234567890_5f3a9c2e",
         "status": "running" | "converged" | "failed" | "stopped" | "max_iterations",
         "current_iteration": 3,
         "max_iterations": 10,
@@ -230,7 +230,7 @@ def stop_session(session_id: str):
     Response:
     {
         "success": true,
-        "session_id": "tune_1234567890_5678",
+        "session_id": "tune_1234567890_5f3a9c2e",
         "status": "stopped"
     }
     """
@@ -265,7 +265,7 @@ def list_sessions():
     {
         "sessions": [
             {
-                "session_id": "tune_1234567890_5678",
+                "session_id": "tune_1234567890_5f3a9c2e",
                 "status": "converged",
                 "current_iteration": 4,
                 "max_iterations": 10,
@@ -312,7 +312,7 @@ def get_session_results(session_id: str):
 
     Response:
     {
-        "session_id": "tune_1234567890_5678",
+        "session_id": "tune_1234567890_5f3a9c2e",
         "status": "converged",
         "iterations": [...],
         "final_metrics": {
@@ -0,0 +1,328 @@
+"""In-process analysis engine.
+
+Runs analysis pipelines (the VE toolkit's ``run_analysis`` and the JetDrive
+autotune pipeline) on a bounded worker pool inside the API process instead of
+spawning a fresh interpreter per request. Each job owns its output directory:
+a second job targeting a directory that is still being written is rejected.
+
+Jobs with a deadline run in warm worker processes (``run_isolated``) so a job
+that overruns is terminated, rather than left writing into a directory it no
+longer owns. Workers are spawned once, import the pipeline modules up front
+and are reused; only a worker whose job misses its deadline is replaced.
+"""
+
+import contextlib
+import importlib.util
+import logging
+import multiprocessing
+import sys
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FuturesTimeoutError
+from pathlib import Path
+from types import ModuleType
+from typing import Any, Callable, Dict, List, Optional, Tuple, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+
+
+class OutputDirBusyError(RuntimeError):
+    """Raised when a job targets an output directory another job is using."""
+
+
+class AnalysisEngine:
+    """
+    Bounded worker pool for in-process analysis jobs.
+
+    Submitting more jobs than ``max_workers`` queues them; the pool never
+    runs more than ``max_workers`` analyses at once.
+    """
+
+    def __init__(self, max_workers: int = 2):
+        """
+        Initialize the engine.
+
+        Args:
+            max_workers: Maximum number of analyses running concurrently
+        """
+        self.max_workers = max(1, int(max_workers))
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.max_workers, thread_name_prefix="dynoai-analysis"
+        )
+        self._lock = threading.Lock()
+        # Claimed output directory -> claim token of the owning job
+        self._active_dirs: Dict[Path, object] = {}
+        # Warm processes for run_isolated, and the pipeline modules
+        # (name -> path) every new worker imports before its first job
+        self._idle_workers: List[_IsolatedWorker] = []
+        self._worker_modules: Dict[str, str] = {}
+        self._closed = False
+
+    def submit(
+        self,
+        output_dir: Path,
+        fn: Callable[..., T],
+        /,
+        *args: Any,
+        **kwargs: Any,
+    ) -> "Future[T]":
+        """
+        Queue ``fn(*args, **kwargs)`` as a job that writes into ``output_dir``.
+
+        ``output_dir`` and ``fn`` are positional-only so jobs may take an
+        ``output_dir`` keyword of their own.
+
+        Raises:
+            OutputDirBusyError: If another queued or running job owns output_dir
+        """
+        key = Path(output_dir).resolve()
+        with self._lock:
+            if key in self._active_dirs:
+                raise OutputDirBusyError(f"Output directory already in use: {key}")
+            token = self._active_dirs[key] = object()
+
+        def job() -> T:
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                # Release before the future completes, so a caller woken by
+                # the result can immediately reuse the directory
+                self._release(key, token)
+
+        try:
+            future = self._executor.submit(job)
+        except Exception:
+            self._release(key, token)
+            raise
+        # Covers jobs cancelled before they started
+        future.add_done_callback(lambda _f: self._release(key, token))
+        return future
+
+    def run(
+        self,
+        output_dir: Path,
+        fn: Callable[..., T],
+        /,
+        *args: Any,
+        timeout: Optional[float] = None,
+        **kwargs: Any,
+    ) -> T:
+        """
+        Submit a job and block until it finishes (or ``timeout`` expires).
+
+        A timed-out job keeps running and keeps ``output_dir``; use
+        ``run_isolated`` for jobs that must be stopped at the deadline.
+        """
+        return self.submit(output_dir, fn, *args, **kwargs).result(timeout=timeout)
+
+    def run_isolated(
+        self,
+        output_dir: Path,
+        module: ModuleType,
+        func_name: str,
+        /,
+        *args: Any,
+        timeout: float,
+        **kwargs: Any,
+    ) -> Any:
+        """
+        Run ``module.func_name(*args, **kwargs)`` in a warm worker process.
+
+        The job takes a pool slot and claims ``output_dir`` like any other,
+        then runs in an idle worker process (spawned only if none is idle).
+        If it has not finished ``timeout`` seconds after submission
+        (including time spent queued), that worker is terminated before the
+        slot and the directory are released; other workers are unaffected.
+        Arguments and the return value must be picklable; ``module`` must
+        have been loaded from a file (e.g. via ``load_pipeline_module``).
+
+        Raises:
+            OutputDirBusyError: If another queued or running job owns output_dir
+            concurrent.futures.TimeoutError: If the deadline passed
+        """
+        deadline = time.monotonic() + timeout
+        with self._lock:
+            self._worker_modules.setdefault(module.__name__, module.__file__)
+        future = self.submit(
+            output_dir,
+            self._call_isolated,
+            (module.__name__, module.__file__, func_name, args, kwargs),
+            deadline,
+        )
+        return future.result()
+
+    @property
+    def active_jobs(self) -> int:
+        """Number of queued or running jobs."""
+        with self._lock:
+            return len(self._active_dirs)
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop accepting jobs and optionally wait for running ones."""
+        self._executor.shutdown(wait=wait)
+        with self._lock:
+            self._closed = True
+            idle, self._idle_workers = self._idle_workers, []
+        for worker in idle:
+            worker.stop()
+
+    def _release(self, key: Path, token: object) -> None:
+        with self._lock:
+            if self._active_dirs.get(key) is token:
+                del self._active_dirs[key]
+
+    def _call_isolated(self, job: tuple, deadline: float) -> Any:
+        """Pool-thread side of ``run_isolated``: run one job on a worker."""
+        if deadline <= time.monotonic():
+            raise FuturesTimeoutError("Analysis timed out before it started")
+
+        with self._lock:
+            worker = self._idle_workers.pop() if self._idle_workers else None
+            preload = list(self._worker_modules.items())
+        if worker is None:
+            worker = _IsolatedWorker(preload)
+        try:
+            return worker.call(job, deadline)
+        finally:
+            with self._lock:
+                keep = worker.reusable and not self._closed
+                if keep:
+                    self._idle_workers.append(worker)
+            if not keep:
+                worker.stop()
+
+
+class _IsolatedWorker:
+    """A spawned process that runs ``run_isolated`` jobs one at a time."""
+
+    def __init__(self, preload: List[Tuple[str, str]]):
+        ctx = multiprocessing.get_context("spawn")
+        self._conn, child_conn = ctx.Pipe()
+        self.process = ctx.Process(
+            target=_worker_main, args=(child_conn, preload), daemon=True
+        )
+        self.process.start()
+        child_conn.close()
+        # False while a job's reply is outstanding
+        self._idle = True
+
+    @property
+    def reusable(self) -> bool:
+        """True if the process is alive and not owed a reply."""
+        return self._idle and self.process.is_alive()
+
+    def call(self, job: tuple, deadline: float) -> Any:
+        """Send a job and wait for its result until ``deadline``."""
+        self._idle = False
+        self._conn.send(job)
+        if not self._conn.poll(max(0.0, deadline - time.monotonic())):
+            raise FuturesTimeoutError("Analysis timed out")
+        try:
+            ok, value = self._conn.recv()
+        except EOFError:
+            raise RuntimeError(
+                f"Analysis process exited unexpectedly (code {self.process.exitcode})"
+            ) from None
+        self._idle = True
+        if not ok:
+            raise value
+        return value
+
+    def stop(self) -> None:
+        """Terminate the process (killing it if it ignores SIGTERM)."""
+        if self.process.is_alive():
+            self.process.terminate()
+            self.process.join(5)
+            if self.process.is_alive():
+                self.process.kill()
+        self.process.join()
+        self._conn.close()
+
+
+def _worker_main(conn: Any, preload: List[Tuple[str, str]]) -> None:
+    """Worker process entry point: import the pipelines, then serve jobs."""
+    for name, path in preload:
+        # A module that fails here fails again, to the caller, in its first job
+        with contextlib.suppress(Exception):
+            load_pipeline_module(name, Path(path))
+
+    while True:
+        try:
+            module_name, module_path, func_name, args, kwargs = conn.recv()
+        except EOFError:
+            return
+        try:
+            module = load_pipeline_module(module_name, Path(module_path))
+            result = (True, getattr(module, func_name)(*args, **kwargs))
+        except BaseException as e:
+            result = (False, e)
+        try:
+            conn.send(result)
+        except Exception as e:
+            # Unpicklable result or exception
+            conn.send((False, RuntimeError(f"{type(e).__name__}: {e}")))
+
+
+_modules: Dict[str, ModuleType] = {}
+_modules_lock = threading.Lock()
+
+
+def load_pipeline_module(name: str, path: Path) -> ModuleType:
+    """
+    Import a pipeline script (e.g. ``ai_tuner_toolkit_dyno_v1_2.py``) once.
+
+    Scripts are loaded by path so bundled/standalone layouts, where the
+    project root is not a package on ``sys.path``, work as well.
+    """
+    with _modules_lock:
+        module = _modules.get(name) or sys.modules.get(name)
+        if module is None:
+            spec = importlib.util.spec_from_file_location(name, path)
+            if spec is None or spec.loader is None:
+                raise ImportError(f"Cannot load analysis pipeline from {path}")
+            module = importlib.util.module_from_spec(spec)
+            sys.modules[name] = module
+            try:
+                spec.loader.exec_module(module)
+            except Exception:
+                sys.modules.pop(name, None)
+                raise
+        _modules[name] = module
+        return module
+
+
+def get_toolkit(root: Optional[Path] = None) -> ModuleType:
+    """Return the VE toolkit module (exposes ``run_analysis``)."""
+    root = root or PROJECT_ROOT
+    return load_pipeline_module(
+        "ai_tuner_toolkit_dyno_v1_2", root / "ai_tuner_toolkit_dyno_v1_2.py"
+    )
+
+
+def get_jetdrive_autotune(root: Optional[Path] = None) -> ModuleType:
+    """Return the JetDrive autotune script module (exposes ``run_autotune``)."""
+    root = root or PROJECT_ROOT
+    return load_pipeline_module(
+        "jetdrive_autotune", root / "scripts" / "jetdrive_autotune.py"
+    )
+
+
+# Global engine instance
+_engine: Optional[AnalysisEngine] = None
+_engine_lock = threading.Lock()
+
+
+def get_analysis_engine() -> AnalysisEngine:
+    """Get or create the global analysis engine."""
+    global _engine
+    with _engine_lock:
+        if _engine is None:
+            from api.config import get_config
+
+            _engine = AnalysisEngine(max_workers=get_config().analysis.max_workers)
+        return _engine
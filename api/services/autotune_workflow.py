@@ -23,7 +23,7 @@ from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from enum import Enum
 from pathlib import Path
-from typing import Optional, Union
+from typing import Optional, Sequence, Union
 
 import numpy as np
 import pandas as pd
@@ -42,7 +42,7 @@ from api.services.powercore_integration import (
 # Import versioned VE math module
 from dynoai.core.ve_math import (
     MathVersion,
-    calculate_ve_correction,
+    calculate_ve_correction_batch,
     correction_to_percentage,
 )
 
@@ -58,8 +58,6 @@ from dynoai.core.signal_filters import (
     TimeAwareMinMaxFilter,
     create_tunelab_filter_chain,
     filter_afr_samples,
-    samples_from_arrays,
-    samples_to_arrays,
 )
 from dynoai.core.weighted_binning import (
     LogarithmicWeighting,
@@ -321,9 +319,9 @@ class AutoTuneWorkflow:
     
     def _filter_afr_data(
         self,
-        times_ms: list[float],
-        afr_values: list[float],
-    ) -> tuple[list[float], list[float], FilterStatistics]:
+        times_ms: Sequence[float],
+        afr_values: Sequence[float],
+    ) -> tuple[np.ndarray, FilterStatistics]:
         """
         Apply configured filters to AFR data.
         
@@ -332,27 +330,20 @@ class AutoTuneWorkflow:
             afr_values: AFR readings
             
         Returns:
-            Tuple of (filtered_times, filtered_values, statistics)
+            Tuple of (validity mask aligned to the input rows, statistics)
         """
         if self._filter_chain is None or not self.enable_filtering:
-            # No filtering - return as-is
-            return list(times_ms), list(afr_values), FilterStatistics()
+            # No filtering - every row is valid
+            return np.ones(len(afr_values), dtype=bool), FilterStatistics()
         
-        # Create samples
-        samples = samples_from_arrays(times_ms, afr_values)
-        
-        # Apply filter chain
-        filtered = self._filter_chain.filter(samples)
-        
-        # Extract valid samples
-        filtered_times, filtered_values = samples_to_arrays(filtered, include_invalid=False)
+        _, valid = self._filter_chain.filter_arrays(times_ms, afr_values)
         
         logger.info(
-            f"AFR filtering: {len(times_ms)} -> {len(filtered_times)} samples "
+            f"AFR filtering: {len(valid)} -> {int(valid.sum())} samples "
             f"({self._filter_chain.statistics.rejection_rate:.1f}% rejected)"
         )
         
-        return filtered_times, filtered_values, self._filter_chain.statistics
+        return valid, self._filter_chain.statistics
     
     def create_session(
         self, run_id: Optional[str] = None, data_source: DataSource = DataSource.CSV
@@ -484,6 +475,47 @@ class AutoTuneWorkflow:
             session.status = "error"
             return False
 
+    def _zone_corrections(
+        self, mean_afr: np.ndarray, has_data: np.ndarray
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """
+        AFR error and VE delta per zone from mean measured AFR.
+        
+        Args:
+            mean_afr: Mean measured AFR per (RPM, MAP) zone
+            has_data: Zones with enough hits to be corrected
+            
+        Returns:
+            Tuple of (AFR error in points, VE delta %) matrices; NaN where
+            a zone has no data
+        """
+        afr_error_matrix = np.full(mean_afr.shape, np.nan)
+        ve_delta_matrix = np.full(mean_afr.shape, np.nan)
+        
+        # Target AFR depends only on the MAP column
+        targets = np.array([self.get_target_afr(m) for m in self.map_axis], dtype=float)
+        target_matrix = np.broadcast_to(targets, mean_afr.shape)
+        
+        # AFR error in points (positive = lean, negative = rich)
+        afr_error_matrix[has_data] = mean_afr[has_data] - target_matrix[has_data]
+        
+        # VE correction using versioned math module
+        # v2.0.0 (default): Ratio model - VE_correction = AFR_measured / AFR_target
+        # v1.0.0 (legacy): Linear model - VE_correction = 1 + (AFR_error * 7%)
+        # Lean (+error) -> need more fuel -> INCREASE VE -> positive VE delta %
+        # Rich (-error) -> need less fuel -> DECREASE VE -> negative VE delta %
+        corrections = calculate_ve_correction_batch(
+            mean_afr[has_data].tolist(),
+            target_matrix[has_data].tolist(),
+            version=self.math_version,
+            clamp=False,
+        )
+        ve_delta_matrix[has_data] = correction_to_percentage(
+            np.asarray(corrections, dtype=float)
+        )
+        
+        return afr_error_matrix, ve_delta_matrix
+
     def _estimate_map_from_rpm(self, rpm: float) -> float:
         """Estimate MAP from RPM when not available."""
         if rpm < 2000:
@@ -632,30 +664,26 @@ class AutoTuneWorkflow:
         # Apply filtering if enabled
         filter_stats: Optional[FilterStatistics] = None
         if self.enable_filtering and self._filter_chain is not None:
-            times_ms = df[time_col].tolist()
-            afr_values = df[afr_meas_col].tolist()
-            
-            filtered_times, filtered_afr, filter_stats = self._filter_afr_data(
-                times_ms, afr_values
+            valid, filter_stats = self._filter_afr_data(
+                df[time_col].to_numpy(dtype=float),
+                df[afr_meas_col].to_numpy(dtype=float),
             )
-            
-            # Create filtered DataFrame by matching timestamps
-            # For simplicity, we'll filter the original df to only include rows
-            # where the time is in the filtered set
-            filtered_time_set = set(filtered_times)
-            df = df[df[time_col].isin(filtered_time_set)].copy()
+            df = df[valid].copy()
             
             logger.info(
                 f"After filtering: {len(df)} samples remain "
                 f"(rejected: {filter_stats.rejection_reasons})"
             )
 
-        # Initialize 2D matrices
+        # Whole columns, without rows missing RPM, MAP or AFR
+        rpm = df[rpm_col].to_numpy(dtype=float)
+        map_kpa = df[map_col].to_numpy(dtype=float)
+        afr = df[afr_meas_col].to_numpy(dtype=float)
+        present = ~(np.isnan(rpm) | np.isnan(map_kpa) | np.isnan(afr))
+        rpm, map_kpa, afr = rpm[present], map_kpa[present], afr[present]
+
         n_rpm = len(self.rpm_axis)
         n_map = len(self.map_axis)
-        afr_error_matrix = np.full((n_rpm, n_map), np.nan)  # AFR points
-        ve_delta_matrix = np.full((n_rpm, n_map), np.nan)  # VE %
-        hit_matrix = np.zeros((n_rpm, n_map), dtype=int)
         
         # Use weighted binning if enabled
         if self.use_weighted_binning:
@@ -666,82 +694,38 @@ class AutoTuneWorkflow:
                 weighting=self.weighting_strategy,
                 min_hits=self.MIN_HITS_PER_ZONE,
             )
+            accumulator.add_samples_batch(rpm, map_kpa, afr)
             
-            # Add all samples
-            for _, row in df.iterrows():
-                rpm = row[rpm_col]
-                afr = row[afr_meas_col]
-                map_kpa = row[map_col]
-                
-                if not (pd.isna(rpm) or pd.isna(afr) or pd.isna(map_kpa)):
-                    accumulator.add_sample(rpm, map_kpa, afr)
-            
-            # Get weighted results
-            afr_table = accumulator.get_table()
+            # Get weighted results (None -> NaN for cells without enough data)
+            mean_afr_matrix = np.array(accumulator.get_table(), dtype=float)
             hit_matrix = np.array(accumulator.get_hit_counts())
             
-            # Calculate errors and VE deltas from weighted means
-            for i in range(n_rpm):
-                for j in range(n_map):
-                    mean_afr = afr_table[i][j]
-                    if mean_afr is not None and hit_matrix[i, j] >= self.MIN_HITS_PER_ZONE:
-                        target_afr = self.get_target_afr(self.map_axis[j])
-                        afr_error = mean_afr - target_afr
-                        afr_error_matrix[i, j] = afr_error
-                        
-                        ve_correction = calculate_ve_correction(
-                            mean_afr, target_afr, version=self.math_version, clamp=False
-                        )
-                        ve_delta_pct = correction_to_percentage(ve_correction)
-                        ve_delta_matrix[i, j] = ve_delta_pct
-            
             logger.info(
                 f"Weighted binning stats: {accumulator.statistics}"
             )
         else:
-            # Original simple averaging approach
-            afr_sum = np.zeros((n_rpm, n_map))
+            # Original simple averaging approach: nearest bin on each axis
+            # (argmin keeps the first of equally near bins)
+            rpm_idx = np.argmin(
+                np.abs(rpm[:, None] - np.asarray(self.rpm_axis, dtype=float)), axis=1
+            )
+            map_idx = np.argmin(
+                np.abs(map_kpa[:, None] - np.asarray(self.map_axis, dtype=float)), axis=1
+            )
+            cell = rpm_idx * n_map + map_idx
             
-            # Helper to find nearest bin
-            def nearest_bin(val: float, bins: list) -> int:
-                return min(range(len(bins)), key=lambda i: abs(bins[i] - val))
-
-            # Bin each sample into the grid
-            for _, row in df.iterrows():
-                rpm = row[rpm_col]
-                afr = row[afr_meas_col]
-                map_kpa = row[map_col]
-
-                if pd.isna(rpm) or pd.isna(afr) or pd.isna(map_kpa):
-                    continue
-
-                rpm_idx = nearest_bin(rpm, self.rpm_axis)
-                map_idx = nearest_bin(map_kpa, self.map_axis)
-
-                hit_matrix[rpm_idx, map_idx] += 1
-                afr_sum[rpm_idx, map_idx] += afr
-
-            # Calculate mean AFR and error per cell
-            for i in range(n_rpm):
-                for j in range(n_map):
-                    if hit_matrix[i, j] >= self.MIN_HITS_PER_ZONE:
-                        mean_afr = afr_sum[i, j] / hit_matrix[i, j]
-                        target_afr = self.get_target_afr(self.map_axis[j])
-
-                        # AFR error in points (positive = lean, negative = rich)
-                        afr_error = mean_afr - target_afr
-                        afr_error_matrix[i, j] = afr_error
-
-                        # VE correction using versioned math module
-                        # v2.0.0 (default): Ratio model - VE_correction = AFR_measured / AFR_target
-                        # v1.0.0 (legacy): Linear model - VE_correction = 1 + (AFR_error * 7%)
-                        # Lean (+error) -> need more fuel -> INCREASE VE -> positive VE delta %
-                        # Rich (-error) -> need less fuel -> DECREASE VE -> negative VE delta %
-                        ve_correction = calculate_ve_correction(
-                            mean_afr, target_afr, version=self.math_version, clamp=False
-                        )
-                        ve_delta_pct = correction_to_percentage(ve_correction)
-                        ve_delta_matrix[i, j] = ve_delta_pct
+            # bincount sums in sample order, like the per-row accumulation
+            hit_matrix = np.bincount(cell, minlength=n_rpm * n_map).reshape(n_rpm, n_map)
+            afr_sum = np.bincount(
+                cell, weights=afr, minlength=n_rpm * n_map
+            ).reshape(n_rpm, n_map)
+            
+            with np.errstate(divide="ignore", invalid="ignore"):
+                mean_afr_matrix = afr_sum / hit_matrix
+
+        afr_error_matrix, ve_delta_matrix = self._zone_corrections(
+            mean_afr_matrix, hit_matrix >= self.MIN_HITS_PER_ZONE
+        )
 
         # Create DataFrames with labeled axes
         error_df = pd.DataFrame(
@@ -11,7 +11,7 @@ Provides:
 import logging
 import os
 from contextlib import contextmanager
-from typing import Generator
+from typing import Generator, Optional
 
 from sqlalchemy import create_engine, event
 from sqlalchemy.engine import Engine
@@ -47,14 +47,20 @@ def is_sqlite(url: str) -> bool:
 # =============================================================================
 
 
-def create_db_engine() -> Engine:
+def create_db_engine(url: Optional[str] = None) -> Engine:
     """
     Create SQLAlchemy engine with appropriate settings.
 
+    File-backed SQLite databases are switched to WAL journaling so readers
+    (e.g. the run history page) don't block on concurrent run updates.
+
+    Args:
+        url: Database URL (default: get_database_url())
+
     Returns:
         Configured SQLAlchemy engine
     """
-    url = get_database_url()
+    url = url or get_database_url()
 
     # SQLite-specific settings
     if is_sqlite(url):
@@ -65,11 +71,14 @@ def create_db_engine() -> Engine:
             echo=False,  # Set to True for SQL debug logging
         )
 
-        # Enable foreign keys for SQLite
+        # Enable foreign keys and WAL journaling for SQLite
+        # (journal_mode is a no-op for in-memory databases)
         @event.listens_for(engine, "connect")
         def set_sqlite_pragma(dbapi_conn, connection_record):
             cursor = dbapi_conn.cursor()
             cursor.execute("PRAGMA foreign_keys=ON")
+            cursor.execute("PRAGMA journal_mode=WAL")
+            cursor.execute("PRAGMA synchronous=NORMAL")
             cursor.close()
 
         logger.info(f"Database initialized: SQLite ({url})")
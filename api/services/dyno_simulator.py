@@ -238,6 +238,10 @@ class SimulatorConfig:
     # Coastdown / engine braking
     engine_brake_coefficient: float = DEFAULT_ENGINE_BRAKE_COEFFICIENT
 
+    # Noise RNG seed (None = nondeterministic). With a seed, stepped runs
+    # (see DynoSimulator.start_stepped) are reproducible.
+    seed: int | None = None
+
 
 @dataclass
 class PhysicsState:
@@ -435,6 +439,12 @@ class DynoSimulator:
     - Can simulate ECU fuel delivery based on VE tables
     - Creates realistic AFR errors when VE tables are wrong
     - Enables closed-loop tuning simulation
+
+    Modes:
+    - Real-time: ``start()`` runs a background thread at ``update_rate_hz``
+    - Stepped: ``start_stepped()`` advances a simulated clock only when
+      ``step()``/``run_pull()`` is called, with no sleeping or wall-clock
+      reads, so a pull runs as fast as the CPU allows
     """
 
     def __init__(self, config: SimulatorConfig | None = None, virtual_ecu=None):
@@ -446,6 +456,11 @@ class DynoSimulator:
         # Virtual ECU for simulating fuel delivery (optional)
         self.virtual_ecu = virtual_ecu
 
+        # Noise source and clock (simulated clock is None in real-time mode)
+        self._rng = random.Random(self.config.seed)
+        self._sim_time: float | None = None
+        self._last_auto_pull: float = 0.0
+
         # Pull state
         self._pull_start_time: float = 0.0
         self._pull_progress: float = 0.0  # 0.0 to 1.0
@@ -497,6 +512,12 @@ class DynoSimulator:
         self.physics.engine_temp_f = profile.optimal_temp_f
         self.physics.iat_f = self.config.ambient_temp_f + 10  # Slightly warmer
 
+    def _now(self) -> float:
+        """Current time: the simulated clock in stepped mode, else wall clock."""
+        if self._sim_time is not None:
+            return self._sim_time
+        return time.time()
+
     def _rpm_to_rad_s(self, rpm: float) -> float:
         """Convert RPM to radians per second."""
         return rpm * 2.0 * math.pi / 60.0
@@ -726,14 +747,18 @@ class DynoSimulator:
         - Reduced when too cold (poor atomization, rich mixture)
         - Reduced when too hot (detonation risk, timing retard, density loss)
         """
+        return self._thermal_correction_at(self.physics.engine_temp_f)
+
+    def _thermal_correction_at(self, engine_temp_f: float) -> float:
+        """Thermal power correction factor at the given engine temperature."""
         if not self.config.enable_thermal_effects:
             return 1.0
 
         profile = self.config.profile
-        temp_diff = abs(self.physics.engine_temp_f - profile.optimal_temp_f)
+        temp_diff = abs(engine_temp_f - profile.optimal_temp_f)
 
         # Power loss increases with temperature deviation
-        if self.physics.engine_temp_f < profile.optimal_temp_f:
+        if engine_temp_f < profile.optimal_temp_f:
             # Cold: 1% loss per 10°F below optimal
             return 1.0 - (temp_diff / 10.0 * 0.01)
         else:
@@ -750,6 +775,10 @@ class DynoSimulator:
 
         Includes humidity correction as water vapor displaces oxygen.
         """
+        return self._air_density_correction_at(self.physics.iat_f)
+
+    def _air_density_correction_at(self, iat_f: float) -> float:
+        """Air density correction factor at the given intake air temperature."""
         if not self.config.enable_air_density_correction:
             return 1.0
 
@@ -758,8 +787,8 @@ class DynoSimulator:
         std_pressure = 29.92
 
         # Current conditions
-        temp_r = self.physics.iat_f + 459.67
-        temp_f = self.physics.iat_f
+        temp_r = iat_f + 459.67
+        temp_f = iat_f
         pressure = self.config.barometric_pressure_inhg
         humidity = self.config.humidity_pct
 
@@ -937,30 +966,34 @@ class DynoSimulator:
         if not self.config.enable_thermal_effects:
             return
 
+        self.physics.engine_temp_f, self.physics.iat_f = self._thermal_step(
+            self.physics.engine_temp_f, self.physics.iat_f, dt, power_hp
+        )
+
+    def _thermal_step(
+        self, engine_temp_f: float, iat_f: float, dt: float, power_hp: float
+    ) -> tuple[float, float]:
+        """Advance (engine temp, IAT) by one timestep. Returns the new pair."""
         profile = self.config.profile
+        ambient = self.config.ambient_temp_f
 
         # Heat generation proportional to power
-        heat_rate = power_hp * self.config.profile.heat_rate * dt
+        heat_rate = power_hp * profile.heat_rate * dt
 
         # Cooling (radiator, oil, etc.)
-        cooling_rate = (
-            (self.physics.engine_temp_f - self.config.ambient_temp_f) * 0.02 * dt
-        )
+        cooling_rate = (engine_temp_f - ambient) * 0.02 * dt
 
         # Update temperature
-        self.physics.engine_temp_f += heat_rate - cooling_rate
+        engine_temp_f += heat_rate - cooling_rate
 
         # Clamp to reasonable range
-        self.physics.engine_temp_f = max(
-            self.config.ambient_temp_f + 20, min(250, self.physics.engine_temp_f)
-        )
+        engine_temp_f = max(ambient + 20, min(250, engine_temp_f))
 
         # IAT follows engine temp but lags
-        iat_target = (
-            self.config.ambient_temp_f
-            + (self.physics.engine_temp_f - profile.optimal_temp_f) * 0.3
-        )
-        self.physics.iat_f += (iat_target - self.physics.iat_f) * 0.1 * dt
+        iat_target = ambient + (engine_temp_f - profile.optimal_temp_f) * 0.3
+        iat_f += (iat_target - iat_f) * 0.1 * dt
+
+        return engine_temp_f, iat_f
 
     def _update_physics(
         self, dt: float, afr: float = 0.0
@@ -1092,7 +1125,7 @@ class DynoSimulator:
             # No ECU simulation - return perfect target AFR
             target_afr = self._get_target_afr(rpm, tps)
             # Add small sensor noise for realism
-            afr_with_noise = target_afr + random.gauss(0, 0.05)
+            afr_with_noise = target_afr + self._rng.gauss(0, 0.05)
             # Clamp to sensor range
             return max(10.0, min(20.0, afr_with_noise))
 
@@ -1106,14 +1139,349 @@ class DynoSimulator:
         )
 
         # Add realistic sensor noise (±0.05 AFR typical for wideband)
-        afr_with_noise = resulting_afr + random.gauss(0, 0.05)
+        afr_with_noise = resulting_afr + self._rng.gauss(0, 0.05)
 
         # Clamp to sensor range
         return max(10.0, min(20.0, afr_with_noise))
 
+    # =========================================================================
+    # Batch (whole-pull) simulation
+    # =========================================================================
+
+    def _volumetric_efficiency_array(
+        self, rpm: np.ndarray, tps: np.ndarray
+    ) -> np.ndarray:
+        """Array version of ``_get_volumetric_efficiency``."""
+        profile = self.config.profile
+        ve_peak = float(profile.volumetric_efficiency_peak)
+        idle = float(profile.idle_rpm)
+        tq_peak = float(profile.tq_peak_rpm) if profile.tq_peak_rpm > 0 else idle * 2.5
+        hp_peak = (
+            float(profile.hp_peak_rpm)
+            if profile.hp_peak_rpm > 0
+            else max(tq_peak + 500.0, idle * 4.0)
+        )
+        redline = (
+            float(profile.redline_rpm) if profile.redline_rpm > 0 else hp_peak + 500.0
+        )
+
+        rpm_f = np.clip(np.asarray(rpm, dtype=float), idle * 0.5, redline * 1.05)
+        tps = np.asarray(tps, dtype=float)
+
+        def smoothstep(x):
+            x = np.clip(x, 0.0, 1.0)
+            return x * x * (3.0 - 2.0 * x)
+
+        # WOT: ramp to peak by tq_peak, hold until hp_peak, then taper
+        ve_low = ve_peak * 0.88
+        ve_high = ve_peak * 0.86
+        ramp = ve_low + (ve_peak - ve_low) * smoothstep(
+            (rpm_f - idle) / max(1.0, tq_peak - idle)
+        )
+        taper = ve_peak + (ve_high - ve_peak) * smoothstep(
+            (rpm_f - hp_peak) / max(1.0, redline - hp_peak)
+        )
+        wot_ve = np.where(
+            rpm_f <= tq_peak, ramp, np.where(rpm_f <= hp_peak, ve_peak, taper)
+        )
+
+        # Part throttle: RPM-shaped VE with low/high RPM penalties
+        rpm_ratio = rpm_f / tq_peak if tq_peak > 0 else np.ones_like(rpm_f)
+        part_ve = ve_peak * np.exp(-0.5 * ((rpm_ratio - 1.0) / 0.45) ** 2)
+        if idle > 0:
+            low = rpm_f < idle * 1.5
+            part_ve = np.where(
+                low, part_ve * (0.6 + 0.4 * rpm_f / (idle * 1.5)), part_ve
+            )
+        if redline - hp_peak > 0:
+            high_factor = np.maximum(0.0, (redline - rpm_f) / (redline - hp_peak))
+            part_ve = np.where(
+                rpm_f > hp_peak, part_ve * (0.75 + 0.25 * high_factor), part_ve
+            )
+
+        rpm_ve = np.where(tps >= 80.0, wot_ve, part_ve)
+        throttle_ve = 0.05 + 0.95 * (tps / 100.0)
+        return np.clip(rpm_ve * throttle_ve, 0.0, 1.0)
+
+    def _pumping_losses_array(self, rpm: np.ndarray, tps: np.ndarray) -> np.ndarray:
+        """Array version of ``_get_pumping_losses``."""
+        rpm = np.asarray(rpm, dtype=float)
+        tps = np.asarray(tps, dtype=float)
+        if not self.config.enable_pumping_losses:
+            return np.zeros(np.broadcast(rpm, tps).shape)
+
+        profile = self.config.profile
+        vacuum_loss = (100 - tps) / 100.0 * 0.40 + np.where(tps < 5.0, 0.15, 0.0)
+        if profile.redline_rpm > 0:
+            rpm_ratio = rpm / profile.redline_rpm
+        else:
+            rpm_ratio = np.full_like(rpm, 0.5)
+        return np.minimum(1.0, vacuum_loss + rpm_ratio * 0.15)
+
+    def _target_afr_array(self, rpm: np.ndarray, tps: np.ndarray) -> np.ndarray:
+        """Array version of ``_get_target_afr``."""
+        profile = self.config.profile
+        rpm = np.asarray(rpm, dtype=float)
+        tps = np.asarray(tps, dtype=float)
+        part = profile.target_afr_idle + (tps - 20) / 30.0 * (
+            profile.target_afr_wot - profile.target_afr_idle
+        )
+        rpm_factor = (rpm - profile.idle_rpm) / (
+            profile.redline_rpm - profile.idle_rpm
+        )
+        wot = profile.target_afr_wot - rpm_factor * 0.5
+        return np.where(
+            tps < 20, profile.target_afr_idle, np.where(tps < 50, part, wot)
+        )
+
+    def _integrate_pull(
+        self, max_steps: int, knock_steps: np.ndarray | None = None
+    ) -> dict[str, np.ndarray]:
+        """
+        Integrate the WOT pull trajectory from idle to redline.
+
+        This is the only sequential part of a batch pull. The throttle- and
+        RPM-dependent torque factors (base torque, VE, pumping losses,
+        mechanical efficiency) are tabulated once on the precomputed (uniform)
+        RPM curve grid, so each WOT step is a table interpolation plus scalar
+        updates.
+
+        Args:
+            max_steps: Step budget
+            knock_steps: Per-step knock flags (timing retard applied)
+
+        Returns:
+            Per-step state arrays (RPM before/after the step, TPS, torque,
+            net angular acceleration, temperatures)
+        """
+        config = self.config
+        profile = config.profile
+        dt = 1.0 / config.update_rate_hz
+        grid = self._rpm_curve
+        wot_table = (
+            self._base_torque_curve
+            * self._volumetric_efficiency_array(grid, 100.0)
+            * (1.0 - self._pumping_losses_array(grid, 100.0))
+            * profile.mechanical_efficiency
+        )
+        wot_list = wot_table.tolist()
+        grid_start = float(grid[0])
+        grid_step = float(grid[1] - grid[0])
+        grid_last = len(wot_list) - 1
+        accel_per_torque = (
+            float(config.torque_to_angular_accel_scale)
+            / float(self.physics.total_inertia)
+            * dt
+        )
+        min_rpm = profile.idle_rpm * 0.5
+        max_rpm = profile.redline_rpm * 1.05
+        end_rpm = profile.redline_rpm * 0.98
+        rad_per_rpm = 2.0 * math.pi / 60.0
+        tps_step = config.throttle_response_rate * dt
+        thermal = config.enable_thermal_effects
+        knock_factor = 1.0 - (KNOCK_TIMING_RETARD_DEG * 0.01)
+
+        rpm = float(profile.idle_rpm)
+        tps = 0.0
+        engine_temp = float(profile.optimal_temp_f)
+        iat = config.ambient_temp_f + 10
+        env_factor = self._thermal_correction_at(
+            engine_temp
+        ) * self._air_density_correction_at(iat)
+        knock = knock_steps.tolist() if knock_steps is not None else []
+        rows = []
+
+        while len(rows) < max_steps:
+            tps = tps + tps_step if tps + tps_step < 100.0 else 100.0
+            if tps == 100.0:
+                # Linear interpolation on the uniform grid, clamped at the ends
+                pos = (rpm - grid_start) / grid_step
+                i = int(pos)
+                i = 0 if i < 0 else grid_last - 1 if i >= grid_last else i
+                frac = pos - i
+                frac = 0.0 if frac < 0.0 else 1.0 if frac > 1.0 else frac
+                torque = wot_list[i] + (wot_list[i + 1] - wot_list[i]) * frac
+            else:
+                torque = float(
+                    self._get_base_torque_at_rpm(rpm)
+                    * self._volumetric_efficiency_array(rpm, tps)
+                    * (1.0 - self._pumping_losses_array(rpm, tps))
+                    * profile.mechanical_efficiency
+                )
+            torque *= env_factor
+            if len(rows) < len(knock) and knock[len(rows)]:
+                torque *= knock_factor
+            if torque < 0.0:
+                torque = 0.0
+
+            omega = rpm * rad_per_rpm + torque * accel_per_torque
+            drag = 1.0 - (DRAG_COEFFICIENT * rpm / 1000.0) * dt
+            new_rpm = omega * (drag if drag > 0.0 else 0.0) / rad_per_rpm
+            new_rpm = min_rpm if new_rpm < min_rpm else max_rpm if new_rpm > max_rpm else new_rpm
+
+            if thermal:
+                engine_temp, iat = self._thermal_step(
+                    engine_temp, iat, dt, torque * new_rpm / 5252.0
+                )
+                env_factor = self._thermal_correction_at(
+                    engine_temp
+                ) * self._air_density_correction_at(iat)
+
+            rows.append((rpm, new_rpm, tps, torque, engine_temp, iat))
+            rpm = new_rpm
+            if rpm >= end_rpm:
+                break
+
+        table = np.array(rows, dtype=float).reshape(-1, 6)
+        state = dict(
+            zip(("rpm_pre", "rpm", "tps", "torque", "engine_temp", "iat"), table.T)
+        )
+        state["alpha_net"] = (state["rpm"] - state["rpm_pre"]) * rad_per_rpm / dt
+        return state
+
+    def simulate_pull_arrays(
+        self,
+        seed: int | None = None,
+        max_duration_sec: float = 600.0,
+    ) -> dict[str, np.ndarray]:
+        """
+        Simulate one complete WOT pull and return its channel trace as arrays.
+
+        Runs the same physics as a stepped pull from idle, but computes every
+        channel (VE, MAP, AFR, knock, noise) vectorized over the whole RPM
+        trajectory instead of per tick. Virtual ECU AFRs come from one batch
+        table lookup per cylinder. Knock is evaluated on a first pass of the
+        trajectory and, if it occurs, the pull is integrated again with the
+        timing retard applied. Results are statistically equivalent to
+        ``run_pull()`` but not sample-identical (noise is drawn differently).
+        The simulator's own state is not modified.
+
+        Args:
+            seed: Noise seed (default: config.seed)
+            max_duration_sec: Simulated seconds before giving up
+
+        Returns:
+            Column name -> array, with the same columns as ``get_pull_data()``
+
+        Raises:
+            TimeoutError: If redline is not reached within max_duration_sec
+        """
+        config = self.config
+        profile = config.profile
+        dt = 1.0 / config.update_rate_hz
+        rng = np.random.default_rng(config.seed if seed is None else seed)
+        max_steps = int(max_duration_sec * config.update_rate_hz)
+
+        state = self._integrate_pull(max_steps)
+        channels = self._pull_channels(state, rng)
+        if channels["Knock"].any():
+            state = self._integrate_pull(max_steps, channels["Knock"].astype(bool))
+            channels = self._pull_channels(state, rng)
+
+        if len(state["rpm"]) == 0 or state["rpm"][-1] < profile.redline_rpm * 0.98:
+            raise TimeoutError(
+                f"Pull did not reach redline within {max_duration_sec:.0f} "
+                "simulated seconds"
+            )
+        channels["timestamp"] = np.arange(len(state["rpm"])) * dt
+        return channels
+
+    def _pull_channels(
+        self, state: dict[str, np.ndarray], rng: np.random.Generator
+    ) -> dict[str, np.ndarray]:
+        """Vectorized channel computation over an integrated pull trajectory."""
+        config = self.config
+        profile = config.profile
+        rpm_pre = state["rpm_pre"]
+        rpm = state["rpm"]
+        tps = state["tps"]
+        torque = state["torque"]
+        n = len(rpm)
+
+        def noise(values, noise_pct):
+            return values + rng.normal(0.0, 1.0, n) * np.abs(values) * noise_pct / 100.0
+
+        scale = float(config.torque_to_angular_accel_scale) or 1.0
+        dyno_torque = float(self.physics.total_inertia) * state["alpha_net"] / scale
+        dyno_hp = dyno_torque * rpm / 5252.0
+
+        drum_radius_ft = get_config().dyno.drum1.radius_ft
+        if drum_radius_ft > 0:
+            force = dyno_torque / drum_radius_ft
+        else:
+            force = dyno_torque * 2.5
+
+        ve = self._volumetric_efficiency_array(rpm_pre, tps)
+        rpm_norm = (rpm - profile.idle_rpm) / max(
+            1.0, (profile.redline_rpm - profile.idle_rpm)
+        )
+        map_target = (
+            (30.0 + (tps / 100.0) * 70.0)
+            * (0.92 + 0.08 * np.clip(ve, 0.0, 1.0))
+            * (1.0 - 0.03 * np.clip(rpm_norm, 0.0, 1.0))
+        )
+        map_kpa = noise(map_target, 2)
+
+        target_afr = self._target_afr_array(rpm_pre, tps)
+        if self.virtual_ecu is not None:
+            afr_front = np.clip(
+                self.virtual_ecu.calculate_resulting_afr_array(
+                    rpm_pre, map_kpa, ve, cylinder="front"
+                )
+                + rng.normal(0.0, 0.05, n),
+                10.0,
+                20.0,
+            )
+            afr_rear = np.clip(
+                self.virtual_ecu.calculate_resulting_afr_array(
+                    rpm, map_kpa, ve, cylinder="rear"
+                )
+                + rng.normal(0.0, 0.05, n),
+                10.0,
+                20.0,
+            )
+            knock_afr = afr_front
+        else:
+            # Lean spots in mid-range, rich at top (typical before tune)
+            rpm_range = profile.redline_rpm - profile.idle_rpm
+            rpm_pct = (rpm_pre - profile.idle_rpm) / rpm_range if rpm_range > 0 else 0.5
+            afr_error = np.where(
+                (rpm_pct > 0.3) & (rpm_pct < 0.5),
+                0.3,
+                np.where(rpm_pct > 0.7, -0.4, 0.0),
+            )
+            current_afr = target_afr + afr_error
+            afr_front = current_afr + rng.normal(0.0, config.afr_noise, n)
+            afr_rear = (current_afr + 0.1) + rng.normal(
+                0.0, config.afr_noise, n
+            ) * (current_afr + 0.1) / current_afr
+            knock_afr = current_afr
+
+        # Knock: lean at high load, or very hot intake air
+        knock = (
+            (tps > 80) & (knock_afr - target_afr > KNOCK_AFR_LEAN_THRESHOLD + 1.0)
+        ) | (state["iat"] > KNOCK_IAT_THRESHOLD_F + 20)
+
+        return {
+            "Engine RPM": rpm,
+            "Torque": dyno_torque,
+            "Horsepower": dyno_hp,
+            "Force": force,
+            "AFR Meas F": afr_front,
+            "AFR Meas R": afr_rear,
+            "AFR Target": target_afr,
+            "MAP kPa": map_kpa,
+            "TPS": tps,
+            "IAT F": state["iat"],
+            "Knock": knock.astype(int),
+            "Engine Torque": torque,
+            "Engine HP": torque * rpm / 5252.0,
+            "Alpha Net": state["alpha_net"],
+        }
+
     def _add_noise(self, value: float, noise_pct: float) -> float:
         """Add gaussian noise to a value."""
-        noise = random.gauss(0, value * noise_pct / 100.0)
+        noise = self._rng.gauss(0, value * noise_pct / 100.0)
         return value + noise
 
     def start(self):
@@ -1126,9 +1494,70 @@ class DynoSimulator:
             self.state = SimState.IDLE
             self._init_physics()
 
+            self._sim_time = None
             self._thread = threading.Thread(target=self._run_loop, daemon=True)
             self._thread.start()
 
+    def start_stepped(self):
+        """
+        Start the simulator in stepped (headless) mode.
+
+        No thread is started; the simulated clock starts at 0 and only
+        advances by ``1 / update_rate_hz`` per ``step()``.
+        """
+        with self._lock:
+            if self.state != SimState.STOPPED:
+                return
+
+            self._stop_event.clear()
+            self.state = SimState.IDLE
+            self._init_physics()
+            self._sim_time = 0.0
+            self._last_auto_pull = 0.0
+
+    def step(self, steps: int = 1):
+        """
+        Advance a stepped simulator by ``steps`` updates.
+
+        Raises:
+            RuntimeError: If the simulator was not started with start_stepped()
+        """
+        if self._sim_time is None:
+            raise RuntimeError("step() requires a simulator started with start_stepped()")
+        dt = 1.0 / self.config.update_rate_hz
+        for _ in range(steps):
+            with self._lock:
+                self._step(dt, self.config.profile)
+                self._sim_time += dt
+
+    def run_pull(self, timeout_sec: float = 60.0) -> list[dict[str, float]]:
+        """
+        Run one complete pull (WOT, decel, cooldown) on a stepped simulator.
+
+        Args:
+            timeout_sec: Maximum simulated seconds before giving up
+
+        Returns:
+            Pull data points, as from get_pull_data()
+
+        Raises:
+            TimeoutError: If the simulator is not back at idle in time
+        """
+        if self._sim_time is None:
+            raise RuntimeError(
+                "run_pull() requires a simulator started with start_stepped()"
+            )
+        self.trigger_pull()
+        max_steps = int(timeout_sec * self.config.update_rate_hz)
+        for _ in range(max_steps):
+            self.step()
+            if self.state == SimState.IDLE:
+                return self.get_pull_data()
+        raise TimeoutError(
+            f"Pull did not complete within {timeout_sec:.0f} simulated seconds "
+            f"(state: {self.state.value})"
+        )
+
     def stop(self):
         """Stop the simulator."""
         self._stop_event.set()
@@ -1138,13 +1567,14 @@ class DynoSimulator:
         with self._lock:
             self.state = SimState.STOPPED
             self.channels = SimulatedChannels()
+            self._sim_time = None
 
     def trigger_pull(self):
         """Manually trigger a WOT pull."""
         with self._lock:
             if self.state == SimState.IDLE:
                 self.state = SimState.PULL
-                self._pull_start_time = time.time()
+                self._pull_start_time = self._now()
                 self._pull_progress = 0.0
                 self._pull_data = []
                 self._physics_snapshots = []
@@ -1188,7 +1618,7 @@ class DynoSimulator:
     ) -> PhysicsSnapshot:
         """Create a physics snapshot from current state."""
         return PhysicsSnapshot(
-            timestamp=time.time(),
+            timestamp=self._now(),
             rpm=self.physics.rpm,
             angular_velocity=self.physics.angular_velocity,
             angular_acceleration=self.physics.angular_acceleration,
@@ -1260,15 +1690,15 @@ class DynoSimulator:
             self.physics.rpm = self._rad_s_to_rpm(self.physics.angular_velocity)
 
         # Add idle oscillation
-        rpm_noise = random.gauss(0, 15)
+        rpm_noise = self._rng.gauss(0, 15)
 
         self.channels.rpm = self.physics.rpm + rpm_noise
         self.channels.tps_pct = self.physics.tps_actual
-        self.channels.map_kpa = 30 + random.gauss(0, 2)
+        self.channels.map_kpa = 30 + self._rng.gauss(0, 2)
         self.channels.torque_ftlb = 0.0  # No load at idle
         self.channels.horsepower = 0.0
-        self.channels.force_lbs = random.gauss(0, 2)
-        self.channels.acceleration_g = random.gauss(0, 0.01)
+        self.channels.force_lbs = self._rng.gauss(0, 2)
+        self.channels.acceleration_g = self._rng.gauss(0, 0.01)
 
         # Idle AFR (lean)
         target_afr = profile.target_afr_idle
@@ -1276,12 +1706,12 @@ class DynoSimulator:
         self.channels.afr_rear = self._add_noise(target_afr, 1.5)
 
         self.channels.iat_f = self.physics.iat_f
-        self.channels.vbatt = 13.6 + random.gauss(0, 0.1)
+        self.channels.vbatt = 13.6 + self._rng.gauss(0, 0.1)
 
     def _handle_pull_state(self, dt: float, profile: EngineProfile):
         """Handle PULL state behavior."""
         # WOT acceleration - physics-based
-        elapsed = time.time() - self._pull_start_time
+        elapsed = self._now() - self._pull_start_time
         self._pull_elapsed_s += dt
 
         # Update throttle (realistic lag)
@@ -1297,7 +1727,7 @@ class DynoSimulator:
             and self.physics.rpm > profile.idle_rpm * 1.5
         ):
             self.state = SimState.DECEL
-            self._pull_start_time = time.time()
+            self._pull_start_time = self._now()
             self.physics.tps_target = 0.0
             self.physics.tps_actual = 0.0
             if self._on_state_change:
@@ -1406,7 +1836,7 @@ class DynoSimulator:
                 self.physics.rpm, self.channels.map_kpa, actual_ve_rear, cylinder="rear"
             )
             # Add realistic sensor noise and clamp to sensor range
-            afr_rear_with_noise = afr_rear + random.gauss(0, 0.05)
+            afr_rear_with_noise = afr_rear + self._rng.gauss(0, 0.05)
             self.channels.afr_rear = max(10.0, min(20.0, afr_rear_with_noise))
         else:
             # Default mode: Add noise to current AFR
@@ -1420,7 +1850,7 @@ class DynoSimulator:
             self.channels.afr_rear = self._add_noise(current_afr + 0.1, noise_pct)
 
         self.channels.iat_f = self.physics.iat_f
-        self.channels.vbatt = 14.0 + random.gauss(0, 0.1)
+        self.channels.vbatt = 14.0 + self._rng.gauss(0, 0.1)
 
         # Collect pull data
         self._pull_data.append(
@@ -1436,7 +1866,7 @@ class DynoSimulator:
                 "MAP kPa": self.channels.map_kpa,
                 "TPS": self.physics.tps_actual,
                 "IAT F": self.physics.iat_f,
-                "timestamp": time.time(),
+                "timestamp": self._now(),
                 "Knock": 1 if self.physics.knock_detected else 0,
                 # Extra debug/telemetry fields (safe to ignore downstream)
                 "Engine Torque": engine_torque,
@@ -1462,7 +1892,7 @@ class DynoSimulator:
             self.physics.angular_velocity = self._rpm_to_rad_s(self.physics.rpm)
 
             self.state = SimState.DECEL
-            self._pull_start_time = time.time()
+            self._pull_start_time = self._now()
             self.physics.tps_target = 0.0  # Close throttle
             self.physics.tps_actual = 0.0  # Force immediate closure for safety
 
@@ -1472,7 +1902,7 @@ class DynoSimulator:
     def _handle_decel_state(self, dt: float, profile: EngineProfile):
         """Handle DECEL state behavior."""
         # Deceleration back to idle
-        elapsed = time.time() - self._pull_start_time
+        elapsed = self._now() - self._pull_start_time
 
         # Close throttle immediately (no lag during decel for safety)
         self.physics.tps_target = 0.0
@@ -1537,13 +1967,13 @@ class DynoSimulator:
             self.channels.afr_rear = self._add_noise(14.7, 2)
 
         self.channels.iat_f = self.physics.iat_f
-        self.channels.vbatt = 13.8 + random.gauss(0, 0.1)
+        self.channels.vbatt = 13.8 + self._rng.gauss(0, 0.1)
 
         # Check if back to idle (allow more time for gradual decel)
         # Transition when RPM drops to 120% of idle (was 110%)
         if self.physics.rpm <= profile.idle_rpm * 1.2:
             self.state = SimState.COOLDOWN
-            self._pull_start_time = time.time()
+            self._pull_start_time = self._now()
 
             # Notify pull complete with data
             if self._on_pull_complete:
@@ -1557,7 +1987,7 @@ class DynoSimulator:
     ) -> float:
         """Handle COOLDOWN state behavior. Returns updated last_auto_pull time."""
         # Brief pause - idle behavior (similar to idle state to prevent throttle creep)
-        elapsed = time.time() - self._pull_start_time
+        elapsed = self._now() - self._pull_start_time
 
         # Use same idle control logic to prevent throttle creep
         rpm_error = self.physics.rpm - profile.idle_rpm
@@ -1573,21 +2003,21 @@ class DynoSimulator:
         self._update_throttle(dt)
         torque, hp, factors = self._update_physics(dt)
 
-        self.channels.rpm = self.physics.rpm + random.gauss(0, 20)
+        self.channels.rpm = self.physics.rpm + self._rng.gauss(0, 20)
         self.channels.tps_pct = self.physics.tps_actual
-        self.channels.map_kpa = 30 + random.gauss(0, 2)
+        self.channels.map_kpa = 30 + self._rng.gauss(0, 2)
         self.channels.torque_ftlb = 0.0
         self.channels.horsepower = 0.0
-        self.channels.force_lbs = random.gauss(0, 2)
-        self.channels.acceleration_g = random.gauss(0, 0.01)
+        self.channels.force_lbs = self._rng.gauss(0, 2)
+        self.channels.acceleration_g = self._rng.gauss(0, 0.01)
         self.channels.afr_front = self._add_noise(14.7, 1)
         self.channels.afr_rear = self._add_noise(14.7, 1)
         self.channels.iat_f = self.physics.iat_f
-        self.channels.vbatt = 13.6 + random.gauss(0, 0.1)
+        self.channels.vbatt = 13.6 + self._rng.gauss(0, 0.1)
 
         if elapsed >= 2.0:  # 2 second cooldown
             self.state = SimState.IDLE
-            new_last_auto_pull = time.time()
+            new_last_auto_pull = self._now()
 
             if self._on_state_change:
                 self._on_state_change(self.state)
@@ -1596,45 +2026,46 @@ class DynoSimulator:
 
         return last_auto_pull
 
+    def _step(self, dt: float, profile: EngineProfile):
+        """Run one update of the state machine. Called with the lock held."""
+        state = self.state
+
+        if state == SimState.IDLE:
+            self._handle_idle_state(dt, profile)
+
+            # Auto-pull check
+            if self.config.auto_pull:
+                if self._now() - self._last_auto_pull > self.config.auto_pull_interval_sec:
+                    self.state = SimState.PULL
+                    self._pull_start_time = self._now()
+                    self._pull_progress = 0.0
+                    self._pull_data = []
+                    self._physics_snapshots = []
+                    self.physics.tps_target = 100.0
+                    self._last_auto_pull = self._now()
+
+        elif state == SimState.PULL:
+            self._handle_pull_state(dt, profile)
+
+        elif state == SimState.DECEL:
+            self._handle_decel_state(dt, profile)
+
+        elif state == SimState.COOLDOWN:
+            self._last_auto_pull = self._handle_cooldown_state(
+                dt, profile, self._last_auto_pull
+            )
+
     def _run_loop(self):
-        """Main simulation loop - dispatches to state handlers."""
+        """Main simulation loop - steps the state machine in real time."""
         profile = self.config.profile
         dt = 1.0 / self.config.update_rate_hz
-        last_auto_pull = time.time()
+        self._last_auto_pull = time.time()
 
         while not self._stop_event.is_set():
             loop_start = time.time()
 
             with self._lock:
-                state = self.state
-
-                if state == SimState.IDLE:
-                    self._handle_idle_state(dt, profile)
-
-                    # Auto-pull check
-                    if self.config.auto_pull:
-                        if (
-                            time.time() - last_auto_pull
-                            > self.config.auto_pull_interval_sec
-                        ):
-                            self.state = SimState.PULL
-                            self._pull_start_time = time.time()
-                            self._pull_progress = 0.0
-                            self._pull_data = []
-                            self._physics_snapshots = []
-                            self.physics.tps_target = 100.0
-                            last_auto_pull = time.time()
-
-                elif state == SimState.PULL:
-                    self._handle_pull_state(dt, profile)
-
-                elif state == SimState.DECEL:
-                    self._handle_decel_state(dt, profile)
-
-                elif state == SimState.COOLDOWN:
-                    last_auto_pull = self._handle_cooldown_state(
-                        dt, profile, last_auto_pull
-                    )
+                self._step(dt, profile)
 
             # Sleep to maintain update rate
             elapsed = time.time() - loop_start
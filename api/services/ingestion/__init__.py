@@ -36,6 +36,15 @@ from .queue import (
     QueueItem,
     QueuePriority,
 )
+from .recording import (
+    RECORDING_COLUMNS,
+    RecordingSink,
+    read_recording,
+)
+from .ring_buffer import (
+    RecordRing,
+    ThreadLocalCounters,
+)
 from .schemas import (  # Base schemas; JetDrive schemas; Innovate schemas; Dyno data schemas; Validation results
     DataSample,
     DynoDataPointSchema,
@@ -76,6 +85,13 @@ __all__ = [
     "IngestionQueue",
     "QueueItem",
     "QueuePriority",
+    # Recording
+    "RECORDING_COLUMNS",
+    "RecordingSink",
+    "read_recording",
+    # Ring buffer
+    "RecordRing",
+    "ThreadLocalCounters",
     # Adapters
     "DataAdapter",
     "JetDriveAdapter",
@@ -24,6 +24,8 @@ from datetime import datetime
 from pathlib import Path
 from typing import Any, BinaryIO, Iterator, TextIO
 
+import numpy as np
+
 from .schemas import (
     DataSample,
     DynoDataPointSchema,
@@ -125,6 +127,7 @@ class JetDriveAdapter(DataAdapter):
     def __init__(self):
         self._channel_values: dict[str, float] = {}
         self._last_timestamp: int = 0
+        self._aggregator: StreamingWindowAggregator | None = None
 
     def can_handle(self, data: Any) -> bool:
         """Check if data is from JetDrive."""
@@ -177,75 +180,259 @@ class JetDriveAdapter(DataAdapter):
         self._channel_values.clear()
         self._last_timestamp = 0
 
+    def standard_name(self, channel_name: str) -> str:
+        """Map a JetDrive channel name to its standard data point name."""
+        return self.CHANNEL_MAP.get(channel_name, channel_name.lower())
+
+    @staticmethod
+    def make_point(
+        timestamp_ms: int, window_values: dict[str, float]
+    ) -> DynoDataPointSchema:
+        """Build a data point from the last value of each standard channel."""
+        return DynoDataPointSchema(
+            timestamp_ms=timestamp_ms,
+            rpm=window_values.get("rpm", 0),
+            horsepower=window_values.get("horsepower", 0),
+            torque=window_values.get("torque", 0),
+            afr=window_values.get("afr"),
+            afr_front=window_values.get("afr_front"),
+            afr_rear=window_values.get("afr_rear"),
+            map_kpa=window_values.get("map_kpa"),
+            tps=window_values.get("tps"),
+            iat=window_values.get("iat"),
+            force_lbs=window_values.get("force_lbs"),
+            acceleration=window_values.get("acceleration"),
+        )
+
     def aggregate_samples(
-        self, samples: list[Any], time_window_ms: int = 50
+        self,
+        samples: list[Any],
+        time_window_ms: int = 50,
+        reductions: dict[str, str] | None = None,
     ) -> list[DynoDataPointSchema]:
         """
         Aggregate multiple samples into data points.
 
         Groups samples by time window and creates one data point per window.
+        Samples are only sorted if they are not already in timestamp order.
+
+        Args:
+            samples: JetDrive samples (``timestamp_ms``, ``channel_name``, ``value``)
+            time_window_ms: Window length in milliseconds
+            reductions: Per standard channel reduction (default: last value)
         """
         if not samples:
             return []
 
-        # Sort by timestamp
-        sorted_samples = sorted(samples, key=lambda s: s.timestamp_ms)
+        timestamps = [s.timestamp_ms for s in samples]
+        if any(b < a for a, b in zip(timestamps, timestamps[1:])):
+            samples = sorted(samples, key=lambda s: s.timestamp_ms)
+
+        aggregator = self._aggregator
+        if reductions or aggregator is None or aggregator.window_ms != time_window_ms:
+            aggregator = StreamingWindowAggregator(time_window_ms, reductions)
+            if not reductions:
+                # Reuse the resolved channel slots across calls
+                self._aggregator = aggregator
+        aggregator.reset()
 
         results = []
-        window_start = sorted_samples[0].timestamp_ms
-        window_values: dict[str, float] = {}
-
-        for sample in sorted_samples:
-            if sample.timestamp_ms - window_start >= time_window_ms:
-                # Create data point for previous window
-                if window_values:
-                    results.append(
-                        DynoDataPointSchema(
-                            timestamp_ms=window_start,
-                            rpm=window_values.get("rpm", 0),
-                            horsepower=window_values.get("horsepower", 0),
-                            torque=window_values.get("torque", 0),
-                            afr=window_values.get("afr"),
-                            afr_front=window_values.get("afr_front"),
-                            afr_rear=window_values.get("afr_rear"),
-                            map_kpa=window_values.get("map_kpa"),
-                            tps=window_values.get("tps"),
-                            iat=window_values.get("iat"),
-                            force_lbs=window_values.get("force_lbs"),
-                            acceleration=window_values.get("acceleration"),
-                        )
-                    )
+        for sample in samples:
+            point = aggregator.add_sample(sample)
+            if point is not None:
+                results.append(point)
 
-                # Start new window
-                window_start = sample.timestamp_ms
-                window_values.clear()
+        # Don't forget the last window
+        point = aggregator.flush()
+        if point is not None:
+            results.append(point)
 
-            # Add to current window
-            standard_name = self.CHANNEL_MAP.get(
-                sample.channel_name, sample.channel_name.lower()
-            )
-            window_values[standard_name] = sample.value
+        return results
 
-        # Don't forget the last window
-        if window_values:
-            results.append(
-                DynoDataPointSchema(
-                    timestamp_ms=window_start,
-                    rpm=window_values.get("rpm", 0),
-                    horsepower=window_values.get("horsepower", 0),
-                    torque=window_values.get("torque", 0),
-                    afr=window_values.get("afr"),
-                    afr_front=window_values.get("afr_front"),
-                    afr_rear=window_values.get("afr_rear"),
-                    map_kpa=window_values.get("map_kpa"),
-                    tps=window_values.get("tps"),
-                    iat=window_values.get("iat"),
-                    force_lbs=window_values.get("force_lbs"),
-                    acceleration=window_values.get("acceleration"),
+
+class StreamingWindowAggregator:
+    """
+    Streaming time-window aggregator over fixed standard channel slots.
+
+    Channel names are resolved to a slot index once and cached; each sample
+    then updates that slot's running reduction. A window closes when a
+    sample arrives ``window_ms`` or more after the window's first sample,
+    so emitting a window costs O(channels) instead of a sort over its
+    samples. Input must be in timestamp order.
+    """
+
+    # Standard channels carried by DynoDataPointSchema, in slot order
+    SLOTS = (
+        "rpm",
+        "horsepower",
+        "torque",
+        "afr",
+        "afr_front",
+        "afr_rear",
+        "map_kpa",
+        "tps",
+        "iat",
+        "force_lbs",
+        "acceleration",
+    )
+    REDUCTIONS = ("last", "mean", "min", "max")
+
+    def __init__(
+        self,
+        window_ms: int = 50,
+        reductions: dict[str, str] | None = None,
+        channel_map: dict[str, str] | None = None,
+    ):
+        """
+        Args:
+            window_ms: Window length in milliseconds
+            reductions: Reduction per standard channel name, one of
+                ``REDUCTIONS`` (channels not listed use "last")
+            channel_map: JetDrive channel name to standard name mapping
+                (default: ``JetDriveAdapter.CHANNEL_MAP``)
+        """
+        self.window_ms = window_ms
+        self._channel_map = (
+            JetDriveAdapter.CHANNEL_MAP if channel_map is None else channel_map
+        )
+        self._slot_index = {name: i for i, name in enumerate(self.SLOTS)}
+        self._slot_by_channel: dict[str, int] = {}
+
+        n = len(self.SLOTS)
+        self._modes = [0] * n  # Index into REDUCTIONS
+        for name, reduction in (reductions or {}).items():
+            if name not in self._slot_index:
+                raise ValueError(f"Unknown channel for reduction: {name}")
+            if reduction not in self.REDUCTIONS:
+                raise ValueError(
+                    f"Unknown reduction {reduction!r} for {name}, "
+                    f"expected one of {self.REDUCTIONS}"
                 )
-            )
+            self._modes[self._slot_index[name]] = self.REDUCTIONS.index(reduction)
+        modes = np.array(self._modes)
+        self._mean_mask = modes == 1
+        self._min_mask = modes == 2
+        self._max_mask = modes == 3
+
+        self._acc = [0.0] * n
+        self._count = [0] * n
+        self._window_start: int | None = None
+
+    def slot_for(self, channel_name: str) -> int:
+        """Slot index for a JetDrive channel name, -1 if not a standard channel."""
+        slot = self._slot_by_channel.get(channel_name)
+        if slot is None:
+            standard = self._channel_map.get(channel_name, channel_name.lower())
+            slot = self._slot_index.get(standard, -1)
+            self._slot_by_channel[channel_name] = slot
+        return slot
+
+    def add(
+        self, timestamp_ms: int, slot: int, value: float
+    ) -> DynoDataPointSchema | None:
+        """
+        Add one sample by slot index.
 
-        return results
+        Returns:
+            The data point of the window this sample closed, if any
+        """
+        point = None
+        if self._window_start is None:
+            self._window_start = timestamp_ms
+        elif timestamp_ms - self._window_start >= self.window_ms:
+            point = self._emit()
+            self._window_start = timestamp_ms
+
+        if slot >= 0:
+            count = self._count[slot]
+            mode = self._modes[slot]
+            if count == 0 or mode == 0:
+                self._acc[slot] = value
+            elif mode == 1:
+                self._acc[slot] += value
+            elif mode == 2:
+                if value < self._acc[slot]:
+                    self._acc[slot] = value
+            elif value > self._acc[slot]:
+                self._acc[slot] = value
+            self._count[slot] = count + 1
+
+        return point
+
+    def add_sample(self, sample: Any) -> DynoDataPointSchema | None:
+        """Add one JetDrive sample (``timestamp_ms``, ``channel_name``, ``value``)."""
+        return self.add(
+            sample.timestamp_ms, self.slot_for(sample.channel_name), sample.value
+        )
+
+    def flush(self) -> DynoDataPointSchema | None:
+        """Emit the open window, if it has any samples."""
+        if self._window_start is None:
+            return None
+        point = self._emit()
+        self._window_start = None
+        return point
+
+    def reset(self) -> None:
+        """Discard the open window."""
+        self._acc = [0.0] * len(self.SLOTS)
+        self._count = [0] * len(self.SLOTS)
+        self._window_start = None
+
+    def _emit(self) -> DynoDataPointSchema:
+        window_values = {}
+        for slot, count in enumerate(self._count):
+            if count:
+                value = self._acc[slot]
+                window_values[self.SLOTS[slot]] = (
+                    value / count if self._modes[slot] == 1 else value
+                )
+        self._acc = [0.0] * len(self.SLOTS)
+        self._count = [0] * len(self.SLOTS)
+        return JetDriveAdapter.make_point(self._window_start, window_values)
+
+    def reduce(self, slots: np.ndarray, values: np.ndarray) -> dict[str, float]:
+        """
+        Reduce one whole window given as slot and value arrays.
+
+        Vectorized equivalent of feeding the window through ``add``, for
+        callers that already hold a window's samples in arrival order.
+
+        Returns:
+            Standard channel name -> reduced value, for channels present
+        """
+        mask = slots >= 0
+        if not mask.all():
+            slots = slots[mask]
+            values = values[mask]
+        count = len(slots)
+        if count == 0:
+            return {}
+
+        n = len(self.SLOTS)
+        counts = np.bincount(slots, minlength=n)
+        result = np.zeros(n)
+        # Last occurrence of each slot, in arrival order
+        unique_slots, first_from_end = np.unique(slots[::-1], return_index=True)
+        result[unique_slots] = values[count - 1 - first_from_end]
+        if self._mean_mask.any():
+            sums = np.bincount(slots, weights=values, minlength=n)
+            means = sums / np.maximum(counts, 1)
+            result[self._mean_mask] = means[self._mean_mask]
+        if self._min_mask.any():
+            mins = np.full(n, np.inf)
+            np.minimum.at(mins, slots, values)
+            result[self._min_mask] = mins[self._min_mask]
+        if self._max_mask.any():
+            maxs = np.full(n, -np.inf)
+            np.maximum.at(maxs, slots, values)
+            result[self._max_mask] = maxs[self._max_mask]
+
+        present = np.flatnonzero(counts)
+        return {
+            self.SLOTS[slot]: value
+            for slot, value in zip(present.tolist(), result[present].tolist())
+        }
 
 
 # =============================================================================
@@ -101,6 +101,9 @@ class QueueSettings:
     flush_interval_sec: float = 5.0
     persist_to_disk: bool = False
     persist_path: str = "data/ingestion_queue"
+    segment_max_bytes: int = 4 * 1024 * 1024
+    fsync_interval_sec: float = 1.0
+    max_segments: int = 8
     priority_enabled: bool = True
     drop_on_full: bool = True
     drop_oldest: bool = True
@@ -112,6 +115,9 @@ class QueueSettings:
             "flush_interval_sec": self.flush_interval_sec,
             "persist_to_disk": self.persist_to_disk,
             "persist_path": self.persist_path,
+            "segment_max_bytes": self.segment_max_bytes,
+            "fsync_interval_sec": self.fsync_interval_sec,
+            "max_segments": self.max_segments,
             "priority_enabled": self.priority_enabled,
             "drop_on_full": self.drop_on_full,
             "drop_oldest": self.drop_oldest,
@@ -125,6 +131,9 @@ class QueueSettings:
             flush_interval_sec=data.get("flush_interval_sec", 5.0),
             persist_to_disk=data.get("persist_to_disk", False),
             persist_path=data.get("persist_path", "data/ingestion_queue"),
+            segment_max_bytes=data.get("segment_max_bytes", 4 * 1024 * 1024),
+            fsync_interval_sec=data.get("fsync_interval_sec", 1.0),
+            max_segments=data.get("max_segments", 8),
             priority_enabled=data.get("priority_enabled", True),
             drop_on_full=data.get("drop_on_full", True),
             drop_oldest=data.get("drop_oldest", True),
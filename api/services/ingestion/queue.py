@@ -3,14 +3,15 @@ Ingestion Queue System
 
 Provides queue-based ingestion for offline resilience:
 - Priority-based queue with multiple levels
-- Disk persistence for crash recovery
-- Batch processing for efficiency
+- Disk persistence for crash recovery (append-only segment log)
+- Batch processing for efficiency (bulk drain, batch processors)
 - Backpressure handling
 - Dead letter queue for failed items
 """
 
 from __future__ import annotations
 
+import bisect
 import json
 import logging
 import os
@@ -25,9 +26,13 @@ from pathlib import Path
 from typing import Any, Callable
 
 from .config import QueueSettings
+from .segment_log import CHECKPOINT_NAME, SegmentLog
 
 logger = logging.getLogger(__name__)
 
+ItemProcessor = Callable[["QueueItem"], bool]
+BatchProcessor = Callable[[list["QueueItem"]], list[bool]]
+
 
 class QueuePriority(IntEnum):
     """Priority levels for queue items."""
@@ -91,6 +96,49 @@ class QueueItem:
         return self.retry_count < self.max_retries
 
 
+class LatencyHistogram:
+    """
+    Fixed-size latency histogram with log-spaced buckets.
+
+    Recording is O(log buckets) and memory does not grow with the number of
+    samples. Quantiles are reported as the upper bound of their bucket.
+    """
+
+    # Bucket upper bounds in ms: 0.01 ms .. ~84 s, doubling per bucket
+    BOUNDS_MS: tuple[float, ...] = tuple(0.01 * 2**i for i in range(24))
+
+    def __init__(self) -> None:
+        self._counts = [0] * (len(self.BOUNDS_MS) + 1)
+        self._total_ms = 0.0
+        self._count = 0
+
+    def record(self, latency_ms: float, count: int = 1) -> None:
+        """Record ``count`` samples of ``latency_ms``."""
+        self._counts[bisect.bisect_left(self.BOUNDS_MS, latency_ms)] += count
+        self._total_ms += latency_ms * count
+        self._count += count
+
+    @property
+    def count(self) -> int:
+        return self._count
+
+    @property
+    def mean_ms(self) -> float:
+        return self._total_ms / self._count if self._count else 0.0
+
+    def quantile_ms(self, q: float) -> float:
+        """Approximate ``q`` quantile (0..1) in ms."""
+        if not self._count:
+            return 0.0
+        rank = q * self._count
+        seen = 0
+        for i, bucket_count in enumerate(self._counts):
+            seen += bucket_count
+            if seen >= rank and bucket_count:
+                return self.BOUNDS_MS[min(i, len(self.BOUNDS_MS) - 1)]
+        return self.BOUNDS_MS[-1]
+
+
 @dataclass
 class QueueStats:
     """Statistics for the ingestion queue."""
@@ -103,6 +151,8 @@ class QueueStats:
     high_watermark: int = 0
     processing_rate_per_sec: float = 0.0
     average_latency_ms: float = 0.0
+    p50_latency_ms: float = 0.0
+    p99_latency_ms: float = 0.0
     last_process_time: float = 0.0
     items_by_priority: dict[int, int] = field(default_factory=dict)
 
@@ -116,6 +166,8 @@ class QueueStats:
             "high_watermark": self.high_watermark,
             "processing_rate_per_sec": round(self.processing_rate_per_sec, 2),
             "average_latency_ms": round(self.average_latency_ms, 2),
+            "p50_latency_ms": round(self.p50_latency_ms, 2),
+            "p99_latency_ms": round(self.p99_latency_ms, 2),
             "last_process_time": self.last_process_time,
             "items_by_priority": self.items_by_priority,
         }
@@ -143,13 +195,19 @@ class IngestionQueue:
         self._lock = threading.Lock()
         self._processing = False
         self._process_thread: threading.Thread | None = None
-        self._processor: Callable[[QueueItem], bool] | None = None
-        self._latency_samples: list[float] = []
+        self._processor: ItemProcessor | BatchProcessor | None = None
+        self._latency = LatencyHistogram()
 
         # Persistence
+        self._log: SegmentLog | None = None
         if self.settings.persist_to_disk:
             self._persist_path = Path(self.settings.persist_path)
-            self._persist_path.mkdir(parents=True, exist_ok=True)
+            self._log = SegmentLog(
+                self._persist_path,
+                segment_max_bytes=self.settings.segment_max_bytes,
+                fsync_interval_sec=self.settings.fsync_interval_sec,
+                max_segments=self.settings.max_segments,
+            )
             self._load_persisted()
 
     def enqueue(
@@ -182,6 +240,8 @@ class IngestionQueue:
                         try:
                             dropped = self._queue.get_nowait()
                             self._stats.total_dropped += 1
+                            if self._log is not None:
+                                self._log.ack([dropped.id])
                             logger.warning(
                                 f"Queue full, dropped oldest item: {dropped.id}"
                             )
@@ -209,7 +269,7 @@ class IngestionQueue:
                 )
 
                 # Persist if enabled
-                if self.settings.persist_to_disk:
+                if self._log is not None:
                     self._persist_item(item)
 
                 return item.id
@@ -249,9 +309,46 @@ class IngestionQueue:
             # Internal heap is a list
             return min(self._queue.queue)
 
+    def drain(
+        self,
+        max_items: int | None = None,
+        max_wait: float | None = None,
+    ) -> list[QueueItem]:
+        """
+        Remove and return up to ``max_items`` items in priority order.
+
+        All items are popped under a single acquisition of the queue lock.
+
+        Args:
+            max_items: Maximum items to return (default: settings.batch_size)
+            max_wait: Seconds to wait for the first item, None to not wait
+
+        Returns:
+            Drained items (empty if none arrived in time)
+        """
+        max_items = max_items or self.settings.batch_size
+        q = self._queue
+        with q.not_empty:
+            if max_wait:
+                deadline = time.monotonic() + max_wait
+                while not q.queue:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    q.not_empty.wait(remaining)
+            items = [q._get() for _ in range(min(max_items, len(q.queue)))]
+            if items:
+                q.not_full.notify(len(items))
+            size = len(q.queue)
+
+        if items:
+            with self._lock:
+                self._stats.current_size = size
+        return items
+
     def process_batch(
         self,
-        processor: Callable[[QueueItem], bool],
+        processor: ItemProcessor,
         batch_size: int | None = None,
     ) -> int:
         """
@@ -264,39 +361,87 @@ class IngestionQueue:
         Returns:
             Number of items successfully processed
         """
-        batch_size = batch_size or self.settings.batch_size
-        processed = 0
-        failed_items = []
+        items = self.drain(batch_size)
+        if not items:
+            return 0
+
+        results = []
+        errors: dict[int, str] = {}
+        for i, item in enumerate(items):
+            start_time = time.perf_counter()
+            try:
+                results.append(bool(processor(item)))
+            except Exception as e:
+                logger.error(f"Error processing item {item.id}: {e}")
+                errors[i] = str(e)
+                results.append(False)
+            self._latency.record((time.perf_counter() - start_time) * 1000)
 
-        for _ in range(batch_size):
-            item = self.dequeue()
-            if item is None:
-                break
+        return self._settle(items, results, errors)
 
-            start_time = time.time()
-            try:
-                success = processor(item)
+    def process_many(
+        self,
+        processor: BatchProcessor,
+        max_items: int | None = None,
+        max_wait: float | None = None,
+    ) -> int:
+        """
+        Drain up to ``max_items`` items and hand them to ``processor`` at once.
 
-                if success:
-                    processed += 1
-                    with self._lock:
-                        self._stats.total_processed += 1
+        The processor returns one success flag per item. Failed items are
+        retried or dead-lettered individually, as with ``process_batch``.
+        If the processor raises, every item in the batch counts as failed.
 
-                    # Remove from persistence
-                    if self.settings.persist_to_disk:
-                        self._remove_persisted_item(item.id)
-                else:
-                    failed_items.append(item)
-            except Exception as e:
-                logger.error(f"Error processing item {item.id}: {e}")
-                item.error = str(e)
+        Args:
+            processor: Function taking the item list, returning success flags
+            max_items: Maximum items per call (default: settings.batch_size)
+            max_wait: Seconds to wait for the first item, None to not wait
+
+        Returns:
+            Number of items successfully processed
+        """
+        items = self.drain(max_items, max_wait)
+        if not items:
+            return 0
+
+        errors: dict[int, str] = {}
+        start_time = time.perf_counter()
+        try:
+            results = [bool(ok) for ok in processor(items)]
+            if len(results) != len(items):
+                raise ValueError(
+                    f"Batch processor returned {len(results)} results "
+                    f"for {len(items)} items"
+                )
+        except Exception as e:
+            logger.error(f"Error processing batch of {len(items)} items: {e}")
+            results = [False] * len(items)
+            errors = dict.fromkeys(range(len(items)), str(e))
+        elapsed_ms = (time.perf_counter() - start_time) * 1000
+        self._latency.record(elapsed_ms / len(items), count=len(items))
+
+        return self._settle(items, results, errors)
+
+    def _settle(
+        self,
+        items: list[QueueItem],
+        results: list[bool],
+        errors: dict[int, str],
+    ) -> int:
+        """Acknowledge successes, retry or dead-letter failures, update stats."""
+        failed_items = []
+        acked_ids = []
+        for i, (item, success) in enumerate(zip(items, results)):
+            if success:
+                acked_ids.append(item.id)
+            else:
+                if i in errors:
+                    item.error = errors[i]
                 failed_items.append(item)
 
-            # Track latency
-            latency = (time.time() - start_time) * 1000
-            self._latency_samples.append(latency)
-            if len(self._latency_samples) > 100:
-                self._latency_samples = self._latency_samples[-100:]
+        # Remove from persistence with a single record for the whole batch
+        if acked_ids and self._log is not None:
+            self._remove_persisted_items(acked_ids)
 
         # Handle failed items
         for item in failed_items:
@@ -306,6 +451,8 @@ class IngestionQueue:
                 item.priority = min(item.priority + 1, QueuePriority.BATCH)
                 try:
                     self._queue.put_nowait(item)
+                    if self._log is not None:
+                        self._persist_item(item)
                 except queue.Full:
                     self._send_to_dead_letter(item)
             else:
@@ -313,20 +460,28 @@ class IngestionQueue:
 
         # Update stats
         with self._lock:
+            self._stats.total_processed += len(acked_ids)
             self._stats.last_process_time = time.time()
-            if self._latency_samples:
-                self._stats.average_latency_ms = sum(self._latency_samples) / len(
-                    self._latency_samples
-                )
+            self._stats.average_latency_ms = self._latency.mean_ms
+            self._stats.p50_latency_ms = self._latency.quantile_ms(0.5)
+            self._stats.p99_latency_ms = self._latency.quantile_ms(0.99)
 
-        return processed
+        return len(acked_ids)
 
     def start_processing(
         self,
-        processor: Callable[[QueueItem], bool],
+        processor: ItemProcessor | BatchProcessor,
         interval: float | None = None,
+        batch: bool = False,
     ) -> None:
-        """Start background processing thread."""
+        """
+        Start background processing thread.
+
+        Args:
+            processor: Per-item processor, or a batch processor if ``batch``
+            interval: Seconds between batches (default: flush_interval_sec)
+            batch: Call ``processor`` with lists of items (``process_many``)
+        """
         if self._processing:
             logger.warning("Processing already started")
             return
@@ -347,7 +502,10 @@ class IngestionQueue:
                     )
 
                     if should_process and not self._queue.empty():
-                        processed = self.process_batch(self._processor)
+                        if batch:
+                            processed = self.process_many(self._processor)
+                        else:
+                            processed = self.process_batch(self._processor)
                         if processed > 0:
                             # Calculate rate
                             elapsed = now - last_process if last_process else 1.0
@@ -357,6 +515,9 @@ class IngestionQueue:
                                 )
                         last_process = now
 
+                    if self._log is not None:
+                        self._log.sync_if_due()
+
                     time.sleep(0.1)  # Small sleep to prevent busy waiting
                 except Exception as e:
                     logger.error(f"Error in processing loop: {e}")
@@ -372,8 +533,30 @@ class IngestionQueue:
         if self._process_thread:
             self._process_thread.join(timeout=5.0)
             self._process_thread = None
+        self.sync()
         logger.info("Queue processing stopped")
 
+    def sync(self) -> None:
+        """Flush persisted queue state to stable storage."""
+        if self._log is not None:
+            try:
+                self._log.sync()
+            except Exception as e:
+                logger.error(f"Failed to sync queue persistence: {e}")
+
+    @property
+    def persist_lag_ms(self) -> float:
+        """Age of the oldest persisted record not yet fsynced."""
+        if self._log is None:
+            return 0.0
+        return self._log.unsynced_age_sec * 1000.0
+
+    def close(self) -> None:
+        """Stop processing and close the persistence log."""
+        self.stop_processing()
+        if self._log is not None:
+            self._log.close()
+
     def _send_to_dead_letter(self, item: QueueItem) -> None:
         """Send failed item to dead letter queue."""
         with self._lock:
@@ -384,7 +567,7 @@ class IngestionQueue:
             if len(self._dead_letter_queue) > 1000:
                 self._dead_letter_queue = self._dead_letter_queue[-1000:]
 
-        if self.settings.persist_to_disk:
+        if self._log is not None:
             self._persist_dead_letter(item)
 
         logger.warning(
@@ -406,6 +589,8 @@ class IngestionQueue:
                     self._dead_letter_queue.pop(i)
                     try:
                         self._queue.put_nowait(item)
+                        if self._log is not None:
+                            self._persist_item(item)
                         return True
                     except queue.Full:
                         self._dead_letter_queue.append(item)
@@ -417,6 +602,8 @@ class IngestionQueue:
         with self._lock:
             count = len(self._dead_letter_queue)
             self._dead_letter_queue.clear()
+            if self._log is not None:
+                self._log.clear_dead()
             return count
 
     def get_stats(self) -> QueueStats:
@@ -437,83 +624,94 @@ class IngestionQueue:
                     break
             self._stats.current_size = 0
             self._stats.items_by_priority.clear()
+            if self._log is not None:
+                self._log.clear_queued()
         return count
 
     # Persistence methods
 
     def _persist_item(self, item: QueueItem) -> None:
-        """Persist item to disk."""
-        if not self.settings.persist_to_disk:
+        """Append item (new or re-queued) to the segment log."""
+        if self._log is None:
             return
 
         try:
-            item_path = self._persist_path / f"{item.id}.json"
-            with open(item_path, "w", encoding="utf-8") as f:
-                json.dump(item.to_dict(), f)
+            self._log.put(item.to_dict())
         except Exception as e:
             logger.error(f"Failed to persist item {item.id}: {e}")
 
-    def _remove_persisted_item(self, item_id: str) -> None:
-        """Remove persisted item."""
-        if not self.settings.persist_to_disk:
+    def _remove_persisted_items(self, item_ids: list[str]) -> None:
+        """Record processed items as consumed."""
+        if self._log is None:
             return
 
         try:
-            item_path = self._persist_path / f"{item_id}.json"
-            if item_path.exists():
-                item_path.unlink()
+            self._log.ack(item_ids)
         except Exception as e:
-            logger.error(f"Failed to remove persisted item {item_id}: {e}")
+            logger.error(f"Failed to remove {len(item_ids)} persisted items: {e}")
 
     def _persist_dead_letter(self, item: QueueItem) -> None:
-        """Persist dead letter item."""
-        if not self.settings.persist_to_disk:
+        """Record item as moved to the dead letter queue."""
+        if self._log is None:
             return
 
         try:
-            dl_path = self._persist_path / "dead_letter"
-            dl_path.mkdir(exist_ok=True)
-            item_path = dl_path / f"{item.id}.json"
-            with open(item_path, "w", encoding="utf-8") as f:
-                json.dump(item.to_dict(), f)
+            self._log.dead(item.to_dict())
         except Exception as e:
             logger.error(f"Failed to persist dead letter item {item.id}: {e}")
 
     def _load_persisted(self) -> None:
-        """Load persisted items on startup."""
-        if not self.settings.persist_to_disk:
+        """Replay the segment log on startup."""
+        if self._log is None:
             return
 
         try:
-            loaded = 0
-            for item_path in self._persist_path.glob("*.json"):
+            queued, dead = self._log.recover()
+        except Exception as e:
+            logger.error(f"Failed to load persisted items: {e}")
+            return
+
+        loaded = 0
+        for data in queued:
+            try:
+                self._queue.put_nowait(QueueItem.from_dict(data))
+                loaded += 1
+            except queue.Full:
+                logger.warning("Queue full while loading persisted items")
+                break
+        self._dead_letter_queue.extend(QueueItem.from_dict(d) for d in dead)
+
+        loaded += self._migrate_legacy_files()
+        if loaded > 0:
+            logger.info(f"Loaded {loaded} persisted queue items")
+
+    def _migrate_legacy_files(self) -> int:
+        """Move items persisted as one JSON file each into the segment log."""
+        loaded = 0
+        dl_path = self._persist_path / "dead_letter"
+        sources = [(self._persist_path, False), (dl_path, True)]
+        for directory, is_dead in sources:
+            if not directory.is_dir():
+                continue
+            for item_path in sorted(directory.glob("*.json")):
+                if item_path.name == CHECKPOINT_NAME:
+                    continue
                 try:
                     with open(item_path, "r", encoding="utf-8") as f:
-                        data = json.load(f)
-                    item = QueueItem.from_dict(data)
-                    self._queue.put_nowait(item)
-                    loaded += 1
+                        item = QueueItem.from_dict(json.load(f))
+                    if is_dead:
+                        self._dead_letter_queue.append(item)
+                        self._persist_dead_letter(item)
+                    else:
+                        self._queue.put_nowait(item)
+                        self._persist_item(item)
+                        loaded += 1
+                    item_path.unlink()
                 except Exception as e:
                     logger.warning(f"Failed to load persisted item {item_path}: {e}")
-
-            # Load dead letter items
-            dl_path = self._persist_path / "dead_letter"
-            if dl_path.exists():
-                for item_path in dl_path.glob("*.json"):
-                    try:
-                        with open(item_path, "r", encoding="utf-8") as f:
-                            data = json.load(f)
-                        item = QueueItem.from_dict(data)
-                        self._dead_letter_queue.append(item)
-                    except Exception as e:
-                        logger.warning(
-                            f"Failed to load dead letter item {item_path}: {e}"
-                        )
-
-            if loaded > 0:
-                logger.info(f"Loaded {loaded} persisted queue items")
-        except Exception as e:
-            logger.error(f"Failed to load persisted items: {e}")
+        if loaded:
+            self.sync()
+        return loaded
 
     def __len__(self) -> int:
         return self._queue.qsize()
@@ -552,13 +750,17 @@ def enqueue_batch(
 
 def drain_queue(
     queue: IngestionQueue,
-    processor: Callable[[QueueItem], bool],
+    processor: ItemProcessor | BatchProcessor,
     max_items: int = 10000,
     timeout_sec: float = 60.0,
+    batch: bool = False,
 ) -> int:
     """
     Process all items in queue until empty or limits reached.
 
+    Args:
+        batch: ``processor`` takes lists of items (see ``process_many``)
+
     Returns:
         Total items processed
     """
@@ -566,7 +768,10 @@ def drain_queue(
     total_processed = 0
 
     while total_processed < max_items and time.time() - start_time < timeout_sec:
-        processed = queue.process_batch(processor)
+        if batch:
+            processed = queue.process_many(processor)
+        else:
+            processed = queue.process_batch(processor)
         if processed == 0:
             break
         total_processed += processed
@@ -0,0 +1,346 @@
+"""
+Live Capture Recording Sinks
+
+Writes aggregated dyno data points to disk in blocks instead of one row at
+a time:
+- Rows are accumulated into preallocated column buffers
+- A block is written when it fills or when its oldest row is older than the
+  flush interval, so at most one block is lost on a crash
+- CSV output (same columns as the original live capture writer)
+- Compact binary columnar output for long sessions
+
+Binary layout (``.dynorec``)::
+
+    b"DYNOREC1" | u4 header_len | header JSON {"columns", "dtypes"}
+    chunk*:  b"CHNK" | u4 rows | column 0 bytes | column 1 bytes | ...
+    footer:  index JSON {"chunks": [[offset, rows], ...], "rows"}
+             | u8 index_len | b"DRINDEX1"
+
+The footer is written on close. A file without one (e.g. after a crash) is
+still readable by scanning chunks from the header; a truncated trailing
+chunk is ignored.
+"""
+
+from __future__ import annotations
+
+import csv
+import json
+import logging
+import math
+import struct
+import threading
+import time
+from pathlib import Path
+from typing import Any, Iterable
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Columns of a live capture recording (based on DynoDataPointSchema)
+RECORDING_COLUMNS = (
+    "timestamp_ms", "rpm", "horsepower", "torque",
+    "afr", "afr_front", "afr_rear",
+    "map_kpa", "tps", "iat", "ect",
+    "force_lbs", "acceleration",
+    "speed_mph", "gear",
+)
+
+BINARY_SUFFIX = ".dynorec"
+BINARY_MAGIC = b"DYNOREC1"
+CHUNK_MAGIC = b"CHNK"
+FOOTER_MAGIC = b"DRINDEX1"
+
+DEFAULT_BLOCK_ROWS = 1000
+DEFAULT_FLUSH_INTERVAL_SEC = 1.0
+
+
+def _column_dtype(name: str) -> np.dtype:
+    return np.dtype("<i8") if name == "timestamp_ms" else np.dtype("<f8")
+
+
+# =============================================================================
+# Block Writers
+# =============================================================================
+
+class _CSVBlockWriter:
+    """
+    Writes column blocks as CSV rows. Missing values are left empty.
+
+    Values that were appended as integers are written as integers, so the
+    output matches ``csv.DictWriter`` on the original rows.
+    """
+
+    def __init__(self, path: Path, columns: tuple[str, ...]):
+        self._file = open(path, "w", newline="", encoding="utf-8")
+        self._writer = csv.writer(self._file)
+        self._writer.writerow(columns)
+
+    def write_block(
+        self, block: list[np.ndarray], int_flags: list[np.ndarray]
+    ) -> None:
+        columns = []
+        for values, is_int in zip(block, int_flags):
+            if values.dtype.kind != "f":
+                columns.append(values.tolist())
+            elif is_int.any():
+                columns.append(
+                    [
+                        "" if math.isnan(v) else int(v) if flag else v
+                        for v, flag in zip(values.tolist(), is_int.tolist())
+                    ]
+                )
+            else:
+                columns.append(
+                    ["" if math.isnan(v) else v for v in values.tolist()]
+                )
+        self._writer.writerows(zip(*columns))
+        self._file.flush()
+
+    def close(self) -> None:
+        self._file.close()
+
+
+class _BinaryBlockWriter:
+    """Writes column blocks as ``.dynorec`` chunks with an index footer."""
+
+    def __init__(self, path: Path, columns: tuple[str, ...]):
+        self._file = open(path, "wb")
+        header = json.dumps(
+            {
+                "columns": list(columns),
+                "dtypes": [_column_dtype(c).str for c in columns],
+            }
+        ).encode("utf-8")
+        self._file.write(BINARY_MAGIC + struct.pack("<I", len(header)) + header)
+        self._chunks: list[tuple[int, int]] = []
+        self._rows = 0
+
+    def write_block(
+        self, block: list[np.ndarray], int_flags: list[np.ndarray]
+    ) -> None:
+        rows = len(block[0])
+        self._chunks.append((self._file.tell(), rows))
+        self._file.write(CHUNK_MAGIC + struct.pack("<I", rows))
+        for values in block:
+            self._file.write(np.ascontiguousarray(values).tobytes())
+        self._file.flush()
+        self._rows += rows
+
+    def close(self) -> None:
+        index = json.dumps({"chunks": self._chunks, "rows": self._rows}).encode("utf-8")
+        self._file.write(index + struct.pack("<Q", len(index)) + FOOTER_MAGIC)
+        self._file.close()
+
+
+# =============================================================================
+# Recording Sink
+# =============================================================================
+
+class RecordingSink:
+    """
+    Buffers data point rows into columns and writes them in blocks.
+
+    The format is chosen from the file suffix: ``.dynorec`` for the binary
+    columnar format, CSV otherwise. Rows keep their arrival order. At most
+    ``block_rows`` rows or ``flush_interval_sec`` seconds of data are held in
+    memory, which bounds what a crash can lose.
+
+    Usage:
+        sink = RecordingSink(Path("runs/session.dynorec"))
+        sink.append(point.to_dict())
+        ...
+        sink.close()
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        columns: Iterable[str] = RECORDING_COLUMNS,
+        block_rows: int = DEFAULT_BLOCK_ROWS,
+        flush_interval_sec: float = DEFAULT_FLUSH_INTERVAL_SEC,
+    ):
+        """
+        Open a recording.
+
+        Args:
+            path: Output file (parent directories are created)
+            columns: Column names; missing row values are recorded as NaN
+            block_rows: Rows per written block
+            flush_interval_sec: Maximum age of buffered rows before a write
+        """
+        self.path = Path(path)
+        self.columns = tuple(columns)
+        self.block_rows = max(1, block_rows)
+        self.flush_interval_sec = flush_interval_sec
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.format = "binary" if self.path.suffix.lower() == BINARY_SUFFIX else "csv"
+        writer_cls = _BinaryBlockWriter if self.format == "binary" else _CSVBlockWriter
+        self._writer: _CSVBlockWriter | _BinaryBlockWriter | None = writer_cls(
+            self.path, self.columns
+        )
+
+        self._buffers = [
+            np.empty(self.block_rows, dtype=_column_dtype(c)) for c in self.columns
+        ]
+        # Which float column values were appended as integers (CSV formatting)
+        self._int_flags = [
+            np.zeros(self.block_rows, dtype=bool) for _ in self.columns
+        ]
+        self._count = 0
+        self._first_buffered_at = 0.0
+        self._rows_written = 0
+        self._lock = threading.Lock()
+
+    @property
+    def rows_written(self) -> int:
+        """Rows written to disk (excludes rows still buffered)."""
+        return self._rows_written
+
+    @property
+    def closed(self) -> bool:
+        return self._writer is None
+
+    def append(self, row: dict[str, Any]) -> None:
+        """Buffer one row, writing a block if the buffer is full or stale."""
+        with self._lock:
+            if self._writer is None:
+                raise ValueError(f"Recording {self.path} is closed")
+
+            index = self._count
+            for name, buffer, is_int in zip(
+                self.columns, self._buffers, self._int_flags
+            ):
+                value = row.get(name)
+                if value is None:
+                    buffer[index] = 0 if buffer.dtype.kind == "i" else np.nan
+                    is_int[index] = False
+                else:
+                    buffer[index] = value
+                    is_int[index] = isinstance(value, (int, np.integer))
+            if index == 0:
+                self._first_buffered_at = time.monotonic()
+            self._count = index + 1
+
+            if (
+                self._count >= self.block_rows
+                or time.monotonic() - self._first_buffered_at >= self.flush_interval_sec
+            ):
+                self._write_block()
+
+    def extend(self, rows: Iterable[dict[str, Any]]) -> None:
+        for row in rows:
+            self.append(row)
+
+    def flush_if_stale(self) -> None:
+        """Write buffered rows older than the flush interval (for idle periods)."""
+        with self._lock:
+            if (
+                self._writer is not None
+                and self._count
+                and time.monotonic() - self._first_buffered_at >= self.flush_interval_sec
+            ):
+                self._write_block()
+
+    def flush(self) -> None:
+        """Write any buffered rows."""
+        with self._lock:
+            if self._writer is not None:
+                self._write_block()
+
+    def close(self) -> None:
+        """Write buffered rows and close the file."""
+        with self._lock:
+            if self._writer is None:
+                return
+            try:
+                self._write_block()
+            finally:
+                self._writer.close()
+                self._writer = None
+
+    def _write_block(self) -> None:
+        count = self._count
+        if count == 0:
+            return
+        self._writer.write_block(
+            [buffer[:count] for buffer in self._buffers],
+            [is_int[:count] for is_int in self._int_flags],
+        )
+        self._rows_written += count
+        self._count = 0
+
+    def __enter__(self) -> "RecordingSink":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+
+# =============================================================================
+# Reading
+# =============================================================================
+
+def read_recording(path: Path) -> dict[str, np.ndarray]:
+    """
+    Read a ``.dynorec`` recording into column arrays.
+
+    Uses the index footer when present; otherwise scans chunks, so
+    recordings cut short by a crash load up to their last complete chunk.
+
+    Args:
+        path: Recording file
+
+    Returns:
+        Mapping of column name to array, in row order
+
+    Raises:
+        ValueError: If the file is not a recording
+    """
+    data = Path(path).read_bytes()
+    if not data.startswith(BINARY_MAGIC):
+        raise ValueError(f"{path} is not a {BINARY_SUFFIX} recording")
+
+    pos = len(BINARY_MAGIC)
+    (header_len,) = struct.unpack_from("<I", data, pos)
+    pos += 4
+    header = json.loads(data[pos: pos + header_len])
+    pos += header_len
+    columns = header["columns"]
+    dtypes = [np.dtype(d) for d in header["dtypes"]]
+    row_bytes = sum(d.itemsize for d in dtypes)
+
+    chunks = _read_footer(data)
+    if chunks is None:
+        chunks = []
+        while pos + 8 <= len(data) and data[pos: pos + 4] == CHUNK_MAGIC:
+            (rows,) = struct.unpack_from("<I", data, pos + 4)
+            if pos + 8 + rows * row_bytes > len(data):
+                break  # Truncated chunk
+            chunks.append((pos, rows))
+            pos += 8 + rows * row_bytes
+
+    parts: list[list[np.ndarray]] = [[] for _ in columns]
+    for offset, rows in chunks:
+        pos = offset + 8
+        for i, dtype in enumerate(dtypes):
+            parts[i].append(np.frombuffer(data, dtype=dtype, count=rows, offset=pos))
+            pos += rows * dtype.itemsize
+
+    return {
+        name: np.concatenate(column) if column else np.empty(0, dtype=dtype)
+        for name, dtype, column in zip(columns, dtypes, parts)
+    }
+
+
+def _read_footer(data: bytes) -> list[tuple[int, int]] | None:
+    if not data.endswith(FOOTER_MAGIC):
+        return None
+    end = len(data) - len(FOOTER_MAGIC)
+    (index_len,) = struct.unpack_from("<Q", data, end - 8)
+    try:
+        index = json.loads(data[end - 8 - index_len: end - 8])
+    except ValueError:
+        return None
+    return [(offset, rows) for offset, rows in index["chunks"]]
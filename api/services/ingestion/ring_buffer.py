@@ -0,0 +1,175 @@
+"""
+Lock-free primitives for the live ingestion path.
+
+- RecordRing: preallocated single-producer/single-consumer ring of NumPy
+  records. The producer only writes ``_head`` and the consumer only writes
+  ``_tail``; under the GIL each index update is atomic, so neither side
+  takes a lock.
+- ThreadLocalCounters: statistics counters sharded per thread and merged
+  on read, so hot paths never contend on a stats lock.
+"""
+
+from __future__ import annotations
+
+import threading
+from collections.abc import Iterable
+from typing import Any
+
+import numpy as np
+
+
+class RecordRing:
+    """
+    Fixed-capacity SPSC ring buffer of structured NumPy records.
+
+    Exactly one thread may call the producer methods (``push``,
+    ``push_many``) and exactly one thread at a time the consumer methods
+    (``peek``, ``advance``, ``pop``). When the ring is full new records are
+    rejected rather than overwriting unread ones.
+    """
+
+    def __init__(self, dtype: np.dtype | list, capacity: int = 65536):
+        """
+        Initialize the ring.
+
+        Args:
+            dtype: Structured record dtype
+            capacity: Minimum number of records (rounded up to a power of two)
+        """
+        capacity = 1 << max(0, int(capacity) - 1).bit_length()
+        self._buf = np.zeros(capacity, dtype=dtype)
+        self._capacity = capacity
+        self._mask = capacity - 1
+        self._head = 0  # Records written (producer-owned)
+        self._tail = 0  # Records consumed (consumer-owned)
+
+    @property
+    def capacity(self) -> int:
+        return self._capacity
+
+    @property
+    def dtype(self) -> np.dtype:
+        return self._buf.dtype
+
+    def __len__(self) -> int:
+        return self._head - self._tail
+
+    # -------------------------------------------------------------------------
+    # Producer side
+    # -------------------------------------------------------------------------
+
+    def push(self, record: tuple) -> bool:
+        """Append one record. Returns False if the ring is full."""
+        head = self._head
+        if head - self._tail >= self._capacity:
+            return False
+        self._buf[head & self._mask] = record
+        self._head = head + 1
+        return True
+
+    def push_many(self, records: np.ndarray) -> int:
+        """
+        Append as many of ``records`` as fit.
+
+        Returns:
+            Number of records accepted (a prefix of ``records``)
+        """
+        head = self._head
+        count = min(len(records), self._capacity - (head - self._tail))
+        if count <= 0:
+            return 0
+        start = head & self._mask
+        first = min(count, self._capacity - start)
+        self._buf[start: start + first] = records[:first]
+        if count > first:
+            self._buf[: count - first] = records[first:count]
+        self._head = head + count
+        return count
+
+    # -------------------------------------------------------------------------
+    # Consumer side
+    # -------------------------------------------------------------------------
+
+    def peek(self, limit: int | None = None) -> np.ndarray:
+        """
+        Copy out unread records without consuming them.
+
+        Args:
+            limit: Maximum number of records to return
+        """
+        tail = self._tail
+        count = self._head - tail
+        if limit is not None:
+            count = min(count, limit)
+        start = tail & self._mask
+        end = start + count
+        if end <= self._capacity:
+            return self._buf[start:end].copy()
+        return np.concatenate(
+            (self._buf[start:], self._buf[: end - self._capacity])
+        )
+
+    def advance(self, count: int) -> None:
+        """Mark ``count`` records as consumed."""
+        if count < 0 or count > self._head - self._tail:
+            raise ValueError(f"Cannot advance ring by {count}")
+        self._tail += count
+
+    def pop(self, limit: int | None = None) -> np.ndarray:
+        """Copy out and consume unread records."""
+        records = self.peek(limit)
+        self.advance(len(records))
+        return records
+
+    def clear(self) -> None:
+        """Discard unread records. Only safe while the producer is idle."""
+        self._tail = self._head
+
+
+class ThreadLocalCounters:
+    """
+    Named integer counters with one shard per writing thread.
+
+    ``add`` touches only the calling thread's shard; ``snapshot`` sums all
+    shards. Shards are created with every counter present, so their size
+    never changes while another thread iterates them.
+    """
+
+    def __init__(self, names: Iterable[str]):
+        self._names = tuple(names)
+        self._lock = threading.Lock()  # Guards shard registration only
+        self._local = threading.local()
+        self._shards: list[dict[str, int]] = []
+
+    def add(self, name: str, amount: int = 1) -> None:
+        try:
+            shard = self._local.shard
+        except AttributeError:
+            shard = self._new_shard()
+        shard[name] += amount
+
+    def _new_shard(self) -> dict[str, int]:
+        shard = dict.fromkeys(self._names, 0)
+        with self._lock:
+            self._shards.append(shard)
+            self._local.shard = shard
+        return shard
+
+    def get(self, name: str) -> int:
+        return self.snapshot()[name]
+
+    def snapshot(self) -> dict[str, Any]:
+        """Sum of every thread's counters."""
+        with self._lock:
+            shards = list(self._shards)
+        totals = dict.fromkeys(self._names, 0)
+        for shard in shards:
+            for name, value in shard.items():
+                totals[name] += value
+        return totals
+
+    def reset(self) -> None:
+        """Zero all counters; threads get fresh shards on their next add."""
+        with self._lock:
+            self._local = threading.local()
+            self._shards = []
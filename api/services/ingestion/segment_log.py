@@ -0,0 +1,361 @@
+"""
+Ingestion Queue Segment Log
+
+Write-ahead log backing ``IngestionQueue`` persistence. Every queue
+mutation is appended to the active segment file instead of creating or
+unlinking one JSON file per item:
+- Length-prefixed, CRC-checked records, appended sequentially
+- Records reach the OS on every append and are fsynced periodically
+- A consumer checkpoint marks where recovery has to start reading
+- Segments rotate at a size limit and are deleted once fully consumed
+- Live items pinning old segments are compacted into the active one
+
+Record layout::
+
+    u4 payload_len | u4 crc32(type + payload) | u1 type | payload JSON
+
+Segment files are named ``{sequence:010d}.seg``; the checkpoint is
+``checkpoint.json`` holding ``{"segment", "offset"}``. Recovery replays
+segments from the checkpoint in order; a torn record at the tail of the
+last segment is truncated away.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import json
+import logging
+import os
+import struct
+import threading
+import time
+import zlib
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+RECORD_HEADER = struct.Struct("<IIB")
+
+# Record types
+PUT = 1  # Item queued (or re-queued); payload is the item dict
+ACK = 2  # Items consumed; payload is a list of item IDs
+DEAD = 3  # Item moved to the dead letter queue; payload is the item dict
+CLEAR_QUEUED = 4  # All queued items discarded; empty payload
+CLEAR_DEAD = 5  # All dead letter items discarded; empty payload
+
+SEGMENT_SUFFIX = ".seg"
+CHECKPOINT_NAME = "checkpoint.json"
+
+DEFAULT_SEGMENT_MAX_BYTES = 4 * 1024 * 1024
+DEFAULT_FSYNC_INTERVAL_SEC = 1.0
+DEFAULT_MAX_SEGMENTS = 8
+MAX_DEAD_LETTER_ITEMS = 1000
+
+
+def _segment_name(sequence: int) -> str:
+    return f"{sequence:010d}{SEGMENT_SUFFIX}"
+
+
+class SegmentLog:
+    """
+    Append-only segment log holding the live state of an ingestion queue.
+
+    The log tracks which items are still queued and which are dead letters,
+    keyed by item ID, together with the segment holding each item's latest
+    record. Callers append mutations; ``recover()`` rebuilds that state
+    after a restart. All methods are thread-safe.
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        segment_max_bytes: int = DEFAULT_SEGMENT_MAX_BYTES,
+        fsync_interval_sec: float = DEFAULT_FSYNC_INTERVAL_SEC,
+        max_segments: int = DEFAULT_MAX_SEGMENTS,
+    ):
+        self.path = Path(path)
+        self.path.mkdir(parents=True, exist_ok=True)
+        self.segment_max_bytes = segment_max_bytes
+        self.fsync_interval_sec = fsync_interval_sec
+        self.max_segments = max(2, max_segments)
+
+        self._lock = threading.Lock()
+        # item id -> (segment sequence, offset, item dict), in log order
+        self._queued: OrderedDict[str, tuple[int, int, dict[str, Any]]] = (
+            OrderedDict()
+        )
+        self._dead: OrderedDict[str, tuple[int, int, dict[str, Any]]] = (
+            OrderedDict()
+        )
+        self._segments: list[int] = []
+        self._file = None
+        self._active = 0
+        self._active_size = 0
+        self._unsynced_since: float | None = None
+        self._checkpoint: tuple[int, int] = (0, 0)
+
+    # =========================================================================
+    # Recovery
+    # =========================================================================
+
+    def recover(self) -> tuple[list[dict[str, Any]], list[dict[str, Any]]]:
+        """
+        Replay the log and open the active segment for appending.
+
+        Returns:
+            (queued item dicts, dead letter item dicts), in log order
+        """
+        with self._lock:
+            self._checkpoint = self._read_checkpoint()
+            self._segments = sorted(
+                int(p.stem)
+                for p in self.path.glob(f"*{SEGMENT_SUFFIX}")
+                if p.stem.isdigit()
+            )
+            start_segment, start_offset = self._checkpoint
+            for sequence in [s for s in self._segments if s < start_segment]:
+                self._unlink_segment(sequence)
+
+            for sequence in list(self._segments):
+                offset = start_offset if sequence == start_segment else 0
+                self._replay_segment(sequence, offset)
+
+            if self._segments:
+                self._active = self._segments[-1]
+            else:
+                self._active = 1
+                self._segments.append(self._active)
+            self._open_active()
+            self._active_size = self._file.tell()
+
+            return (
+                [entry[2] for entry in self._queued.values()],
+                [entry[2] for entry in self._dead.values()],
+            )
+
+    def _replay_segment(self, sequence: int, offset: int) -> None:
+        """Apply the records of one segment, starting at ``offset``."""
+        segment_path = self.path / _segment_name(sequence)
+        with open(segment_path, "rb") as f:
+            buf = memoryview(f.read())
+
+        pos = offset
+        end = len(buf)
+        while pos + RECORD_HEADER.size <= end:
+            length, crc, rtype = RECORD_HEADER.unpack_from(buf, pos)
+            body_start = pos + RECORD_HEADER.size
+            if body_start + length > end:
+                break
+            body = buf[body_start - 1 : body_start + length]
+            if zlib.crc32(body) != crc:
+                break
+            try:
+                payload = (
+                    json.loads(bytes(body[1:]).decode("utf-8")) if length else None
+                )
+            except ValueError:
+                break
+            self._apply(rtype, payload, sequence, pos)
+            pos = body_start + length
+
+        if pos < end:
+            logger.warning(
+                f"Truncating {end - pos} bytes of incomplete records "
+                f"from segment {segment_path.name}"
+            )
+            with open(segment_path, "r+b") as f:
+                f.truncate(pos)
+
+    def _apply(self, rtype: int, payload: Any, sequence: int, offset: int) -> None:
+        """Apply one record to the in-memory state."""
+        if rtype == PUT:
+            item_id = payload["id"]
+            self._dead.pop(item_id, None)
+            self._queued.pop(item_id, None)
+            self._queued[item_id] = (sequence, offset, payload)
+        elif rtype == ACK:
+            for item_id in payload:
+                self._queued.pop(item_id, None)
+        elif rtype == DEAD:
+            item_id = payload["id"]
+            self._queued.pop(item_id, None)
+            self._dead.pop(item_id, None)
+            self._dead[item_id] = (sequence, offset, payload)
+            while len(self._dead) > MAX_DEAD_LETTER_ITEMS:
+                self._dead.popitem(last=False)
+        elif rtype == CLEAR_QUEUED:
+            self._queued.clear()
+        elif rtype == CLEAR_DEAD:
+            self._dead.clear()
+        else:
+            logger.warning(f"Unknown segment log record type {rtype}, skipping")
+
+    # =========================================================================
+    # Appending
+    # =========================================================================
+
+    def put(self, item: dict[str, Any]) -> None:
+        """Record that an item was queued or re-queued."""
+        self._append(PUT, item)
+
+    def ack(self, item_ids: list[str]) -> None:
+        """Record that items were consumed (or dropped)."""
+        if item_ids:
+            self._append(ACK, list(item_ids))
+
+    def dead(self, item: dict[str, Any]) -> None:
+        """Record that an item moved to the dead letter queue."""
+        self._append(DEAD, item)
+
+    def clear_queued(self) -> None:
+        """Record that every queued item was discarded."""
+        self._append(CLEAR_QUEUED, None)
+
+    def clear_dead(self) -> None:
+        """Record that every dead letter item was discarded."""
+        self._append(CLEAR_DEAD, None)
+
+    def _append(self, rtype: int, payload: Any) -> None:
+        body = b"" if payload is None else json.dumps(
+            payload, separators=(",", ":")
+        ).encode("utf-8")
+        crc = zlib.crc32(bytes((rtype,)) + body)
+
+        with self._lock:
+            if self._file is None:
+                raise RuntimeError("Segment log is not open")
+            if (
+                self._active_size > 0
+                and self._active_size + RECORD_HEADER.size + len(body)
+                > self.segment_max_bytes
+            ):
+                self._rotate()
+
+            offset = self._active_size
+            self._file.write(RECORD_HEADER.pack(len(body), crc, rtype) + body)
+            self._file.flush()
+            self._active_size += RECORD_HEADER.size + len(body)
+            self._apply(rtype, payload, self._active, offset)
+
+            now = time.monotonic()
+            if self._unsynced_since is None:
+                self._unsynced_since = now
+            elif now - self._unsynced_since >= self.fsync_interval_sec:
+                self._sync()
+
+    def _open_active(self) -> None:
+        """Open the active segment for appending; closed by _rotate()/close()."""
+        self._file = open(  # noqa: SIM115 - long-lived handle owned by the log
+            self.path / _segment_name(self._active), "ab"
+        )
+
+    def _rotate(self) -> None:
+        """Close the active segment and start the next one."""
+        self._sync()
+        self._file.close()
+        self._active += 1
+        self._segments.append(self._active)
+        self._open_active()
+        self._active_size = 0
+
+        if len(self._segments) > self.max_segments:
+            self._compact()
+
+    def _compact(self) -> None:
+        """Move live records out of the oldest segment so it can be dropped."""
+        oldest = self._segments[0]
+        for state, rtype in ((self._queued, PUT), (self._dead, DEAD)):
+            for _, _, payload in [e for e in state.values() if e[0] == oldest]:
+                body = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+                crc = zlib.crc32(bytes((rtype,)) + body)
+                offset = self._active_size
+                self._file.write(RECORD_HEADER.pack(len(body), crc, rtype) + body)
+                self._active_size += RECORD_HEADER.size + len(body)
+                self._apply(rtype, payload, self._active, offset)
+        self._file.flush()
+        self._sync()
+
+    # =========================================================================
+    # Durability
+    # =========================================================================
+
+    def sync(self) -> None:
+        """Fsync the active segment and advance the checkpoint."""
+        with self._lock:
+            if self._file is not None:
+                self._sync()
+
+    def sync_if_due(self) -> None:
+        """Fsync if unsynced records are older than the fsync interval."""
+        with self._lock:
+            if (
+                self._file is not None
+                and self._unsynced_since is not None
+                and time.monotonic() - self._unsynced_since
+                >= self.fsync_interval_sec
+            ):
+                self._sync()
+
+    def _sync(self) -> None:
+        os.fsync(self._file.fileno())
+        self._unsynced_since = None
+        self._advance_checkpoint()
+
+    def _advance_checkpoint(self) -> None:
+        """Checkpoint the oldest live record and drop segments before it."""
+        live = [
+            next(iter(state.values()))[:2]
+            for state in (self._queued, self._dead)
+            if state
+        ]
+        checkpoint = min(live) if live else (self._active, self._active_size)
+        if checkpoint == self._checkpoint:
+            return
+
+        tmp_path = self.path / (CHECKPOINT_NAME + ".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"segment": checkpoint[0], "offset": checkpoint[1]}, f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.path / CHECKPOINT_NAME)
+        self._checkpoint = checkpoint
+
+        for sequence in [s for s in self._segments if s < checkpoint[0]]:
+            self._unlink_segment(sequence)
+
+    def _read_checkpoint(self) -> tuple[int, int]:
+        try:
+            with open(self.path / CHECKPOINT_NAME, encoding="utf-8") as f:
+                data = json.load(f)
+            return int(data["segment"]), int(data["offset"])
+        except FileNotFoundError:
+            return (0, 0)
+        except (ValueError, KeyError, TypeError) as e:
+            logger.warning(f"Ignoring unreadable segment log checkpoint: {e}")
+            return (0, 0)
+
+    def _unlink_segment(self, sequence: int) -> None:
+        with contextlib.suppress(FileNotFoundError):
+            (self.path / _segment_name(sequence)).unlink()
+        if sequence in self._segments:
+            self._segments.remove(sequence)
+
+    @property
+    def unsynced_age_sec(self) -> float:
+        """Seconds since the oldest record not yet fsynced was appended."""
+        since = self._unsynced_since
+        return 0.0 if since is None else time.monotonic() - since
+
+    @property
+    def segment_count(self) -> int:
+        return len(self._segments)
+
+    def close(self) -> None:
+        """Fsync and close the active segment."""
+        with self._lock:
+            if self._file is not None:
+                self._sync()
+                self._file.close()
+                self._file = None
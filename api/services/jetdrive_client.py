@@ -11,6 +11,8 @@ from dataclasses import dataclass, field
 from enum import IntEnum
 from typing import Callable
 
+import numpy as np
+
 # KLHDV transport defaults (overridable via env vars)
 # 224.0.2.10 = Official Dynojet/JetDrive vendor multicast address
 DEFAULT_MCAST_GROUP = os.getenv("JETDRIVE_MCAST_GROUP", "224.0.2.10")
@@ -33,6 +35,11 @@ CHANNEL_NAME_LEN = 30
 CHANNEL_INFO_BLOCK = 34  # id(2) + vendor(1) + name(30) + unit(1)
 CHANNEL_VALUES_BLOCK = 10  # id(2) + ts(4) + float(4)
 
+# Wire layout of one ChannelValues block, used to decode whole frames at once
+CHANNEL_VALUES_DTYPE = np.dtype(
+    [("chan_id", "<u2"), ("timestamp_ms", "<u4"), ("value", "<f4")]
+)
+
 
 class JDUnit(IntEnum):
     Time = 0
@@ -383,97 +390,189 @@ def _parse_channel_info(
     )
 
 
-def _parse_channel_values(
-    provider_id: int, channel_lookup: dict[int, ChannelInfo], value: bytes
-) -> list[JetDriveSample]:
+# Channels where we FORCE the registry name because hardware sends wrong names.
+# Atmospheric Probe channels 35-38: hardware mis-labels them (e.g. reports
+# Pressure as "Temperature 2" and Humidity as "Pressure").
+FORCE_REGISTRY_CHANNELS = frozenset({35, 36, 37, 38})
+
+# Keyword scans used to infer a category from a hardware channel name
+_CATEGORY_KEYWORDS = (
+    ("atmospheric", ("humidity", "temperature", "pressure", "atmospheric")),
+    ("dyno", ("rpm", "force", "power", "torque", "speed", "distance", "acceleration")),
+    ("afr", ("afr", "lambda", "lc2", "lc1", "fuel", "o2")),
+    ("engine", ("map", "tps", "iat", "ect", "vbat", "volt")),
+)
+
+
+def _infer_category(name: str) -> str:
+    name_lower = name.lower()
+    for category, keywords in _CATEGORY_KEYWORDS:
+        if any(x in name_lower for x in keywords):
+            return category
+    return "misc"
+
+
+def resolve_channel(
+    chan_id: int, channel_lookup: dict[int, ChannelInfo]
+) -> tuple[str, str, str]:
     """
-    Parse channel values from a JetDrive wire frame.
+    Resolve a channel ID to (name, category, units).
     
     Name resolution priority:
     1. CHANNEL_REGISTRY (for channels where hardware metadata is known to be WRONG)
     2. Hardware ChannelInfo metadata (if available)
     3. CHANNEL_REGISTRY by ID (comprehensive known channels)
     4. Generic fallback name (Channel X)
+    """
+    # Priority 1: FORCE registry for channels with known bad hardware metadata
+    if chan_id in FORCE_REGISTRY_CHANNELS:
+        registry_info = get_channel_info_from_registry(chan_id)
+        if registry_info:
+            return (
+                str(registry_info["name"]),
+                str(registry_info.get("category", "misc")),
+                str(registry_info.get("units", "")),
+            )
+    
+    # Priority 2: Use provider-specific channel_lookup (from ChannelInfo packets)
+    chan = channel_lookup.get(chan_id)
+    if chan and chan.name:
+        # Let frontend handle units based on name
+        return chan.name, _infer_category(chan.name), ""
+    
+    # Priority 3: Use CHANNEL_REGISTRY (fallback for channels without metadata)
+    registry_info = get_channel_info_from_registry(chan_id)
+    if registry_info:
+        return (
+            str(registry_info["name"]),
+            str(registry_info.get("category", "misc")),
+            str(registry_info.get("units", "")),
+        )
+    
+    # Priority 4: Generic fallback with channel ID
+    return f"Channel {chan_id}", "misc", ""
+
+
+class ChannelTable:
+    """
+    Per-provider ``chan_id -> (name, category, units)`` table.
+    
+    Entries are resolved once on first sight and reused for every later
+    sample. Call ``invalidate()`` whenever the provider's ChannelInfo
+    changes; the table is rebuilt lazily from the current lookup.
     
     IMPORTANT: The channel_lookup should be provider-specific to avoid
     channel ID collisions between Power Core CPU and Atmospheric Probe.
     """
-    # Channels where we FORCE the registry name because hardware sends wrong names.
-    # Atmospheric Probe channels 35-38: hardware mis-labels them (e.g. reports
-    # Pressure as "Temperature 2" and Humidity as "Pressure").
-    FORCE_REGISTRY_CHANNELS = {35, 36, 37, 38}
-    
-    samples: list[JetDriveSample] = []
-    idx = 0
-    while idx + CHANNEL_VALUES_BLOCK <= len(value):
-        chan_id = int.from_bytes(value[idx: idx + 2], "little")
-        idx += 2
-        ts = int.from_bytes(value[idx: idx + 4], "little")
-        idx += 4
-        try:
-            val = struct.unpack_from("<f", value, idx)[0]
-        except struct.error:
-            break
-        idx += 4
-        
-        # Resolve channel name, category, and units
-        name: str = ""
-        category: str = "misc"
-        units: str = ""
-        
-        # Priority 1: FORCE registry for channels with known bad hardware metadata
-        if chan_id in FORCE_REGISTRY_CHANNELS:
-            registry_info = get_channel_info_from_registry(chan_id)
-            if registry_info:
-                name = str(registry_info["name"])
-                category = str(registry_info.get("category", "misc"))
-                units = str(registry_info.get("units", ""))
-        
-        # Priority 2: Use provider-specific channel_lookup (from ChannelInfo packets)
-        if not name:
-            chan = channel_lookup.get(chan_id)
-            if chan and chan.name:
-                name = chan.name
-                # Infer category from channel name
-                name_lower = name.lower()
-                if any(x in name_lower for x in ['humidity', 'temperature', 'pressure', 'atmospheric']):
-                    category = "atmospheric"
-                elif any(x in name_lower for x in ['rpm', 'force', 'power', 'torque', 'speed', 'distance', 'acceleration']):
-                    category = "dyno"
-                elif any(x in name_lower for x in ['afr', 'lambda', 'lc2', 'lc1', 'fuel', 'o2']):
-                    category = "afr"
-                elif any(x in name_lower for x in ['map', 'tps', 'iat', 'ect', 'vbat', 'volt']):
-                    category = "engine"
-                else:
-                    category = "misc"
-                units = ""  # Let frontend handle units based on name
-        
-        # Priority 3: Use CHANNEL_REGISTRY (fallback for channels without metadata)
-        if not name:
-            registry_info = get_channel_info_from_registry(chan_id)
-            if registry_info:
-                name = str(registry_info["name"])
-                category = str(registry_info.get("category", "misc"))
-                units = str(registry_info.get("units", ""))
-        
-        # Priority 4: Generic fallback with channel ID
-        if not name:
-            name = f"Channel {chan_id}"
-            category = "misc"
-            units = ""
-        
-        samples.append(
-            JetDriveSample(
-                provider_id=provider_id,
-                channel_id=chan_id,
-                channel_name=name,
-                timestamp_ms=ts,
-                value=float(val),
-                category=category,
-                units=units,
-            )
+    
+    __slots__ = ("channel_lookup", "_entries")
+    
+    def __init__(self, channel_lookup: dict[int, ChannelInfo] | None = None):
+        self.channel_lookup = channel_lookup if channel_lookup is not None else {}
+        self._entries: dict[int, tuple[str, str, str]] = {}
+    
+    def resolve(self, chan_id: int) -> tuple[str, str, str]:
+        entry = self._entries.get(chan_id)
+        if entry is None:
+            entry = resolve_channel(chan_id, self.channel_lookup)
+            self._entries[chan_id] = entry
+        return entry
+    
+    def invalidate(self, channel_lookup: dict[int, ChannelInfo] | None = None) -> None:
+        """Drop resolved entries, optionally switching to a new lookup."""
+        if channel_lookup is not None:
+            self.channel_lookup = channel_lookup
+        self._entries.clear()
+
+
+@dataclass
+class JetDriveSampleBatch:
+    """
+    All channel values from one ChannelValues frame, as parallel arrays.
+    
+    The arrays are read-only views over the received frame.
+    """
+    
+    provider_id: int
+    channel_ids: np.ndarray  # uint16
+    timestamps_ms: np.ndarray  # uint32
+    values: np.ndarray  # float32
+    table: ChannelTable
+    
+    def __len__(self) -> int:
+        return len(self.channel_ids)
+    
+    def select(self, mask: np.ndarray) -> JetDriveSampleBatch:
+        """Return a batch holding only the rows where ``mask`` is True."""
+        return JetDriveSampleBatch(
+            provider_id=self.provider_id,
+            channel_ids=self.channel_ids[mask],
+            timestamps_ms=self.timestamps_ms[mask],
+            values=self.values[mask],
+            table=self.table,
         )
-    return samples
+    
+    def to_samples(self) -> list[JetDriveSample]:
+        """Materialize one JetDriveSample per value."""
+        resolve = self.table.resolve
+        samples: list[JetDriveSample] = []
+        for chan_id, ts, val in zip(
+            self.channel_ids.tolist(),
+            self.timestamps_ms.tolist(),
+            self.values.tolist(),
+        ):
+            name, category, units = resolve(chan_id)
+            samples.append(
+                JetDriveSample(
+                    provider_id=self.provider_id,
+                    channel_id=chan_id,
+                    channel_name=name,
+                    timestamp_ms=ts,
+                    value=val,
+                    category=category,
+                    units=units,
+                )
+            )
+        return samples
+
+
+def decode_channel_values(
+    provider_id: int, table: ChannelTable, value: bytes
+) -> JetDriveSampleBatch:
+    """
+    Decode a ChannelValues payload without copying it.
+    
+    A trailing partial block is ignored.
+    """
+    count = len(value) // CHANNEL_VALUES_BLOCK
+    records = np.frombuffer(value, dtype=CHANNEL_VALUES_DTYPE, count=count)
+    return JetDriveSampleBatch(
+        provider_id=provider_id,
+        channel_ids=records["chan_id"],
+        timestamps_ms=records["timestamp_ms"],
+        values=records["value"],
+        table=table,
+    )
+
+
+def _parse_channel_values(
+    provider_id: int,
+    channel_lookup: dict[int, ChannelInfo] | ChannelTable,
+    value: bytes,
+) -> list[JetDriveSample]:
+    """
+    Parse channel values from a JetDrive wire frame.
+    
+    Names are resolved via ``resolve_channel``. Pass a long-lived
+    ``ChannelTable`` instead of a plain lookup to reuse resolved names
+    across frames.
+    """
+    table = (
+        channel_lookup
+        if isinstance(channel_lookup, ChannelTable)
+        else ChannelTable(channel_lookup)
+    )
+    return decode_channel_values(provider_id, table, value).to_samples()
 
 
 def parse_frame(
@@ -672,19 +771,25 @@ async def discover_providers(
 def _subscribe_sync(
     provider: JetDriveProviderInfo,
     channel_names: list[str],
-    on_sample: Callable[[JetDriveSample], None],
+    on_sample: Callable[[JetDriveSample], None] | None,
     cfg: JetDriveConfig,
     stop_flag: list,  # Use mutable list as thread-safe flag [False]
     recv_timeout: float = 0.5,
     debug: bool = False,
     accept_all_providers: bool = True,  # NEW: Accept data from ALL providers
+    on_batch: Callable[[JetDriveSampleBatch], None] | None = None,
 ) -> dict[str, int]:
     """
     Synchronous subscribe using blocking sockets (works reliably on Windows).
     
     Args:
+        on_sample: Called once per channel value (may be None if on_batch is set)
         accept_all_providers: If True, accept ChannelValues from ANY provider on the network.
             This is necessary because Power Core CPU and Atmospheric Probe are separate providers.
+        on_batch: Called once per ChannelValues frame with array views of
+            all (filtered) values, avoiding a JetDriveSample per value.
+            Exceptions it raises are counted as ``callback_errors``; the
+            frame is still delivered to ``on_sample``.
     """
     global _provider_cache
     
@@ -715,8 +820,13 @@ def _subscribe_sync(
             for chan_id, meta in cached_provider.channels.items():
                 if meta.name.lower() in names:
                     allowed_ids.add(chan_id)
+    allowed_ids_arr = np.fromiter(allowed_ids, dtype=np.uint16, count=len(allowed_ids))
+
+    # Resolved channel names per provider, rebuilt when its ChannelInfo changes
+    tables: dict[int, ChannelTable] = {}
 
     dropped_frames = 0
+    callback_errors = 0
     non_provider_frames = 0
     total_frames = 0
     accepted_providers: set[int] = set()
@@ -745,6 +855,7 @@ def _subscribe_sync(
                             _provider_cache[host].channels.update(info.channels)
                         else:
                             _provider_cache[host] = info
+                        tables.pop(host, None)
                 except Exception:
                     pass
                 continue
@@ -761,28 +872,41 @@ def _subscribe_sync(
             
             # CRITICAL: Use PROVIDER-SPECIFIC channel lookup to avoid ID collisions
             # Power Core CPU and Atmospheric Probe have different channel IDs with same meanings
-            if host in _provider_cache:
-                provider_channels = _provider_cache[host].channels
-            else:
-                # Fallback to empty dict - will use CHANNEL_REGISTRY
-                provider_channels = {}
+            table = tables.get(host)
+            if table is None:
+                if host in _provider_cache:
+                    provider_channels = _provider_cache[host].channels
+                else:
+                    # Fallback to empty dict - will use CHANNEL_REGISTRY
+                    provider_channels = {}
+                table = tables[host] = ChannelTable(provider_channels)
             
             try:
-                samples = _parse_channel_values(
-                    host, provider_channels, value
-                )
+                batch = decode_channel_values(host, table, value)
+                if allowed_ids:
+                    batch = batch.select(np.isin(batch.channel_ids, allowed_ids_arr))
+                samples = batch.to_samples() if on_sample is not None else []
             except Exception:
                 dropped_frames += 1
                 continue
+            if on_batch is not None and len(batch):
+                try:
+                    on_batch(batch)
+                except Exception as e:
+                    callback_errors += 1
+                    if debug and callback_errors == 1:
+                        print(
+                            f"[jetdrive_client._subscribe_sync] on_batch failed: {e!r}",
+                            flush=True,
+                        )
             for sample in samples:
-                if allowed_ids and sample.channel_id not in allowed_ids:
-                    continue
                 on_sample(sample)
     finally:
         sock.close()
         if debug:
             print(
                 f"[jetdrive_client._subscribe_sync] dropped_frames={dropped_frames}, "
+                f"callback_errors={callback_errors}, "
                 f"non_provider_frames={non_provider_frames}, total_frames={total_frames}, "
                 f"accepted_providers={[hex(p) for p in accepted_providers]}",
                 flush=True,
@@ -790,6 +914,7 @@ def _subscribe_sync(
 
     return {
         "dropped_frames": dropped_frames,
+        "callback_errors": callback_errors,
         "non_provider_frames": non_provider_frames,
         "total_frames": total_frames,
         "accepted_providers": list(accepted_providers),
@@ -799,17 +924,21 @@ def _subscribe_sync(
 async def subscribe(
     provider: JetDriveProviderInfo,
     channel_names: list[str],
-    on_sample: Callable[[JetDriveSample], None],
+    on_sample: Callable[[JetDriveSample], None] | None,
     *,
     config: JetDriveConfig | None = None,
     stop_event: asyncio.Event | None = None,
     recv_timeout: float = 0.5,
     debug: bool = False,
     return_stats: bool = False,
+    on_batch: Callable[[JetDriveSampleBatch], None] | None = None,
 ) -> dict[str, int] | None:
     """
     Listen for ChannelValues from a provider and invoke the callback.
     Uses synchronous blocking socket in a thread (works reliably on Windows).
+    
+    ``on_sample`` receives one JetDriveSample per value; ``on_batch``
+    receives a JetDriveSampleBatch per frame. Either may be None.
     """
     cfg = config or JetDriveConfig.from_env()
     
@@ -828,7 +957,8 @@ async def subscribe(
         # Run sync subscribe in thread pool
         result = await asyncio.to_thread(
             _subscribe_sync,
-            provider, channel_names, on_sample, cfg, stop_flag, recv_timeout, debug
+            provider, channel_names, on_sample, cfg, stop_flag, recv_timeout, debug,
+            on_batch=on_batch,
         )
         if return_stats:
             return result
@@ -2,11 +2,12 @@
 JetDrive Live Capture Queue Manager
 
 Manages the ingestion queue for live JetDrive capture with:
+- Lock-free SPSC ring buffer between the UDP receive thread and the aggregator
 - 50ms sample aggregation for stable UI updates (20Hz)
 - Bounded queue with graceful degradation on overload
 - Optional persistence for crash recovery
-- CSV writing via batch processing
-- Health metrics tracking
+- Block-buffered recording (CSV or binary columnar) via batch processing
+- Health metrics tracking (per-thread counters merged on read)
 - Real-time analysis integration (Phase 4)
 """
 
@@ -15,15 +16,26 @@ from __future__ import annotations
 import logging
 import threading
 import time
-from collections import defaultdict
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, TYPE_CHECKING
 
-from api.services.jetdrive_client import JetDriveSample
-from api.services.ingestion.adapters import JetDriveAdapter
+import numpy as np
+
+from api.services.jetdrive_client import JetDriveSample, JetDriveSampleBatch
+from api.services.ingestion.adapters import (
+    JetDriveAdapter,
+    StreamingWindowAggregator,
+)
 from api.services.ingestion.config import create_live_capture_queue_config
-from api.services.ingestion.queue import IngestionQueue, QueueItem, QueuePriority
+from api.services.ingestion.queue import (
+    IngestionQueue,
+    QueueItem,
+    QueuePriority,
+    drain_queue,
+)
+from api.services.ingestion.recording import RecordingSink
+from api.services.ingestion.ring_buffer import RecordRing, ThreadLocalCounters
 
 if TYPE_CHECKING:
     from api.services.jetdrive_realtime_analysis import RealtimeAnalysisEngine
@@ -37,6 +49,28 @@ logger = logging.getLogger(__name__)
 
 AGGREGATION_WINDOW_MS = 50  # 50ms window = 20Hz UI update rate
 BATCH_FLUSH_INTERVAL_SEC = 1.0  # Write CSV data every second
+RING_CAPACITY = 65536  # Raw samples buffered between receiver and aggregator
+
+# One raw sample as stored in the ring. ``slot`` indexes the aggregator's
+# standard channel slots (-1 for other channels); ``window`` is the
+# aggregation window sequence.
+SAMPLE_RECORD_DTYPE = np.dtype(
+    [
+        ("timestamp_ms", "<i8"),
+        ("window", "<i8"),
+        ("slot", "<i4"),
+        ("value", "<f8"),
+    ]
+)
+
+_COUNTERS = (
+    "samples_received",
+    "samples_overrun",
+    "samples_aggregated",
+    "samples_enqueued",
+    "samples_dropped",
+    "aggregation_windows",
+)
 
 
 # =============================================================================
@@ -48,6 +82,7 @@ class LiveCaptureQueueStats:
     """Statistics for live capture queue."""
     
     samples_received: int = 0
+    samples_overrun: int = 0  # Raw samples rejected because the ring was full
     samples_aggregated: int = 0
     samples_enqueued: int = 0
     samples_dropped: int = 0
@@ -63,6 +98,7 @@ class LiveCaptureQueueStats:
     def to_dict(self) -> dict[str, Any]:
         return {
             "samples_received": self.samples_received,
+            "samples_overrun": self.samples_overrun,
             "samples_aggregated": self.samples_aggregated,
             "samples_enqueued": self.samples_enqueued,
             "samples_dropped": self.samples_dropped,
@@ -84,155 +120,313 @@ class LiveCaptureQueueManager:
     """
     Manages ingestion queue for JetDrive live capture.
     
-    Aggregates raw samples into 50ms windows before enqueueing,
-    maintains bounded queue with graceful degradation, and handles
-    batch writing to CSV.
+    The UDP receive thread (the single producer) appends raw samples to a
+    preallocated ring and decides window boundaries; an aggregator thread
+    (the single consumer) turns each completed 50ms window into one data
+    point and enqueues it. Neither side takes a lock per sample. Without a
+    running aggregator, completed windows are aggregated inline.
+    
+    Provider clocks are not comparable (Power Core and the Atmospheric
+    Probe count from different epochs), so each provider's timestamps are
+    measured against that provider's first sample in the window. The
+    window's timestamp is that of the sample that opened it.
     """
     
     def __init__(
         self,
         output_path: Path | None = None,
         persist_enabled: bool = False,
+        ring_capacity: int = RING_CAPACITY,
+        persist_path: str | None = None,
+        reductions: dict[str, str] | None = None,
     ):
         """
         Initialize live capture queue manager.
         
         Args:
-            output_path: Path to write CSV data (if None, no writing)
+            output_path: Path to write recording data (if None, no writing)
             persist_enabled: Enable disk persistence for crash recovery
+            ring_capacity: Raw samples buffered ahead of the aggregator
+            persist_path: Directory for the persistence log (defaults to
+                the live capture queue config)
+            reductions: Per standard channel window reduction ("last",
+                "mean", "min" or "max"; default "last")
         """
         self.output_path = output_path
         
         # Create queue
         queue_settings = create_live_capture_queue_config()
         queue_settings.persist_to_disk = persist_enabled
+        if persist_path is not None:
+            queue_settings.persist_path = persist_path
         self.queue = IngestionQueue(settings=queue_settings)
         
         # Create adapter for sample aggregation
         self.adapter = JetDriveAdapter()
+        self.aggregator = StreamingWindowAggregator(AGGREGATION_WINDOW_MS, reductions)
+        self._slot_for = self.aggregator.slot_for
+        
+        # Raw sample ring (producer: receive thread, consumer: aggregator)
+        self._ring = RecordRing(SAMPLE_RECORD_DTYPE, ring_capacity)
+        self._reset_windowing()
         
-        # Sample aggregation buffer (grouped by window)
-        self._sample_buffer: list[JetDriveSample] = []
-        self._buffer_lock = threading.Lock()
-        self._last_window_start_ms: int = 0
+        # Serializes consumers (aggregator thread vs. inline/forced drains)
+        self._drain_lock = threading.Lock()
         
-        # CSV writer
-        self._csv_file = None
-        self._csv_writer = None
-        self._csv_lock = threading.Lock()
+        # Recording sink (CSV or .dynorec)
+        self._recording: RecordingSink | None = None
+        self._rows_recorded = 0  # Rows written by already closed recordings
         
         # Stats
-        self.stats = LiveCaptureQueueStats()
-        self.stats.persist_enabled = persist_enabled
-        self._stats_lock = threading.Lock()
+        self._counters = ThreadLocalCounters(_COUNTERS)
+        self._queue_high_watermark = 0
+        self._last_flush_time = 0.0
+        self._persist_enabled = persist_enabled
         
-        # Background processor thread
+        # Background threads
         self._processing = False
+        self._processor = None
         self._process_thread: threading.Thread | None = None
+        self._aggregator_stop = threading.Event()
+        self._aggregator_thread: threading.Thread | None = None
         
         # Real-time analysis engine (Phase 4)
         self._realtime_engine: RealtimeAnalysisEngine | None = None
-        
+    
+    def _reset_windowing(self) -> None:
+        # Producer-owned window state
+        self._window_seq = 0  # Windows < this are complete
+        self._window_first_ts: dict[int, int] = {}  # provider -> first ts in window
+        self._window_starts: dict[int, int] = {0: 0}  # window -> start ts
+    
+    @property
+    def stats(self) -> LiveCaptureQueueStats:
+        """Snapshot of the statistics, merged across threads."""
+        return LiveCaptureQueueStats(
+            **self._counters.snapshot(),
+            samples_written=self._samples_written(),
+            queue_high_watermark=self._queue_high_watermark,
+            last_flush_time=self._last_flush_time,
+            persist_enabled=self._persist_enabled,
+            persist_lag_ms=self.queue.persist_lag_ms,
+        )
+    
+    # =========================================================================
+    # Producer side (UDP receive thread)
+    # =========================================================================
+    
+    def _closes_window(self, provider_id: int, timestamp_ms: int) -> bool:
+        """Whether this sample falls past the current window."""
+        first_ts = self._window_first_ts.get(provider_id)
+        return first_ts is not None and timestamp_ms - first_ts >= AGGREGATION_WINDOW_MS
+    
+    def _advance_window(self, provider_id: int, timestamp_ms: int) -> int:
+        """Close the current window if this sample falls past it."""
+        if provider_id not in self._window_first_ts:
+            if not self._window_first_ts:
+                self._window_starts[self._window_seq] = timestamp_ms
+            self._window_first_ts[provider_id] = timestamp_ms
+        elif self._closes_window(provider_id, timestamp_ms):
+            # Start new window
+            self._window_seq += 1
+            self._window_starts[self._window_seq] = timestamp_ms
+            self._window_first_ts = {provider_id: timestamp_ms}
+            if self._aggregator_thread is None:
+                self._drain()
+        return self._window_seq
+    
     def on_sample(self, sample: JetDriveSample) -> None:
         """
         Receive a raw sample from JetDrive.
         
-        Buffers samples for aggregation into 50ms windows.
+        Buffers samples for aggregation into 50ms windows. Must only be
+        called from one thread at a time (the receive thread).
+        """
+        self._counters.add("samples_received")
+        window = self._advance_window(sample.provider_id, sample.timestamp_ms)
+        record = (
+            sample.timestamp_ms,
+            window,
+            self._slot_for(sample.channel_name),
+            sample.value,
+        )
+        if not self._ring.push(record):
+            self._counters.add("samples_overrun")
+    
+    def on_batch(self, batch: JetDriveSampleBatch) -> None:
         """
-        with self._stats_lock:
-            self.stats.samples_received += 1
+        Receive a whole decoded ChannelValues frame.
         
-        with self._buffer_lock:
-            # Initialize window start if first sample
-            if self._last_window_start_ms == 0:
-                self._last_window_start_ms = sample.timestamp_ms
+        Equivalent to calling ``on_sample`` for each value, without
+        creating a JetDriveSample per value. A frame crossing a window
+        boundary is pushed in segments, so the closing window is complete
+        in the ring before it can be drained.
+        """
+        count = len(batch)
+        if count == 0:
+            return
+        self._counters.add("samples_received", count)
+        
+        provider_id = batch.provider_id
+        resolve = batch.table.resolve
+        records = np.empty(count, dtype=SAMPLE_RECORD_DTYPE)
+        records["timestamp_ms"] = batch.timestamps_ms
+        records["value"] = batch.values
+        records["slot"] = [
+            self._slot_for(resolve(chan_id)[0])
+            for chan_id in batch.channel_ids.tolist()
+        ]
+        windows = records["window"]
+        lo = 0
+        for i, ts in enumerate(batch.timestamps_ms.tolist()):
+            if i > lo and self._closes_window(provider_id, ts):
+                self._push_records(records[lo:i])
+                lo = i
+            windows[i] = self._advance_window(provider_id, ts)
+        self._push_records(records[lo:])
+    
+    def _push_records(self, records: np.ndarray) -> None:
+        accepted = self._ring.push_many(records)
+        if accepted < len(records):
+            self._counters.add("samples_overrun", len(records) - accepted)
+    
+    def force_flush(self) -> None:
+        """
+        Force flush the current aggregation window.
+        
+        Call from the receive thread or after it has stopped.
+        """
+        if self._window_first_ts:
+            self._window_seq += 1
+            self._window_starts[self._window_seq] = 0
+            self._window_first_ts = {}
+        self._drain()
+    
+    # =========================================================================
+    # Consumer side (aggregator)
+    # =========================================================================
+    
+    def _drain(self) -> int:
+        """
+        Aggregate every completed window in the ring and enqueue the results.
+        
+        Returns:
+            Number of windows aggregated
+        """
+        with self._drain_lock:
+            # Read the window sequence before the ring contents: every record
+            # of a window below it has already been published.
+            complete_below = self._window_seq
+            records = self._ring.peek()
+            if len(records) == 0:
+                return 0
+            count = int(np.searchsorted(records["window"], complete_below, side="left"))
+            if count == 0:
+                return 0
+            records = records[:count]
             
-            # Check if we need to flush the current window
-            if sample.timestamp_ms - self._last_window_start_ms >= AGGREGATION_WINDOW_MS:
-                # Flush current window
-                self._flush_aggregation_window()
-                
-                # Start new window
-                self._last_window_start_ms = sample.timestamp_ms
-                self._sample_buffer.clear()
+            windows = records["window"]
+            bounds = np.flatnonzero(np.diff(windows)) + 1
+            starts = np.concatenate(([0], bounds))
+            ends = np.concatenate((bounds, [count]))
+            for lo, hi in zip(starts.tolist(), ends.tolist()):
+                window = int(windows[lo])
+                self._flush_aggregation_window(
+                    self._window_starts.pop(window, 0),
+                    records["slot"][lo:hi],
+                    records["value"][lo:hi],
+                )
             
-            # Add to current window
-            self._sample_buffer.append(sample)
+            self._ring.advance(count)
+            return len(starts)
     
-    def _flush_aggregation_window(self) -> None:
+    def _flush_aggregation_window(
+        self,
+        window_start_ms: int,
+        slots: np.ndarray,
+        values: np.ndarray,
+    ) -> None:
         """
-        Flush the current aggregation window to the queue.
+        Aggregate one window (reduced per channel) and enqueue it.
         
-        Called from within buffer lock.
+        Called from within the drain lock.
         """
-        if not self._sample_buffer:
-            return
-        
+        sample_count = len(slots)
         try:
-            # Aggregate samples using adapter
-            # adapter.aggregate_samples() takes list and returns list of DynoDataPointSchema
-            aggregated = self.adapter.aggregate_samples(
-                self._sample_buffer,
-                time_window_ms=AGGREGATION_WINDOW_MS
-            )
+            window_values = self.aggregator.reduce(slots, values)
+            point = self.adapter.make_point(window_start_ms, window_values)
+            
+            self._counters.add("samples_aggregated", sample_count)
+            self._counters.add("aggregation_windows")
             
-            if not aggregated:
-                return
+            point_dict = point.to_dict()
+            
+            # Feed to real-time analysis engine (Phase 4)
+            if self._realtime_engine is not None:
+                try:
+                    self._realtime_engine.on_aggregated_sample(point_dict)
+                except Exception as e:
+                    # Don't let analysis errors block capture
+                    logger.warning(f"Realtime analysis error (non-blocking): {e}")
             
-            with self._stats_lock:
-                self.stats.samples_aggregated += len(self._sample_buffer)
-                self.stats.aggregation_windows += 1
+            item_id = self.queue.enqueue(
+                source="jetdrive_live",
+                data=point_dict,
+                priority=QueuePriority.HIGH,  # Real-time data is high priority
+                metadata={
+                    "window_start_ms": window_start_ms,
+                    "sample_count": sample_count,
+                }
+            )
             
-            # Enqueue aggregated data point(s)
-            for point in aggregated:
-                point_dict = point.to_dict()
-                
-                # Feed to real-time analysis engine (Phase 4)
-                if self._realtime_engine is not None:
-                    try:
-                        self._realtime_engine.on_aggregated_sample(point_dict)
-                    except Exception as e:
-                        # Don't let analysis errors block capture
-                        logger.warning(f"Realtime analysis error (non-blocking): {e}")
-                
-                item_id = self.queue.enqueue(
-                    source="jetdrive_live",
-                    data=point_dict,
-                    priority=QueuePriority.HIGH,  # Real-time data is high priority
-                    metadata={
-                        "window_start_ms": self._last_window_start_ms,
-                        "sample_count": len(self._sample_buffer),
-                    }
+            if item_id:
+                self._counters.add("samples_enqueued")
+                self._queue_high_watermark = max(
+                    self._queue_high_watermark, len(self.queue)
                 )
-                
-                if item_id:
-                    with self._stats_lock:
-                        self.stats.samples_enqueued += 1
-                        queue_size = len(self.queue)
-                        self.stats.queue_high_watermark = max(
-                            self.stats.queue_high_watermark, queue_size
-                        )
-                else:
-                    with self._stats_lock:
-                        self.stats.samples_dropped += 1
-                    logger.warning("Queue full, dropped aggregated sample")
+            else:
+                self._counters.add("samples_dropped")
+                logger.warning("Queue full, dropped aggregated sample")
         
         except Exception as e:
             logger.error(f"Error flushing aggregation window: {e}")
     
-    def force_flush(self) -> None:
-        """Force flush the current aggregation window."""
-        with self._buffer_lock:
-            if self._sample_buffer:
-                self._flush_aggregation_window()
-                self._sample_buffer.clear()
+    def _aggregator_loop(self) -> None:
+        interval = AGGREGATION_WINDOW_MS / 1000.0 / 2
+        while not self._aggregator_stop.wait(interval):
+            try:
+                self._drain()
+                recording = self._recording
+                if recording is not None:
+                    # Bound the crash-loss window while capture is idle
+                    recording.flush_if_stale()
+            except Exception as e:
+                logger.error(f"Aggregator error: {e}")
+    
+    def _start_aggregator(self) -> None:
+        self._aggregator_stop.clear()
+        self._aggregator_thread = threading.Thread(
+            target=self._aggregator_loop,
+            name="jetdrive-live-aggregator",
+            daemon=True,
+        )
+        self._aggregator_thread.start()
+    
+    def _stop_aggregator(self) -> None:
+        thread = self._aggregator_thread
+        if thread is None:
+            return
+        self._aggregator_stop.set()
+        thread.join(timeout=5.0)
+        self._aggregator_thread = None
     
     def start_processing(self, csv_path: Path | None = None) -> None:
         """
         Start background queue processing.
         
         Args:
-            csv_path: Optional path to write CSV data
+            csv_path: Optional path to record data to. A ``.dynorec``
+                suffix selects the binary columnar format, otherwise CSV.
         """
         if self._processing:
             logger.warning("Processing already started")
@@ -240,119 +434,91 @@ class LiveCaptureQueueManager:
         
         self._processing = True
         
-        # Open CSV file if path provided
+        # Open recording if path provided
         if csv_path:
-            self._open_csv(csv_path)
-        
-        # Define processor function
-        def processor(item: QueueItem) -> bool:
-            """Process a queue item (write to CSV)."""
-            try:
-                if self._csv_writer:
-                    # Write data point to CSV
-                    data = item.data
-                    self._write_csv_row(data)
-                    
-                    with self._stats_lock:
-                        self.stats.samples_written += 1
-                
-                return True
-            except Exception as e:
-                logger.error(f"Error processing item {item.id}: {e}")
-                return False
+            self._open_recording(csv_path)
+        
+        # Define batch processor function
+        def processor(items: list[QueueItem]) -> list[bool]:
+            """Process drained queue items (buffer for recording)."""
+            recording = self._recording
+            if recording is None:
+                return [True] * len(items)
+            results = []
+            for item in items:
+                try:
+                    recording.append(item.data)
+                    results.append(True)
+                except Exception as e:
+                    logger.error(f"Error processing item {item.id}: {e}")
+                    results.append(False)
+            return results
         
         # Start queue processing
-        self.queue.start_processing(processor, interval=BATCH_FLUSH_INTERVAL_SEC)
+        self._processor = processor
+        self.queue.start_processing(
+            processor, interval=BATCH_FLUSH_INTERVAL_SEC, batch=True
+        )
+        self._start_aggregator()
         
-        with self._stats_lock:
-            self.stats.last_flush_time = time.time()
+        self._last_flush_time = time.time()
         
         logger.info("Live capture queue processing started")
     
     def stop_processing(self) -> None:
-        """Stop background processing and close CSV file."""
-        # Force flush any remaining samples
+        """Stop background processing and close the recording."""
+        # Stop the aggregator, then force flush any remaining samples
+        self._stop_aggregator()
         self.force_flush()
         
         # Stop queue processing
         self.queue.stop_processing()
         
-        # Wait for queue to drain (with timeout)
-        timeout = 10.0
-        start = time.time()
-        while len(self.queue) > 0 and time.time() - start < timeout:
-            time.sleep(0.1)
+        # Record whatever the background thread had not reached yet
+        if self._processor is not None:
+            drain_queue(
+                self.queue, self._processor, timeout_sec=10.0, batch=True
+            )
+            self._processor = None
         
         self._processing = False
         
-        # Close CSV
-        self._close_csv()
+        # Close recording
+        self._close_recording()
         
         logger.info("Live capture queue processing stopped")
     
-    def _open_csv(self, path: Path) -> None:
-        """Open CSV file for writing."""
-        import csv
-        
-        with self._csv_lock:
+    def _open_recording(self, path: Path) -> None:
+        """Open the recording sink."""
+        try:
+            self._recording = RecordingSink(
+                path, flush_interval_sec=BATCH_FLUSH_INTERVAL_SEC
+            )
+            logger.info(f"Opened {self._recording.format} recording: {path}")
+        except Exception as e:
+            logger.error(f"Failed to open recording {path}: {e}")
+            self._recording = None
+    
+    def _close_recording(self) -> None:
+        """Write buffered rows and close the recording."""
+        recording, self._recording = self._recording, None
+        if recording is not None:
             try:
-                # Ensure parent directory exists
-                path.parent.mkdir(parents=True, exist_ok=True)
-                
-                self._csv_file = open(path, 'w', newline='', encoding='utf-8')
-                
-                # Define columns (based on DynoDataPointSchema)
-                columns = [
-                    'timestamp_ms', 'rpm', 'horsepower', 'torque',
-                    'afr', 'afr_front', 'afr_rear',
-                    'map_kpa', 'tps', 'iat', 'ect',
-                    'force_lbs', 'acceleration',
-                    'speed_mph', 'gear',
-                ]
-                
-                self._csv_writer = csv.DictWriter(
-                    self._csv_file,
-                    fieldnames=columns,
-                    extrasaction='ignore'  # Ignore extra fields
-                )
-                self._csv_writer.writeheader()
-                
-                logger.info(f"Opened CSV file: {path}")
+                recording.close()
+                logger.info(f"Closed recording ({recording.rows_written} rows)")
             except Exception as e:
-                logger.error(f"Failed to open CSV file {path}: {e}")
-                self._csv_file = None
-                self._csv_writer = None
-    
-    def _write_csv_row(self, data: dict[str, Any]) -> None:
-        """Write a single row to CSV."""
-        with self._csv_lock:
-            if self._csv_writer:
-                try:
-                    self._csv_writer.writerow(data)
-                    # Flush periodically (every second via batch processor)
-                    if self.stats.samples_written % 20 == 0:
-                        self._csv_file.flush()
-                except Exception as e:
-                    logger.error(f"Failed to write CSV row: {e}")
+                logger.error(f"Error closing recording: {e}")
+            self._rows_recorded += recording.rows_written
     
-    def _close_csv(self) -> None:
-        """Close CSV file."""
-        with self._csv_lock:
-            if self._csv_file:
-                try:
-                    self._csv_file.flush()
-                    self._csv_file.close()
-                    logger.info("Closed CSV file")
-                except Exception as e:
-                    logger.error(f"Error closing CSV file: {e}")
-                finally:
-                    self._csv_file = None
-                    self._csv_writer = None
+    def _samples_written(self) -> int:
+        """Rows flushed to recordings (excludes rows still buffered)."""
+        recording = self._recording
+        current = recording.rows_written if recording is not None else 0
+        return self._rows_recorded + current
     
     def get_stats(self) -> dict[str, Any]:
         """Get current statistics."""
-        with self._stats_lock:
-            stats = self.stats.to_dict()
+        stats = self.stats.to_dict()
         
         # Add queue stats
         queue_stats = self.queue.get_stats()
@@ -361,14 +527,16 @@ class LiveCaptureQueueManager:
         return stats
     
     def reset(self) -> None:
-        """Reset all state (for testing or restart)."""
-        with self._buffer_lock:
-            self._sample_buffer.clear()
-            self._last_window_start_ms = 0
-        
-        with self._stats_lock:
-            self.stats = LiveCaptureQueueStats()
-            self.stats.persist_enabled = self.queue.settings.persist_to_disk
+        """Reset all state (for testing or restart). Capture must be stopped."""
+        with self._drain_lock:
+            self._ring.clear()
+            self._reset_windowing()
+        
+        self._counters.reset()
+        self._queue_high_watermark = 0
+        self._last_flush_time = 0.0
+        self._rows_recorded = 0
+        self._persist_enabled = self.queue.settings.persist_to_disk
         
         self.queue.clear()
         self.adapter.reset()
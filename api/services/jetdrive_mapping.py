@@ -21,6 +21,10 @@ Usage:
     
     # Apply mapping to a sample
     canonical_name, transformed_value = apply_mapping(mapping, sample)
+    
+    # Map a whole decoded frame at once
+    compiled = mapping.compile()
+    slots, values = compiled.apply(batch.channel_ids, batch.values)
 """
 
 from __future__ import annotations
@@ -34,6 +38,8 @@ from datetime import datetime
 from pathlib import Path
 from typing import Any, Callable
 
+import numpy as np
+
 logger = logging.getLogger(__name__)
 
 
@@ -196,6 +202,9 @@ class ProviderMapping:
     created_at: str = ""
     updated_at: str = ""
     channels: dict[str, ChannelMapping] = field(default_factory=dict)
+    _compiled: CompiledMapping | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     def to_dict(self) -> dict[str, Any]:
         return {
@@ -257,6 +266,134 @@ class ProviderMapping:
         mapped = set(self.channels.keys())
         return [ch for ch in RECOMMENDED_CANONICAL if ch not in mapped]
 
+    def fingerprint(self) -> tuple:
+        """Everything that affects how samples are mapped."""
+        return tuple(
+            (name, m.source_id, m.transform, m.enabled)
+            for name, m in self.channels.items()
+        )
+
+    def compile(self) -> CompiledMapping:
+        """
+        Get the compiled form of this mapping.
+
+        The compiled mapping is cached and rebuilt only when the channel
+        mappings change. Call once per frame (or session), not per sample.
+        """
+        fingerprint = self.fingerprint()
+        if self._compiled is None or self._compiled.fingerprint != fingerprint:
+            self._compiled = CompiledMapping(self, fingerprint)
+        return self._compiled
+
+
+class CompiledMapping:
+    """
+    Dense lookup tables for applying a ProviderMapping on the live path.
+
+    ``slot_by_id[source_id]`` is the index of the canonical channel the
+    source maps to (-1 if unmapped or disabled); ``canonical_names`` and
+    ``transforms`` are indexed by slot. When several enabled mappings share
+    a source ID the first one wins, as in ``apply_mapping_to_sample``.
+    """
+
+    # Wire channel IDs are u16; wider (merged-provider) IDs go in a dict
+    MAX_DENSE_ID = 0xFFFF
+
+    __slots__ = (
+        "fingerprint",
+        "canonical_names",
+        "transforms",
+        "slot_by_id",
+        "_wide_slots",
+        "_group_transforms",
+        "_group_by_slot",
+    )
+
+    def __init__(self, mapping: ProviderMapping, fingerprint: tuple | None = None):
+        self.fingerprint = fingerprint if fingerprint is not None else mapping.fingerprint()
+        names: list[str] = []
+        transforms: list[Callable[[Any], Any]] = []
+        slots: dict[int, int] = {}
+        for canonical_name, ch_mapping in mapping.channels.items():
+            if not ch_mapping.enabled or ch_mapping.source_id in slots:
+                continue
+            slots[ch_mapping.source_id] = len(names)
+            names.append(canonical_name)
+            transforms.append(TRANSFORMS.get(ch_mapping.transform, identity))
+
+        self.canonical_names: tuple[str, ...] = tuple(names)
+        self.transforms: tuple[Callable[[Any], Any], ...] = tuple(transforms)
+
+        dense = {i: s for i, s in slots.items() if 0 <= i <= self.MAX_DENSE_ID}
+        self.slot_by_id = np.full(max(dense, default=-1) + 1, -1, dtype=np.int32)
+        for source_id, slot in dense.items():
+            self.slot_by_id[source_id] = slot
+        self._wide_slots = {i: s for i, s in slots.items() if i not in dense}
+
+        # Group slots by non-identity transform so apply() runs each
+        # transform once per frame. Group 0 means "no transform"; the extra
+        # trailing entry makes slot -1 (unmapped) land in group 0 as well.
+        group_transforms: list[Callable[[Any], Any]] = []
+        self._group_by_slot = np.zeros(len(transforms) + 1, dtype=np.int8)
+        for slot, transform in enumerate(transforms):
+            if transform is identity:
+                continue
+            if transform not in group_transforms:
+                group_transforms.append(transform)
+            self._group_by_slot[slot] = group_transforms.index(transform) + 1
+        self._group_transforms = tuple(group_transforms)
+
+    def slot_for(self, channel_id: int) -> int:
+        """Canonical slot for a source channel ID, or -1 if unmapped."""
+        if 0 <= channel_id < len(self.slot_by_id):
+            return int(self.slot_by_id[channel_id])
+        return self._wide_slots.get(channel_id, -1)
+
+    def slots_for(self, channel_ids: np.ndarray) -> np.ndarray:
+        """Vectorized ``slot_for``."""
+        ids = np.asarray(channel_ids, dtype=np.int64)
+        table = self.slot_by_id
+        in_range = (ids >= 0) & (ids < len(table))
+        slots = np.full(ids.shape, -1, dtype=np.int32)
+        slots[in_range] = table[ids[in_range]]
+        if self._wide_slots:
+            for i in np.flatnonzero(~in_range):
+                slots[i] = self._wide_slots.get(int(ids[i]), -1)
+        return slots
+
+    def apply_one(self, channel_id: int, value: float) -> tuple[str | None, float]:
+        """Map a single sample; same result as ``apply_mapping_to_sample``."""
+        slot = self.slot_for(channel_id)
+        if slot < 0:
+            return None, value
+        return self.canonical_names[slot], self.transforms[slot](value)
+
+    def apply(
+        self, channel_ids: np.ndarray, values: np.ndarray
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Map a whole frame in one call.
+
+        Args:
+            channel_ids: Source channel IDs
+            values: Source values (same length)
+
+        Returns:
+            ``(slots, transformed)`` where ``slots`` indexes
+            ``canonical_names`` (-1 for unmapped samples) and ``transformed``
+            is float64 with each slot's transform applied; unmapped values
+            are passed through unchanged.
+        """
+        slots = self.slots_for(channel_ids)
+        out = np.array(values, dtype=np.float64)
+        if self._group_transforms:
+            groups = self._group_by_slot[slots]
+            for group, transform in enumerate(self._group_transforms, start=1):
+                mask = groups == group
+                if mask.any():
+                    out[mask] = transform(out[mask])
+        return slots, out
+
 
 # =============================================================================
 # Provider Signature
@@ -568,7 +705,7 @@ def apply_transform(value: float, transform_name: str) -> float:
 
 
 def apply_mapping_to_sample(
-    mapping: ProviderMapping,
+    mapping: ProviderMapping | CompiledMapping,
     channel_id: int,
     channel_name: str,
     value: float,
@@ -577,7 +714,7 @@ def apply_mapping_to_sample(
     Apply mapping to a single sample.
 
     Args:
-        mapping: ProviderMapping to use
+        mapping: ProviderMapping to use, or its compiled form for O(1) lookup
         channel_id: Source channel ID
         channel_name: Source channel name
         value: Source value
@@ -586,6 +723,9 @@ def apply_mapping_to_sample(
         Tuple of (canonical_name, transformed_value).
         canonical_name is None if channel is not mapped.
     """
+    if isinstance(mapping, CompiledMapping):
+        return mapping.apply_one(channel_id, value)
+
     # Find mapping by source channel ID
     for canonical_name, ch_mapping in mapping.channels.items():
         if ch_mapping.source_id == channel_id and ch_mapping.enabled:
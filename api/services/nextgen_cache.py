@@ -0,0 +1,444 @@
+"""
+Content-Addressed NextGen Result Cache.
+
+Caches NextGen analysis payloads on disk keyed by what they were computed
+from, not by run ID: the SHA-256 of the input CSV, the pipeline
+configuration, the planner constraints and the payload schema version.
+Re-uploading an identical log under a new run therefore reuses the earlier
+result instead of re-running the whole pipeline.
+
+Intermediate pipeline artifacts (normalized frame, mode labels, surfaces)
+are memoized as pickles under ``stages/<stage>/``, keyed by their upstream
+inputs, so a change that only affects later stages (e.g. planner
+constraints) skips the expensive early ones.
+
+The cache directory is a trust boundary: loading a stage pickle can run
+arbitrary code, so it must only be writable by the DynoAI service itself
+(never a shared or user-supplied location). Stage entries that fail to
+load for any reason, such as pickles written by an older code version,
+are treated as misses and deleted.
+
+Features:
+- Shared across run IDs
+- Per-stage artifact memoization
+- LRU eviction bounded by entry count and total size on disk, tracked
+  in memory so a put does not rescan the cache directory
+- Thread-safe operations
+- Hit/miss counters (also exported via api.metrics)
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import pickle
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any
+
+from api.metrics import record_nextgen_cache
+from dynoai.core.io_contracts import file_sha256
+
+__all__ = [
+    "NextGenResultCache",
+    "get_nextgen_cache",
+]
+
+logger = logging.getLogger(__name__)
+
+RESULT_GROUP = "result"
+STAGES_DIR = "stages"
+FILE_HASH_MEMO_SIZE = 256
+
+
+def _canonical_json(data: Any) -> str:
+    """Key-order independent JSON used for hashing configuration."""
+    return json.dumps(data, sort_keys=True, separators=(",", ":"), default=str)
+
+
+class NextGenResultCache:
+    """
+    On-disk payload cache keyed by content hash.
+
+    Result entries are ``<key>.json`` files in ``cache_dir``; stage artifacts
+    are ``stages/<stage>/<key>.pkl``. The directory is scanned once, on
+    first use, ordering entries by mtime; after that an in-memory LRU index
+    with running size totals decides what to evict. ``max_entries`` applies
+    to results and to each stage separately; ``max_bytes`` bounds the whole
+    cache directory. Entries written by other processes are picked up the
+    next time ``clear()`` is called or the process restarts.
+
+    A cached payload is returned exactly as stored, including the
+    ``generated_at`` of the analysis that produced it.
+
+    Usage:
+        cache = NextGenResultCache(Path("data/cache/nextgen"))
+        key = cache.make_key(csv_path, config, constraints, SCHEMA_VERSION)
+
+        payload = cache.get(key)
+        if payload is None:
+            payload_json = run_pipeline(...)
+            cache.put(key, payload_json)
+    """
+
+    def __init__(
+        self,
+        cache_dir: Path,
+        max_entries: int = 200,
+        max_bytes: int = 500 * 1024 * 1024,
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            cache_dir: Directory holding cache entries
+            max_entries: Maximum number of cached payloads
+            max_bytes: Maximum total size of cached payloads
+        """
+        self._cache_dir = Path(cache_dir)
+        self._max_entries = max(1, max_entries)
+        self._max_bytes = max(1, max_bytes)
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        # path -> (mtime_ns, size, sha256), so unchanged inputs aren't rehashed
+        self._file_hashes: OrderedDict[str, tuple[int, int, str]] = OrderedDict()
+        # LRU index, oldest first: path -> (size, group); None until scanned
+        self._index: OrderedDict[Path, tuple[int, str]] | None = None
+        self._total_bytes = 0
+        self._group_counts: dict[str, int] = {}
+
+    @property
+    def cache_dir(self) -> Path:
+        return self._cache_dir
+
+    def hash_file(self, path: Path) -> str:
+        """SHA-256 of a file, memoized on path, mtime and size (LRU-bounded)."""
+        st = os.stat(path)
+        memo_key = str(Path(path).resolve())
+        with self._lock:
+            memo = self._file_hashes.get(memo_key)
+            if memo is not None and memo[:2] == (st.st_mtime_ns, st.st_size):
+                self._file_hashes.move_to_end(memo_key)
+                return memo[2]
+
+        digest = file_sha256(str(path))
+        with self._lock:
+            self._file_hashes[memo_key] = (st.st_mtime_ns, st.st_size, digest)
+            self._file_hashes.move_to_end(memo_key)
+            while len(self._file_hashes) > FILE_HASH_MEMO_SIZE:
+                self._file_hashes.popitem(last=False)
+        return digest
+
+    def make_key(
+        self,
+        csv_path: Path,
+        config: dict[str, Any],
+        constraints: dict[str, Any],
+        schema_version: str,
+    ) -> str:
+        """
+        Build the cache key for an analysis.
+
+        Args:
+            csv_path: Input CSV
+            config: Pipeline configuration (JSON-serializable)
+            constraints: Planner constraints (JSON-serializable)
+            schema_version: Payload schema version
+
+        Returns:
+            Hex SHA-256 cache key
+        """
+        material = _canonical_json(
+            {
+                "csv_sha256": self.hash_file(csv_path),
+                "config": config,
+                "constraints": constraints,
+                "schema_version": schema_version,
+            }
+        )
+        return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def stage_key(stage: str, *inputs: Any) -> str:
+        """
+        Build the key of a pipeline stage from its upstream inputs.
+
+        Args:
+            stage: Stage name
+            *inputs: JSON-serializable inputs, typically the upstream
+                stage key plus this stage's configuration
+
+        Returns:
+            Hex SHA-256 stage key
+        """
+        material = _canonical_json({"stage": stage, "inputs": list(inputs)})
+        return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def _check_key(key: str) -> None:
+        if not key or not all(c in "0123456789abcdef" for c in key):
+            raise ValueError(f"Invalid cache key: {key!r}")
+
+    def _entry_path(self, key: str) -> Path:
+        self._check_key(key)
+        return self._cache_dir / f"{key}.json"
+
+    def _stage_path(self, stage: str, key: str) -> Path:
+        self._check_key(key)
+        if not stage.isidentifier():
+            raise ValueError(f"Invalid stage name: {stage!r}")
+        return self._cache_dir / STAGES_DIR / stage / f"{key}.pkl"
+
+    def get(self, key: str) -> dict[str, Any] | None:
+        """
+        Look up a cached payload.
+
+        Args:
+            key: Cache key from make_key()
+
+        Returns:
+            Payload dict on a hit, None on a miss
+        """
+        path = self._entry_path(key)
+        try:
+            with open(path, encoding="utf-8") as f:
+                payload = json.load(f)
+            os.utime(path)  # mark as recently used
+        except FileNotFoundError:
+            payload = None
+        except (json.JSONDecodeError, OSError) as e:
+            logger.warning(f"Discarding unreadable NextGen cache entry {key}: {e}")
+            path.unlink(missing_ok=True)
+            payload = None
+
+        with self._lock:
+            if payload is None:
+                self._misses += 1
+                self._forget(path)
+            else:
+                self._hits += 1
+                self._touch(path)
+        record_nextgen_cache("hit" if payload is not None else "miss")
+        return payload
+
+    def get_stage(self, stage: str, key: str) -> Any | None:
+        """
+        Load a memoized stage artifact.
+
+        Args:
+            stage: Stage name (e.g. "normalize")
+            key: Stage key from stage_key()
+
+        Returns:
+            The stored artifact, or None on a miss (including entries that
+            can't be unpickled by the current code)
+        """
+        path = self._stage_path(stage, key)
+        try:
+            with open(path, "rb") as f:
+                value = pickle.load(f)
+            os.utime(path)  # mark as recently used
+        except FileNotFoundError:
+            value = None
+        except Exception as e:
+            # Unpickling can fail in many ways (ImportError, TypeError, ...)
+            logger.warning(f"Discarding unreadable {stage} stage entry {key}: {e}")
+            path.unlink(missing_ok=True)
+            value = None
+
+        with self._lock:
+            if value is None:
+                self._forget(path)
+            else:
+                self._touch(path)
+
+        record_nextgen_cache("hit" if value is not None else "miss", stage=stage)
+        return value
+
+    def put_stage(self, stage: str, key: str, value: Any) -> None:
+        """
+        Memoize a stage artifact and evict old entries if over budget.
+
+        Args:
+            stage: Stage name (e.g. "normalize")
+            key: Stage key from stage_key()
+            value: Picklable artifact
+        """
+        path = self._stage_path(stage, key)
+        try:
+            data = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+            self._write_atomic(path, data)
+        except (OSError, pickle.PicklingError) as e:
+            logger.warning(f"Failed to write {stage} stage entry {key}: {e}")
+            return
+
+        with self._lock:
+            self._record(path, len(data), stage)
+        self.evict()
+
+    @staticmethod
+    def _write_atomic(path: Path, data: bytes) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+
+    def put(self, key: str, payload_json: str) -> None:
+        """
+        Store a serialized payload and evict old entries if over budget.
+
+        Args:
+            key: Cache key from make_key()
+            payload_json: Payload serialized as JSON
+        """
+        path = self._entry_path(key)
+        data = payload_json.encode("utf-8")
+        try:
+            self._write_atomic(path, data)
+        except OSError as e:
+            logger.warning(f"Failed to write NextGen cache entry {key}: {e}")
+            return
+
+        with self._lock:
+            self._record(path, len(data), RESULT_GROUP)
+        self.evict()
+
+    def evict(self) -> int:
+        """
+        Remove least recently used entries until within the size limits.
+
+        Returns:
+            Number of entries removed
+        """
+        with self._lock:
+            index = self._load_index()
+            removed = 0
+            # Oldest first
+            for path, (_, group) in list(index.items()):
+                if (
+                    self._group_counts[group] <= self._max_entries
+                    and self._total_bytes <= self._max_bytes
+                ):
+                    continue
+                try:
+                    path.unlink(missing_ok=True)
+                except OSError:
+                    continue
+                self._forget(path)
+                removed += 1
+
+        if removed:
+            logger.info(f"Evicted {removed} NextGen cache entries")
+        return removed
+
+    # Index bookkeeping (call with the lock held)
+
+    def _load_index(self) -> OrderedDict[Path, tuple[int, str]]:
+        """Build the LRU index from the cache directory on first use."""
+        if self._index is None:
+            self._index = OrderedDict()
+            self._total_bytes = 0
+            self._group_counts = {}
+            entries = self._list_entries(include_stages=True)
+            for path, _, size, group in sorted(entries, key=lambda e: e[1]):
+                self._add(path, size, group)
+        return self._index
+
+    def _add(self, path: Path, size: int, group: str) -> None:
+        self._index[path] = (size, group)
+        self._total_bytes += size
+        self._group_counts[group] = self._group_counts.get(group, 0) + 1
+
+    def _forget(self, path: Path) -> None:
+        if self._index is None:
+            return
+        entry = self._index.pop(path, None)
+        if entry is not None:
+            size, group = entry
+            self._total_bytes -= size
+            self._group_counts[group] -= 1
+
+    def _record(self, path: Path, size: int, group: str) -> None:
+        """Add or replace an entry as the most recently used."""
+        self._load_index()
+        self._forget(path)
+        self._add(path, size, group)
+
+    def _touch(self, path: Path) -> None:
+        if self._index is not None and path in self._index:
+            self._index.move_to_end(path)
+
+    def _list_entries(
+        self, include_stages: bool = False
+    ) -> list[tuple[Path, float, int, str]]:
+        """List (path, mtime, size, group) for result and stage entries."""
+        paths = [(p, RESULT_GROUP) for p in self._cache_dir.glob("*.json")]
+        if include_stages:
+            paths.extend(
+                (p, p.parent.name)
+                for p in self._cache_dir.glob(f"{STAGES_DIR}/*/*.pkl")
+            )
+
+        entries = []
+        for path, group in paths:
+            try:
+                st = path.stat()
+            except OSError:
+                continue
+            entries.append((path, st.st_mtime, st.st_size, group))
+        return entries
+
+    def clear(self) -> None:
+        """Remove all cache entries and reset counters."""
+        with self._lock:
+            for path, _, _, _ in self._list_entries(include_stages=True):
+                path.unlink(missing_ok=True)
+            self._hits = 0
+            self._misses = 0
+            self._file_hashes.clear()
+            self._index = None
+
+    def stats(self) -> dict[str, Any]:
+        """Get cache statistics."""
+        with self._lock:
+            entries = self._list_entries(include_stages=True)
+            lookups = self._hits + self._misses
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_rate": self._hits / lookups if lookups else 0.0,
+                "entries": sum(1 for e in entries if e[3] == RESULT_GROUP),
+                "stage_entries": sum(1 for e in entries if e[3] != RESULT_GROUP),
+                "size_bytes": sum(size for _, _, size, _ in entries),
+                "max_entries": self._max_entries,
+                "max_bytes": self._max_bytes,
+            }
+
+
+# =============================================================================
+# Global Instance
+# =============================================================================
+
+_nextgen_cache: NextGenResultCache | None = None
+_nextgen_cache_lock = threading.Lock()
+
+
+def get_nextgen_cache() -> NextGenResultCache:
+    """Get or create the global NextGen result cache."""
+    global _nextgen_cache
+    with _nextgen_cache_lock:
+        if _nextgen_cache is None:
+            from api.config import get_config
+
+            config = get_config()
+            _nextgen_cache = NextGenResultCache(
+                cache_dir=config.storage.nextgen_cache_folder,
+                max_entries=config.analysis.nextgen_cache_max_entries,
+                max_bytes=config.analysis.nextgen_cache_max_mb * 1024 * 1024,
+            )
+        return _nextgen_cache
@@ -25,17 +25,19 @@ from __future__ import annotations
 import hashlib
 import json
 import logging
-from dataclasses import dataclass
+from dataclasses import asdict, dataclass
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Callable, Dict, Optional, TypeVar
 
 import pandas as pd
 
+from api.services.nextgen_cache import NextGenResultCache, get_nextgen_cache
 from api.services.run_manager import get_run_manager
+from dynoai.constants import KPA_BINS, RPM_BINS
 from dynoai.core.cause_tree import build_cause_tree
 from dynoai.core.log_normalizer import normalize_dataframe, get_channel_readiness
-from dynoai.core.mode_detection import label_modes
+from dynoai.core.mode_detection import ModeDetectionConfig, label_modes
 from dynoai.core.next_test_planner import generate_test_plan
 from dynoai.core.nextgen_payload import (
     SCHEMA_VERSION,
@@ -43,7 +45,11 @@ from dynoai.core.nextgen_payload import (
     build_nextgen_payload,
 )
 from dynoai.core.spark_valley import detect_valleys_multi_cylinder
-from dynoai.core.surface_builder import build_standard_surfaces
+from dynoai.core.surface_builder import (
+    build_standard_surfaces,
+    describe_surface_spec,
+    standard_surface_specs,
+)
 
 __all__ = [
     "NextGenWorkflow",
@@ -55,6 +61,8 @@ __all__ = [
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
 
 # =============================================================================
 # Configuration
@@ -149,6 +157,17 @@ def save_planner_constraints(constraints: TestPlannerConstraints, vehicle_id: st
 NEXTGEN_PAYLOAD_FILE = "NextGenAnalysis.json"
 NEXTGEN_META_FILE = "NextGenAnalysis_Meta.json"
 
+# Per-stage versions, part of each stage key: bump a stage's version when
+# its output changes shape or semantics (downstream keys follow)
+STAGE_VERSIONS = {
+    "normalize": 1,
+    "modes": 1,
+    "surfaces": 1,
+}
+
+# Surface builder settings (also part of the surfaces stage key)
+SURFACE_MIN_SAMPLES = 3
+
 
 # =============================================================================
 # Workflow Service
@@ -161,19 +180,75 @@ class NextGenWorkflow:
     Handles:
     - Input resolution (RunManager or fallback)
     - Analysis execution
-    - Output caching
+    - Output caching (per run, plus a content-addressed cache shared
+      across runs)
     - Metadata generation
     """
     
-    def __init__(self, runs_dir: str = "runs"):
+    def __init__(
+        self,
+        runs_dir: str = "runs",
+        result_cache: Optional[NextGenResultCache] = None,
+    ):
         """
         Initialize the workflow service.
         
         Args:
             runs_dir: Base directory for runs
+            result_cache: Shared result cache (defaults to the global one)
         """
         self._runs_dir = Path(runs_dir)
         self._run_manager = get_run_manager()
+        self._result_cache = result_cache
+    
+    @property
+    def result_cache(self) -> NextGenResultCache:
+        """Content-addressed result cache shared across runs."""
+        if self._result_cache is None:
+            self._result_cache = get_nextgen_cache()
+        return self._result_cache
+    
+    def compute_cache_key(self, csv_path: Path) -> str:
+        """
+        Compute the content-addressed cache key for an input CSV.
+        
+        The key covers the CSV contents, the pipeline configuration, the
+        planner constraints and the payload schema version, so changing any
+        of them produces a fresh analysis.
+        
+        Args:
+            csv_path: Path to input CSV
+            
+        Returns:
+            Hex SHA-256 cache key
+        """
+        return self.result_cache.make_key(
+            csv_path,
+            config={"mode_detection": asdict(ModeDetectionConfig())},
+            constraints=get_planner_constraints().to_dict(),
+            schema_version=SCHEMA_VERSION,
+        )
+    
+    def _stage_key(self, stage: str, *inputs: Any) -> str:
+        """Stage key covering the stage's version and its upstream inputs."""
+        return self.result_cache.stage_key(stage, STAGE_VERSIONS[stage], *inputs)
+    
+    def _memoized(self, stage: str, key: str, compute: Callable[[], T]) -> T:
+        """
+        Return a stage artifact from the stage cache, computing it on a miss.
+        
+        Args:
+            stage: Stage name
+            key: Stage key (covers all upstream inputs)
+            compute: Produces the artifact when it isn't cached
+        """
+        value = self.result_cache.get_stage(stage, key)
+        if value is not None:
+            logger.info(f"Reusing cached {stage} stage")
+            return value
+        value = compute()
+        self.result_cache.put_stage(stage, key, value)
+        return value
     
     def get_input_csv_path(self, run_id: str) -> Optional[Path]:
         """
@@ -256,6 +331,14 @@ class NextGenWorkflow:
                 )
                 return None
             
+            # Check the inputs haven't changed since the payload was written
+            cached_key = meta.get("cache_key")
+            if cached_key:
+                csv_path = self.get_input_csv_path(run_id)
+                if csv_path and self.compute_cache_key(csv_path) != cached_key:
+                    logger.info("Cache invalidated: inputs or configuration changed")
+                    return None
+            
             # Load payload
             with open(payload_path, "r", encoding="utf-8") as f:
                 payload = json.load(f)
@@ -311,12 +394,24 @@ class NextGenWorkflow:
             return result
         
         try:
-            # Execute pipeline
-            payload = self._execute_pipeline(run_id, csv_path)
+            cache_key = self.compute_cache_key(csv_path)
+            
+            # Identical inputs analyzed under another run can be reused
+            cached = None if force else self.result_cache.get(cache_key)
+            if cached:
+                logger.info(f"NextGen result cache hit for run {run_id}")
+                # generated_at stays that of the analysis that produced it
+                payload = NextGenAnalysisPayload.from_dict(cached)
+                payload.run_id = run_id
+                result["from_cache"] = True
+            else:
+                payload = self._execute_pipeline(run_id, csv_path)
             
             # Write outputs
             output_dir = self.get_output_dir(run_id)
-            self._write_outputs(output_dir, payload)
+            payload_json = self._write_outputs(output_dir, payload, cache_key)
+            if not cached:
+                self.result_cache.put(cache_key, payload_json)
             
             # Build response
             payload_dict = payload.to_dict()
@@ -340,6 +435,12 @@ class NextGenWorkflow:
         """
         Execute the full NextGen analysis pipeline.
         
+        Normalization, mode labeling and surface building are memoized per
+        stage, keyed by the stage version, the CSV hash or upstream stage key,
+        and the stage's configuration (for surfaces: builder settings and the
+        serialized surface specs), so only stages whose inputs changed are
+        re-run.
+        
         Args:
             run_id: The run ID
             csv_path: Path to input CSV
@@ -349,14 +450,22 @@ class NextGenWorkflow:
         """
         logger.info(f"Starting NextGen analysis for run {run_id}")
         
-        # Step 1: Load CSV
-        logger.info(f"Loading CSV from {csv_path}")
-        df = pd.read_csv(csv_path)
-        logger.info(f"Loaded {len(df)} rows, {len(df.columns)} columns")
+        cache = self.result_cache
+        mode_config = ModeDetectionConfig()
+        normalize_key = self._stage_key("normalize", cache.hash_file(csv_path))
+        modes_key = self._stage_key("modes", normalize_key, asdict(mode_config))
         
-        # Step 2: Normalize columns
-        logger.info("Normalizing columns...")
-        norm_result = normalize_dataframe(df)
+        def load_and_normalize():
+            # Step 1: Load CSV
+            logger.info(f"Loading CSV from {csv_path}")
+            df = pd.read_csv(csv_path)
+            logger.info(f"Loaded {len(df)} rows, {len(df.columns)} columns")
+            
+            # Step 2: Normalize columns
+            logger.info("Normalizing columns...")
+            return normalize_dataframe(df)
+        
+        norm_result = self._memoized("normalize", normalize_key, load_and_normalize)
         logger.info(
             f"Normalization complete: {len(norm_result.columns_found)} columns found, "
             f"confidence={norm_result.confidence_factor:.2f}"
@@ -377,12 +486,33 @@ class NextGenWorkflow:
         
         # Step 3: Label operating modes
         logger.info("Detecting operating modes...")
-        mode_result = label_modes(norm_result.df)
+        mode_result = self._memoized(
+            "modes", modes_key, lambda: label_modes(norm_result.df, mode_config)
+        )
         logger.info(f"Mode detection complete: {mode_result.summary_counts}")
         
         # Step 4: Build surfaces
         logger.info("Building surfaces...")
-        surfaces = build_standard_surfaces(mode_result.df)
+        surface_specs = standard_surface_specs(
+            mode_result.df.columns, SURFACE_MIN_SAMPLES
+        )
+        surfaces_key = self._stage_key(
+            "surfaces",
+            modes_key,
+            {
+                "rpm_bins": list(RPM_BINS),
+                "map_bins": list(KPA_BINS),
+                "min_samples": SURFACE_MIN_SAMPLES,
+            },
+            [describe_surface_spec(spec) for spec in surface_specs],
+        )
+        surfaces = self._memoized(
+            "surfaces",
+            surfaces_key,
+            lambda: build_standard_surfaces(
+                mode_result.df, RPM_BINS, KPA_BINS, SURFACE_MIN_SAMPLES
+            ),
+        )
         logger.info(f"Built {len(surfaces)} surfaces: {list(surfaces.keys())}")
         
         # Step 5: Detect spark valley
@@ -428,13 +558,18 @@ class NextGenWorkflow:
         self,
         output_dir: Path,
         payload: NextGenAnalysisPayload,
-    ) -> None:
+        cache_key: Optional[str] = None,
+    ) -> str:
         """
         Write payload and metadata to output directory.
         
         Args:
             output_dir: Output directory path
             payload: NextGenAnalysisPayload to write
+            cache_key: Content-addressed key of the inputs, recorded in metadata
+            
+        Returns:
+            The serialized payload JSON
         """
         payload_path = output_dir / NEXTGEN_PAYLOAD_FILE
         meta_path = output_dir / NEXTGEN_META_FILE
@@ -461,6 +596,7 @@ class NextGenWorkflow:
             "test_step_count": len(payload.next_tests.get("steps", [])),
             "sha256": payload_hash,
             "file_size_bytes": len(payload_json),
+            "cache_key": cache_key,
         }
         
         # Write metadata JSON
@@ -468,6 +604,7 @@ class NextGenWorkflow:
             json.dump(meta, f, indent=2)
         
         logger.info(f"Wrote metadata to {meta_path}")
+        return payload_json
     
     def _build_summary(self, payload_dict: Dict[str, Any]) -> Dict[str, Any]:
         """
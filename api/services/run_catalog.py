@@ -0,0 +1,451 @@
+"""
+SQL-backed run catalog.
+
+Mirrors each run's run_state.json into the ``runs`` / ``run_files`` tables
+so run listings are answered by indexed queries instead of loading and
+sorting every run state:
+- upsert() / delete() are called by RunManager as runs change
+- list_runs() filters by status/source and pages newest first by keyset
+  on (created_at, id), served by the ix_runs_*created_id indexes
+- import_run_states() bulk-loads existing runs/*/run_state.json
+- sync_run_states() brings an existing catalog back in line with the run
+  directories (runs changed or deleted while it was not attached)
+
+Usage:
+    python -m api.services.run_catalog import [runs_dir]
+"""
+
+import base64
+import json
+import logging
+import threading
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import (
+    Any,
+    Dict,
+    Generator,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
+
+from sqlalchemy import func, null, select, tuple_
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session, selectinload, sessionmaker
+
+from api.jetstream.models import RunState, RunStatus
+from api.models.run import Base, Run, RunFile
+
+logger = logging.getLogger(__name__)
+
+IMPORT_BATCH_SIZE = 500
+
+
+# =============================================================================
+# Cursors and timestamps
+# =============================================================================
+
+
+def encode_cursor(created_at: str, run_id: str) -> str:
+    """
+    Encode a keyset pagination cursor.
+
+    Args:
+        created_at: Creation timestamp of the last run on the page
+        run_id: ID of the last run on the page
+
+    Returns:
+        Opaque URL-safe cursor string
+    """
+    raw = json.dumps([created_at, run_id], separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[str, str]:
+    """
+    Decode a cursor produced by encode_cursor().
+
+    Returns:
+        (created_at, run_id)
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        created_at, run_id = json.loads(raw)
+    except (ValueError, TypeError) as e:
+        raise ValueError(f"Invalid cursor: {cursor!r}") from e
+    if not isinstance(created_at, str) or not isinstance(run_id, str):
+        raise ValueError(f"Invalid cursor: {cursor!r}")
+    return created_at, run_id
+
+
+def _parse_timestamp(value: str) -> datetime:
+    """ISO timestamp ('Z', offset or naive UTC) -> naive UTC datetime."""
+    dt = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    if dt.tzinfo is not None:
+        dt = dt.astimezone(timezone.utc).replace(tzinfo=None)
+    return dt
+
+
+def _format_timestamp(dt: Optional[datetime]) -> Optional[str]:
+    """Naive UTC datetime -> ISO string in utc_now_iso() format."""
+    if dt is None:
+        return None
+    timespec = "milliseconds" if dt.microsecond % 1000 == 0 else "microseconds"
+    return dt.isoformat(timespec=timespec) + "Z"
+
+
+# =============================================================================
+# Row mapping
+# =============================================================================
+
+
+def _apply_state(run: Run, state: RunState) -> None:
+    """Copy a RunState onto its Run row."""
+    status = state.status.value if isinstance(state.status, RunStatus) else state.status
+    run.status = status
+    run.source = state.source
+    run.created_at = _parse_timestamp(state.created_at)
+    run.updated_at = _parse_timestamp(state.updated_at)
+    run.jetstream_id = state.jetstream_id
+    run.current_stage = state.current_stage
+    # Explicit NULL: the column default would turn "no progress yet" into 0
+    run.progress_percent = (
+        null() if state.progress_percent is None else state.progress_percent
+    )
+    run.results_summary = state.results_summary or None
+
+    if state.error:
+        run.error_info = {
+            "stage": state.error.stage,
+            "code": state.error.code,
+            "message": state.error.message,
+        }
+        run.error_message = state.error.message
+    else:
+        run.error_info = None
+        run.error_message = None
+
+    if status == RunStatus.COMPLETE.value and run.completed_at is None:
+        run.completed_at = run.updated_at
+
+    if [f.filename for f in run.files] != list(state.files):
+        run.files = [
+            RunFile(filename=name, file_type=Path(name).suffix.lstrip(".") or None)
+            for name in state.files
+        ]
+
+
+def _state_dict(run: Run, files: List[str]) -> Dict[str, Any]:
+    """Build the RunState.to_dict() form of a Run row."""
+    result = {
+        "run_id": run.id,
+        "status": run.status,
+        "source": run.source,
+        "created_at": _format_timestamp(run.created_at),
+        "updated_at": _format_timestamp(run.updated_at),
+        "jetstream_id": run.jetstream_id,
+        "current_stage": run.current_stage,
+        "progress_percent": run.progress_percent,
+        "files": files,
+    }
+    if run.error_info:
+        result["error"] = run.error_info
+    if run.results_summary:
+        result["results_summary"] = run.results_summary
+    return result
+
+
+def _read_run_states(runs_dir: Path) -> Iterator[RunState]:
+    """Yield the state in each readable runs_dir/*/run_state.json."""
+    for state_path in sorted(runs_dir.glob("*/run_state.json")):
+        try:
+            with open(state_path, "r", encoding="utf-8") as f:
+                state = RunState.from_dict(json.load(f))
+            _parse_timestamp(state.created_at)
+            _parse_timestamp(state.updated_at)
+        except (OSError, ValueError, KeyError, TypeError, AttributeError) as e:
+            logger.warning(f"Skipping unreadable run state {state_path}: {e}")
+            continue
+        yield state
+
+
+# =============================================================================
+# Catalog
+# =============================================================================
+
+
+class RunCatalog:
+    """
+    Run states stored in the ``runs`` and ``run_files`` tables.
+
+    Creates the tables if they don't exist. All methods are thread-safe;
+    they serialize on one lock because the SQLite engine shares a single
+    connection (StaticPool).
+    """
+
+    def __init__(self, engine: Engine):
+        """
+        Initialize the catalog.
+
+        Args:
+            engine: SQLAlchemy engine (see api.services.database)
+        """
+        self._engine = engine
+        self._session_factory = sessionmaker(
+            bind=engine, autoflush=False, expire_on_commit=False
+        )
+        self._lock = threading.Lock()
+        Base.metadata.create_all(
+            bind=engine, tables=[Run.__table__, RunFile.__table__]
+        )
+
+    @contextmanager
+    def _session(self) -> Generator[Session, None, None]:
+        with self._lock:
+            session = self._session_factory()
+            try:
+                yield session
+                session.commit()
+            except Exception:
+                session.rollback()
+                raise
+            finally:
+                session.close()
+
+    # ------------------------------------------------------------------
+    # Writes
+    # ------------------------------------------------------------------
+
+    def upsert(self, state: RunState) -> None:
+        """Insert or update one run."""
+        self.upsert_many([state])
+
+    def upsert_many(self, states: Iterable[RunState]) -> int:
+        """
+        Insert or update runs in a single transaction.
+
+        Args:
+            states: Run states to store
+
+        Returns:
+            Number of runs written
+        """
+        batch = list(states)
+        if not batch:
+            return 0
+
+        with self._session() as session:
+            existing = {
+                run.id: run
+                for run in session.scalars(
+                    select(Run)
+                    .where(Run.id.in_([s.run_id for s in batch]))
+                    .options(selectinload(Run.files))
+                )
+            }
+            for state in batch:
+                run = existing.get(state.run_id)
+                if run is None:
+                    run = Run(id=state.run_id)
+                    session.add(run)
+                    existing[state.run_id] = run
+                _apply_state(run, state)
+        return len(batch)
+
+    def delete(self, run_id: str) -> bool:
+        """
+        Remove a run and its files.
+
+        Returns:
+            True if the run was in the catalog
+        """
+        with self._session() as session:
+            run = session.get(Run, run_id)
+            if run is None:
+                return False
+            session.delete(run)
+        return True
+
+    def import_run_states(
+        self, runs_dir: Union[str, Path], batch_size: int = IMPORT_BATCH_SIZE
+    ) -> int:
+        """
+        Load every runs_dir/*/run_state.json into the catalog.
+
+        Existing rows are updated, so re-running the import resyncs the
+        catalog with the run directories. Unreadable states are skipped.
+
+        Args:
+            runs_dir: Base run directory (as used by RunManager)
+            batch_size: Runs written per transaction
+
+        Returns:
+            Number of runs imported
+        """
+        runs_dir = Path(runs_dir)
+        imported = self._upsert_batches(_read_run_states(runs_dir), batch_size)
+        logger.info(f"Imported {imported} runs from {runs_dir} into the run catalog")
+        return imported
+
+    def sync_run_states(
+        self, runs_dir: Union[str, Path], batch_size: int = IMPORT_BATCH_SIZE
+    ) -> Tuple[int, int]:
+        """
+        Bring the catalog in line with runs_dir/*/run_state.json.
+
+        Runs whose state is missing from the catalog or has a different
+        updated_at are upserted; catalog rows without a run directory are
+        removed. Catches up on changes made while the catalog was not
+        attached (index.json fallback, failed write-through).
+
+        Args:
+            runs_dir: Base run directory (as used by RunManager)
+            batch_size: Runs written per transaction
+
+        Returns:
+            (runs upserted, runs removed)
+        """
+        runs_dir = Path(runs_dir)
+        with self._session() as session:
+            known = dict(session.execute(select(Run.id, Run.updated_at)).all())
+
+        changed = (
+            state
+            for state in _read_run_states(runs_dir)
+            if known.get(state.run_id) != _parse_timestamp(state.updated_at)
+        )
+        upserted = self._upsert_batches(changed, batch_size)
+
+        # Rows of unreadable states are kept; only missing runs are removed
+        on_disk = {p.parent.name for p in runs_dir.glob("*/run_state.json")}
+        stale = [run_id for run_id in known if run_id not in on_disk]
+        if stale:
+            with self._session() as session:
+                for run in session.scalars(select(Run).where(Run.id.in_(stale))):
+                    session.delete(run)
+
+        if upserted or stale:
+            logger.info(
+                f"Run catalog resynced from {runs_dir}: "
+                f"{upserted} upserted, {len(stale)} removed"
+            )
+        return upserted, len(stale)
+
+    def _upsert_batches(self, states: Iterable[RunState], batch_size: int) -> int:
+        written = 0
+        batch: List[RunState] = []
+        for state in states:
+            batch.append(state)
+            if len(batch) >= batch_size:
+                written += self.upsert_many(batch)
+                batch = []
+        return written + self.upsert_many(batch)
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    def count(self) -> int:
+        """Total number of runs in the catalog."""
+        with self._session() as session:
+            return session.scalar(select(func.count()).select_from(Run)) or 0
+
+    def list_runs(
+        self,
+        status: Optional[Union[RunStatus, str]] = None,
+        source: Optional[str] = None,
+        limit: int = 100,
+        offset: int = 0,
+        cursor: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """
+        List runs newest first.
+
+        Args:
+            status: Filter by status
+            source: Filter by source
+            limit: Maximum number of runs to return
+            offset: Number of runs to skip (after the cursor, if given)
+            cursor: ``next_cursor`` from the previous page
+
+        Returns:
+            Dictionary with 'runs' list, 'total' count of runs matching
+            the filters, and 'next_cursor' (None on the last page)
+
+        Raises:
+            ValueError: If the cursor is malformed
+        """
+        filters = []
+        if status:
+            status_val = status.value if isinstance(status, RunStatus) else status
+            filters.append(Run.status == status_val)
+        if source:
+            filters.append(Run.source == source)
+
+        page_query = select(Run).where(*filters)
+        if cursor:
+            created_at, run_id = decode_cursor(cursor)
+            page_query = page_query.where(
+                tuple_(Run.created_at, Run.id)
+                < tuple_(_parse_timestamp(created_at), run_id)
+            )
+        # One extra row tells whether another page follows
+        page_query = (
+            page_query.order_by(Run.created_at.desc(), Run.id.desc())
+            .offset(offset)
+            .limit(limit + 1)
+        )
+
+        with self._session() as session:
+            total = session.scalar(
+                select(func.count()).select_from(Run).where(*filters)
+            )
+            runs = list(session.scalars(page_query))
+            has_more = len(runs) > limit
+            runs = runs[:limit]
+
+            files: Dict[str, List[str]] = {run.id: [] for run in runs}
+            if runs:
+                for run_id, filename in session.execute(
+                    select(RunFile.run_id, RunFile.filename)
+                    .where(RunFile.run_id.in_(list(files)))
+                    .order_by(RunFile.id)
+                ):
+                    files[run_id].append(filename)
+
+        next_cursor = None
+        if has_more and runs:
+            last = runs[-1]
+            next_cursor = encode_cursor(last.created_at.isoformat(), last.id)
+
+        return {
+            "runs": [_state_dict(run, files[run.id]) for run in runs],
+            "total": total or 0,
+            "next_cursor": next_cursor,
+        }
+
+
+# =============================================================================
+# CLI Utilities
+# =============================================================================
+
+if __name__ == "__main__":
+    import sys
+
+    if len(sys.argv) > 1 and sys.argv[1] == "import":
+        from api.services.database import engine
+
+        source_dir = sys.argv[2] if len(sys.argv) > 2 else "runs"
+        print(f"Importing run states from {source_dir}...")
+        count = RunCatalog(engine).import_run_states(source_dir)
+        print(f"✓ Imported {count} runs")
+    else:
+        print("Usage: python -m api.services.run_catalog import [runs_dir]")
@@ -1,15 +1,20 @@
 """Run lifecycle management service."""
 
 import json
+import logging
 import os
 import shutil
+import threading
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from api.jetstream.models import RunError, RunState, RunStatus
+from api.services.run_catalog import RunCatalog, decode_cursor, encode_cursor
 from dynoai.core.io_contracts import make_run_id, safe_path, utc_now_iso
 
+logger = logging.getLogger(__name__)
+
 
 class RunManager:
     """
@@ -22,18 +27,36 @@ class RunManager:
     ├── jetstream_raw/
     ├── input/dynoai_input.csv
     └── output/
+
+    run_state.json is the authoritative copy of each run. With a
+    RunCatalog, every change is written through to the database and
+    list_runs() is served by indexed queries; index.json is not maintained
+    and get_run_manager() rebuilds it before falling back to it. Without
+    one, runs/index.json holds every run's state, newest first: it is
+    updated one entry at a time and cached in memory, the cache is
+    reloaded when the file changes on disk, and the index is rebuilt from
+    the run directories only when it is missing or unreadable.
     """
 
-    def __init__(self, runs_dir: str = "runs"):
+    def __init__(self, runs_dir: str = "runs", catalog: Optional[RunCatalog] = None):
         """
         Initialize the run manager.
 
         Args:
             runs_dir: Base directory for storing runs
+            catalog: Database catalog to list runs from (default: index.json)
         """
         self._runs_dir = safe_path(runs_dir)
         self._runs_dir.mkdir(parents=True, exist_ok=True)
         self._index_path = self._runs_dir / "index.json"
+        self._catalog = catalog
+
+        # In-memory index: run_id -> state dict, plus the file identity
+        # (mtime, size, inode) it was loaded from or written as
+        self._lock = threading.RLock()
+        self._index: Optional[Dict[str, Dict[str, Any]]] = None
+        self._index_stamp: Optional[Tuple[int, int, int]] = None
+        self._sorted_runs: Optional[List[Dict[str, Any]]] = None
 
     def create_run(
         self,
@@ -88,7 +111,7 @@ class RunManager:
             self._save_jetstream_metadata(run_id, metadata)
 
         # Update index
-        self._update_index()
+        self._record_state(state)
 
         return state
 
@@ -174,7 +197,7 @@ class RunManager:
             state.files = files
 
         self._save_run_state(run_id, state)
-        self._update_index()
+        self._record_state(state)
 
         return state
 
@@ -184,48 +207,53 @@ class RunManager:
         source: Optional[str] = None,
         limit: int = 100,
         offset: int = 0,
+        cursor: Optional[str] = None,
     ) -> Dict[str, Any]:
         """
-        List runs with optional filtering.
+        List runs with optional filtering, newest first.
 
         Args:
             status: Filter by status
             source: Filter by source
             limit: Maximum number of runs to return
-            offset: Number of runs to skip
+            offset: Number of runs to skip (after the cursor, if given)
+            cursor: ``next_cursor`` from the previous page
 
         Returns:
-            Dictionary with 'runs' list and 'total' count
+            Dictionary with 'runs' list, 'total' count and 'next_cursor'
+            (None on the last page)
+
+        Raises:
+            ValueError: If the cursor is malformed
         """
-        all_runs = []
+        if self._catalog is not None:
+            return self._catalog.list_runs(
+                status=status, source=source, limit=limit, offset=offset, cursor=cursor
+            )
 
-        # Read from index if available
-        if self._index_path.exists():
-            try:
-                with open(self._index_path, "r", encoding="utf-8") as f:
-                    index_data = json.load(f)
-                all_runs = index_data.get("runs", [])
-            except (json.JSONDecodeError, IOError):
-                # Fall back to scanning directories
-                all_runs = self._scan_runs()
-        else:
-            all_runs = self._scan_runs()
+        with self._lock:
+            self._load_index()
+            # Already sorted by (created_at, run_id) descending
+            filtered = self._runs_newest_first()
 
         # Apply filters
-        filtered = all_runs
         if status:
             status_val = status.value if isinstance(status, RunStatus) else status
             filtered = [r for r in filtered if r.get("status") == status_val]
         if source:
             filtered = [r for r in filtered if r.get("source") == source]
 
-        # Sort by created_at descending
-        filtered.sort(key=lambda r: r.get("created_at", ""), reverse=True)
-
         total = len(filtered)
-        runs = filtered[offset: offset + limit]
+        if cursor:
+            after = decode_cursor(cursor)
+            filtered = [r for r in filtered if _sort_key(r) < after]
 
-        return {"runs": runs, "total": total}
+        runs = [dict(r) for r in filtered[offset: offset + limit]]
+        next_cursor = None
+        if runs and offset + limit < len(filtered):
+            next_cursor = encode_cursor(*_sort_key(runs[-1]))
+
+        return {"runs": runs, "total": total, "next_cursor": next_cursor}
 
     def get_run_input_path(self, run_id: str) -> Optional[Path]:
         """Get the input CSV path for a run."""
@@ -263,7 +291,13 @@ class RunManager:
             return False
 
         shutil.rmtree(run_dir)
-        self._update_index()
+        if self._catalog is not None:
+            self._catalog.delete(run_id)
+            return True
+        with self._lock:
+            index = self._load_index()
+            if index.pop(run_id, None) is not None:
+                self._write_index(index)
         return True
 
     def _save_run_state(self, run_id: str, state: RunState) -> None:
@@ -303,19 +337,126 @@ class RunManager:
 
         return runs
 
-    def _update_index(self) -> None:
-        """Rebuild the index.json file."""
-        runs = self._scan_runs()
-        runs.sort(key=lambda r: r.get("created_at", ""), reverse=True)
+    def _record_state(self, state: RunState) -> None:
+        """Write a changed run state through to the catalog or the index."""
+        if self._catalog is None:
+            self._upsert_index(state)
+            return
+        try:
+            self._catalog.upsert(state)
+        except Exception as e:
+            # run_state.json is already saved; sync_run_states() catches up
+            logger.error(f"Failed to update run catalog for {state.run_id}: {e}")
+
+    # ------------------------------------------------------------------
+    # Index
+    # ------------------------------------------------------------------
+
+    def _index_file_stamp(self) -> Optional[Tuple[int, int, int]]:
+        try:
+            st = os.stat(self._index_path)
+        except OSError:
+            return None
+        return (st.st_mtime_ns, st.st_size, st.st_ino)
+
+    def _load_index(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Return the index, re-reading index.json only if it changed on disk.
 
+        A missing or unreadable index is rebuilt from the run directories.
+        Call with ``self._lock`` held.
+        """
+        stamp = self._index_file_stamp()
+        if self._index is not None and stamp == self._index_stamp:
+            return self._index
+
+        runs: Optional[List[Dict[str, Any]]] = None
+        if stamp is not None:
+            try:
+                with open(self._index_path, "r", encoding="utf-8") as f:
+                    runs = json.load(f)["runs"]
+                if not isinstance(runs, list):
+                    raise TypeError("'runs' is not a list")
+            except (OSError, ValueError, KeyError, TypeError) as e:
+                logger.warning(
+                    f"Rebuilding unreadable run index {self._index_path}: {e}"
+                )
+                runs = None
+
+        if runs is None:
+            self._rebuild_index()
+        else:
+            self._index = {
+                r["run_id"]: r for r in runs if isinstance(r, dict) and "run_id" in r
+            }
+            self._index_stamp = stamp
+            self._sorted_runs = None
+        return self._index
+
+    def _rebuild_index(self) -> None:
+        """Rebuild index.json from the run directories."""
+        with self._lock:
+            self._write_index(
+                {r["run_id"]: r for r in self._scan_runs() if "run_id" in r}
+            )
+
+    def _upsert_index(self, state: RunState) -> None:
+        """Insert or replace one run's entry in the index."""
+        with self._lock:
+            index = self._load_index()
+            index[state.run_id] = state.to_dict()
+            self._write_index(index)
+
+    def _write_index(self, index: Dict[str, Dict[str, Any]]) -> None:
+        """Atomically write the index and remember it as the cached copy."""
+        self._index = index
+        self._sorted_runs = None
+        runs = self._runs_newest_first()
         index_data = {
             "updated_at": utc_now_iso(),
             "total": len(runs),
             "runs": runs,
         }
 
-        with open(self._index_path, "w", encoding="utf-8") as f:
-            json.dump(index_data, f, indent=2)
+        tmp_path = self._index_path.with_suffix(
+            f".{os.getpid()}.{threading.get_ident()}.tmp"
+        )
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(index_data, f, separators=(",", ":"))
+        os.replace(tmp_path, self._index_path)
+        self._index_stamp = self._index_file_stamp()
+
+    def _runs_newest_first(self) -> List[Dict[str, Any]]:
+        """Cached index entries sorted by created_at descending."""
+        if self._sorted_runs is None:
+            self._sorted_runs = sorted(
+                self._index.values(), key=_sort_key, reverse=True
+            )
+        return self._sorted_runs
+
+
+def _sort_key(run: Dict[str, Any]) -> Tuple[str, str]:
+    """Index listing order (descending) and keyset cursor position."""
+    return (run.get("created_at") or "", run.get("run_id") or "")
+
+
+def _open_run_catalog(runs_dir: Path) -> Optional[RunCatalog]:
+    """
+    Open the run catalog on the application database.
+
+    The catalog is resynced with the run directories first, picking up
+    runs created, changed or deleted while listing fell back to
+    index.json. Returns None if the database is unavailable.
+    """
+    try:
+        from api.services.database import engine
+
+        catalog = RunCatalog(engine)
+        catalog.sync_run_states(runs_dir)
+        return catalog
+    except Exception as e:
+        logger.warning(f"Run catalog unavailable, listing runs from index.json: {e}")
+        return None
 
 
 # Global run manager instance
@@ -326,5 +467,11 @@ def get_run_manager() -> RunManager:
     """Get or create the global run manager instance."""
     global _run_manager
     if _run_manager is None:
-        _run_manager = RunManager()
+        runs_dir = "runs"
+        catalog = _open_run_catalog(safe_path(runs_dir))
+        manager = RunManager(runs_dir, catalog=catalog)
+        if catalog is None:
+            # index.json went stale while the catalog was attached
+            manager._rebuild_index()
+        _run_manager = manager
     return _run_manager
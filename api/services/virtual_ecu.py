@@ -23,6 +23,7 @@ This is the foundation for closed-loop virtual tuning!
 from __future__ import annotations
 
 import logging
+import math
 from dataclasses import dataclass, field
 from typing import Literal
 
@@ -41,6 +42,10 @@ STOICH_AFR = 14.7  # Stoichiometric AFR for gasoline
 R_SPECIFIC_AIR = 287.05  # J/(kg·K) - specific gas constant for air
 KELVIN_OFFSET = 273.15
 
+# Fine-grid lookup table lattice spacing: (RPM step, kPa step). Every default
+# RPM/MAP bin lies on this lattice, so the fine-grid lookups are exact.
+DEFAULT_LOOKUP_TABLE_STEPS = (25.0, 0.5)
+
 
 @dataclass
 class VirtualECU:
@@ -63,6 +68,8 @@ class VirtualECU:
         num_cylinders: Number of cylinders (default: 2 for V-twin)
         ambient_temp_f: Ambient temperature (°F) for air density
         barometric_pressure_inhg: Barometric pressure (inHg)
+        lookup_table_steps: (RPM step, kPa step) of an optional precomputed
+            fine-grid lookup table; None uses the interpolators directly
     """
     
     # VE Tables (Front/Rear for V-twin)
@@ -84,10 +91,14 @@ class VirtualECU:
     ambient_temp_f: float = 75.0
     barometric_pressure_inhg: float = 29.92
     
+    # Optional fine-grid lookup tables (built on init)
+    lookup_table_steps: tuple[float, float] | None = None
+    
     # Interpolators (built on init)
     _interp_ve_front: RegularGridInterpolator | None = field(default=None, init=False, repr=False)
     _interp_ve_rear: RegularGridInterpolator | None = field(default=None, init=False, repr=False)
     _interp_afr_target: RegularGridInterpolator | None = field(default=None, init=False, repr=False)
+    _lut: dict[str, FineGridTable] | None = field(default=None, init=False, repr=False)
     
     def __post_init__(self):
         """Build interpolators for fast table lookups."""
@@ -132,11 +143,63 @@ class VirtualECU:
             fill_value=None
         )
         
+        if self.lookup_table_steps is not None:
+            self.build_lookup_tables(*self.lookup_table_steps)
+        
         logger.debug(
             f"VirtualECU initialized: {len(self.rpm_bins)}x{len(self.map_bins)} grid, "
             f"{self.displacement_ci}ci displacement"
         )
     
+    def build_lookup_tables(
+        self,
+        rpm_step: float = DEFAULT_LOOKUP_TABLE_STEPS[0],
+        map_step: float = DEFAULT_LOOKUP_TABLE_STEPS[1],
+    ) -> None:
+        """
+        Precompute fine-grid lookup tables for all three tables.
+        
+        Lookups then do a bilinear interpolation on a dense uniform lattice
+        instead of calling the interpolators, which is much cheaper for both
+        scalar and array lookups. Results are exact when every table bin
+        lies on the lattice. Call again after editing a table in place.
+        
+        Args:
+            rpm_step: Lattice spacing along RPM
+            map_step: Lattice spacing along MAP (kPa)
+        """
+        self.lookup_table_steps = (rpm_step, map_step)
+        self._lut = {
+            'front': FineGridTable.sample(
+                self._interp_ve_front, self.rpm_bins, self.map_bins, rpm_step, map_step
+            ),
+            'rear': FineGridTable.sample(
+                self._interp_ve_rear, self.rpm_bins, self.map_bins, rpm_step, map_step
+            ),
+            'afr': FineGridTable.sample(
+                self._interp_afr_target, self.rpm_bins, self.map_bins, rpm_step, map_step
+            ),
+        }
+    
+    def _lookup(self, table: str, rpm: float, map_kpa: float) -> float:
+        """Scalar lookup in 'front', 'rear' or 'afr'."""
+        if self._lut is not None:
+            return self._lut[table].lookup(rpm, map_kpa)
+        return float(self._interpolator(table)([rpm, map_kpa])[0])
+    
+    def _lookup_array(
+        self, table: str, rpm: np.ndarray, map_kpa: np.ndarray
+    ) -> np.ndarray:
+        """Array lookup in 'front', 'rear' or 'afr'."""
+        if self._lut is not None:
+            return self._lut[table].lookup_array(rpm, map_kpa)
+        return _interpolate_points(self._interpolator(table), rpm, map_kpa)
+    
+    def _interpolator(self, table: str) -> RegularGridInterpolator:
+        if table == 'afr':
+            return self._interp_afr_target
+        return self._interp_ve_front if table == 'front' else self._interp_ve_rear
+    
     def lookup_ve(self, rpm: float, map_kpa: float, cylinder: Literal['front', 'rear']) -> float:
         """
         Look up VE value from table at given RPM and MAP.
@@ -149,11 +212,30 @@ class VirtualECU:
         Returns:
             VE value (0.0 to ~1.5, typically 0.7-1.0)
         """
-        interp = self._interp_ve_front if cylinder == 'front' else self._interp_ve_rear
-        ve_value = float(interp([rpm, map_kpa])[0])
+        ve_value = self._lookup('front' if cylinder == 'front' else 'rear', rpm, map_kpa)
         
         # Clamp to reasonable range
-        return np.clip(ve_value, 0.3, 1.5)
+        return min(max(ve_value, 0.3), 1.5)
+    
+    def lookup_ve_array(
+        self,
+        rpm: np.ndarray,
+        map_kpa: np.ndarray,
+        cylinder: Literal['front', 'rear'],
+    ) -> np.ndarray:
+        """
+        Array version of ``lookup_ve``: one table lookup for all points.
+        
+        Args:
+            rpm: Engine speeds (RPM), broadcastable against map_kpa
+            map_kpa: Manifold absolute pressures (kPa)
+            cylinder: Which cylinder ('front' or 'rear')
+        
+        Returns:
+            VE values, clamped like ``lookup_ve``, in the broadcast shape
+        """
+        table = 'front' if cylinder == 'front' else 'rear'
+        return np.clip(self._lookup_array(table, rpm, map_kpa), 0.3, 1.5)
     
     def lookup_target_afr(self, rpm: float, map_kpa: float) -> float:
         """
@@ -166,10 +248,16 @@ class VirtualECU:
         Returns:
             Target AFR (typically 12.0-14.7)
         """
-        afr = float(self._interp_afr_target([rpm, map_kpa])[0])
+        afr = self._lookup('afr', rpm, map_kpa)
         
         # Clamp to reasonable range
-        return np.clip(afr, 10.0, 18.0)
+        return min(max(afr, 10.0), 18.0)
+    
+    def lookup_target_afr_array(
+        self, rpm: np.ndarray, map_kpa: np.ndarray
+    ) -> np.ndarray:
+        """Array version of ``lookup_target_afr``."""
+        return np.clip(self._lookup_array('afr', rpm, map_kpa), 10.0, 18.0)
     
     def calculate_air_mass_mg(self, rpm: float, map_kpa: float) -> float:
         """
@@ -203,6 +291,25 @@ class VirtualECU:
         
         return air_mass_mg
     
+    def calculate_air_mass_mg_array(
+        self, rpm: np.ndarray, map_kpa: np.ndarray
+    ) -> np.ndarray:
+        """
+        Array version of ``calculate_air_mass_mg``.
+        
+        Args:
+            rpm: Engine speeds (RPM), broadcastable against map_kpa
+            map_kpa: Manifold absolute pressures (kPa)
+        
+        Returns:
+            Air masses in milligrams per combustion event, in the broadcast shape
+        """
+        _, map_arr = np.broadcast_arrays(
+            np.asarray(rpm, dtype=float), np.asarray(map_kpa, dtype=float)
+        )
+        # Linear in MAP: scale the per-kPa air mass
+        return map_arr * self.calculate_air_mass_mg(0.0, 1.0)
+    
     def calculate_required_fuel_mg(
         self, 
         rpm: float, 
@@ -311,9 +418,30 @@ class VirtualECU:
         resulting_afr = target_afr * ve_error_ratio
         
         # Clamp to physically reasonable range
-        resulting_afr = np.clip(resulting_afr, 8.0, 20.0)
+        return min(max(resulting_afr, 8.0), 20.0)
+    
+    def calculate_resulting_afr_array(
+        self,
+        rpm: np.ndarray,
+        map_kpa: np.ndarray,
+        actual_ve: np.ndarray,
+        cylinder: Literal['front', 'rear']
+    ) -> np.ndarray:
+        """
+        Array version of ``calculate_resulting_afr``.
+        
+        Args:
+            rpm: Engine speeds (RPM)
+            map_kpa: Manifold absolute pressures (kPa)
+            actual_ve: Actual volumetric efficiencies from physics
+            cylinder: Which cylinder ('front' or 'rear')
         
-        return resulting_afr
+        Returns:
+            Resulting AFRs, clamped like ``calculate_resulting_afr``
+        """
+        ecu_ve = self.lookup_ve_array(rpm, map_kpa, cylinder)
+        target_afr = self.lookup_target_afr_array(rpm, map_kpa)
+        return np.clip(target_afr * (np.asarray(actual_ve) / ecu_ve), 8.0, 20.0)
     
     def get_ve_error_pct(
         self,
@@ -339,6 +467,82 @@ class VirtualECU:
         return error_pct
 
 
+@dataclass
+class FineGridTable:
+    """
+    A table resampled onto a dense uniform RPM x MAP lattice.
+    
+    Lookups are bilinear on the lattice; points outside it extrapolate
+    linearly from the edge cell, matching the interpolators' behaviour.
+    """
+    
+    rpm0: float
+    map0: float
+    rpm_step: float
+    map_step: float
+    values: np.ndarray
+    
+    @classmethod
+    def sample(
+        cls,
+        interp: RegularGridInterpolator,
+        rpm_bins: list[int],
+        map_bins: list[int],
+        rpm_step: float,
+        map_step: float,
+    ) -> FineGridTable:
+        """Sample an interpolator on a lattice covering the table's bins."""
+        if rpm_step <= 0 or map_step <= 0:
+            raise ValueError("Lookup table steps must be positive")
+        n_rpm = math.ceil((rpm_bins[-1] - rpm_bins[0]) / rpm_step) + 1
+        n_map = math.ceil((map_bins[-1] - map_bins[0]) / map_step) + 1
+        rpm = rpm_bins[0] + rpm_step * np.arange(max(n_rpm, 2))
+        map_kpa = map_bins[0] + map_step * np.arange(max(n_map, 2))
+        values = _interpolate_points(interp, rpm[:, None], map_kpa[None, :])
+        return cls(float(rpm_bins[0]), float(map_bins[0]), rpm_step, map_step, values)
+    
+    def lookup(self, rpm: float, map_kpa: float) -> float:
+        """Bilinear lookup of one point."""
+        n_rpm, n_map = self.values.shape
+        x = (rpm - self.rpm0) / self.rpm_step
+        y = (map_kpa - self.map0) / self.map_step
+        i = min(max(int(math.floor(x)), 0), n_rpm - 2)
+        j = min(max(int(math.floor(y)), 0), n_map - 2)
+        tx = x - i
+        ty = y - j
+        v = self.values
+        return float(
+            (v[i, j] * (1.0 - ty) + v[i, j + 1] * ty) * (1.0 - tx)
+            + (v[i + 1, j] * (1.0 - ty) + v[i + 1, j + 1] * ty) * tx
+        )
+    
+    def lookup_array(self, rpm: np.ndarray, map_kpa: np.ndarray) -> np.ndarray:
+        """Bilinear lookup of broadcast (rpm, map_kpa) points."""
+        n_rpm, n_map = self.values.shape
+        x = (np.asarray(rpm, dtype=float) - self.rpm0) / self.rpm_step
+        y = (np.asarray(map_kpa, dtype=float) - self.map0) / self.map_step
+        x, y = np.broadcast_arrays(x, y)
+        i = np.clip(np.floor(x).astype(np.intp), 0, n_rpm - 2)
+        j = np.clip(np.floor(y).astype(np.intp), 0, n_map - 2)
+        tx = x - i
+        ty = y - j
+        v = self.values
+        return (v[i, j] * (1.0 - ty) + v[i, j + 1] * ty) * (1.0 - tx) + (
+            v[i + 1, j] * (1.0 - ty) + v[i + 1, j + 1] * ty
+        ) * tx
+
+
+def _interpolate_points(
+    interp: RegularGridInterpolator, rpm: np.ndarray, map_kpa: np.ndarray
+) -> np.ndarray:
+    """Evaluate an RPM x MAP interpolator at broadcast (rpm, map_kpa) points."""
+    rpm_arr, map_arr = np.broadcast_arrays(
+        np.asarray(rpm, dtype=float), np.asarray(map_kpa, dtype=float)
+    )
+    points = np.column_stack((rpm_arr.ravel(), map_arr.ravel()))
+    return interp(points).reshape(rpm_arr.shape)
+
+
 def create_baseline_ve_table(
     rpm_bins: list[int] | None = None,
     map_bins: list[int] | None = None,
@@ -10,17 +10,27 @@ This module orchestrates complete tuning sessions:
 6. Repeat until converged
 
 This is the complete closed-loop tuning simulation!
+
+Parameter sweeps (``VirtualTuningOrchestrator.run_sweep``) run a grid of
+session configs on a process pool and collect one comparison table.
 """
 
 from __future__ import annotations
 
+import dataclasses
+import itertools
 import logging
+import multiprocessing
+import os
+import queue
 import threading
 import time
+import uuid
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from enum import Enum
-from typing import Any
+from typing import Any, Callable
 
 import numpy as np
 import pandas as pd  # type: ignore[import-untyped]
@@ -32,6 +42,7 @@ from api.services.dyno_simulator import (
     SimulatorConfig,
 )
 from api.services.virtual_ecu import (
+    DEFAULT_LOOKUP_TABLE_STEPS,
     VirtualECU,
     create_afr_target_table,
     create_baseline_ve_table,
@@ -109,6 +120,7 @@ class TuningSessionConfig:
 
     # Timeout protection
     iteration_timeout_sec: float = 60.0  # Max time per iteration
+    max_pull_sim_sec: float = 600.0  # Simulated seconds before a pull is abandoned
 
     # Oscillation detection
     oscillation_detection_enabled: bool = True
@@ -118,6 +130,10 @@ class TuningSessionConfig:
     barometric_pressure_inhg: float = 29.92
     ambient_temp_f: float = 75.0
 
+    # Simulator noise seed (None = nondeterministic). Iteration N seeds its
+    # simulator with seed + N, so a seeded session is reproducible.
+    seed: int | None = None
+
 
 @dataclass
 class TuningSession:
@@ -148,6 +164,16 @@ class TuningSession:
 
     # Error tracking
     error_message: str | None = None
+    oscillation_detected: bool = False
+
+    # Optional observer of progress updates, called as (pct, message)
+    progress_callback: Callable[[float, str], None] | None = field(
+        default=None, repr=False
+    )
+
+    # Optional cross-process stop flag (an Event, set by stop_session) for
+    # sessions whose loop runs in a sweep worker
+    stop_event: Any = field(default=None, repr=False)
 
     # Thread safety for progress updates
     _progress_lock: Any = field(
@@ -161,6 +187,8 @@ class TuningSession:
         with self._progress_lock:
             self.progress_pct = pct
             self.progress_message = message
+        if self.progress_callback is not None:
+            self.progress_callback(pct, message)
 
     def to_dict(self) -> dict[str, Any]:
         """Convert to JSON-serializable dict."""
@@ -262,7 +290,9 @@ class VirtualTuningOrchestrator:
         Returns:
             TuningSession object
         """
-        session_id = f"tune_{int(time.time())}_{np.random.randint(1000, 9999)}"
+        # Not np.random: creating a session reseeds the global RNG (VE table
+        # perturbation), so sweep sessions created together would share IDs
+        session_id = f"tune_{int(time.time())}_{uuid.uuid4().hex[:8]}"
 
         session = TuningSession(
             session_id=session_id,
@@ -325,12 +355,18 @@ class VirtualTuningOrchestrator:
         Returns:
             Updated TuningSession with results
         """
+        if session.status == TuningStatus.STOPPED:
+            logger.info(f"Session stopped before starting: {session.session_id}")
+            return session
+
         logger.info(f"Starting tuning session: {session.session_id}")
         session.status = TuningStatus.RUNNING
 
         try:
             for iteration in range(1, session.config.max_iterations + 1):
                 # Allow external stop requests (best-effort; current iteration may still finish)
+                if session.stop_event is not None and session.stop_event.is_set():
+                    session.status = TuningStatus.STOPPED
                 if session.status == TuningStatus.STOPPED:
                     session.end_time = time.time()
                     logger.info(f"Session stopped: {session.session_id}")
@@ -342,8 +378,8 @@ class VirtualTuningOrchestrator:
 
                 # Run one iteration
                 # Note: Removed ThreadPoolExecutor timeout protection to avoid issues
-                # with Flask's debug mode reloader. Iterations are bounded by internal
-                # timeouts in the simulator (~30s max per pull).
+                # with Flask's debug mode reloader. Pulls run on a stepped simulator
+                # bounded by max_pull_sim_sec of simulated time.
                 try:
                     iteration_result = self._run_iteration(session, iteration)
                 except Exception as iter_error:
@@ -374,6 +410,7 @@ class VirtualTuningOrchestrator:
                     and self._detect_oscillation(session)
                 ):
                     session.status = TuningStatus.FAILED
+                    session.oscillation_detected = True
                     session.error_message = (
                         "Oscillation detected - corrections are not converging"
                     )
@@ -437,6 +474,7 @@ class VirtualTuningOrchestrator:
             afr_target_table=afr_table,
             barometric_pressure_inhg=session.config.barometric_pressure_inhg,
             ambient_temp_f=session.config.ambient_temp_f,
+            lookup_table_steps=DEFAULT_LOOKUP_TABLE_STEPS,
         )
         logger.info("  ✓ Virtual ECU created with VE tables")
 
@@ -445,66 +483,35 @@ class VirtualTuningOrchestrator:
 
         # Create simulator with Virtual ECU
         logger.info("  🏍️ Creating dyno simulator...")
-        print(f"[TUNING] Creating dyno simulator for iteration {iteration}")
+        seed = session.config.seed
         sim_config = SimulatorConfig(
             profile=session.config.engine_profile,
             enable_thermal_effects=True,
             auto_pull=False,
+            seed=None if seed is None else seed + iteration,
         )
 
+        # Stepped mode: simulated clock, no sleeping
         simulator = DynoSimulator(config=sim_config, virtual_ecu=ecu)
-        logger.info("  ✓ Simulator created, starting...")
-        print(f"[TUNING] Simulator created, starting...")
-        simulator.start()
-
-        # Wait for idle
-        time.sleep(0.5)
+        simulator.start_stepped()
 
-        logger.info(f"  ✓ Simulator started (state: {simulator.get_state().value})")
-        print(f"[TUNING] Simulator started, state: {simulator.get_state().value}")
-
-        # Trigger pull
+        # Run pull
         # Progress: 40% - Dyno pull started
         session.update_progress(40.0, "Running dyno pull...")
         logger.info("  🚀 Starting dyno pull simulation...")
         pull_start = time.time()  # Record start time for duration calculation
-        simulator.trigger_pull()
-
-        # Verify pull started
-        time.sleep(0.2)
-        logger.info(f"  ⏳ Pull triggered (state: {simulator.get_state().value})")
-
-        # Wait for completion (with timeout)
-        max_wait = 30  # 30 second timeout
-        wait_count = 0
-        last_log = 0
-        while simulator.get_state().value != "idle":
-            time.sleep(0.1)
-            wait_count += 1
-
-            # Log progress every 2 seconds
-            if wait_count % 20 == 0 and wait_count != last_log:
-                elapsed = wait_count / 10
-                logger.info(
-                    f"  ⏳ Pull in progress... {elapsed:.1f}s elapsed (state: {simulator.get_state().value})"
-                )
-                last_log = wait_count
-
-            if wait_count > max_wait * 10:  # 10 checks per second
-                logger.error(
-                    f"  ❌ Timeout waiting for pull to complete (state: {simulator.get_state().value})"
-                )
-                simulator.stop()
-                raise TimeoutError("Pull did not complete within 30 seconds")
+        try:
+            pull_data = simulator.run_pull(
+                timeout_sec=session.config.max_pull_sim_sec
+            )
+        finally:
+            simulator.stop()
 
         pull_duration = time.time() - pull_start
-        logger.info(f"  ✓ Pull completed in {pull_duration:.1f}s")
-
-        # Get pull data
-        pull_data = simulator.get_pull_data()
-        logger.info(f"  ✓ Dyno pull complete, {len(pull_data)} data points captured")
-        simulator.stop()
-        logger.info("  ✓ Simulator stopped")
+        logger.info(
+            f"  ✓ Dyno pull complete in {pull_duration:.2f}s, "
+            f"{len(pull_data)} data points captured"
+        )
 
         # Progress: 70% - Dyno pull completed
         session.update_progress(70.0, f"Dyno pull complete ({len(pull_data)} points)")
@@ -712,6 +719,130 @@ class VirtualTuningOrchestrator:
 
         return False
 
+    def run_sweep(
+        self,
+        configs: list[TuningSessionConfig],
+        max_workers: int | None = None,
+    ) -> pd.DataFrame:
+        """
+        Run a grid of tuning sessions with bounded concurrency.
+
+        Every config gets a registered session (visible through
+        ``get_session``), whose progress and iteration count are updated as
+        its worker reports them. Sessions run in worker processes and stay
+        INITIALIZING until their worker starts them. ``stop_session`` cancels
+        a session that has not started yet and signals a running one's
+        worker, which stops at the next iteration boundary like
+        ``run_session`` does in-process.
+
+        Args:
+            configs: Session configurations, e.g. from ``build_sweep_configs``
+            max_workers: Worker processes (default: CPU count). ``1`` runs
+                the sessions serially in this process.
+
+        Returns:
+            Comparison table with one row per config, in input order
+        """
+        sessions = [self.create_session(config) for config in configs]
+        workers = max(1, min(max_workers or os.cpu_count() or 1, len(sessions) or 1))
+        logger.info(f"Starting sweep of {len(sessions)} sessions on {workers} workers")
+
+        if workers == 1:
+            for session in sessions:
+                if session.status != TuningStatus.STOPPED:
+                    self.run_session(session)
+            return sweep_table(sessions)
+
+        ctx = multiprocessing.get_context("spawn")
+        progress_queue = ctx.Queue()
+        with ctx.Manager() as manager, ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=ctx,
+            initializer=_init_sweep_worker,
+            initargs=(progress_queue,),
+        ) as pool:
+            try:
+                futures = {}
+                for index, session in enumerate(sessions):
+                    session.stop_event = manager.Event()
+                    future = pool.submit(
+                        _run_sweep_session, index, session.config, session.stop_event
+                    )
+                    futures[future] = session
+
+                pending = set(futures)
+                while pending:
+                    done, pending = wait(
+                        pending, timeout=0.2, return_when=FIRST_COMPLETED
+                    )
+                    self._forward_sweep_progress(progress_queue, sessions)
+                    for future in done:
+                        session = futures[future]
+                        if future.cancelled():
+                            continue
+                        try:
+                            self._apply_session_result(session, future.result())
+                        except Exception as e:
+                            logger.error(
+                                f"Sweep session {session.session_id} failed: {e}",
+                                exc_info=True,
+                            )
+                            session.status = TuningStatus.FAILED
+                            session.error_message = str(e)
+                            session.end_time = time.time()
+                    for future in pending:
+                        if futures[future].status == TuningStatus.STOPPED:
+                            future.cancel()
+                self._forward_sweep_progress(progress_queue, sessions)
+            finally:
+                # The events die with the manager
+                with self._lock:
+                    for session in sessions:
+                        session.stop_event = None
+
+        return sweep_table(sessions)
+
+    def _apply_session_result(
+        self, session: TuningSession, result: dict[str, Any]
+    ) -> None:
+        """
+        Copy a worker's session results onto the parent process's session.
+
+        A session stopped meanwhile keeps its STOPPED status and stop time;
+        its worker saw the stop and returned the iterations run before it.
+        """
+        with self._lock:
+            if session.status != TuningStatus.STOPPED:
+                session.status = result["status"]
+                session.end_time = time.time()
+                session.start_time = session.end_time - result["duration_sec"]
+            session.current_iteration = result["current_iteration"]
+            session.iterations = result["iterations"]
+            session.current_ve_front = result["current_ve_front"]
+            session.current_ve_rear = result["current_ve_rear"]
+            session.error_message = result["error_message"]
+            session.oscillation_detected = result["oscillation_detected"]
+        session.update_progress(result["progress_pct"], result["progress_message"])
+
+    def _forward_sweep_progress(
+        self, progress_queue: Any, sessions: list[TuningSession]
+    ) -> None:
+        """Apply queued worker progress reports to the parent sessions."""
+        while True:
+            try:
+                index, iteration, pct, message = progress_queue.get_nowait()
+            except queue.Empty:
+                return
+            session = sessions[index]
+            with self._lock:
+                if session.status == TuningStatus.INITIALIZING:
+                    session.status = TuningStatus.RUNNING
+                    session.start_time = time.time()
+                running = session.status == TuningStatus.RUNNING
+            if running:
+                session.current_iteration = iteration
+                session.update_progress(pct, f"Iteration {iteration + 1}: {message}")
+
     def get_session(self, session_id: str) -> TuningSession | None:
         """Get a session by ID."""
         with self._lock:
@@ -719,7 +850,7 @@ class VirtualTuningOrchestrator:
 
     def stop_session(self, session_id: str) -> bool:
         """
-        Stop a running session.
+        Stop a running session, or one that has not started yet.
 
         Args:
             session_id: Session to stop
@@ -729,9 +860,14 @@ class VirtualTuningOrchestrator:
         """
         with self._lock:
             session = self.sessions.get(session_id)
-            if session and session.status == TuningStatus.RUNNING:
+            if session and session.status in (
+                TuningStatus.INITIALIZING,
+                TuningStatus.RUNNING,
+            ):
                 session.status = TuningStatus.STOPPED
                 session.end_time = time.time()
+                if session.stop_event is not None:
+                    session.stop_event.set()
                 logger.info(f"Stopped session: {session_id}")
                 return True
         return False
@@ -836,6 +972,114 @@ class VirtualTuningOrchestrator:
             return completed
 
 
+# =============================================================================
+# Parameter sweeps
+# =============================================================================
+
+
+def build_sweep_configs(
+    base: TuningSessionConfig, **axes: list[Any]
+) -> list[TuningSessionConfig]:
+    """
+    Expand a base config into the cartesian product of parameter values.
+
+    Example:
+        build_sweep_configs(
+            base,
+            engine_profile=[EngineProfile.m8_114(), EngineProfile.m8_131()],
+            base_ve_error_pct=[-15.0, -10.0, -5.0],
+            max_correction_per_iteration_pct=[10.0, 15.0],
+        )  # 12 configs
+
+    Args:
+        base: Config providing every value not swept
+        axes: TuningSessionConfig field name -> values to sweep
+
+    Returns:
+        One config per combination, the last axis varying fastest
+    """
+    names = list(axes)
+    unknown = set(names) - {f.name for f in dataclasses.fields(TuningSessionConfig)}
+    if unknown:
+        raise ValueError(f"Unknown TuningSessionConfig fields: {sorted(unknown)}")
+    return [
+        dataclasses.replace(base, **dict(zip(names, values)))
+        for values in itertools.product(*(axes[name] for name in names))
+    ]
+
+
+def sweep_table(sessions: list[TuningSession]) -> pd.DataFrame:
+    """Comparison table of finished sessions, one row each."""
+    rows = []
+    for session in sessions:
+        config = session.config
+        final = session.iterations[-1] if session.iterations else None
+        converged = session.status == TuningStatus.CONVERGED
+        rows.append(
+            {
+                "session_id": session.session_id,
+                "engine_profile": config.engine_profile.name,
+                "base_ve_scenario": config.base_ve_scenario,
+                "base_ve_error_pct": config.base_ve_error_pct,
+                "max_correction_per_iteration_pct": config.max_correction_per_iteration_pct,
+                "status": session.status.value,
+                "converged": converged,
+                "iterations": len(session.iterations),
+                "iterations_to_converge": len(session.iterations) if converged else None,
+                "final_max_afr_error": final.max_afr_error if final else None,
+                "final_mean_afr_error": final.mean_afr_error if final else None,
+                "oscillation": session.oscillation_detected,
+                "duration_sec": (session.end_time or time.time()) - session.start_time,
+                "error_message": session.error_message,
+            }
+        )
+    return pd.DataFrame(rows)
+
+
+# Sweep worker process state (set by _init_sweep_worker)
+_sweep_worker: dict[str, Any] = {}
+
+
+def _init_sweep_worker(progress_queue: Any) -> None:
+    _sweep_worker["queue"] = progress_queue
+    _sweep_worker["orchestrator"] = VirtualTuningOrchestrator()
+
+
+def _run_sweep_session(
+    index: int, config: TuningSessionConfig, stop_event: Any
+) -> dict[str, Any]:
+    """Run one sweep session in a worker process and return its results."""
+    orchestrator: VirtualTuningOrchestrator = _sweep_worker["orchestrator"]
+    progress_queue = _sweep_worker["queue"]
+    session = orchestrator.create_session(config)
+    session.stop_event = stop_event
+
+    def report(pct: float, message: str) -> None:
+        progress_queue.put((index, session.current_iteration, pct, message))
+
+    session.progress_callback = report
+    # First report marks the parent's session as RUNNING
+    session.update_progress(0.0, "Started")
+    try:
+        orchestrator.run_session(session)
+    finally:
+        with orchestrator._lock:
+            orchestrator.sessions.pop(session.session_id, None)
+
+    return {
+        "status": session.status,
+        "current_iteration": session.current_iteration,
+        "iterations": session.iterations,
+        "current_ve_front": session.current_ve_front,
+        "current_ve_rear": session.current_ve_rear,
+        "progress_pct": session.progress_pct,
+        "progress_message": session.progress_message,
+        "error_message": session.error_message,
+        "oscillation_detected": session.oscillation_detected,
+        "duration_sec": (session.end_time or time.time()) - session.start_time,
+    }
+
+
 # Global orchestrator instance
 _orchestrator: VirtualTuningOrchestrator | None = None
 _orchestrator_lock = threading.Lock()
@@ -30,6 +30,7 @@ __all__ = [
     "ModeDetectionConfig",
     "ModeLabeledFrame",
     "label_modes",
+    "classify_modes",
     "compute_derivatives",
 ]
 
@@ -287,6 +288,65 @@ def classify_sample(
     return ModeTag.CRUISE
 
 
+def _column_or_default(df: pd.DataFrame, col: str, default: float) -> np.ndarray:
+    """Column as float array, or a constant array if the column is missing."""
+    if col in df.columns:
+        return df[col].to_numpy(dtype=float, na_value=np.nan)
+    return np.full(len(df), default, dtype=float)
+
+
+def classify_modes(
+    df: pd.DataFrame,
+    config: ModeDetectionConfig,
+) -> np.ndarray:
+    """
+    Classify every sample at once.
+    
+    Vectorized equivalent of applying classify_sample() to each row: the
+    same priority chain is evaluated over whole columns with np.select, with
+    the same defaults for missing columns. NaN fails every comparison, as it
+    does in the scalar path.
+    
+    Args:
+        df: DataFrame with tps_dot/map_dot (see compute_derivatives)
+        config: Detection thresholds
+        
+    Returns:
+        Array of mode values (strings), one per row
+    """
+    rpm = _column_or_default(df, "rpm", 0)
+    tps = _column_or_default(df, "tps", 50)  # Default to mid-throttle if missing
+    map_kpa = _column_or_default(df, "map_kpa", 50)
+    iat = _column_or_default(df, "iat", 77)  # Default to room temp
+    tps_dot = _column_or_default(df, "tps_dot", 0)
+    map_dot = _column_or_default(df, "map_dot", 0)
+    
+    # Conditions in priority order; np.select picks the first match
+    conditions = [
+        (iat > config.iat_soak_threshold)
+        & (rpm < config.rpm_soak_ceiling)
+        & (tps < config.tps_soak_ceiling),
+        (tps_dot > config.tpsdot_tipin_threshold)
+        | (map_dot > config.mapdot_tipin_threshold),
+        (tps_dot < config.tpsdot_tipout_threshold)
+        | (map_dot < config.mapdot_tipout_threshold),
+        (tps >= config.tps_wot_threshold) | (map_kpa >= config.map_wot_threshold),
+        (tps <= config.tps_decel_ceiling) & (rpm > config.rpm_decel_floor),
+        (rpm < config.rpm_idle_ceiling)
+        & (tps < config.tps_idle_ceiling)
+        & (map_kpa < config.map_idle_ceiling),
+    ]
+    choices = [
+        ModeTag.HEAT_SOAK.value,
+        ModeTag.TIP_IN.value,
+        ModeTag.TIP_OUT.value,
+        ModeTag.WOT.value,
+        ModeTag.DECEL.value,
+        ModeTag.IDLE.value,
+    ]
+    return np.select(conditions, choices, default=ModeTag.CRUISE.value).astype(object)
+
+
 def label_modes(
     df: pd.DataFrame,
     config: Optional[ModeDetectionConfig] = None,
@@ -313,9 +373,8 @@ def label_modes(
     # Compute derivatives for transient detection
     df = compute_derivatives(df, config)
     
-    # Classify each sample
-    modes = df.apply(lambda row: classify_sample(row, config).value, axis=1)
-    df["mode"] = modes
+    # Classify all samples (vectorized classify_sample)
+    df["mode"] = classify_modes(df, config)
     
     # Build summary counts
     summary_counts = df["mode"].value_counts().to_dict()
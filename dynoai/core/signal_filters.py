@@ -27,6 +27,9 @@ Usage:
     
     # Filter samples
     filtered = afr_filter.filter(samples)
+    
+    # Or filter (time, value) arrays: returns a validity mask aligned to rows
+    valid = afr_filter.mask(times_ms, afr_values)
 
 References:
     - Dynojet Power Core tlfilters.py
@@ -41,6 +44,8 @@ from dataclasses import dataclass, field
 from typing import List, Optional, Sequence, Tuple, Union
 import logging
 
+import numpy as np
+
 __all__ = [
     "FilteredSample",
     "SignalFilter",
@@ -118,6 +123,11 @@ class SignalFilter(ABC):
     
     All filters operate on lists of FilteredSample objects in-place,
     modifying the is_valid flag and value as needed.
+    
+    ``filter_arrays`` is the array equivalent: it takes (time, value)
+    arrays plus an optional validity mask and returns new values and a
+    mask aligned to the input rows. Subclasses override it with a
+    vectorized implementation; the default goes through ``filter``.
     """
     
     @abstractmethod
@@ -133,6 +143,38 @@ class SignalFilter(ABC):
         """
         pass
     
+    def filter_arrays(
+        self,
+        times_ms: Sequence[float],
+        values: Sequence[float],
+        valid: Optional[np.ndarray] = None,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Apply filter to parallel arrays.
+        
+        Args:
+            times_ms: Timestamps in milliseconds
+            values: Sample values
+            valid: Validity mask from a previous filter (default: all valid)
+            
+        Returns:
+            Tuple of (values, valid mask); invalid rows hold NaN
+        """
+        values, valid = _as_filter_arrays(times_ms, values, valid)
+        samples = samples_from_arrays(np.asarray(times_ms, dtype=float), values)
+        for sample, ok in zip(samples, valid):
+            if not ok:
+                sample.invalidate()
+        samples = self.filter(samples)
+        return (
+            np.array([s.value for s in samples], dtype=float),
+            np.array([s.is_valid for s in samples], dtype=bool),
+        )
+    
+    def mask(self, times_ms: Sequence[float], values: Sequence[float]) -> np.ndarray:
+        """Boolean mask of the rows that pass this filter."""
+        return self.filter_arrays(times_ms, values)[1]
+    
     @abstractmethod
     def reset(self) -> None:
         """Reset any internal filter state."""
@@ -230,6 +272,56 @@ class LowpassFilter(SignalFilter):
         
         return samples
     
+    def filter_arrays(
+        self,
+        times_ms: Sequence[float],
+        values: Sequence[float],
+        valid: Optional[np.ndarray] = None,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Array version of ``filter``.
+        
+        The variable-dt recurrence y[k] = a[k]×x[k] + (1-a[k])×y[k-1] is
+        solved in closed form with cumulative log-decay sums, split into
+        segments short enough that the decay factors stay in float range.
+        """
+        self.reset()
+        values, valid = _as_filter_arrays(times_ms, values, valid)
+        if len(values) < 2:
+            return values, valid
+        
+        self._stats.total_samples = len(values)
+        
+        # Like filter(), the first row never takes part
+        idx = np.flatnonzero(valid[1:]) + 1
+        self._stats.valid_samples = len(idx)
+        if len(idx) < 2:
+            return values, valid
+        
+        t = np.asarray(times_ms, dtype=float)[idx]
+        dt = np.diff(t)
+        dt[dt <= 0] = 1.0
+        # log(1 - alpha) with alpha = dt / (RC + dt); a decay below e^-600
+        # leaves nothing of y[k-1] anyway
+        log_decay = np.maximum(np.log(self.rc_ms / (self.rc_ms + dt)), -600.0)
+        alpha = dt / (self.rc_ms + dt)
+        
+        x = values[idx]
+        y = x.copy()
+        # cum[k]: log of the total decay from the anchor to sample k
+        cum = np.concatenate(([0.0], np.cumsum(log_decay)))
+        start = 0
+        while start < len(idx) - 1:
+            # Keep exp(cum[start] - cum[k]) well below float overflow
+            end = int(np.searchsorted(-cum, -cum[start] + 600.0, side='right'))
+            rel = cum[start + 1:end] - cum[start]
+            terms = alpha[start:end - 1] * x[start + 1:end] * np.exp(-rel)
+            y[start + 1:end] = np.exp(rel) * (y[start] + np.cumsum(terms))
+            start = end - 1
+        
+        values[idx] = y
+        return values, valid
+    
     @property
     def statistics(self) -> FilterStatistics:
         return self._stats
@@ -280,9 +372,9 @@ class MinMaxFilter(SignalFilter):
                 continue
             
             if sample.value < self.min_val or sample.value > self.max_val:
+                reason = "below_min" if sample.value < self.min_val else "above_max"
                 sample.invalidate()
                 self._stats.rejected_samples += 1
-                reason = "below_min" if sample.value < self.min_val else "above_max"
                 self._stats.rejection_reasons[reason] = (
                     self._stats.rejection_reasons.get(reason, 0) + 1
                 )
@@ -291,6 +383,29 @@ class MinMaxFilter(SignalFilter):
         
         return samples
     
+    def filter_arrays(
+        self,
+        times_ms: Sequence[float],
+        values: Sequence[float],
+        valid: Optional[np.ndarray] = None,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Array version of ``filter``."""
+        self.reset()
+        values, valid = _as_filter_arrays(times_ms, values, valid)
+        self._stats.total_samples = len(values)
+        
+        below = valid & (values < self.min_val)
+        above = valid & (values > self.max_val)
+        rejected = below | above
+        _count_reason(self._stats, "below_min", below)
+        _count_reason(self._stats, "above_max", above)
+        self._stats.rejected_samples = int(rejected.sum())
+        self._stats.valid_samples = int(valid.sum()) - self._stats.rejected_samples
+        
+        values[rejected] = np.nan
+        valid &= ~rejected
+        return values, valid
+    
     @property
     def statistics(self) -> FilterStatistics:
         return self._stats
@@ -413,6 +528,65 @@ class TimeAwareMinMaxFilter(SignalFilter):
         
         return samples
     
+    def filter_arrays(
+        self,
+        times_ms: Sequence[float],
+        values: Sequence[float],
+        valid: Optional[np.ndarray] = None,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Array version of ``filter``.
+        
+        Each run of out-of-range samples excludes the time span from
+        ``exclude_leading_ms`` before its first sample to
+        ``exclude_trailing_ms`` after the next in-range sample.
+        """
+        self.reset()
+        values, valid = _as_filter_arrays(times_ms, values, valid)
+        self._stats.total_samples = len(values)
+        if len(values) == 0:
+            return values, valid
+        t = np.asarray(times_ms, dtype=float)
+        
+        idx = np.flatnonzero(valid)
+        v = values[idx]
+        oob = (v < self.min_val) | (v > self.max_val)
+        
+        # Exclusion ranges: one per run of out-of-range samples
+        prev_oob = np.concatenate(([False], oob[:-1]))
+        run_starts = np.flatnonzero(oob & ~prev_oob)
+        run_ends = np.flatnonzero(~oob & prev_oob)  # first in-range sample after
+        range_start = t[idx[run_starts]] - self.exclude_leading_ms
+        range_end = t[idx[run_ends]] + self.exclude_trailing_ms
+        if len(run_ends) < len(run_starts):
+            range_end = np.append(range_end, t[-1] + self.exclude_trailing_ms)
+        
+        rejected = np.zeros(len(values), dtype=bool)
+        rejected[idx[oob]] = True
+        _count_reason(self._stats, "out_of_range", rejected)
+        
+        # A remaining sample is excluded if any range covers its time:
+        # among ranges starting at or before t, the latest end reaches t
+        remaining = valid & ~rejected
+        excluded = np.zeros(len(values), dtype=bool)
+        if len(range_start):
+            order = np.argsort(range_start, kind='stable')
+            starts = range_start[order]
+            max_end = np.maximum.accumulate(range_end[order])
+            t_rem = t[remaining]
+            k = np.searchsorted(starts, t_rem, side='right')
+            covered = (k > 0) & (max_end[np.maximum(k - 1, 0)] >= t_rem)
+            excluded[np.flatnonzero(remaining)[covered]] = True
+        _count_reason(self._stats, "neighbor_exclusion", excluded)
+        
+        rejected |= excluded
+        self._stats.rejected_samples = int(rejected.sum())
+        self._stats.valid_samples = int(valid.sum()) - self._stats.rejected_samples
+        
+        values[rejected] = np.nan
+        valid &= ~rejected
+        return values, valid
+    
     @property
     def statistics(self) -> FilterStatistics:
         return self._stats
@@ -558,6 +732,60 @@ class StatisticalOutlierFilter(SignalFilter):
         
         return samples
     
+    def filter_arrays(
+        self,
+        times_ms: Sequence[float],
+        values: Sequence[float],
+        valid: Optional[np.ndarray] = None,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Array version of ``filter``.
+        
+        The Welford statistics are computed with vectorized reductions, and
+        the neighbour rejection window is a convolution of the outlier mask.
+        """
+        self.reset()
+        values, valid = _as_filter_arrays(times_ms, values, valid)
+        n = len(values)
+        self._stats.total_samples = n
+        if n < 3:
+            return values, valid
+        
+        finite = values[valid & ~np.isnan(values)]
+        self._n = len(finite)
+        if self._n:
+            self._mean = float(finite.mean())
+            self._m2 = float(np.square(finite - self._mean).sum())
+        
+        std = self.std_dev
+        outliers = np.zeros(n, dtype=bool)
+        if std >= self.min_std_threshold:
+            with np.errstate(invalid='ignore'):
+                outliers = valid & (
+                    np.abs(values - self._mean) > self.sigma_threshold * std
+                )
+        
+        # Window [i - leading, i + trailing] around each outlier
+        lead = self.reject_leading_samples
+        trail = self.reject_trailing_samples
+        window = np.ones(lead + trail + 1, dtype=np.int64)
+        hits = np.convolve(outliers.astype(np.int64), window)
+        in_window = hits[lead:lead + n] > 0
+        
+        rejected = valid & in_window
+        _count_reason(self._stats, "statistical_outlier", rejected)
+        self._stats.rejected_samples = int(rejected.sum())
+        self._stats.valid_samples = int(valid.sum()) - self._stats.rejected_samples
+        
+        logger.debug(
+            f"StatisticalOutlierFilter: mean={self._mean:.2f}, std={self.std_dev:.2f}, "
+            f"rejected={self._stats.rejected_samples}/{self._stats.total_samples}"
+        )
+        
+        values[rejected] = np.nan
+        valid &= ~rejected
+        return values, valid
+    
     @property
     def statistics(self) -> FilterStatistics:
         return self._stats
@@ -615,14 +843,39 @@ class CompositeFilter(SignalFilter):
             self._combined_stats.total_samples - self._combined_stats.valid_samples
         )
         
-        # Merge rejection reasons from all filters
+        self._merge_rejection_reasons()
+        
+        return samples
+    
+    def filter_arrays(
+        self,
+        times_ms: Sequence[float],
+        values: Sequence[float],
+        valid: Optional[np.ndarray] = None,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Apply all filters in sequence to parallel arrays."""
+        self.reset()
+        values, valid = _as_filter_arrays(times_ms, values, valid)
+        
+        for f in self.filters:
+            values, valid = f.filter_arrays(times_ms, values, valid)
+        
+        self._combined_stats.total_samples = len(values)
+        self._combined_stats.valid_samples = int(valid.sum())
+        self._combined_stats.rejected_samples = (
+            self._combined_stats.total_samples - self._combined_stats.valid_samples
+        )
+        self._merge_rejection_reasons()
+        
+        return values, valid
+    
+    def _merge_rejection_reasons(self) -> None:
+        """Merge rejection reasons from all filters."""
         for f in self.filters:
             for reason, count in f.statistics.rejection_reasons.items():
                 self._combined_stats.rejection_reasons[reason] = (
                     self._combined_stats.rejection_reasons.get(reason, 0) + count
                 )
-        
-        return samples
     
     @property
     def statistics(self) -> FilterStatistics:
@@ -634,6 +887,31 @@ class CompositeFilter(SignalFilter):
 # =============================================================================
 
 
+def _as_filter_arrays(
+    times_ms: Sequence[float],
+    values: Sequence[float],
+    valid: Optional[np.ndarray],
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Copy values and validity mask into fresh arrays for a filter pass."""
+    values = np.array(values, dtype=float)
+    if len(times_ms) != len(values):
+        raise ValueError("times_ms and values must have same length")
+    if valid is None:
+        valid = np.ones(len(values), dtype=bool)
+    else:
+        valid = np.array(valid, dtype=bool)
+        if len(valid) != len(values):
+            raise ValueError("valid mask and values must have same length")
+    return values, valid
+
+
+def _count_reason(stats: FilterStatistics, reason: str, mask: np.ndarray) -> None:
+    """Add the rows set in ``mask`` to a rejection reason count."""
+    count = int(np.count_nonzero(mask))
+    if count:
+        stats.rejection_reasons[reason] = stats.rejection_reasons.get(reason, 0) + count
+
+
 def samples_from_arrays(
     times_ms: Sequence[float],
     values: Sequence[float],
@@ -747,13 +1025,11 @@ def filter_afr_samples(
     
     # Create composite filter and apply
     composite = CompositeFilter(filters)
-    samples = samples_from_arrays(times_ms, afr_values)
-    filtered_samples = composite.filter(samples)
+    values, valid = composite.filter_arrays(times_ms, afr_values)
     
     # Extract valid samples
-    filtered_times, filtered_values = samples_to_arrays(
-        filtered_samples, include_invalid=False
-    )
+    filtered_times = np.asarray(times_ms, dtype=float)[valid].tolist()
+    filtered_values = values[valid].tolist()
     
     return filtered_times, filtered_values, composite.statistics
 
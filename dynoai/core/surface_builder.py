@@ -48,8 +48,11 @@ __all__ = [
     "SurfaceStats",
     "Surface2D",
     "SurfaceSpec",
+    "SurfaceBins",
     "build_surface",
     "build_standard_surfaces",
+    "standard_surface_specs",
+    "describe_surface_spec",
     "surface_to_dict",
 ]
 
@@ -192,6 +195,8 @@ class SurfaceSpec:
         value_column: Column name to aggregate, or callable that computes value
         filter_modes: List of modes to include (None = all modes)
         filter_expr: Additional filter callable (takes row, returns bool)
+        vectorized: If True, value_column/filter_expr callables take the
+            whole DataFrame and return an array/Series (no row-wise apply)
         aggregation: Aggregation method: "mean", "max", "min", "p95", "rate", "sum"
         weighting: Weighting strategy for binning
         min_samples_per_cell: Minimum samples for a cell to be valid
@@ -203,6 +208,7 @@ class SurfaceSpec:
     value_column: Union[str, Callable[[pd.Series], float]]
     filter_modes: Optional[List[ModeTag]] = None
     filter_expr: Optional[Callable[[pd.Series], bool]] = None
+    vectorized: bool = False
     aggregation: str = "mean"
     weighting: Optional[WeightingStrategy] = None
     min_samples_per_cell: int = 3
@@ -215,11 +221,117 @@ class SurfaceSpec:
 # Core Functions
 # =============================================================================
 
+class SurfaceBins:
+    """
+    RPM/MAP bin placement for one DataFrame, shared by every surface built
+    from it.
+    
+    Holds both placements build_surface needs: the weighted accumulator's
+    cell and center distance (for "mean" surfaces) and the nearest bin (for
+    max/min/p95/sum/rate surfaces).
+    
+    Args:
+        df: DataFrame with 'rpm' and 'map_kpa' columns
+        rpm_bins: RPM axis bins (defaults to RPM_BINS from constants)
+        map_bins: MAP axis bins (defaults to KPA_BINS from constants)
+    """
+    
+    def __init__(
+        self,
+        df: pd.DataFrame,
+        rpm_bins: Optional[List[float]] = None,
+        map_bins: Optional[List[float]] = None,
+    ):
+        if "rpm" not in df.columns:
+            raise ValueError("Column 'rpm' not found in DataFrame")
+        if "map_kpa" not in df.columns:
+            raise ValueError("Column 'map_kpa' not found in DataFrame")
+        
+        self.index = df.index
+        self.rpm_bins = list(RPM_BINS) if rpm_bins is None else list(rpm_bins)
+        self.map_bins = list(KPA_BINS) if map_bins is None else list(map_bins)
+        self.shape = (len(self.rpm_bins), len(self.map_bins))
+        
+        rpm = df["rpm"].to_numpy(dtype=float, na_value=np.nan)
+        map_kpa = df["map_kpa"].to_numpy(dtype=float, na_value=np.nan)
+        
+        # Nearest-bin placement (aggregated surfaces); first bin wins ties
+        self.has_axes = ~(np.isnan(rpm) | np.isnan(map_kpa))
+        self.rpm_nearest = _nearest_bin_indices(rpm, self.rpm_bins)
+        self.map_nearest = _nearest_bin_indices(map_kpa, self.map_bins)
+        
+        # Weighted accumulator placement (mean surfaces)
+        finite = np.isfinite(rpm) & np.isfinite(map_kpa)
+        self.rpm_cell = np.full(len(rpm), -1, dtype=np.intp)
+        self.map_cell = np.full(len(rpm), -1, dtype=np.intp)
+        self.distance = np.full(len(rpm), np.nan)
+        placer = WeightedBinAccumulator(self.rpm_bins, self.map_bins)
+        (
+            self.rpm_cell[finite],
+            self.map_cell[finite],
+            self.distance[finite],
+        ) = placer.place_samples(rpm[finite], map_kpa[finite])
+    
+    def matches(self, df: pd.DataFrame) -> bool:
+        """True if these bins were computed for df's rows."""
+        return self.index.equals(df.index)
+
+
+def _nearest_bin_indices(values: np.ndarray, bins: List[float]) -> np.ndarray:
+    if not bins or len(values) == 0:
+        return np.zeros(len(values), dtype=np.intp)
+    distances = np.abs(np.asarray(bins, dtype=float)[None, :] - values[:, None])
+    # All-NaN rows (missing values) are masked out by has_axes
+    distances[np.isnan(distances)] = np.inf
+    return np.argmin(distances, axis=1)
+
+
+def _row_mask(df: pd.DataFrame, spec: SurfaceSpec, mask_info_parts: List[str]) -> np.ndarray:
+    """Evaluate the spec's mode filter and filter expression as one mask."""
+    mask = np.ones(len(df), dtype=bool)
+    
+    if spec.filter_modes is not None and "mode" in df.columns:
+        mode_values = [m.value for m in spec.filter_modes]
+        mask &= df["mode"].isin(mode_values).to_numpy()
+        mask_info_parts.append(f"modes: {', '.join(mode_values)}")
+    
+    if spec.filter_expr is not None:
+        if spec.vectorized:
+            mask &= np.asarray(spec.filter_expr(df), dtype=bool)
+        elif mask.any():
+            # Row-wise callables only see the rows that passed the mode filter
+            selected = df[mask]
+            mask[mask] = np.asarray(
+                selected.apply(spec.filter_expr, axis=1), dtype=bool
+            )
+        mask_info_parts.append("custom filter applied")
+    
+    return mask
+
+
+def _spec_values(df: pd.DataFrame, spec: SurfaceSpec, mask: np.ndarray) -> np.ndarray:
+    """Evaluate the spec's value column for every row (NaN where masked)."""
+    if callable(spec.value_column):
+        if spec.vectorized:
+            values = spec.value_column(df)
+            return np.asarray(values, dtype=float)
+        values = np.full(len(df), np.nan)
+        if mask.any():
+            applied = df[mask].apply(spec.value_column, axis=1)
+            values[mask] = applied.to_numpy(dtype=float, na_value=np.nan)
+        return values
+    
+    if spec.value_column not in df.columns:
+        raise ValueError(f"Column '{spec.value_column}' not found in DataFrame")
+    return df[spec.value_column].to_numpy(dtype=float, na_value=np.nan)
+
+
 def build_surface(
     df: pd.DataFrame,
     spec: SurfaceSpec,
     rpm_bins: Optional[List[float]] = None,
     map_bins: Optional[List[float]] = None,
+    bins: Optional[SurfaceBins] = None,
 ) -> Surface2D:
     """
     Build a 2D surface from a labeled DataFrame.
@@ -232,44 +344,19 @@ def build_surface(
         spec: Surface specification
         rpm_bins: RPM axis bins (defaults to RPM_BINS from constants)
         map_bins: MAP axis bins (defaults to KPA_BINS from constants)
+        bins: Precomputed SurfaceBins for df (overrides rpm_bins/map_bins);
+            pass the same instance when building several surfaces from df
         
     Returns:
         Surface2D with computed values and statistics
     """
-    # Use default bins if not provided
-    if rpm_bins is None:
-        rpm_bins = list(RPM_BINS)
-    if map_bins is None:
-        map_bins = list(KPA_BINS)
-    
-    # Apply mode filter
-    filtered_df = df.copy()
-    mask_info_parts = []
-    
-    if spec.filter_modes is not None and "mode" in df.columns:
-        mode_values = [m.value for m in spec.filter_modes]
-        filtered_df = filtered_df[filtered_df["mode"].isin(mode_values)]
-        mask_info_parts.append(f"modes: {', '.join(mode_values)}")
-    
-    # Apply additional filter expression
-    if spec.filter_expr is not None:
-        filter_mask = filtered_df.apply(spec.filter_expr, axis=1)
-        filtered_df = filtered_df[filter_mask]
-        mask_info_parts.append("custom filter applied")
+    mask_info_parts: List[str] = []
+    mask = _row_mask(df, spec, mask_info_parts)
+    values = _spec_values(df, spec, mask)
     
-    # Get value column
-    if callable(spec.value_column):
-        values_series = filtered_df.apply(spec.value_column, axis=1)
-    else:
-        if spec.value_column not in filtered_df.columns:
-            raise ValueError(f"Column '{spec.value_column}' not found in DataFrame")
-        values_series = filtered_df[spec.value_column]
-    
-    # Check for required columns
-    if "rpm" not in filtered_df.columns:
-        raise ValueError("Column 'rpm' not found in DataFrame")
-    if "map_kpa" not in filtered_df.columns:
-        raise ValueError("Column 'map_kpa' not found in DataFrame")
+    if bins is None or not bins.matches(df):
+        bins = SurfaceBins(df, rpm_bins, map_bins)
+    rpm_bins, map_bins = bins.rpm_bins, bins.map_bins
     
     # Build accumulator
     weighting = spec.weighting or LogarithmicWeighting()
@@ -281,15 +368,13 @@ def build_surface(
     )
     
     # Add samples
-    total_samples = 0
-    for idx in filtered_df.index:
-        rpm = filtered_df.loc[idx, "rpm"]
-        map_kpa = filtered_df.loc[idx, "map_kpa"]
-        value = values_series.loc[idx]
-        
-        if pd.notna(rpm) and pd.notna(map_kpa) and pd.notna(value):
-            if accumulator.add_sample(rpm, map_kpa, value):
-                total_samples += 1
+    selected = mask & bins.has_axes & ~np.isnan(values)
+    total_samples = accumulator.add_placed_samples(
+        bins.rpm_cell[selected],
+        bins.map_cell[selected],
+        bins.distance[selected],
+        values[selected],
+    )
     
     # Get results
     raw_table = accumulator.get_table()
@@ -299,10 +384,10 @@ def build_surface(
     if spec.aggregation in ["max", "min", "p95", "sum", "rate"]:
         # For non-mean aggregations, we need to recompute
         values_matrix = _compute_aggregated_surface(
-            filtered_df, 
-            values_series,
-            rpm_bins, 
-            map_bins,
+            bins.rpm_nearest[selected],
+            bins.map_nearest[selected],
+            values[selected],
+            bins.shape,
             spec.aggregation,
             spec.min_samples_per_cell,
         )
@@ -343,10 +428,10 @@ def build_surface(
 
 
 def _compute_aggregated_surface(
-    df: pd.DataFrame,
-    values_series: pd.Series,
-    rpm_bins: List[float],
-    map_bins: List[float],
+    rpm_idx: np.ndarray,
+    map_idx: np.ndarray,
+    values: np.ndarray,
+    shape: tuple,
     aggregation: str,
     min_samples: int,
 ) -> List[List[Optional[float]]]:
@@ -354,84 +439,60 @@ def _compute_aggregated_surface(
     Compute surface with custom aggregation.
     
     Used for aggregations other than weighted mean (max, min, p95, etc.).
+    Samples are grouped by cell with a stable sort, so per-cell sums add
+    values in log order.
     """
-    n_rpm = len(rpm_bins)
-    n_map = len(map_bins)
-    
-    # Initialize cell accumulators
-    cell_values: List[List[List[float]]] = [
-        [[] for _ in range(n_map)] for _ in range(n_rpm)
+    n_cells = shape[0] * shape[1]
+    flat = np.ravel_multi_index((rpm_idx, map_idx), shape) if n_cells else rpm_idx
+    counts = np.bincount(flat, minlength=n_cells)
+    
+    result = np.full(n_cells, np.nan)
+    if aggregation == "rate":
+        # Rate = count / time (assuming 1 sample = 10ms for now)
+        result = counts / 10.0  # events per second
+    elif aggregation == "sum":
+        result = np.bincount(flat, weights=values, minlength=n_cells)
+    elif aggregation in ("max", "min") and len(values):
+        order = np.argsort(flat, kind="stable")
+        starts = np.flatnonzero(np.diff(flat[order], prepend=-1))
+        reduce = np.maximum if aggregation == "max" else np.minimum
+        result[flat[order][starts]] = reduce.reduceat(values[order], starts)
+    elif aggregation == "p95" and len(values):
+        order = np.argsort(flat, kind="stable")
+        cells, starts = np.unique(flat[order], return_index=True)
+        for cell, cell_values in zip(cells, np.split(values[order], starts[1:])):
+            if len(cell_values) >= min_samples:
+                result[cell] = np.percentile(cell_values, 95)
+    
+    valid = counts >= min_samples
+    table = result.reshape(shape).tolist()
+    valid_rows = valid.reshape(shape).tolist()
+    return [
+        [v if ok else None for v, ok in zip(row, valid_row)]
+        for row, valid_row in zip(table, valid_rows)
     ]
-    
-    def nearest_bin(val: float, bins: List[float]) -> int:
-        return min(range(len(bins)), key=lambda i: abs(bins[i] - val))
-    
-    # Accumulate values into cells
-    for idx in df.index:
-        rpm = df.loc[idx, "rpm"]
-        map_kpa = df.loc[idx, "map_kpa"]
-        value = values_series.loc[idx]
-        
-        if pd.notna(rpm) and pd.notna(map_kpa) and pd.notna(value):
-            rpm_idx = nearest_bin(rpm, rpm_bins)
-            map_idx = nearest_bin(map_kpa, map_bins)
-            cell_values[rpm_idx][map_idx].append(value)
-    
-    # Aggregate each cell
-    result: List[List[Optional[float]]] = []
-    for rpm_idx in range(n_rpm):
-        row: List[Optional[float]] = []
-        for map_idx in range(n_map):
-            values = cell_values[rpm_idx][map_idx]
-            if len(values) >= min_samples:
-                if aggregation == "max":
-                    row.append(max(values))
-                elif aggregation == "min":
-                    row.append(min(values))
-                elif aggregation == "p95":
-                    row.append(np.percentile(values, 95))
-                elif aggregation == "sum":
-                    row.append(sum(values))
-                elif aggregation == "rate":
-                    # Rate = count / time (assuming 1 sample = 10ms for now)
-                    row.append(len(values) / 10.0)  # events per second
-                else:
-                    row.append(sum(values) / len(values))
-            else:
-                row.append(None)
-        result.append(row)
-    
-    return result
 
 
-def build_standard_surfaces(
-    df: pd.DataFrame,
-    rpm_bins: Optional[List[float]] = None,
-    map_bins: Optional[List[float]] = None,
+def standard_surface_specs(
+    columns: Sequence[str],
     min_samples: int = 3,
-) -> Dict[str, Surface2D]:
+) -> List[SurfaceSpec]:
     """
-    Build a standard set of surfaces from a normalized DataFrame.
-    
-    Builds surfaces for:
-    - Spark timing (front, rear, or global)
-    - AFR error (front, rear, or global)
-    - Knock activity (if present)
+    Specs of the standard surfaces that can be built from the given columns.
     
     Args:
-        df: Normalized and mode-labeled DataFrame
-        rpm_bins: RPM axis bins
-        map_bins: MAP axis bins
+        columns: Columns of the normalized, mode-labeled DataFrame
         min_samples: Minimum samples per cell
         
     Returns:
-        Dict of surface_id -> Surface2D
+        SurfaceSpec list in build order
     """
-    surfaces: Dict[str, Surface2D] = {}
+    columns = set(columns)
+    specs: List[SurfaceSpec] = []
     
     # Spark surfaces
-    if "spark_f" in df.columns:
-        spec_spark_f = SurfaceSpec(
+    if "spark_f" in columns:
+        specs.append(SurfaceSpec(
             value_column="spark_f",
             filter_modes=[ModeTag.WOT, ModeTag.CRUISE],
             aggregation="mean",
@@ -439,11 +500,9 @@ def build_standard_surfaces(
             surface_id="spark_front",
             title="Spark Timing - Front",
             description="Spark advance for front cylinder across RPM/MAP",
-        )
-        surfaces["spark_front"] = build_surface(df, spec_spark_f, rpm_bins, map_bins)
-    
-    if "spark_r" in df.columns:
-        spec_spark_r = SurfaceSpec(
+        ))
+    if "spark_r" in columns:
+        specs.append(SurfaceSpec(
             value_column="spark_r",
             filter_modes=[ModeTag.WOT, ModeTag.CRUISE],
             aggregation="mean",
@@ -451,11 +510,9 @@ def build_standard_surfaces(
             surface_id="spark_rear",
             title="Spark Timing - Rear",
             description="Spark advance for rear cylinder across RPM/MAP",
-        )
-        surfaces["spark_rear"] = build_surface(df, spec_spark_r, rpm_bins, map_bins)
-    
-    if "spark" in df.columns and "spark_f" not in df.columns:
-        spec_spark = SurfaceSpec(
+        ))
+    if "spark" in columns and "spark_f" not in columns:
+        specs.append(SurfaceSpec(
             value_column="spark",
             filter_modes=[ModeTag.WOT, ModeTag.CRUISE],
             aggregation="mean",
@@ -463,12 +520,11 @@ def build_standard_surfaces(
             surface_id="spark_global",
             title="Spark Timing - Global",
             description="Spark advance (single sensor) across RPM/MAP",
-        )
-        surfaces["spark_global"] = build_surface(df, spec_spark, rpm_bins, map_bins)
+        ))
     
     # AFR error surfaces
-    if "afr_error_f" in df.columns:
-        spec_afr_f = SurfaceSpec(
+    if "afr_error_f" in columns:
+        specs.append(SurfaceSpec(
             value_column="afr_error_f",
             filter_modes=[ModeTag.WOT, ModeTag.CRUISE],
             aggregation="mean",
@@ -476,11 +532,9 @@ def build_standard_surfaces(
             surface_id="afr_error_front",
             title="AFR Error - Front",
             description="AFR error (measured - commanded) for front cylinder",
-        )
-        surfaces["afr_error_front"] = build_surface(df, spec_afr_f, rpm_bins, map_bins)
-    
-    if "afr_error_r" in df.columns:
-        spec_afr_r = SurfaceSpec(
+        ))
+    if "afr_error_r" in columns:
+        specs.append(SurfaceSpec(
             value_column="afr_error_r",
             filter_modes=[ModeTag.WOT, ModeTag.CRUISE],
             aggregation="mean",
@@ -488,11 +542,9 @@ def build_standard_surfaces(
             surface_id="afr_error_rear",
             title="AFR Error - Rear",
             description="AFR error (measured - commanded) for rear cylinder",
-        )
-        surfaces["afr_error_rear"] = build_surface(df, spec_afr_r, rpm_bins, map_bins)
-    
-    if "afr_error" in df.columns and "afr_error_f" not in df.columns:
-        spec_afr = SurfaceSpec(
+        ))
+    if "afr_error" in columns and "afr_error_f" not in columns:
+        specs.append(SurfaceSpec(
             value_column="afr_error",
             filter_modes=[ModeTag.WOT, ModeTag.CRUISE],
             aggregation="mean",
@@ -500,25 +552,96 @@ def build_standard_surfaces(
             surface_id="afr_error_global",
             title="AFR Error - Global",
             description="AFR error (single sensor) across RPM/MAP",
-        )
-        surfaces["afr_error_global"] = build_surface(df, spec_afr, rpm_bins, map_bins)
+        ))
     
     # Knock surfaces (if present)
-    if "knock" in df.columns or "knock_f" in df.columns:
-        knock_col = "knock_f" if "knock_f" in df.columns else "knock"
-        spec_knock = SurfaceSpec(
-            value_column=knock_col,
+    if "knock" in columns or "knock_f" in columns:
+        specs.append(SurfaceSpec(
+            value_column="knock_f" if "knock_f" in columns else "knock",
             filter_modes=[ModeTag.WOT],
             aggregation="mean",
             min_samples_per_cell=min_samples,
             surface_id="knock_activity",
             title="Knock Activity",
             description="Knock sensor activity across RPM/MAP",
-        )
-        try:
-            surfaces["knock_activity"] = build_surface(df, spec_knock, rpm_bins, map_bins)
-        except Exception:
-            pass  # Skip if knock column has issues
+        ))
+    
+    return specs
+
+
+def describe_surface_spec(spec: SurfaceSpec) -> Dict:
+    """
+    JSON-compatible description of a SurfaceSpec, for cache keys.
+    
+    Callables are described by module and qualified name, weighting
+    strategies by class name and parameters.
+    """
+    def name_of(value):
+        if not callable(value):
+            return value
+        qualname = getattr(value, "__qualname__", repr(value))
+        return f"{getattr(value, '__module__', '')}.{qualname}"
+    
+    weighting = None
+    if spec.weighting is not None:
+        weighting = {"type": type(spec.weighting).__name__, **vars(spec.weighting)}
+    
+    return {
+        "value_column": name_of(spec.value_column),
+        "filter_modes": (
+            [m.value for m in spec.filter_modes] if spec.filter_modes is not None else None
+        ),
+        "filter_expr": name_of(spec.filter_expr),
+        "vectorized": spec.vectorized,
+        "aggregation": spec.aggregation,
+        "weighting": weighting,
+        "min_samples_per_cell": spec.min_samples_per_cell,
+        "surface_id": spec.surface_id,
+        "title": spec.title,
+        "description": spec.description,
+    }
+
+
+def build_standard_surfaces(
+    df: pd.DataFrame,
+    rpm_bins: Optional[List[float]] = None,
+    map_bins: Optional[List[float]] = None,
+    min_samples: int = 3,
+) -> Dict[str, Surface2D]:
+    """
+    Build a standard set of surfaces from a normalized DataFrame.
+    
+    Builds surfaces for:
+    - Spark timing (front, rear, or global)
+    - AFR error (front, rear, or global)
+    - Knock activity (if present)
+    
+    See standard_surface_specs() for the exact specs.
+    
+    Args:
+        df: Normalized and mode-labeled DataFrame
+        rpm_bins: RPM axis bins
+        map_bins: MAP axis bins
+        min_samples: Minimum samples per cell
+        
+    Returns:
+        Dict of surface_id -> Surface2D
+    """
+    surfaces: Dict[str, Surface2D] = {}
+    
+    # Place every row on the grid once and share it across all surfaces
+    bins: Optional[SurfaceBins] = None
+    if "rpm" in df.columns and "map_kpa" in df.columns:
+        bins = SurfaceBins(df, rpm_bins, map_bins)
+    
+    for spec in standard_surface_specs(df.columns, min_samples):
+        if spec.surface_id == "knock_activity":
+            try:
+                surfaces[spec.surface_id] = build_surface(df, spec, rpm_bins, map_bins, bins=bins)
+            except Exception:
+                pass  # Skip if knock column has issues
+            continue
+        surfaces[spec.surface_id] = build_surface(df, spec, rpm_bins, map_bins, bins=bins)
     
     return surfaces
 
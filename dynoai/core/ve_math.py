@@ -29,6 +29,9 @@ Usage:
     
     # Legacy v1.0.0 mode
     correction = calculate_ve_correction(14.0, 13.0, version=MathVersion.V1_0_0)
+    
+    # Whole arrays: invalid entries are reported in a mask, not raised
+    corrections, valid = calculate_ve_correction_array(measured, targets)
 
 References:
     - docs/MATH_V2_SPECIFICATION.md
@@ -40,6 +43,8 @@ from dataclasses import dataclass
 from typing import Optional, Tuple
 import logging
 
+import numpy as np
+
 # Import environmental corrections
 from dynoai.core.environmental import (
     EnvironmentalCorrector,
@@ -52,6 +57,7 @@ __all__ = [
     "MathConfig",
     "calculate_ve_correction",
     "calculate_ve_correction_batch",
+    "calculate_ve_correction_array",
     "calculate_ve_correction_with_environment",
     "get_default_config",
     "VEMathError",
@@ -335,6 +341,74 @@ def calculate_ve_correction(
     return correction
 
 
+def calculate_ve_correction_array(
+    afr_measured: np.ndarray,
+    afr_target: np.ndarray,
+    version: Optional[MathVersion] = None,
+    config: Optional[MathConfig] = None,
+    clamp: bool = True,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Vectorized calculate_ve_correction() over arrays of AFR values.
+    
+    Uses the same element-wise operations as the scalar path, so every
+    valid entry is bit-identical to calculate_ve_correction(). Entries
+    that would fail validation (NaN, None, out of range) are reported in
+    the returned mask instead of raising.
+    
+    Args:
+        afr_measured: Measured AFR values
+        afr_target: Target AFR values (broadcastable against afr_measured)
+        version: Math version to use (overrides config if provided)
+        config: Math configuration (uses default if not provided)
+        clamp: Whether to apply safety clamping (default: True)
+        
+    Returns:
+        Tuple of (corrections, valid mask); invalid entries are NaN
+        
+    Raises:
+        VEMathError: If the math version is unknown
+    """
+    if config is None:
+        config = _DEFAULT_CONFIG
+    math_version = version if version is not None else config.version
+    
+    measured, target = np.broadcast_arrays(
+        np.asarray(afr_measured, dtype=float), np.asarray(afr_target, dtype=float)
+    )
+    
+    # Same checks as _validate_afr(); NaN fails both comparisons
+    valid = (
+        (config.afr_min <= measured) & (measured <= config.afr_max)
+        & (config.afr_min <= target) & (target <= config.afr_max)
+    )
+    
+    with np.errstate(invalid="ignore", divide="ignore", over="ignore"):
+        if math_version == MathVersion.V1_0_0:
+            correction = 1.0 + ((measured - target) * V1_VE_PER_AFR_POINT)
+        elif math_version == MathVersion.V2_0_0:
+            correction = measured / target
+        else:
+            raise VEMathError(f"Unknown math version: {math_version}")
+    
+    if clamp and config.clamp_enabled:
+        min_val = 1.0 - (config.max_correction_pct / 100.0)
+        max_val = 1.0 + (config.max_correction_pct / 100.0)
+        below = correction < min_val
+        above = correction > max_val
+        correction = np.where(below, min_val, np.where(above, max_val, correction))
+        clamped = int(np.count_nonzero((below | above) & valid))
+        if clamped:
+            logger.debug(
+                "VE correction clamped for %d of %d entries (±%.1f%%)",
+                clamped,
+                correction.size,
+                config.max_correction_pct,
+            )
+    
+    return np.where(valid, correction, np.nan), valid
+
+
 def calculate_ve_correction_batch(
     afr_measured_list: list,
     afr_target_list: list,
@@ -347,7 +421,9 @@ def calculate_ve_correction_batch(
     Calculate VE corrections for multiple AFR measurements.
     
     Batch version of calculate_ve_correction() for efficiency when
-    processing multiple data points.
+    processing multiple data points. Computed with
+    calculate_ve_correction_array(), so results are bit-identical to the
+    scalar function.
     
     Args:
         afr_measured_list: List of measured AFR values
@@ -370,20 +446,35 @@ def calculate_ve_correction_batch(
             f"target={len(afr_target_list)}"
         )
     
-    results = []
-    for measured, target in zip(afr_measured_list, afr_target_list):
-        try:
-            correction = calculate_ve_correction(
-                measured, target, version=version, config=config, clamp=clamp
-            )
-            results.append(correction)
-        except (AFRValidationError, VEMathError) as e:
-            if skip_invalid:
-                results.append(None)
-            else:
-                raise
-    
-    return results
+    measured = np.asarray(afr_measured_list)
+    target = np.asarray(afr_target_list)
+    if measured.dtype.kind in "fiu" and target.dtype.kind in "fiu":
+        corrections, valid = calculate_ve_correction_array(
+            measured, target, version=version, config=config, clamp=clamp
+        )
+    else:
+        # None or non-numeric entries: let the scalar path report or skip them
+        corrections = None
+    
+    if corrections is None or not valid.all():
+        results = []
+        for i, (measured, target) in enumerate(zip(afr_measured_list, afr_target_list)):
+            if corrections is not None and valid[i]:
+                results.append(float(corrections[i]))
+                continue
+            try:
+                # Raises the same AFRValidationError as a per-entry loop
+                results.append(calculate_ve_correction(
+                    measured, target, version=version, config=config, clamp=clamp
+                ))
+            except (AFRValidationError, VEMathError):
+                if skip_invalid:
+                    results.append(None)
+                else:
+                    raise
+        return results
+    
+    return corrections.tolist()
 
 
 # =============================================================================
@@ -46,6 +46,8 @@ from dataclasses import dataclass, field
 from typing import List, Optional, Sequence, Tuple
 import logging
 
+import numpy as np
+
 __all__ = [
     "WeightedBinAccumulator",
     "BinPlacement",
@@ -76,6 +78,29 @@ class WeightingStrategy:
             Weight value (higher = more influence)
         """
         raise NotImplementedError
+    
+    def calculate_weights(self, distances: np.ndarray) -> np.ndarray:
+        """
+        Calculate weights for an array of distances.
+        
+        Subclasses with exact NumPy equivalents override this; the default
+        applies calculate_weight() element by element. Formulas using
+        log/exp/pow keep the default, because NumPy's SIMD versions can
+        differ from libm in the last bit and batch weights must match
+        add_sample() exactly.
+        
+        Args:
+            distances: Normalized distances from cell center
+            
+        Returns:
+            Array of weights, same shape as distances
+        """
+        distances = np.asarray(distances, dtype=float)
+        return np.fromiter(
+            map(self.calculate_weight, distances.tolist()),
+            dtype=float,
+            count=len(distances),
+        )
 
 
 class UniformWeighting(WeightingStrategy):
@@ -87,6 +112,9 @@ class UniformWeighting(WeightingStrategy):
     
     def calculate_weight(self, distance: float) -> float:
         return 1.0
+    
+    def calculate_weights(self, distances: np.ndarray) -> np.ndarray:
+        return np.ones(len(distances))
 
 
 class LinearWeighting(WeightingStrategy):
@@ -98,6 +126,9 @@ class LinearWeighting(WeightingStrategy):
     
     def calculate_weight(self, distance: float) -> float:
         return max(0.0, 1.0 - distance)
+    
+    def calculate_weights(self, distances: np.ndarray) -> np.ndarray:
+        return np.maximum(0.0, 1.0 - distances)
 
 
 class LogarithmicWeighting(WeightingStrategy):
@@ -250,27 +281,145 @@ def find_axis_placement(axis: Sequence[float], value: float) -> BinPlacement:
     return BinPlacement(index=index, percent_to_next=percent_next)
 
 
+def find_axis_placements(
+    axis: Sequence[float],
+    values: np.ndarray,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Vectorized find_axis_placement() for an array of values.
+    
+    Uses searchsorted on monotonic axes and gives the same index and
+    percent_to_next as the scalar function, including its tie-breaking
+    on repeated axis values. Non-monotonic axes fall back to the scalar
+    function.
+    
+    Args:
+        axis: Sorted axis values (ascending or descending)
+        values: Values to place
+        
+    Returns:
+        Tuple of (index array, percent_to_next array)
+    """
+    values = np.asarray(values, dtype=float)
+    n = len(axis)
+    if n == 0:
+        return np.full(len(values), -1, dtype=np.intp), np.full(len(values), np.nan)
+    if n == 1:
+        return np.zeros(len(values), dtype=np.intp), np.zeros(len(values))
+    
+    axis_arr = np.asarray(axis, dtype=float)
+    steps = np.diff(axis_arr)
+    if axis_arr[0] < axis_arr[-1] and np.all(steps >= 0):
+        a, v = axis_arr, values
+    elif axis_arr[0] >= axis_arr[-1] and np.all(steps <= 0):
+        # Negating a descending axis makes it ascending; the percentages
+        # come out bit-identical because negation is exact
+        a, v = -axis_arr, -values
+    else:
+        placements = [find_axis_placement(axis, float(val)) for val in values]
+        return (
+            np.array([p.index for p in placements], dtype=np.intp),
+            np.array([p.percent_to_next for p in placements], dtype=float),
+        )
+    
+    # Bound values to axis range
+    v = np.clip(v, a[0], a[-1])
+    
+    # Exact hits take the first matching bin; others the bin below them
+    left = np.searchsorted(a, v, side="left")
+    exact = a[np.minimum(left, n - 1)] == v
+    index = np.where(exact, left, np.searchsorted(a, v, side="right") - 1)
+    
+    lo = a[index]
+    hi = a[np.minimum(index + 1, n - 1)]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        percent = np.where(exact, 0.0, (v - lo) / (hi - lo))
+    return index.astype(np.intp), percent
+
+
 # =============================================================================
 # Weighted Bin Accumulator
 # =============================================================================
 
 
-@dataclass
+class CellArrays:
+    """Dense per-cell accumulation state for a whole grid."""
+    
+    def __init__(self, shape: Tuple[int, int]):
+        self.weighted_sum = np.zeros(shape)
+        self.weight_sum = np.zeros(shape)
+        self.hit_count = np.zeros(shape, dtype=np.int64)
+        self.min_value = np.full(shape, np.inf)
+        self.max_value = np.full(shape, -np.inf)
+    
+    def add(self, index: Tuple[int, int], value: float, weight: float) -> None:
+        """Add one weighted sample to a cell."""
+        self.weighted_sum[index] += value * weight
+        self.weight_sum[index] += weight
+        self.hit_count[index] += 1
+        if value < self.min_value[index]:
+            self.min_value[index] = value
+        if value > self.max_value[index]:
+            self.max_value[index] = value
+    
+    def add_many(
+        self,
+        x_idx: np.ndarray,
+        y_idx: np.ndarray,
+        values: np.ndarray,
+        weights: np.ndarray,
+    ) -> None:
+        """
+        Scatter-add weighted samples.
+        
+        ufunc.at applies the updates in sample order, so the sums are the
+        same as adding the samples one at a time.
+        """
+        flat = np.ravel_multi_index((x_idx, y_idx), self.hit_count.shape)
+        np.add.at(self.weighted_sum.reshape(-1), flat, values * weights)
+        np.add.at(self.weight_sum.reshape(-1), flat, weights)
+        np.add.at(self.hit_count.reshape(-1), flat, 1)
+        np.minimum.at(self.min_value.reshape(-1), flat, values)
+        np.maximum.at(self.max_value.reshape(-1), flat, values)
+
+
+def _cell_field(name: str, cast: type) -> property:
+    def getter(self: "CellAccumulator"):
+        return cast(getattr(self._arrays, name)[self._index])
+    
+    def setter(self: "CellAccumulator", value) -> None:
+        getattr(self._arrays, name)[self._index] = value
+    
+    return property(getter, setter)
+
+
 class CellAccumulator:
-    """Accumulator for a single cell."""
-    weighted_sum: float = 0.0
-    weight_sum: float = 0.0
-    hit_count: int = 0
-    min_value: float = float('inf')
-    max_value: float = float('-inf')
+    """
+    Accumulator for a single cell.
+    
+    A view into one cell of a CellArrays grid; a standalone accumulator
+    gets its own 1x1 grid.
+    """
+    
+    __slots__ = ("_arrays", "_index")
+    
+    weighted_sum = _cell_field("weighted_sum", float)
+    weight_sum = _cell_field("weight_sum", float)
+    hit_count = _cell_field("hit_count", int)
+    min_value = _cell_field("min_value", float)
+    max_value = _cell_field("max_value", float)
+    
+    def __init__(
+        self,
+        arrays: Optional[CellArrays] = None,
+        index: Tuple[int, int] = (0, 0),
+    ):
+        self._arrays = arrays if arrays is not None else CellArrays((1, 1))
+        self._index = index
     
     def add(self, value: float, weight: float) -> None:
         """Add a weighted sample."""
-        self.weighted_sum += value * weight
-        self.weight_sum += weight
-        self.hit_count += 1
-        self.min_value = min(self.min_value, value)
-        self.max_value = max(self.max_value, value)
+        self._arrays.add(self._index, value, weight)
     
     @property
     def mean(self) -> Optional[float]:
@@ -334,15 +483,19 @@ class WeightedBinAccumulator:
         self.min_hits = min_hits
         self.snap_threshold = snap_threshold
         
-        # Initialize cell accumulators
-        self._cells: List[List[CellAccumulator]] = [
-            [CellAccumulator() for _ in range(len(y_axis))]
-            for _ in range(len(x_axis))
-        ]
+        self._reset_cells()
         
         self._total_samples = 0
         self._accepted_samples = 0
     
+    def _reset_cells(self) -> None:
+        # Per-cell state lives in dense arrays; the CellAccumulators are views
+        self._arrays = CellArrays(self.shape)
+        self._cells: List[List[CellAccumulator]] = [
+            [CellAccumulator(self._arrays, (x, y)) for y in range(len(self.y_axis))]
+            for x in range(len(self.x_axis))
+        ]
+    
     @property
     def shape(self) -> Tuple[int, int]:
         """Grid shape (x_size, y_size)."""
@@ -350,10 +503,7 @@ class WeightedBinAccumulator:
     
     def reset(self) -> None:
         """Clear all accumulated data."""
-        self._cells = [
-            [CellAccumulator() for _ in range(len(self.y_axis))]
-            for _ in range(len(self.x_axis))
-        ]
+        self._reset_cells()
         self._total_samples = 0
         self._accepted_samples = 0
     
@@ -411,7 +561,7 @@ class WeightedBinAccumulator:
         weight = self.weighting.calculate_weight(distance)
         
         # Accumulate
-        self._cells[x_idx][y_idx].add(z_value, weight)
+        self._arrays.add((x_idx, y_idx), z_value, weight)
         self._accepted_samples += 1
         
         return True
@@ -425,6 +575,10 @@ class WeightedBinAccumulator:
         """
         Add multiple samples at once.
         
+        Array equivalent of calling add_sample() for each sample: placement,
+        snapping, distances and weights are computed for the whole batch and
+        scattered into the cell arrays in sample order.
+        
         Args:
             x_values: X-axis values
             y_values: Y-axis values
@@ -436,12 +590,103 @@ class WeightedBinAccumulator:
         if not (len(x_values) == len(y_values) == len(z_values)):
             raise ValueError("All input arrays must have same length")
         
-        accepted = 0
-        for x, y, z in zip(x_values, y_values, z_values):
-            if self.add_sample(x, y, z):
-                accepted += 1
+        x = np.asarray(x_values, dtype=float)
+        y = np.asarray(y_values, dtype=float)
+        z = np.asarray(z_values, dtype=float)
+        self._total_samples += len(z)
+        
+        # Reject NaN/inf samples
+        valid = np.isfinite(x) & np.isfinite(y) & np.isfinite(z)
+        x_idx, y_idx, distance = self.place_samples(x[valid], y[valid])
+        z = z[valid]
+        
+        placed = x_idx >= 0
+        if not placed.all():
+            x_idx, y_idx, distance, z = (
+                x_idx[placed], y_idx[placed], distance[placed], z[placed]
+            )
         
-        return accepted
+        self._accumulate(x_idx, y_idx, distance, z)
+        return len(z)
+    
+    def place_samples(
+        self,
+        x_values: np.ndarray,
+        y_values: np.ndarray,
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Find the target cell and center distance for each (x, y) pair.
+        
+        Placement depends only on the axes and snap threshold, so callers
+        aggregating several value columns over the same samples can place
+        them once and reuse the result with add_placed_samples().
+        
+        Args:
+            x_values: Finite X-axis values
+            y_values: Finite Y-axis values
+            
+        Returns:
+            Tuple of (x index, y index, distance) arrays; the indices are -1
+            for samples that cannot be placed (empty axis)
+        """
+        x_idx, percent_x = find_axis_placements(self.x_axis, x_values)
+        y_idx, percent_y = find_axis_placements(self.y_axis, y_values)
+        
+        # Apply snap threshold (TuneLab behavior)
+        snap_x = (percent_x >= self.snap_threshold) & (x_idx < len(self.x_axis) - 1)
+        x_idx = x_idx + snap_x
+        percent_x = np.where(snap_x, percent_x - 1.0, percent_x)
+        
+        snap_y = (percent_y >= self.snap_threshold) & (y_idx < len(self.y_axis) - 1)
+        y_idx = y_idx + snap_y
+        percent_y = np.where(snap_y, percent_y - 1.0, percent_y)
+        
+        unplaced = (x_idx < 0) | (y_idx < 0)
+        if unplaced.any():
+            x_idx = np.where(unplaced, -1, x_idx)
+            y_idx = np.where(unplaced, -1, y_idx)
+        
+        # Combined Euclidean distance of X and Y percentages
+        distance = np.sqrt(percent_x ** 2 + percent_y ** 2)
+        return x_idx, y_idx, distance
+    
+    def add_placed_samples(
+        self,
+        x_idx: np.ndarray,
+        y_idx: np.ndarray,
+        distance: np.ndarray,
+        z_values: np.ndarray,
+    ) -> int:
+        """
+        Add samples already placed with place_samples().
+        
+        Samples with a non-finite value or no cell (index -1) are rejected.
+        
+        Returns:
+            Number of samples accepted
+        """
+        z = np.asarray(z_values, dtype=float)
+        self._total_samples += len(z)
+        
+        valid = np.isfinite(z) & (x_idx >= 0) & (y_idx >= 0)
+        if not valid.all():
+            x_idx, y_idx, distance, z = (
+                x_idx[valid], y_idx[valid], distance[valid], z[valid]
+            )
+        
+        self._accumulate(x_idx, y_idx, distance, z)
+        return len(z)
+    
+    def _accumulate(
+        self,
+        x_idx: np.ndarray,
+        y_idx: np.ndarray,
+        distance: np.ndarray,
+        z: np.ndarray,
+    ) -> None:
+        weights = self.weighting.calculate_weights(distance)
+        self._arrays.add_many(x_idx, y_idx, z, weights)
+        self._accepted_samples += len(z)
     
     def get_table(self) -> List[List[Optional[float]]]:
         """
@@ -452,19 +697,19 @@ class WeightedBinAccumulator:
         Returns:
             2D list of values (or None for insufficient data)
         """
-        result: List[List[Optional[float]]] = []
-        
-        for x_idx in range(len(self.x_axis)):
-            row: List[Optional[float]] = []
-            for y_idx in range(len(self.y_axis)):
-                cell = self._cells[x_idx][y_idx]
-                if cell.hit_count >= self.min_hits:
-                    row.append(cell.mean)
-                else:
-                    row.append(None)
-            result.append(row)
+        arrays = self._arrays
+        valid = (
+            (arrays.hit_count >= self.min_hits)
+            & (arrays.hit_count > 0)
+            & (arrays.weight_sum != 0)
+        )
+        with np.errstate(divide="ignore", invalid="ignore"):
+            means = arrays.weighted_sum / arrays.weight_sum
         
-        return result
+        return [
+            [m if ok else None for m, ok in zip(mean_row, valid_row)]
+            for mean_row, valid_row in zip(means.tolist(), valid.tolist())
+        ]
     
     def get_hit_counts(self) -> List[List[int]]:
         """
@@ -473,10 +718,7 @@ class WeightedBinAccumulator:
         Returns:
             2D list of hit counts
         """
-        return [
-            [self._cells[x][y].hit_count for y in range(len(self.y_axis))]
-            for x in range(len(self.x_axis))
-        ]
+        return self._arrays.hit_count.tolist()
     
     def get_cell_stats(
         self,
@@ -509,17 +751,9 @@ class WeightedBinAccumulator:
     @property
     def statistics(self) -> dict:
         """Get overall accumulator statistics."""
-        total_hits = sum(
-            self._cells[x][y].hit_count
-            for x in range(len(self.x_axis))
-            for y in range(len(self.y_axis))
-        )
-        
-        cells_with_data = sum(
-            1 for x in range(len(self.x_axis))
-            for y in range(len(self.y_axis))
-            if self._cells[x][y].hit_count >= self.min_hits
-        )
+        hit_count = self._arrays.hit_count
+        total_hits = int(hit_count.sum())
+        cells_with_data = int((hit_count >= self.min_hits).sum())
         
         total_cells = len(self.x_axis) * len(self.y_axis)
         
@@ -0,0 +1,89 @@
+"""Run catalog columns and keyset indexes
+
+Revision ID: 002_run_catalog
+Revises: 001_initial
+Create Date: 2026-10-16
+
+Brings the runs tables in line with the Run/RunFile models so RunManager
+can write through to them:
+- runs: columns added to the model after 001 (completion, progress
+  message, error message, input and performance metrics)
+- run_files: storage_type
+- (status|source, created_at, id) indexes replacing the (status|source,
+  created_at) ones, plus (created_at, id), so run listings can page by
+  keyset without sorting
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "002_run_catalog"
+down_revision: Union[str, None] = "001_initial"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _run_columns() -> list:
+    """Columns added to ``runs`` (fresh objects; a Column binds to one table)."""
+    return [
+        sa.Column("completed_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("jetstream_status", sa.String(20), nullable=True),
+        sa.Column("progress_message", sa.Text(), nullable=True),
+        sa.Column("error_message", sa.Text(), nullable=True),
+        sa.Column("input_size_bytes", sa.Integer(), nullable=True),
+        sa.Column("input_rows", sa.Integer(), nullable=True),
+        sa.Column("peak_hp", sa.Float(), nullable=True),
+        sa.Column("peak_torque", sa.Float(), nullable=True),
+        sa.Column("afr_mean", sa.Float(), nullable=True),
+        sa.Column("afr_std", sa.Float(), nullable=True),
+        sa.Column("ve_corrections_count", sa.Integer(), nullable=True),
+        sa.Column("ve_max_correction_pct", sa.Float(), nullable=True),
+    ]
+
+
+def upgrade() -> None:
+    """Add catalog columns and keyset pagination indexes."""
+    for column in _run_columns():
+        op.add_column("runs", column)
+    op.add_column(
+        "run_files",
+        sa.Column("storage_type", sa.String(20), nullable=True, server_default="local"),
+    )
+
+    op.drop_index("ix_runs_status_created", table_name="runs")
+    op.drop_index("ix_runs_source_created", table_name="runs")
+    op.create_index("ix_runs_created_id", "runs", ["created_at", "id"], unique=False)
+    op.create_index(
+        "ix_runs_status_created_id",
+        "runs",
+        ["status", "created_at", "id"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_runs_source_created_id",
+        "runs",
+        ["source", "created_at", "id"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Restore the 001 indexes and drop the catalog columns."""
+    op.drop_index("ix_runs_source_created_id", table_name="runs")
+    op.drop_index("ix_runs_status_created_id", table_name="runs")
+    op.drop_index("ix_runs_created_id", table_name="runs")
+    op.create_index(
+        "ix_runs_status_created", "runs", ["status", "created_at"], unique=False
+    )
+    op.create_index(
+        "ix_runs_source_created", "runs", ["source", "created_at"], unique=False
+    )
+
+    with op.batch_alter_table("run_files") as batch_op:
+        batch_op.drop_column("storage_type")
+    with op.batch_alter_table("runs") as batch_op:
+        for column in reversed(_run_columns()):
+            batch_op.drop_column(column.name)
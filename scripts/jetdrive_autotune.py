@@ -972,6 +972,84 @@ def print_results(result: AnalysisResult, outputs: dict[str, Path]):
     print("\n" + "=" * 70)
 
 
+def run_autotune(
+    run_id: str,
+    csv_path: str | Path | None = None,
+    simulate: bool = False,
+    afr_targets: dict[int, float] | None = None,
+    math_version: MathVersion = MathVersion.V2_0_0,
+    output_dir: Path | None = None,
+    quiet: bool = True,
+) -> dict[str, Path]:
+    """Run the autotune pipeline in-process (importable form of ``main``).
+
+    Args:
+        run_id: Unique run identifier (sanitized before use)
+        csv_path: Existing CSV to analyze; takes precedence over ``simulate``
+        simulate: Generate a simulated dyno run when no CSV is given
+        afr_targets: Optional AFR targets by MAP (kPa)
+        math_version: VE calculation math version
+        output_dir: Output directory (default: runs/<run-id> under the cwd)
+        quiet: Suppress console output
+
+    Returns:
+        Mapping of output name to written file path.
+
+    Raises:
+        ValueError: If the run ID or output directory is invalid, or no data
+            source was given.
+    """
+    safe_run_id = sanitize_run_id(run_id)
+
+    # Determine output directory
+    if output_dir is None:
+        try:
+            # NOTE: we always derive output under runs/<run-id> to keep paths constrained.
+            # If you need custom output locations, copy the run folder after generation.
+            output_dir = safe_path(str(Path("runs") / safe_run_id))
+        except ValueError as e:
+            raise ValueError(f"Invalid output directory: {e}") from e
+
+    # Get data
+    if csv_path:
+        if not quiet:
+            print(f"Loading data from: {csv_path}")
+        df = pd.read_csv(csv_path)
+        source_file = str(csv_path)
+    elif simulate:
+        if not quiet:
+            print("Generating simulated dyno run...")
+        df = generate_simulated_dyno_run()
+        source_file = "simulated"
+    else:
+        raise ValueError("Must specify --csv or --simulate")
+
+    if not quiet:
+        print(f"Loaded {len(df)} samples")
+
+    # Run analysis
+    if not quiet:
+        print(f"Running analysis (math version {math_version})...")
+
+    # Create config with selected math version
+    config = TuneConfig(math_version=math_version)
+    result = analyze_dyno_data(df, config=config, afr_targets=afr_targets)
+    result.run_id = safe_run_id
+    result.source_file = source_file
+
+    # Generate outputs
+    if not quiet:
+        print(f"Generating outputs to: {output_dir}")
+
+    outputs = generate_outputs(df, result, output_dir)
+
+    # Print results
+    if not quiet:
+        print_results(result, outputs)
+
+    return outputs
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="DynoAI JetDrive Auto-Tune Pipeline",
@@ -1035,52 +1113,22 @@ Examples:
     if not args.quiet:
         print_banner()
 
-    # Determine output directory
-    try:
-        # NOTE: we always derive output under runs/<run-id> to keep paths constrained.
-        # If you need custom output locations, copy the run folder after generation.
-        output_dir = safe_path(str(Path("runs") / safe_run_id))
-    except ValueError as e:
-        print(f"Error: Invalid output directory: {e}")
-        return 1
-
-    # Get data
-    if args.csv:
-        if not args.quiet:
-            print(f"Loading data from: {args.csv}")
-        df = pd.read_csv(args.csv)
-        source_file = args.csv
-    elif args.simulate:
-        if not args.quiet:
-            print("Generating simulated dyno run...")
-        df = generate_simulated_dyno_run()
-        source_file = "simulated"
-    else:
+    if not (args.csv or args.simulate):
         print("Error: Must specify --csv or --simulate")
         return 1
 
-    if not args.quiet:
-        print(f"Loaded {len(df)} samples")
-
-    # Run analysis
-    if not args.quiet:
-        print(f"Running analysis (math version {math_version})...")
-
-    # Create config with selected math version
-    config = TuneConfig(math_version=math_version)
-    result = analyze_dyno_data(df, config=config, afr_targets=afr_targets)
-    result.run_id = safe_run_id
-    result.source_file = source_file
-
-    # Generate outputs
-    if not args.quiet:
-        print(f"Generating outputs to: {output_dir}")
-
-    outputs = generate_outputs(df, result, output_dir)
-
-    # Print results
-    if not args.quiet:
-        print_results(result, outputs)
+    try:
+        run_autotune(
+            safe_run_id,
+            csv_path=args.csv,
+            simulate=args.simulate,
+            afr_targets=afr_targets,
+            math_version=math_version,
+            quiet=args.quiet,
+        )
+    except ValueError as e:
+        print(f"Error: {e}")
+        return 1
 
     return 0
 
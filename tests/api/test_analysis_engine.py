@@ -0,0 +1,187 @@
+"""Tests for the in-process analysis engine."""
+
+import json
+import os
+import shutil
+import textwrap
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FuturesTimeoutError
+from pathlib import Path
+
+import pytest
+
+from api.services.analysis_engine import (
+    AnalysisEngine,
+    OutputDirBusyError,
+    get_toolkit,
+    load_pipeline_module,
+)
+from dynoai.test_utils import make_synthetic_csv
+
+ROOT = Path(__file__).resolve().parents[2]
+
+
+@pytest.fixture
+def engine():
+    engine = AnalysisEngine(max_workers=2)
+    yield engine
+    engine.shutdown()
+
+
+def test_engine_never_exceeds_max_workers(engine: AnalysisEngine, tmp_path: Path):
+    lock = threading.Lock()
+    running = 0
+    peak = 0
+    release = threading.Event()
+
+    def job():
+        nonlocal running, peak
+        with lock:
+            running += 1
+            peak = max(peak, running)
+        release.wait(5)
+        with lock:
+            running -= 1
+
+    futures = [engine.submit(tmp_path / f"run{i}", job) for i in range(5)]
+    assert engine.active_jobs == 5
+    release.set()
+    for future in futures:
+        future.result(timeout=5)
+
+    assert peak <= 2
+    assert engine.active_jobs == 0
+
+
+def test_engine_rejects_busy_output_dir(engine: AnalysisEngine, tmp_path: Path):
+    release = threading.Event()
+    future = engine.submit(tmp_path / "run", release.wait, 5)
+
+    with pytest.raises(OutputDirBusyError):
+        engine.submit(tmp_path / "run" / ".." / "run", lambda: None)
+
+    release.set()
+    future.result(timeout=5)
+    # Directory is released once the job finishes
+    assert engine.run(tmp_path / "run", lambda: 42, timeout=5) == 42
+
+
+@pytest.fixture
+def slow_pipeline(tmp_path: Path):
+    path = tmp_path / "slow_pipeline.py"
+    path.write_text(
+        textwrap.dedent(
+            """
+            import os
+            import time
+            from pathlib import Path
+
+            def pid(seconds=0):
+                time.sleep(seconds)
+                return os.getpid()
+
+            def work(marker, seconds):
+                time.sleep(seconds)
+                Path(marker).write_text("done")
+                return seconds
+
+            def fail():
+                raise ValueError("bad input")
+            """
+        )
+    )
+    return load_pipeline_module(f"slow_pipeline_{uuid.uuid4().hex[:8]}", path)
+
+
+def test_isolated_job_returns_result_and_errors(
+    engine: AnalysisEngine, slow_pipeline, tmp_path: Path
+):
+    marker = tmp_path / "marker"
+    assert engine.run_isolated(tmp_path / "run", slow_pipeline, "work", str(marker), 0, timeout=60) == 0
+    assert marker.exists()
+
+    with pytest.raises(ValueError, match="bad input"):
+        engine.run_isolated(tmp_path / "run", slow_pipeline, "fail", timeout=60)
+
+
+def test_isolated_job_is_stopped_at_deadline(
+    engine: AnalysisEngine, slow_pipeline, tmp_path: Path
+):
+    marker = tmp_path / "marker"
+    started = time.monotonic()
+    with pytest.raises(FuturesTimeoutError):
+        engine.run_isolated(tmp_path / "run", slow_pipeline, "work", str(marker), 30, timeout=3)
+
+    assert time.monotonic() - started < 15
+    # The job was terminated: its slot and output directory are free again
+    assert engine.active_jobs == 0
+    assert engine.run(tmp_path / "run", lambda: 42, timeout=5) == 42
+    time.sleep(0.5)
+    assert not marker.exists()
+
+
+def test_isolated_workers_are_reused(
+    engine: AnalysisEngine, slow_pipeline, tmp_path: Path
+):
+    first = engine.run_isolated(tmp_path / "run", slow_pipeline, "pid", timeout=60)
+    second = engine.run_isolated(tmp_path / "run", slow_pipeline, "pid", timeout=60)
+
+    assert first == second != os.getpid()
+
+
+def test_only_overrunning_worker_is_recycled(
+    engine: AnalysisEngine, slow_pipeline, tmp_path: Path
+):
+    # Warm both workers
+    with ThreadPoolExecutor(max_workers=2) as callers:
+        warm = set(
+            callers.map(
+                lambda i: engine.run_isolated(
+                    tmp_path / f"run{i}", slow_pipeline, "pid", 1, timeout=60
+                ),
+                range(2),
+            )
+        )
+    assert len(warm) == 2
+
+    with pytest.raises(FuturesTimeoutError):
+        engine.run_isolated(tmp_path / "run", slow_pipeline, "pid", 30, timeout=2)
+
+    # The surviving warm worker takes the next job; no new process is spawned
+    survivor = engine.run_isolated(tmp_path / "run", slow_pipeline, "pid", timeout=60)
+    assert survivor in warm
+    assert len(engine._idle_workers) == 1
+
+
+def test_toolkit_run_analysis_in_process(engine: AnalysisEngine):
+    # The toolkit enforces safe_path, so stay inside the project tree
+    workdir = ROOT / "temp_selftest" / f"engine_{uuid.uuid4().hex[:8]}"
+    csv_path = workdir / "log.csv"
+    outdir = workdir / "out"
+    workdir.mkdir(parents=True)
+    make_synthetic_csv(csv_path, rows=1500)
+
+    progress = []
+    try:
+        manifest = engine.run(
+            outdir,
+            get_toolkit().run_analysis,
+            {"csv": csv_path, "outdir": outdir, "clamp": 10.0},
+            progress=lambda pct, msg: progress.append(pct),
+            timeout=120,
+        )
+        written = json.loads((outdir / "manifest.json").read_text())
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    assert manifest["status"]["code"] == "success"
+    assert written == manifest
+    assert progress[-1] == 100
+
+
+def test_toolkit_run_analysis_rejects_unknown_options():
+    with pytest.raises(ValueError, match="bogus"):
+        get_toolkit().run_analysis({"csv": "log.csv", "bogus": 1})
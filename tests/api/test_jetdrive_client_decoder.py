@@ -0,0 +1,154 @@
+"""Tests for the table-driven JetDrive ChannelValues decoder."""
+
+import struct
+
+import numpy as np
+
+from api.services import jetdrive_client as jc
+from api.services.jetdrive_client import ChannelInfo, ChannelTable
+
+
+def _values_payload(samples, trailing: bytes = b"") -> bytes:
+    payload = bytearray()
+    for chan_id, ts, value in samples:
+        payload.extend(struct.pack("<HIf", chan_id, ts, value))
+    return bytes(payload) + trailing
+
+
+LOOKUP = {
+    # Hardware metadata; 37 is overridden by the registry
+    1: ChannelInfo(chan_id=1, name="Engine RPM", unit=8),
+    2: ChannelInfo(chan_id=2, name="Front AFR", unit=11),
+    3: ChannelInfo(chan_id=3, name="Gizmo", unit=0),
+    37: ChannelInfo(chan_id=37, name="Temperature 2", unit=0),
+}
+
+
+class TestResolveChannel:
+    """Name/category/unit resolution priorities."""
+
+    def test_registry_overrides_bad_hardware_names(self):
+        assert jc.resolve_channel(37, LOOKUP) == ("Pressure", "atmospheric", "kPa")
+
+    def test_hardware_names_infer_category(self):
+        assert jc.resolve_channel(1, LOOKUP) == ("Engine RPM", "dyno", "")
+        assert jc.resolve_channel(2, LOOKUP) == ("Front AFR", "afr", "")
+        assert jc.resolve_channel(3, LOOKUP) == ("Gizmo", "misc", "")
+
+    def test_registry_and_generic_fallbacks(self):
+        assert jc.resolve_channel(28, {}) == ("MAP", "engine", "kPa")
+        assert jc.resolve_channel(999, {}) == ("Channel 999", "misc", "")
+
+
+class TestChannelTable:
+    """Resolved entries are cached until invalidated."""
+
+    def test_invalidate_picks_up_channel_info_changes(self):
+        lookup = {5: ChannelInfo(chan_id=5, name="Torque", unit=0)}
+        table = ChannelTable(lookup)
+        assert table.resolve(5)[0] == "Torque"
+
+        lookup[5] = ChannelInfo(chan_id=5, name="Lambda 1", unit=0)
+        assert table.resolve(5)[0] == "Torque"
+
+        table.invalidate()
+        assert table.resolve(5) == ("Lambda 1", "afr", "")
+
+
+class TestDecodeChannelValues:
+    """Whole-frame decoding matches the wire format exactly."""
+
+    def test_batch_arrays_match_wire_values(self):
+        samples = [(1, 1000, 1600.5), (2, 1001, 13.3), (37, 0xFFFFFFFF, -0.1)]
+        batch = jc.decode_channel_values(
+            0x1234, ChannelTable(LOOKUP), _values_payload(samples, b"\x01\x02")
+        )
+
+        assert len(batch) == 3
+        assert batch.channel_ids.tolist() == [1, 2, 37]
+        assert batch.timestamps_ms.tolist() == [1000, 1001, 0xFFFFFFFF]
+        expected = [struct.unpack("<f", struct.pack("<f", v))[0] for _, _, v in samples]
+        assert batch.values.tolist() == expected
+
+    def test_samples_match_per_value_resolution(self):
+        samples = [(1, 10, 1.0), (37, 11, 100.6), (999, 12, 3.5)]
+        parsed = jc._parse_channel_values(7, LOOKUP, _values_payload(samples))
+
+        assert [(s.channel_id, s.channel_name, s.category, s.units) for s in parsed] == [
+            (1, "Engine RPM", "dyno", ""),
+            (37, "Pressure", "atmospheric", "kPa"),
+            (999, "Channel 999", "misc", ""),
+        ]
+        assert all(s.provider_id == 7 for s in parsed)
+        assert all(isinstance(s.value, float) for s in parsed)
+        assert parsed[1].value == struct.unpack("<f", struct.pack("<f", 100.6))[0]
+
+    def test_select_filters_rows(self):
+        batch = jc.decode_channel_values(
+            1, ChannelTable(), _values_payload([(1, 1, 1.0), (2, 2, 2.0), (1, 3, 3.0)])
+        )
+        ones = batch.select(batch.channel_ids == 1)
+
+        assert ones.timestamps_ms.tolist() == [1, 3]
+        assert [s.value for s in ones.to_samples()] == [1.0, 3.0]
+
+    def test_empty_payload(self):
+        batch = jc.decode_channel_values(1, ChannelTable(), b"")
+        assert len(batch) == 0
+        assert batch.values.dtype == np.float32
+
+
+class _FakeSocket:
+    """Serves queued datagrams, then raises the stop flag."""
+
+    def __init__(self, frames, stop_flag):
+        self._frames = list(frames)
+        self._stop_flag = stop_flag
+
+    def setsockopt(self, *args):
+        pass
+
+    def bind(self, addr):
+        pass
+
+    def settimeout(self, timeout):
+        pass
+
+    def recvfrom(self, size):
+        if not self._frames:
+            self._stop_flag[0] = True
+            raise jc.socket.timeout()
+        return self._frames.pop(0), ("127.0.0.1", 22344)
+
+    def close(self):
+        pass
+
+
+class TestSubscribeCallbacks:
+    """Frame delivery from the receive loop."""
+
+    def test_on_batch_errors_are_counted_separately(self, monkeypatch):
+        frame = jc._Wire.encode(
+            jc.KEY_CHANNEL_VALUES, 0x1001, 0xFFFF, 0,
+            _values_payload([(1, 1000, 3000.0), (2, 1000, 13.1)]),
+        )
+        stop_flag = [False]
+        monkeypatch.setattr(
+            jc.socket, "socket", lambda *a: _FakeSocket([frame, frame], stop_flag)
+        )
+
+        def failing_batch(batch):
+            raise RuntimeError("consumer failed")
+
+        samples = []
+        provider = jc.JetDriveProviderInfo(
+            provider_id=0x1001, name="test", host="127.0.0.1", port=22344, channels={}
+        )
+        stats = jc._subscribe_sync(
+            provider, [], samples.append, jc.JetDriveConfig(), stop_flag,
+            on_batch=failing_batch,
+        )
+
+        assert stats["callback_errors"] == 2
+        assert stats["dropped_frames"] == 0
+        assert len(samples) == 4
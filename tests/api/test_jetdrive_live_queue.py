@@ -14,7 +14,14 @@ import time
 from pathlib import Path
 from unittest.mock import MagicMock
 
-from api.services.jetdrive_client import JetDriveSample
+import numpy as np
+
+from api.services.jetdrive_client import (
+    ChannelInfo,
+    ChannelTable,
+    JetDriveSample,
+    JetDriveSampleBatch,
+)
 from api.services.jetdrive_live_queue import (
     LiveCaptureQueueManager,
     LiveCaptureQueueStats,
@@ -38,9 +45,9 @@ def queue_manager():
 @pytest.fixture
 def queue_manager_with_persist(tmp_path):
     """Create a queue manager with persistence enabled."""
-    mgr = LiveCaptureQueueManager(persist_enabled=True)
-    # Override persist path
-    mgr.queue.settings.persist_path = str(tmp_path / "queue_persist")
+    mgr = LiveCaptureQueueManager(
+        persist_enabled=True, persist_path=str(tmp_path / "queue_persist")
+    )
     yield mgr
     # Don't call stop_processing() - just clear queue
     mgr.queue.clear()
@@ -215,6 +222,14 @@ class TestPersistence:
         # Manager created with persist enabled
         assert queue_manager_with_persist.queue.settings.persist_to_disk is True
 
+    def test_persist_path_applied_before_queue_opens(self, tmp_path):
+        """The persistence log is created under the given path only."""
+        persist_path = tmp_path / "queue_persist"
+        mgr = LiveCaptureQueueManager(persist_enabled=True, persist_path=str(persist_path))
+        mgr.queue.enqueue("test", {"value": 1})
+        mgr.queue.close()
+        assert list(persist_path.glob("*.seg"))
+
 
 # =============================================================================
 # No Unbounded Growth Tests
@@ -273,3 +288,140 @@ class TestNoUnboundedGrowth:
         # Should be clean
         assert len(queue_manager.queue) == 0
         assert queue_manager.stats.samples_received == 0
+
+
+# =============================================================================
+# Ring Buffer / Windowing Tests
+# =============================================================================
+
+class TestWindowing:
+    """Window boundaries and in-place aggregation."""
+
+    def test_last_value_per_channel_in_window(self, queue_manager):
+        """Each window keeps the latest value of every channel."""
+        queue_manager.on_sample(make_sample(timestamp_ms=1000, channel_name="Digital RPM 1", value=3000.0))
+        queue_manager.on_sample(make_sample(timestamp_ms=1010, channel_name="Air/Fuel Ratio 1", value=13.1))
+        queue_manager.on_sample(make_sample(timestamp_ms=1020, channel_name="Digital RPM 1", value=3100.0))
+        queue_manager.force_flush()
+
+        item = queue_manager.queue.dequeue()
+        assert item.metadata == {"window_start_ms": 1000, "sample_count": 3}
+        assert item.data["timestamp_ms"] == 1000
+        assert item.data["rpm"] == 3100.0
+        assert item.data["afr"] == pytest.approx(13.1)
+
+    def test_configured_reductions(self):
+        """Channels can reduce to mean/min/max instead of the last value."""
+        mgr = LiveCaptureQueueManager(
+            persist_enabled=False, reductions={"rpm": "mean", "afr": "min"}
+        )
+        for ts, rpm, afr in ((1000, 3000.0, 13.5), (1010, 3200.0, 12.9), (1020, 3100.0, 13.2)):
+            mgr.on_sample(make_sample(timestamp_ms=ts, channel_name="Digital RPM 1", value=rpm))
+            mgr.on_sample(make_sample(timestamp_ms=ts, channel_name="Air/Fuel Ratio 1", value=afr))
+        mgr.force_flush()
+
+        item = mgr.queue.dequeue()
+        assert item.data["rpm"] == pytest.approx(3100.0)
+        assert item.data["afr"] == pytest.approx(12.9)
+        mgr.queue.clear()
+
+    def test_provider_clocks_do_not_split_windows(self, queue_manager):
+        """Providers with unrelated clocks share one window per 50ms."""
+        for i in range(10):
+            # Power Core counts from boot, the probe from its own epoch
+            queue_manager.on_sample(make_sample(provider_id=0x1001, timestamp_ms=500_000 + i * 10))
+            queue_manager.on_sample(
+                make_sample(provider_id=0x2002, channel_name="Humidity", timestamp_ms=20 + i * 10, value=40.0)
+            )
+        queue_manager.force_flush()
+
+        assert queue_manager.stats.samples_received == 20
+        assert queue_manager.stats.aggregation_windows == 2
+        assert queue_manager.stats.samples_aggregated == 20
+
+    def test_aggregator_thread_drains_ring(self, queue_manager):
+        """With the aggregator running, windows are drained off-thread."""
+        queue_manager._start_aggregator()
+        try:
+            for i in range(20):
+                queue_manager.on_sample(make_sample(timestamp_ms=i * 25, value=float(i)))
+            deadline = time.time() + 2.0
+            while queue_manager.stats.aggregation_windows < 9 and time.time() < deadline:
+                time.sleep(0.01)
+        finally:
+            queue_manager._stop_aggregator()
+        queue_manager.force_flush()
+
+        stats = queue_manager.stats
+        assert stats.aggregation_windows == 10
+        assert stats.samples_aggregated == 20
+        assert len(queue_manager._ring) == 0
+
+    def test_batch_crossing_window_boundary(self, queue_manager):
+        """A frame spanning two windows yields one point per window."""
+        table = ChannelTable({
+            10: ChannelInfo(chan_id=10, name="Digital RPM 1", unit=8),
+            15: ChannelInfo(chan_id=15, name="Air/Fuel Ratio 1", unit=11),
+        })
+        def frame(channel_ids, timestamps_ms, values):
+            return JetDriveSampleBatch(
+                provider_id=0x1001,
+                channel_ids=np.array(channel_ids, dtype=np.uint16),
+                timestamps_ms=np.array(timestamps_ms, dtype=np.uint32),
+                values=np.array(values, dtype=np.float32),
+                table=table,
+            )
+
+        queue_manager.on_batch(frame([10], [1000], [3000.0]))
+        # Second frame finishes window 1000 and opens the next one
+        queue_manager.on_batch(
+            frame([15, 10], [1010, 1000 + AGGREGATION_WINDOW_MS], [13.1, 3100.0])
+        )
+        queue_manager.force_flush()
+
+        first = queue_manager.queue.dequeue()
+        second = queue_manager.queue.dequeue()
+        assert first.metadata == {"window_start_ms": 1000, "sample_count": 2}
+        assert first.data["rpm"] == 3000.0
+        assert second.metadata == {
+            "window_start_ms": 1000 + AGGREGATION_WINDOW_MS,
+            "sample_count": 1,
+        }
+        assert second.data["rpm"] == 3100.0
+        assert queue_manager.queue.dequeue() is None
+
+    def test_ring_overrun_is_counted(self):
+        """A full ring rejects samples instead of blocking."""
+        mgr = LiveCaptureQueueManager(persist_enabled=False, ring_capacity=4)
+        mgr._aggregator_thread = MagicMock()  # Pretend a (stalled) aggregator owns draining
+        for i in range(6):
+            mgr.on_sample(make_sample(timestamp_ms=1000 + i))
+
+        assert mgr.stats.samples_received == 6
+        assert mgr.stats.samples_overrun == 2
+        assert "samples_overrun" in mgr.get_stats()
+
+
+# =============================================================================
+# Recording Tests
+# =============================================================================
+
+class TestRecording:
+    """Aggregated points are recorded through the block sink."""
+
+    @pytest.mark.parametrize("suffix", [".csv", ".dynorec"])
+    def test_start_stop_records_all_windows(self, queue_manager, tmp_path, suffix):
+        path = tmp_path / f"capture{suffix}"
+        queue_manager.start_processing(path)
+        for i in range(10):
+            queue_manager.on_sample(make_sample(timestamp_ms=i * 50, value=2000.0 + i))
+        queue_manager.stop_processing()
+
+        assert queue_manager.stats.samples_written == 10
+        assert path.exists()
+        if suffix == ".dynorec":
+            from api.services.ingestion.recording import read_recording
+
+            assert read_recording(path)["timestamp_ms"].tolist() == [i * 50 for i in range(10)]
+        else:
+            assert len(path.read_text().splitlines()) == 11
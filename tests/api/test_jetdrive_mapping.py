@@ -11,6 +11,7 @@ Tests:
 """
 
 import json
+import numpy as np
 import pytest
 import tempfile
 from pathlib import Path
@@ -34,6 +35,7 @@ from api.services.jetdrive_mapping import (
     TRANSFORMS,
     # Data classes
     ChannelMapping,
+    CompiledMapping,
     ProviderMapping,
     # Persistence
     get_mapping,
@@ -486,6 +488,64 @@ class TestMappingApplication:
         assert value == 123.4
 
 
+class TestCompiledMapping:
+    """Compiled mappings must match apply_mapping_to_sample exactly."""
+
+    @pytest.fixture
+    def mapping(self):
+        return ProviderMapping(
+            channels={
+                "rpm": ChannelMapping("rpm", 10, "Digital RPM 1"),
+                "afr_front": ChannelMapping("afr_front", 15, "Lambda 1", "lambda_to_afr"),
+                "iat": ChannelMapping("iat", 30, "IAT", "c_to_f"),
+                "torque": ChannelMapping("torque", 3, "Torque", "nm_to_ftlb", enabled=False),
+                # Duplicate source: first enabled mapping wins
+                "afr_rear": ChannelMapping("afr_rear", 15, "Lambda 1", "identity"),
+                "power": ChannelMapping("power", 0x10005, "Power", "kw_to_hp"),
+            }
+        )
+
+    def test_apply_matches_per_sample_path(self, mapping):
+        rng = np.random.default_rng(3)
+        ids = rng.choice([3, 10, 15, 30, 99, 0x10005], size=500)
+        values = rng.uniform(0, 200, size=500).astype(np.float32)
+
+        compiled = mapping.compile()
+        slots, out = compiled.apply(ids, values)
+
+        for cid, val, slot, got in zip(ids.tolist(), values.tolist(), slots, out):
+            canonical, expected = apply_mapping_to_sample(mapping, cid, "", val)
+            name = compiled.canonical_names[slot] if slot >= 0 else None
+            assert name == canonical
+            assert got == expected
+
+    def test_compiled_single_sample_path(self, mapping):
+        compiled = mapping.compile()
+
+        assert apply_mapping_to_sample(compiled, 15, "Lambda 1", 1.0) == (
+            "afr_front",
+            pytest.approx(14.7),
+        )
+        assert apply_mapping_to_sample(compiled, 3, "Torque", 10.0) == (None, 10.0)
+        assert apply_mapping_to_sample(compiled, 0x10005, "Power", 1.0)[0] == "power"
+
+    def test_compile_is_cached_until_channels_change(self, mapping):
+        compiled = mapping.compile()
+        assert isinstance(compiled, CompiledMapping)
+        assert mapping.compile() is compiled
+
+        mapping.channels["torque"].enabled = True
+        recompiled = mapping.compile()
+
+        assert recompiled is not compiled
+        assert recompiled.apply_one(3, 10.0) == ("torque", pytest.approx(7.37562))
+
+    def test_compiled_state_not_serialized(self, mapping):
+        mapping.compile()
+        assert "_compiled" not in mapping.to_dict()
+        assert ProviderMapping.from_dict(mapping.to_dict()) == mapping
+
+
 # =============================================================================
 # Signature Change Detection Tests
 # =============================================================================
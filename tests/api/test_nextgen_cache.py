@@ -0,0 +1,239 @@
+"""Tests for the content-addressed NextGen result cache."""
+
+import json
+import os
+import shutil
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from api.services import nextgen_workflow
+from api.services.nextgen_cache import NextGenResultCache
+from api.services.nextgen_workflow import (
+    NEXTGEN_META_FILE,
+    NEXTGEN_PAYLOAD_FILE,
+    NextGenWorkflow,
+    TestPlannerConstraints,
+)
+from dynoai.core.nextgen_payload import SCHEMA_VERSION
+
+DENSE_DYNO_CSV = Path(__file__).parent.parent / "data" / "dense_dyno_test.csv"
+
+
+@pytest.fixture
+def cache(tmp_path: Path) -> NextGenResultCache:
+    return NextGenResultCache(tmp_path / "cache", max_entries=3)
+
+
+@pytest.fixture
+def workflow(tmp_path: Path, cache: NextGenResultCache) -> NextGenWorkflow:
+    """Workflow rooted in tmp_path with two runs sharing identical input."""
+    runs_dir = tmp_path / "runs"
+    for run_id in ("run_a", "run_b"):
+        (runs_dir / run_id / "input").mkdir(parents=True)
+        shutil.copy(DENSE_DYNO_CSV, runs_dir / run_id / "input" / "dynoai_input.csv")
+
+    workflow = NextGenWorkflow(runs_dir=str(runs_dir), result_cache=cache)
+    # Keep the workflow off the real runs directory
+    workflow._run_manager = MagicMock()
+    workflow._run_manager.get_run_input_path.return_value = None
+    workflow._run_manager.get_run_output_dir.return_value = None
+    return workflow
+
+
+class TestCacheKey:
+    """Keys must change with any input that affects the result."""
+
+    def test_key_is_stable_and_order_independent(self, cache, tmp_path):
+        csv_path = tmp_path / "log.csv"
+        csv_path.write_text("rpm,map_kpa\n3000,60\n")
+
+        a = cache.make_key(csv_path, {"x": 1, "y": 2}, {"min_rpm": 1000}, SCHEMA_VERSION)
+        b = cache.make_key(csv_path, {"y": 2, "x": 1}, {"min_rpm": 1000}, SCHEMA_VERSION)
+
+        assert a == b
+        assert len(a) == 64
+
+    def test_key_changes_with_inputs(self, cache, tmp_path):
+        csv_path = tmp_path / "log.csv"
+        csv_path.write_text("rpm,map_kpa\n3000,60\n")
+        base = cache.make_key(csv_path, {}, {"min_rpm": 1000}, SCHEMA_VERSION)
+
+        assert cache.make_key(csv_path, {"x": 1}, {"min_rpm": 1000}, SCHEMA_VERSION) != base
+        assert cache.make_key(csv_path, {}, {"min_rpm": 1500}, SCHEMA_VERSION) != base
+        assert cache.make_key(csv_path, {}, {"min_rpm": 1000}, "other@1") != base
+
+        csv_path.write_text("rpm,map_kpa\n3000,61\n")
+        assert cache.make_key(csv_path, {}, {"min_rpm": 1000}, SCHEMA_VERSION) != base
+
+
+class TestCacheStorage:
+    """Lookup, counters and eviction."""
+
+    def test_get_put_and_counters(self, cache):
+        key = "ab" * 32
+        assert cache.get(key) is None
+
+        cache.put(key, json.dumps({"run_id": "run_a"}))
+
+        assert cache.get(key) == {"run_id": "run_a"}
+        stats = cache.stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["entries"] == 1
+
+    def test_rejects_non_hex_keys(self, cache):
+        with pytest.raises(ValueError):
+            cache.get("../escape")
+
+    def test_evicts_least_recently_used(self, cache):
+        keys = [f"{i:064x}" for i in range(4)]
+        for age, key in enumerate(keys[:3]):
+            cache.put(key, "{}")
+            path = cache.cache_dir / f"{key}.json"
+            os.utime(path, (1000 + age, 1000 + age))
+
+        # Touch the oldest entry so the second one becomes the LRU victim
+        assert cache.get(keys[0]) == {}
+        cache.put(keys[3], "{}")
+
+        assert cache.get(keys[1]) is None
+        for key in (keys[0], keys[2], keys[3]):
+            assert cache.get(key) == {}
+
+    def test_stage_entries_round_trip_and_count_per_stage(self, cache):
+        for i in range(4):
+            cache.put_stage("modes", f"{i:064x}", {"i": i})
+        cache.put(f"{0:064x}", "{}")
+
+        assert cache.get_stage("modes", f"{3:064x}") == {"i": 3}
+        assert cache.get_stage("surfaces", f"{3:064x}") is None
+        stats = cache.stats()
+        assert stats["stage_entries"] == 3
+        assert stats["entries"] == 1
+
+    @pytest.mark.parametrize(
+        "data",
+        [
+            b"cdynoai_removed_module\nOldArtifact\n.",  # ModuleNotFoundError
+            b"\x80\x05\x95",  # truncated
+        ],
+    )
+    def test_unloadable_stage_entry_is_a_miss(self, cache, data):
+        key = f"{1:064x}"
+        cache.put_stage("modes", key, {"i": 1})
+        path = cache._stage_path("modes", key)
+        path.write_bytes(data)
+
+        assert cache.get_stage("modes", key) is None
+        assert not path.exists()
+
+    def test_evicts_over_byte_budget(self, tmp_path):
+        cache = NextGenResultCache(tmp_path / "cache", max_entries=10, max_bytes=100)
+        for i in range(3):
+            cache.put(f"{i:064x}", json.dumps({"pad": "x" * 40}))
+
+        assert cache.stats()["size_bytes"] <= 100
+        assert cache.get(f"{2:064x}") is not None
+
+
+    def test_put_does_not_rescan_cache_dir(self, cache):
+        cache.put(f"{0:064x}", "{}")
+        with patch.object(cache, "_list_entries", side_effect=AssertionError):
+            for i in range(1, 5):
+                cache.put(f"{i:064x}", "{}")
+        assert cache.stats()["entries"] == 3
+
+    def test_file_hash_memo_is_bounded(self, cache, tmp_path, monkeypatch):
+        from api.services import nextgen_cache
+
+        monkeypatch.setattr(nextgen_cache, "FILE_HASH_MEMO_SIZE", 2)
+        paths = []
+        for i in range(3):
+            path = tmp_path / f"log{i}.csv"
+            path.write_text(f"rpm\n{i}\n")
+            paths.append(path)
+            cache.hash_file(path)
+
+        assert len(cache._file_hashes) == 2
+        assert str(paths[0].resolve()) not in cache._file_hashes
+
+
+class TestWorkflowIntegration:
+    """NextGenWorkflow reuses results across runs with identical inputs."""
+
+    def test_identical_input_reuses_result_across_runs(self, workflow, cache):
+        with patch.object(
+            workflow, "_execute_pipeline", wraps=workflow._execute_pipeline
+        ) as execute:
+            first = workflow.generate_for_run("run_a")
+            second = workflow.generate_for_run("run_b")
+
+        assert first["success"] and second["success"]
+        assert execute.call_count == 1
+        assert second["from_cache"] is True
+        assert second["payload"]["run_id"] == "run_b"
+        assert second["payload"]["surfaces"] == first["payload"]["surfaces"]
+
+        out_dir = workflow._runs_dir / "run_b"
+        assert json.loads((out_dir / NEXTGEN_PAYLOAD_FILE).read_text())["run_id"] == "run_b"
+        meta = json.loads((out_dir / NEXTGEN_META_FILE).read_text())
+        assert meta["cache_key"] == workflow.compute_cache_key(
+            out_dir / "input" / "dynoai_input.csv"
+        )
+
+    def test_changed_input_invalidates_run_cache(self, workflow):
+        assert workflow.generate_for_run("run_a")["success"]
+        assert workflow.load_cached("run_a") is not None
+
+        csv_path = workflow._runs_dir / "run_a" / "input" / "dynoai_input.csv"
+        with open(csv_path, "a", encoding="utf-8") as f:
+            f.write(csv_path.read_text().splitlines()[-1] + "\n")
+
+        assert workflow.load_cached("run_a") is None
+
+    @pytest.mark.parametrize("change", ["version", "specs"])
+    def test_surface_change_rebuilds_only_surfaces(self, workflow, monkeypatch, change):
+        assert workflow.generate_for_run("run_a")["success"]
+
+        if change == "version":
+            monkeypatch.setitem(nextgen_workflow.STAGE_VERSIONS, "surfaces", 2)
+        else:
+            real_specs = nextgen_workflow.standard_surface_specs
+
+            def fewer_specs(columns, min_samples):
+                return real_specs(columns, min_samples)[:1]
+
+            monkeypatch.setattr(nextgen_workflow, "standard_surface_specs", fewer_specs)
+        with patch.object(
+            nextgen_workflow, "label_modes", side_effect=AssertionError
+        ), patch.object(
+            nextgen_workflow,
+            "build_standard_surfaces",
+            wraps=nextgen_workflow.build_standard_surfaces,
+        ) as build:
+            result = workflow.generate_for_run("run_a", force=True)
+
+        assert result["success"], result["error"]
+        assert build.call_count == 1
+
+    def test_constraint_change_reuses_upstream_stages(self, workflow, monkeypatch):
+        assert workflow.generate_for_run("run_a")["success"]
+
+        monkeypatch.setattr(
+            nextgen_workflow,
+            "get_planner_constraints",
+            lambda vehicle_id="default": TestPlannerConstraints(max_rpm=6000),
+        )
+        with patch.object(
+            nextgen_workflow, "normalize_dataframe", side_effect=AssertionError
+        ), patch.object(
+            nextgen_workflow, "label_modes", side_effect=AssertionError
+        ), patch.object(
+            nextgen_workflow, "build_standard_surfaces", side_effect=AssertionError
+        ):
+            result = workflow.generate_for_run("run_a", force=True)
+
+        assert result["success"], result["error"]
+        assert result["from_cache"] is False
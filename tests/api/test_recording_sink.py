@@ -0,0 +1,116 @@
+"""Tests for the block-buffered live capture recording sink."""
+
+import csv
+import math
+
+import numpy as np
+import pytest
+
+from api.services.ingestion.recording import (
+    RECORDING_COLUMNS,
+    RecordingSink,
+    read_recording,
+)
+
+
+def _rows(count: int) -> list[dict]:
+    return [
+        {
+            "timestamp_ms": 1000 + i * 50,
+            "rpm": 2000.0 + i,
+            "horsepower": 0,
+            "torque": 0,
+            "afr": 13.0 + i / 10 if i % 3 else None,
+            "map_kpa": 80.5,
+        }
+        for i in range(count)
+    ]
+
+
+class TestCSVRecording:
+    def test_rows_written_in_order_with_same_columns(self, tmp_path):
+        path = tmp_path / "capture.csv"
+        rows = _rows(7)
+        with RecordingSink(path, block_rows=3, flush_interval_sec=60) as sink:
+            sink.extend(rows)
+            assert sink.rows_written == 6  # Two full blocks; one row buffered
+
+        with open(path, newline="") as f:
+            reader = csv.DictReader(f)
+            written = list(reader)
+        assert tuple(reader.fieldnames) == RECORDING_COLUMNS
+        assert [int(r["timestamp_ms"]) for r in written] == [r["timestamp_ms"] for r in rows]
+        assert [r["afr"] for r in written[:3]] == ["", "13.1", "13.2"]
+        assert written[0]["gear"] == ""
+
+    def test_matches_dict_writer_output(self, tmp_path):
+        """Byte-for-byte parity with the previous csv.DictWriter recording."""
+        rows = [
+            {
+                "timestamp_ms": 1000 + i * 50,
+                "rpm": 3000 if i % 2 else float(np.float32(3000.25 + i)),
+                "horsepower": 0,
+                "torque": 0.0,
+                "afr": None if i % 3 == 0 else float(np.float32(13.1)),
+                "map_kpa": 80.5,
+                "gear": 3,
+                "extra": "ignored",
+            }
+            for i in range(5)
+        ]
+        legacy_path = tmp_path / "legacy.csv"
+        with open(legacy_path, "w", newline="", encoding="utf-8") as f:
+            writer = csv.DictWriter(f, fieldnames=RECORDING_COLUMNS, extrasaction="ignore")
+            writer.writeheader()
+            for row in rows:
+                writer.writerow(row)
+
+        path = tmp_path / "capture.csv"
+        with RecordingSink(path, block_rows=2, flush_interval_sec=60) as sink:
+            sink.extend(rows)
+
+        assert path.read_bytes() == legacy_path.read_bytes()
+
+    def test_stale_rows_are_flushed(self, tmp_path):
+        sink = RecordingSink(tmp_path / "capture.csv", flush_interval_sec=0)
+        sink.append(_rows(1)[0])
+        assert sink.rows_written == 1
+        sink.close()
+        assert sink.closed
+        with pytest.raises(ValueError):
+            sink.append(_rows(1)[0])
+
+
+class TestBinaryRecording:
+    def test_round_trip(self, tmp_path):
+        path = tmp_path / "capture.dynorec"
+        rows = _rows(10)
+        with RecordingSink(path, block_rows=4, flush_interval_sec=60) as sink:
+            assert sink.format == "binary"
+            sink.extend(rows)
+
+        data = read_recording(path)
+        assert list(data) == list(RECORDING_COLUMNS)
+        assert data["timestamp_ms"].tolist() == [r["timestamp_ms"] for r in rows]
+        assert data["rpm"].tolist() == [r["rpm"] for r in rows]
+        assert math.isnan(data["afr"][0]) and data["afr"][1] == pytest.approx(13.1)
+        assert np.isnan(data["gear"]).all()
+
+    def test_reads_unclosed_recording_up_to_last_block(self, tmp_path):
+        path = tmp_path / "crash.dynorec"
+        sink = RecordingSink(path, block_rows=4, flush_interval_sec=60)
+        sink.extend(_rows(10))  # 8 rows on disk, 2 buffered, no footer
+
+        # Simulate a crash mid-way through the next chunk
+        with open(path, "ab") as f:
+            f.write(b"CHNK\x04\x00\x00\x00partial")
+
+        data = read_recording(path)
+        assert len(data["timestamp_ms"]) == 8
+        assert data["timestamp_ms"][-1] == 1000 + 7 * 50
+
+    def test_rejects_other_files(self, tmp_path):
+        path = tmp_path / "capture.csv"
+        path.write_text("timestamp_ms\n1\n")
+        with pytest.raises(ValueError):
+            read_recording(path)
@@ -0,0 +1,101 @@
+"""Tests for the live ingestion ring buffer and thread-local counters."""
+
+import threading
+
+import numpy as np
+import pytest
+
+from api.services.ingestion.ring_buffer import RecordRing, ThreadLocalCounters
+
+DTYPE = np.dtype([("ts", "<i8"), ("value", "<f8")])
+
+
+def _records(start: int, count: int) -> np.ndarray:
+    records = np.empty(count, dtype=DTYPE)
+    records["ts"] = np.arange(start, start + count)
+    records["value"] = records["ts"] * 0.5
+    return records
+
+
+class TestRecordRing:
+    def test_capacity_rounds_up_to_power_of_two(self):
+        assert RecordRing(DTYPE, 5).capacity == 8
+        assert RecordRing(DTYPE, 8).capacity == 8
+
+    def test_push_peek_advance(self):
+        ring = RecordRing(DTYPE, 4)
+        assert ring.push((1, 0.5))
+        assert ring.push((2, 1.0))
+
+        assert ring.peek()["ts"].tolist() == [1, 2]
+        assert len(ring) == 2
+        ring.advance(1)
+        assert ring.pop()["ts"].tolist() == [2]
+        assert len(ring) == 0
+
+    def test_rejects_when_full(self):
+        ring = RecordRing(DTYPE, 4)
+        assert ring.push_many(_records(0, 6)) == 4
+        assert not ring.push((9, 0.0))
+        assert ring.pop()["ts"].tolist() == [0, 1, 2, 3]
+
+    def test_wraparound_preserves_order(self):
+        ring = RecordRing(DTYPE, 8)
+        ring.push_many(_records(0, 6))
+        ring.advance(5)
+        assert ring.push_many(_records(6, 6)) == 6
+
+        out = ring.pop()
+        assert out["ts"].tolist() == list(range(5, 12))
+        assert out["value"].tolist() == [t * 0.5 for t in range(5, 12)]
+
+    def test_advance_past_head_raises(self):
+        ring = RecordRing(DTYPE, 4)
+        ring.push((1, 0.0))
+        with pytest.raises(ValueError):
+            ring.advance(2)
+
+    def test_concurrent_producer_consumer(self):
+        ring = RecordRing(DTYPE, 64)
+        total = 20000
+        received = []
+
+        def produce():
+            sent = 0
+            while sent < total:
+                sent += ring.push_many(_records(sent, min(50, total - sent)))
+
+        producer = threading.Thread(target=produce)
+        producer.start()
+        while len(received) < total:
+            received.extend(ring.pop()["ts"].tolist())
+        producer.join()
+
+        assert received == list(range(total))
+
+
+class TestThreadLocalCounters:
+    def test_merges_shards_from_all_threads(self):
+        counters = ThreadLocalCounters(["a", "b"])
+
+        def work():
+            for _ in range(1000):
+                counters.add("a")
+
+        threads = [threading.Thread(target=work) for _ in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        counters.add("b", 5)
+
+        assert counters.snapshot() == {"a": 4000, "b": 5}
+        assert counters.get("a") == 4000
+
+    def test_reset(self):
+        counters = ThreadLocalCounters(["a"])
+        counters.add("a", 3)
+        counters.reset()
+        assert counters.get("a") == 0
+        counters.add("a")
+        assert counters.get("a") == 1
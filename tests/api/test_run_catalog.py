@@ -0,0 +1,243 @@
+"""Tests for the SQL run catalog and RunManager write-through."""
+
+from pathlib import Path
+
+import pytest
+
+from api.jetstream.models import RunError, RunState, RunStatus
+from api.services import run_manager
+from api.services.database import create_db_engine
+from api.services.run_catalog import RunCatalog, encode_cursor
+from api.services.run_manager import RunManager
+
+
+@pytest.fixture
+def engine(tmp_path: Path):
+    engine = create_db_engine(f"sqlite:///{tmp_path / 'catalog.db'}")
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def catalog(engine) -> RunCatalog:
+    return RunCatalog(engine)
+
+
+def make_state(index: int, created_at: str = None, **kwargs) -> RunState:
+    created_at = created_at or f"2025-01-01T00:{index // 60:02d}:{index % 60:02d}.000Z"
+    defaults = {
+        "run_id": f"run_{index:05d}",
+        "status": RunStatus.PENDING,
+        "source": "jetstream" if index % 2 else "manual_upload",
+        "created_at": created_at,
+        "updated_at": created_at,
+    }
+    defaults.update(kwargs)
+    return RunState(**defaults)
+
+
+def collect_pages(catalog: RunCatalog, limit: int, **filters) -> list:
+    run_ids, cursor = [], None
+    while True:
+        page = catalog.list_runs(limit=limit, cursor=cursor, **filters)
+        run_ids.extend(r["run_id"] for r in page["runs"])
+        cursor = page["next_cursor"]
+        if cursor is None:
+            return run_ids
+
+
+class TestRunCatalog:
+    """Storing and listing run states."""
+
+    def test_round_trip_matches_run_state(self, catalog):
+        state = make_state(
+            1,
+            status=RunStatus.ERROR,
+            current_stage="validate",
+            progress_percent=30,
+            error=RunError(stage="validate", code="BAD_CSV", message="no rpm"),
+            results_summary={"peak_hp": 112.5},
+            files=["VE_Correction_Delta_DYNO.csv", "Diagnostics_Report.txt"],
+        )
+        catalog.upsert(state)
+
+        assert catalog.list_runs()["runs"] == [state.to_dict()]
+
+    def test_upsert_updates_existing_run(self, catalog):
+        state = make_state(1, files=["a.csv"])
+        catalog.upsert(state)
+
+        state.status = RunStatus.COMPLETE
+        state.files = ["a.csv", "b.csv"]
+        catalog.upsert(state)
+
+        result = catalog.list_runs()
+        assert result["total"] == 1
+        assert result["runs"][0]["status"] == "complete"
+        assert result["runs"][0]["files"] == ["a.csv", "b.csv"]
+
+    def test_filters_and_total(self, catalog):
+        catalog.upsert_many(make_state(i) for i in range(10))
+        catalog.upsert(make_state(3, status=RunStatus.COMPLETE))
+
+        assert catalog.list_runs(source="jetstream")["total"] == 5
+        complete = catalog.list_runs(status=RunStatus.COMPLETE, source="jetstream")
+        assert [r["run_id"] for r in complete["runs"]] == ["run_00003"]
+        assert complete["next_cursor"] is None
+
+    def test_delete(self, catalog):
+        catalog.upsert(make_state(1, files=["a.csv"]))
+
+        assert catalog.delete("run_00001") is True
+        assert catalog.delete("run_00001") is False
+        assert catalog.count() == 0
+
+
+class TestKeysetPagination:
+    """Cursor pages are complete, ordered and stable."""
+
+    def test_pages_cover_all_runs_newest_first(self, catalog):
+        # Shared timestamps: run_id has to break ties
+        states = [
+            make_state(i, created_at=f"2025-01-01T00:00:{i // 4:02d}.000Z")
+            for i in range(23)
+        ]
+        catalog.upsert_many(states)
+
+        newest_first = sorted(
+            states, key=lambda s: (s.created_at, s.run_id), reverse=True
+        )
+        expected = [s.run_id for s in newest_first]
+        assert collect_pages(catalog, limit=5) == expected
+        assert collect_pages(catalog, limit=4, source="jetstream") == [
+            r for r in expected if int(r[-5:]) % 2
+        ]
+
+    def test_new_runs_do_not_shift_later_pages(self, catalog):
+        catalog.upsert_many(make_state(i) for i in range(6))
+        first = catalog.list_runs(limit=3)
+
+        catalog.upsert(make_state(99))
+        second = catalog.list_runs(limit=3, cursor=first["next_cursor"])
+
+        assert [r["run_id"] for r in second["runs"]] == [
+            "run_00002",
+            "run_00001",
+            "run_00000",
+        ]
+
+    def test_invalid_cursor(self, catalog):
+        with pytest.raises(ValueError):
+            catalog.list_runs(cursor="not-a-cursor")
+        with pytest.raises(ValueError):
+            catalog.list_runs(cursor=encode_cursor("yesterday", "run_1"))
+
+    @pytest.mark.parametrize("where", ["", "WHERE status = 'pending' AND "])
+    def test_listing_uses_index_without_sort(self, catalog, engine, where):
+        clause = where or "WHERE "
+        sql = (
+            f"EXPLAIN QUERY PLAN SELECT id FROM runs {clause}"
+            "(created_at, id) < ('2025-01-01 00:00:00', 'run_1') "
+            "ORDER BY created_at DESC, id DESC LIMIT 51"
+        )
+        with engine.connect() as conn:
+            plan = " ".join(row[-1] for row in conn.exec_driver_sql(sql))
+
+        assert "_created_id" in plan
+        assert "TEMP B-TREE" not in plan
+
+    def test_sqlite_uses_wal(self, catalog, engine):
+        with engine.connect() as conn:
+            mode = conn.exec_driver_sql("PRAGMA journal_mode").scalar()
+
+        assert mode == "wal"
+
+
+class TestImportRunStates:
+    """One-shot import of existing run directories."""
+
+    def test_imports_and_skips_unreadable(self, catalog, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        manager = RunManager(runs_dir="runs")
+        for i in range(3):
+            manager.create_run("jetstream", run_id=f"run_{i}")
+        manager.update_run_status("run_1", RunStatus.COMPLETE, files=["out.csv"])
+        (tmp_path / "runs" / "run_2" / "run_state.json").write_text("{")
+
+        assert catalog.import_run_states(tmp_path / "runs", batch_size=1) == 2
+        listed = {r["run_id"]: r for r in catalog.list_runs()["runs"]}
+        assert listed["run_1"] == manager.get_run("run_1").to_dict()
+        assert "run_2" not in listed
+
+        # Re-running resyncs instead of duplicating
+        assert catalog.import_run_states(tmp_path / "runs") == 2
+        assert catalog.count() == 2
+
+    def test_sync_catches_up_on_fallback_changes(self, catalog, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        attached = RunManager(runs_dir="runs", catalog=catalog)
+        for i in range(3):
+            attached.create_run("jetstream", run_id=f"run_{i}")
+
+        # Database unavailable: runs change through the index.json fallback
+        fallback = RunManager(runs_dir="runs")
+        fallback.create_run("manual_upload", run_id="run_new")
+        fallback.update_run_status("run_1", RunStatus.COMPLETE)
+        fallback.delete_run("run_2")
+
+        assert catalog.sync_run_states(tmp_path / "runs") == (2, 1)
+        assert catalog.list_runs()["runs"] == fallback.list_runs()["runs"]
+        assert catalog.sync_run_states(tmp_path / "runs") == (0, 0)
+
+
+class TestRunManagerWriteThrough:
+    """RunManager keeps the catalog current and lists from it."""
+
+    @pytest.fixture
+    def manager(self, catalog, tmp_path, monkeypatch) -> RunManager:
+        monkeypatch.chdir(tmp_path)
+        return RunManager(runs_dir="runs", catalog=catalog)
+
+    def test_lifecycle(self, manager, catalog):
+        manager.create_run("jetstream", run_id="run_a")
+        manager.create_run("manual_upload", run_id="run_b")
+        manager.update_run_status("run_a", RunStatus.PROCESSING, progress_percent=50)
+
+        result = manager.list_runs(status=RunStatus.PROCESSING)
+        assert result["runs"] == [manager.get_run("run_a").to_dict()]
+        assert not manager._index_path.exists()
+
+        assert manager.delete_run("run_b") is True
+        assert catalog.count() == 1
+
+    def test_catalog_failure_does_not_lose_state(self, manager, catalog, monkeypatch):
+        manager.create_run("jetstream", run_id="run_a")
+
+        def fail(state):
+            raise RuntimeError("database is locked")
+
+        monkeypatch.setattr(catalog, "upsert", fail)
+        state = manager.update_run_status("run_a", RunStatus.COMPLETE)
+
+        assert state.status == RunStatus.COMPLETE
+        assert manager.get_run("run_a").status == RunStatus.COMPLETE
+
+
+class TestCatalogFallback:
+    """index.json is usable again when the catalog is unavailable."""
+
+    def test_fallback_rebuilds_stale_index(self, catalog, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        fallback = RunManager(runs_dir="runs")
+        fallback.create_run("jetstream", run_id="run_old")
+
+        # Catalog attached: index.json is left behind
+        attached = RunManager(runs_dir="runs", catalog=catalog)
+        attached.create_run("jetstream", run_id="run_new")
+        attached.delete_run("run_old")
+
+        monkeypatch.setattr(run_manager, "_run_manager", None)
+        monkeypatch.setattr(run_manager, "_open_run_catalog", lambda runs_dir: None)
+        manager = run_manager.get_run_manager()
+
+        assert [r["run_id"] for r in manager.list_runs()["runs"]] == ["run_new"]
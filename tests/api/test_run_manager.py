@@ -0,0 +1,122 @@
+"""Tests for RunManager and its incremental run index."""
+
+import json
+import os
+from pathlib import Path
+
+import pytest
+
+from api.jetstream.models import RunStatus
+from api.services.run_manager import RunManager
+
+
+@pytest.fixture
+def manager(tmp_path: Path, monkeypatch) -> RunManager:
+    # safe_path() only allows paths under the working directory
+    monkeypatch.chdir(tmp_path)
+    return RunManager(runs_dir="runs")
+
+
+def _read_index(manager: RunManager) -> dict:
+    with open(manager._index_path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+class TestRunIndex:
+    """The index is maintained entry by entry, without rescanning."""
+
+    def test_create_and_update_are_indexed(self, manager):
+        manager.create_run("jetstream", run_id="run_a")
+        manager.create_run("manual_upload", run_id="run_b")
+        manager.update_run_status("run_a", RunStatus.PROCESSING, progress_percent=40)
+
+        index = _read_index(manager)
+        entries = {r["run_id"]: r for r in index["runs"]}
+        assert index["total"] == 2
+        assert entries["run_a"]["status"] == "processing"
+        assert entries["run_a"]["progress_percent"] == 40
+
+    def test_updates_do_not_rescan(self, manager, monkeypatch):
+        manager.create_run("jetstream", run_id="run_a")
+
+        def fail_scan():
+            raise AssertionError("run directories rescanned")
+
+        monkeypatch.setattr(manager, "_scan_runs", fail_scan)
+        manager.update_run_status("run_a", RunStatus.PROCESSING, progress_percent=10)
+        result = manager.list_runs()
+
+        assert result["runs"][0]["progress_percent"] == 10
+
+    def test_list_runs_uses_cache_until_file_changes(self, manager, monkeypatch):
+        manager.create_run("jetstream", run_id="run_a")
+        manager.list_runs()
+
+        reads = []
+        real_load = json.load
+        monkeypatch.setattr(
+            "api.services.run_manager.json.load",
+            lambda f: reads.append(f.name) or real_load(f),
+        )
+        manager.list_runs()
+        assert reads == []
+
+        # Another process rewrites the index
+        other = RunManager(runs_dir="runs")
+        other.create_run("manual_upload", run_id="run_b")
+        reads.clear()
+        result = manager.list_runs()
+
+        assert len(reads) == 1
+        assert result["total"] == 2
+
+    def test_corrupt_index_is_rebuilt(self, manager):
+        manager.create_run("jetstream", run_id="run_a")
+        manager._index_path.write_text("{not json", encoding="utf-8")
+
+        result = manager.list_runs()
+
+        assert [r["run_id"] for r in result["runs"]] == ["run_a"]
+        assert _read_index(manager)["total"] == 1
+
+    def test_delete_run_removes_entry(self, manager):
+        manager.create_run("jetstream", run_id="run_a")
+        manager.create_run("jetstream", run_id="run_b")
+
+        assert manager.delete_run("run_a") is True
+        assert [r["run_id"] for r in manager.list_runs()["runs"]] == ["run_b"]
+        assert _read_index(manager)["total"] == 1
+
+    def test_no_temp_files_left_behind(self, manager):
+        manager.create_run("jetstream", run_id="run_a")
+        manager.update_run_status("run_a", RunStatus.COMPLETE)
+
+        assert not [p for p in os.listdir(manager._runs_dir) if p.endswith(".tmp")]
+
+
+class TestListRuns:
+    """Filtering, ordering and pagination."""
+
+    def test_filters_sort_and_paginate(self, manager):
+        for i in range(5):
+            manager.create_run(
+                "jetstream" if i % 2 else "manual_upload", run_id=f"run_{i}"
+            )
+        manager.update_run_status("run_3", RunStatus.COMPLETE)
+
+        ordered = [r["created_at"] for r in manager.list_runs()["runs"]]
+        assert ordered == sorted(ordered, reverse=True)
+
+        assert manager.list_runs(source="jetstream")["total"] == 2
+        complete = manager.list_runs(status=RunStatus.COMPLETE)
+        assert [r["run_id"] for r in complete["runs"]] == ["run_3"]
+
+        page = manager.list_runs(limit=2, offset=1)
+        assert page["total"] == 5
+        assert len(page["runs"]) == 2
+
+    def test_returned_entries_are_copies(self, manager):
+        manager.create_run("jetstream", run_id="run_a")
+        manager.list_runs()["runs"][0]["status"] = "tampered"
+
+        assert manager.list_runs()["runs"][0]["status"] == "pending"
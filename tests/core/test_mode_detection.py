@@ -7,15 +7,20 @@ Tests verify:
 - Mode summary counts are accurate
 """
 
+from pathlib import Path
+
 import pytest
 import pandas as pd
 import numpy as np
 
+from dynoai.core.log_normalizer import normalize_dataframe
 from dynoai.core.mode_detection import (
     ModeTag,
     ModeDetectionConfig,
     ModeLabeledFrame,
     label_modes,
+    classify_modes,
+    classify_sample,
     compute_derivatives,
     get_steady_state_mask,
     get_wot_mask,
@@ -387,3 +392,66 @@ class TestCustomConfig:
         idle_count2 = (result2.df["mode"] == "idle").sum()
         
         assert idle_count1 > idle_count2
+
+
+class TestVectorizedClassification:
+    """classify_modes must match the row-wise classify_sample exactly."""
+    
+    @staticmethod
+    def scalar_labels(df, config):
+        return [classify_sample(row, config).value for _, row in df.iterrows()]
+    
+    @pytest.fixture
+    def random_df(self):
+        """Samples hitting every rule, exact thresholds and NaNs."""
+        rng = np.random.default_rng(42)
+        n = 3000
+        config = ModeDetectionConfig()
+        df = pd.DataFrame({
+            "rpm": rng.uniform(600, 6500, n),
+            "map_kpa": rng.uniform(20, 105, n),
+            "tps": rng.uniform(0, 100, n),
+            "iat": rng.uniform(60, 180, n),
+            "tps_dot": rng.normal(0, 20, n),
+            "map_dot": rng.normal(0, 10, n),
+        })
+        # Values exactly on the thresholds exercise </<= boundaries
+        df.loc[::7, "tps"] = config.tps_wot_threshold
+        df.loc[::11, "map_kpa"] = config.map_idle_ceiling
+        df.loc[::13, "rpm"] = config.rpm_decel_floor
+        df.loc[::17, "tps"] = config.tps_decel_ceiling
+        df.loc[::19, "tps_dot"] = config.tpsdot_tipin_threshold
+        for col in df.columns:
+            df.loc[rng.random(n) < 0.05, col] = np.nan
+        return df
+    
+    def test_matches_scalar_on_random_samples(self, random_df):
+        config = ModeDetectionConfig()
+        labels = classify_modes(random_df, config)
+        
+        assert list(labels) == self.scalar_labels(random_df, config)
+        assert set(labels) == {m.value for m in ModeTag} - {"unknown"}
+    
+    @pytest.mark.parametrize("missing", [["tps"], ["iat"], ["map_kpa"], ["tps", "iat", "map_kpa", "tps_dot", "map_dot"]])
+    def test_matches_scalar_with_missing_columns(self, random_df, missing):
+        config = ModeDetectionConfig()
+        df = random_df.drop(columns=missing)
+        
+        assert list(classify_modes(df, config)) == self.scalar_labels(df, config)
+    
+    def test_label_modes_matches_scalar_on_dense_log(self):
+        raw = pd.read_csv(Path(__file__).parents[1] / "data" / "dense_dyno_test.csv")
+        df = normalize_dataframe(raw).df
+        config = ModeDetectionConfig()
+        
+        result = label_modes(df, config)
+        derived = compute_derivatives(df, config)
+        
+        assert list(result.df["mode"]) == self.scalar_labels(derived, config)
+    
+    def test_handles_empty_frame(self):
+        df = pd.DataFrame({"rpm": [], "map_kpa": [], "tps": []})
+        result = label_modes(df)
+        
+        assert result.total_samples == 0
+        assert sum(result.summary_counts.values()) == 0
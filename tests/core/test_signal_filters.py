@@ -0,0 +1,153 @@
+"""
+Tests for dynoai.core.signal_filters array API.
+
+Tests verify:
+- filter_arrays matches the FilteredSample path (values, mask, statistics)
+- Masks stay aligned to input rows with repeated or unsorted timestamps
+- The default SignalFilter.filter_arrays works for list-only filters
+"""
+
+import copy
+from typing import List
+
+import numpy as np
+import pytest
+
+from dynoai.core.signal_filters import (
+    CompositeFilter,
+    FilteredSample,
+    FilterStatistics,
+    LowpassFilter,
+    MinMaxFilter,
+    SignalFilter,
+    StatisticalOutlierFilter,
+    TimeAwareMinMaxFilter,
+    filter_afr_samples,
+    samples_from_arrays,
+)
+
+
+class NegativeFilter(SignalFilter):
+    """Custom filter implementing only the list API."""
+
+    def filter(self, samples: List[FilteredSample]) -> List[FilteredSample]:
+        for sample in samples:
+            if sample.is_valid and sample.value < 0:
+                sample.invalidate()
+        return samples
+
+    def reset(self) -> None:
+        pass
+
+    @property
+    def name(self) -> str:
+        return "NegativeFilter"
+
+    @property
+    def statistics(self) -> FilterStatistics:
+        return FilterStatistics()
+
+
+def make_signal(seed: int, n: int = 400, shuffle: bool = False):
+    rng = np.random.default_rng(seed)
+    # Repeated timestamps (dt=0) and gaps
+    t = np.cumsum(rng.choice([0, 5, 10, 10, 10, 200], n)).astype(float)
+    if shuffle:
+        t = rng.permutation(t)
+    x = rng.normal(13.0, 1.0, n)
+    spikes = rng.random(n) < 0.05
+    x[spikes] = rng.choice([5.0, 25.0], spikes.sum())
+    x[n // 2] = np.nan
+    return t, x
+
+
+def make_filters():
+    return [
+        LowpassFilter(rc_ms=50.0),
+        LowpassFilter(rc_ms=1.0),
+        MinMaxFilter(min_val=10.0, max_val=19.0),
+        TimeAwareMinMaxFilter(10.0, 19.0, exclude_leading_ms=30, exclude_trailing_ms=70),
+        StatisticalOutlierFilter(sigma_threshold=2.0, reject_leading_samples=3),
+        CompositeFilter([
+            LowpassFilter(rc_ms=500.0),
+            TimeAwareMinMaxFilter(min_val=10.0, max_val=19.0),
+            StatisticalOutlierFilter(sigma_threshold=2.0),
+        ]),
+    ]
+
+
+class TestArrayParity:
+    """filter_arrays must agree with filter on FilteredSample lists."""
+
+    @pytest.mark.parametrize("seed", [0, 1, 2])
+    @pytest.mark.parametrize("shuffle", [False, True])
+    @pytest.mark.parametrize("index", range(len(make_filters())))
+    def test_matches_sample_path(self, seed, shuffle, index):
+        t, x = make_signal(seed, shuffle=shuffle)
+        list_filter = make_filters()[index]
+        array_filter = copy.deepcopy(list_filter)
+
+        samples = list_filter.filter(samples_from_arrays(t.tolist(), x.tolist()))
+        values, valid = array_filter.filter_arrays(t, x)
+
+        np.testing.assert_array_equal(valid, [s.is_valid for s in samples])
+        np.testing.assert_allclose(
+            values, [s.value for s in samples], rtol=1e-9, equal_nan=True
+        )
+        assert vars(array_filter.statistics) == vars(list_filter.statistics)
+
+    @pytest.mark.parametrize("n", [0, 1, 2])
+    def test_short_inputs(self, n):
+        t, x = np.arange(n) * 10.0, np.full(n, 30.0)
+        for f in make_filters():
+            values, valid = f.filter_arrays(t, x)
+            assert len(values) == len(valid) == n
+
+    def test_minmax_rejection_reasons(self):
+        f = MinMaxFilter(min_val=10.0, max_val=19.0)
+        f.filter_arrays([0, 1, 2, 3], [5.0, 13.0, 25.0, 26.0])
+
+        assert f.statistics.rejection_reasons == {"below_min": 1, "above_max": 2}
+
+
+class TestMask:
+    """Masks are aligned to the input rows."""
+
+    def test_repeated_timestamps(self):
+        # Two rows share a timestamp; only the out-of-range one is dropped
+        t = np.array([0.0, 1000.0, 1000.0, 2000.0])
+        x = np.array([13.0, 13.0, 25.0, 13.0])
+        f = MinMaxFilter(10.0, 19.0)
+
+        np.testing.assert_array_equal(f.mask(t, x), [True, True, False, True])
+
+    def test_incoming_mask_is_respected(self):
+        t = np.arange(5) * 10.0
+        x = np.array([13.0, 25.0, 13.0, 13.0, 13.0])
+        f = MinMaxFilter(10.0, 19.0)
+
+        _, valid = f.filter_arrays(t, x, valid=np.array([True, True, True, False, True]))
+
+        np.testing.assert_array_equal(valid, [True, False, True, False, True])
+        assert f.statistics.valid_samples == 3
+
+    def test_default_implementation_for_custom_filters(self):
+        chain = CompositeFilter([NegativeFilter(), MinMaxFilter(-100.0, 19.0)])
+
+        valid = chain.mask([0, 10, 20, 30], [13.0, -1.0, 25.0, 14.0])
+
+        np.testing.assert_array_equal(valid, [True, False, False, True])
+        assert chain.statistics.rejected_samples == 2
+
+    def test_rejects_mismatched_lengths(self):
+        with pytest.raises(ValueError):
+            MinMaxFilter().filter_arrays([0, 10], [13.0])
+
+
+def test_filter_afr_samples_returns_valid_rows():
+    t, x = make_signal(5)
+    x[np.isnan(x)] = 13.0
+    times, values, stats = filter_afr_samples(t, x)
+
+    assert len(times) == len(values) == stats.valid_samples
+    assert all(10.0 <= v <= 19.0 for v in values)
@@ -5,6 +5,7 @@ Tests verify:
 - Surface shapes match bin dimensions
 - min_samples_per_cell masks low-hit cells to None
 - Aggregation methods work correctly
+- Shared bin placement and vectorized specs match the row-wise path
 """
 
 import pytest
@@ -14,6 +15,7 @@ import numpy as np
 from dynoai.core.surface_builder import (
     build_surface,
     build_standard_surfaces,
+    SurfaceBins,
     SurfaceSpec,
     Surface2D,
 )
@@ -361,3 +363,100 @@ class TestSurfaceStatistics:
         assert stats.non_nan_cells == 1
         assert stats.total_cells == 1
         assert stats.coverage_pct == 100.0
+
+
+class TestSharedBinsAndVectorizedSpecs:
+    """Tests for SurfaceBins reuse and vectorized filter/value specs."""
+    
+    @pytest.fixture
+    def log_df(self):
+        rng = np.random.default_rng(5)
+        n = 3000
+        df = pd.DataFrame({
+            "rpm": rng.uniform(800, 6500, n),
+            "map_kpa": rng.uniform(15, 105, n),
+            "spark_f": rng.uniform(10, 35, n),
+            "mode": rng.choice(["wot", "cruise", "idle"], n),
+        })
+        df.loc[::40, "rpm"] = np.nan
+        df.loc[::33, "spark_f"] = np.nan
+        df.loc[::7, "rpm"] = 2250.0  # between bins
+        df.index = df.index * 3 + 7  # non-default index
+        return df
+    
+    @staticmethod
+    def reference_aggregate(df, values, rpm_bins, map_bins, agg, min_samples):
+        """Straightforward per-row reference for non-mean aggregations."""
+        cells = {}
+        for rpm, map_kpa, value in zip(df["rpm"], df["map_kpa"], values):
+            if pd.isna(rpm) or pd.isna(map_kpa) or pd.isna(value):
+                continue
+            r = min(range(len(rpm_bins)), key=lambda i: abs(rpm_bins[i] - rpm))
+            m = min(range(len(map_bins)), key=lambda i: abs(map_bins[i] - map_kpa))
+            cells.setdefault((r, m), []).append(value)
+        funcs = {
+            "max": max,
+            "min": min,
+            "sum": sum,
+            "p95": lambda v: np.percentile(v, 95),
+            "rate": lambda v: len(v) / 10.0,
+        }
+        return [
+            [
+                funcs[agg](cells[(r, m)]) if len(cells.get((r, m), [])) >= min_samples else None
+                for m in range(len(map_bins))
+            ]
+            for r in range(len(rpm_bins))
+        ]
+    
+    @pytest.mark.parametrize("agg", ["max", "min", "p95", "sum", "rate"])
+    def test_grouped_aggregation_matches_reference(self, log_df, agg):
+        spec = SurfaceSpec(value_column="spark_f", aggregation=agg, min_samples_per_cell=3)
+        surface = build_surface(log_df, spec)
+        
+        expected = self.reference_aggregate(
+            log_df, log_df["spark_f"], surface.rpm_axis.bins,
+            surface.map_axis.bins, agg, 3,
+        )
+        assert surface.values == expected
+    
+    def test_vectorized_spec_matches_row_wise_spec(self, log_df):
+        row_spec = SurfaceSpec(
+            value_column=lambda row: row["spark_f"] * 2,
+            filter_expr=lambda row: row["rpm"] > 2000,
+            filter_modes=[ModeTag.WOT, ModeTag.CRUISE],
+            aggregation="p95",
+        )
+        vec_spec = SurfaceSpec(
+            value_column=lambda df: df["spark_f"] * 2,
+            filter_expr=lambda df: df["rpm"] > 2000,
+            filter_modes=[ModeTag.WOT, ModeTag.CRUISE],
+            aggregation="p95",
+            vectorized=True,
+        )
+        
+        row_surface = build_surface(log_df, row_spec)
+        vec_surface = build_surface(log_df, vec_spec)
+        
+        assert vec_surface.values == row_surface.values
+        assert vec_surface.hit_count == row_surface.hit_count
+        assert vec_surface.mask_info == row_surface.mask_info
+    
+    def test_shared_bins_give_same_surface(self, log_df):
+        spec = SurfaceSpec(value_column="spark_f", filter_modes=[ModeTag.WOT])
+        bins = SurfaceBins(log_df)
+        
+        shared = build_surface(log_df, spec, bins=bins)
+        fresh = build_surface(log_df, spec)
+        
+        assert shared.values == fresh.values
+        assert shared.hit_count == fresh.hit_count
+        assert shared.stats.total_samples == fresh.stats.total_samples
+    
+    def test_bins_for_other_frame_are_not_reused(self, log_df):
+        spec = SurfaceSpec(value_column="spark_f", min_samples_per_cell=1)
+        subset = log_df.iloc[:100]
+        
+        surface = build_surface(subset, spec, bins=SurfaceBins(log_df))
+        
+        assert surface.stats.total_samples == build_surface(subset, spec).stats.total_samples
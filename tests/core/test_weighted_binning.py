@@ -0,0 +1,156 @@
+"""
+Tests for dynoai.core.weighted_binning module.
+
+Tests verify:
+- Vectorized axis placement matches find_axis_placement exactly
+- add_samples_batch matches repeated add_sample calls
+- CellAccumulator views stay in sync with the accumulator arrays
+"""
+
+import numpy as np
+import pytest
+
+from dynoai.core.weighted_binning import (
+    CellAccumulator,
+    GaussianWeighting,
+    LinearWeighting,
+    LogarithmicWeighting,
+    UniformWeighting,
+    WeightedBinAccumulator,
+    WeightingStrategy,
+    create_map_axis,
+    create_rpm_axis,
+    find_axis_placement,
+    find_axis_placements,
+)
+
+
+class SquareWeighting(WeightingStrategy):
+    """Custom strategy without a vectorized calculate_weights."""
+    
+    def calculate_weight(self, distance: float) -> float:
+        return 1.0 / (1.0 + distance * distance)
+
+
+@pytest.fixture
+def samples():
+    rng = np.random.default_rng(7)
+    n = 5000
+    x = rng.uniform(500, 7000, n)
+    y = rng.uniform(10, 110, n)
+    z = rng.uniform(10, 16, n)
+    # Exact bin centers, midpoints and invalid samples
+    x[::13] = 1500.0
+    x[::29] = 1750.0
+    y[::17] = 35.0
+    x[::50] = np.nan
+    z[::77] = np.inf
+    return x, y, z
+
+
+class TestAxisPlacement:
+    """find_axis_placements must agree with find_axis_placement."""
+    
+    @pytest.mark.parametrize("axis", [
+        [1000, 1500, 2000, 2500, 3000],
+        [3000, 2500, 2000, 1500, 1000],
+        [1000, 1500, 1500, 2000, 3000, 3000],
+        [1000, 3000, 2000],  # non-monotonic falls back to the scalar path
+        [2000],
+        [],
+    ])
+    def test_matches_scalar_placement(self, axis):
+        values = np.concatenate([
+            np.random.default_rng(3).uniform(0, 4000, 500),
+            [0, 1000, 1500, 1750, 2000, 3000, 9999],
+        ])
+        index, percent = find_axis_placements(axis, values)
+        
+        for i, value in enumerate(values):
+            expected = find_axis_placement(axis, float(value))
+            assert index[i] == expected.index
+            np.testing.assert_equal(percent[i], expected.percent_to_next)
+
+
+class TestBatchAccumulation:
+    """add_samples_batch must match the per-sample path."""
+    
+    @pytest.mark.parametrize("weighting", [
+        LogarithmicWeighting(),
+        UniformWeighting(),
+        LinearWeighting(),
+        GaussianWeighting(sigma=0.4),
+        SquareWeighting(),
+    ])
+    @pytest.mark.parametrize("x_axis", [create_rpm_axis(), create_rpm_axis()[::-1]])
+    def test_batch_matches_scalar(self, samples, weighting, x_axis):
+        x, y, z = samples
+        scalar = WeightedBinAccumulator(x_axis, create_map_axis(), weighting=weighting)
+        batch = WeightedBinAccumulator(x_axis, create_map_axis(), weighting=weighting)
+        
+        scalar_accepted = sum(
+            scalar.add_sample(xi, yi, zi) for xi, yi, zi in zip(x, y, z)
+        )
+        batch_accepted = batch.add_samples_batch(x, y, z)
+        
+        assert batch_accepted == scalar_accepted
+        assert batch.get_hit_counts() == scalar.get_hit_counts()
+        assert batch.statistics == scalar.statistics
+        for scalar_row, batch_row in zip(scalar.get_table(), batch.get_table()):
+            for expected, actual in zip(scalar_row, batch_row):
+                if expected is None:
+                    assert actual is None
+                else:
+                    assert actual == expected
+    
+    def test_batch_accumulates_on_top_of_existing_data(self, samples):
+        x, y, z = samples
+        acc = WeightedBinAccumulator(create_rpm_axis(), create_map_axis())
+        acc.add_samples_batch(x[:2000], y[:2000], z[:2000])
+        acc.add_samples_batch(x[2000:], y[2000:], z[2000:])
+        
+        whole = WeightedBinAccumulator(create_rpm_axis(), create_map_axis())
+        whole.add_samples_batch(x, y, z)
+        
+        assert acc.get_hit_counts() == whole.get_hit_counts()
+        assert acc.statistics["total_samples"] == len(x)
+    
+    def test_rejects_mismatched_lengths(self):
+        acc = WeightedBinAccumulator(create_rpm_axis(), create_map_axis())
+        with pytest.raises(ValueError):
+            acc.add_samples_batch([1000, 2000], [50], [13.0, 13.1])
+
+
+class TestCellViews:
+    """CellAccumulator objects are views over the accumulator arrays."""
+    
+    def test_cell_stats_reflect_batch_updates(self):
+        acc = WeightedBinAccumulator([1000, 2000], [50, 100], weighting=UniformWeighting())
+        acc.add_samples_batch([1000, 1000, 2000], [50, 50, 100], [12.0, 14.0, 13.0])
+        
+        stats = acc.get_cell_stats(0, 0)
+        assert stats["hit_count"] == 2
+        assert stats["mean"] == 13.0
+        assert stats["min_value"] == 12.0
+        assert stats["max_value"] == 14.0
+        assert isinstance(stats["weight_sum"], float)
+        
+        cell = acc._cells[1][1]
+        cell.add(15.0, 1.0)
+        assert acc.get_hit_counts() == [[2, 0], [0, 2]]
+    
+    def test_standalone_cell(self):
+        cell = CellAccumulator()
+        assert cell.mean is None
+        cell.add(10.0, 2.0)
+        cell.add(13.0, 1.0)
+        assert cell.mean == 11.0
+        assert cell.hit_count == 2
+    
+    def test_reset_clears_arrays(self, samples):
+        acc = WeightedBinAccumulator(create_rpm_axis(), create_map_axis())
+        acc.add_samples_batch(*samples)
+        acc.reset()
+        
+        assert all(v == 0 for row in acc.get_hit_counts() for v in row)
+        assert acc.statistics["total_samples"] == 0
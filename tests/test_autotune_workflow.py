@@ -3,7 +3,13 @@
 import sys
 from pathlib import Path
 
+import numpy as np
+import pandas as pd
+import pytest
+
 from api.services.autotune_workflow import AutoTuneWorkflow
+from dynoai.core.ve_math import MathVersion, calculate_ve_correction
+from dynoai.core.weighted_binning import WeightedBinAccumulator
 from api.services.powercore_integration import find_log_files
 
 # Add project root to path
@@ -81,3 +87,89 @@ def test_full_workflow():
 
 if __name__ == "__main__":
     test_full_workflow()
+
+
+def _capture(n: int = 5000) -> pd.DataFrame:
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame(
+        {
+            "Time_ms": np.arange(n) * 10.0,
+            "Engine RPM": rng.uniform(1000, 7000, n),
+            "MAP kPa": rng.uniform(15, 105, n),
+            "AFR Meas F": rng.normal(13.5, 0.8, n),
+        }
+    )
+    df.loc[::97, "Engine RPM"] = np.nan
+    df.loc[::101, "AFR Meas F"] = np.nan
+    # Values exactly between two bins
+    df.loc[::50, "Engine RPM"] = 3250.0
+    df.loc[::60, "MAP kPa"] = 45.0
+    return df
+
+
+def _per_row_matrices(workflow: AutoTuneWorkflow, df: pd.DataFrame):
+    """Reference per-row binning and per-cell corrections."""
+    n_rpm, n_map = len(workflow.rpm_axis), len(workflow.map_axis)
+    hits = np.zeros((n_rpm, n_map), dtype=int)
+    means = np.full((n_rpm, n_map), np.nan)
+    rows = [
+        (rpm, map_kpa, afr)
+        for rpm, map_kpa, afr in zip(df["Engine RPM"], df["MAP kPa"], df["AFR Meas F"])
+        if not (pd.isna(rpm) or pd.isna(map_kpa) or pd.isna(afr))
+    ]
+
+    if workflow.use_weighted_binning:
+        acc = WeightedBinAccumulator(
+            workflow.rpm_axis,
+            workflow.map_axis,
+            weighting=workflow.weighting_strategy,
+            min_hits=workflow.MIN_HITS_PER_ZONE,
+        )
+        for rpm, map_kpa, afr in rows:
+            acc.add_sample(rpm, map_kpa, afr)
+        hits = np.array(acc.get_hit_counts())
+        means = np.array(acc.get_table(), dtype=float)
+    else:
+        sums = np.zeros((n_rpm, n_map))
+
+        def nearest(val, bins):
+            return min(range(len(bins)), key=lambda i: abs(bins[i] - val))
+
+        for rpm, map_kpa, afr in rows:
+            i, j = nearest(rpm, workflow.rpm_axis), nearest(map_kpa, workflow.map_axis)
+            hits[i, j] += 1
+            sums[i, j] += afr
+        with np.errstate(invalid="ignore", divide="ignore"):
+            means = sums / hits
+
+    errors = np.full((n_rpm, n_map), np.nan)
+    deltas = np.full((n_rpm, n_map), np.nan)
+    for i in range(n_rpm):
+        for j in range(n_map):
+            if hits[i, j] >= workflow.MIN_HITS_PER_ZONE:
+                target = workflow.get_target_afr(workflow.map_axis[j])
+                errors[i, j] = means[i, j] - target
+                correction = calculate_ve_correction(
+                    means[i, j], target, version=workflow.math_version, clamp=False
+                )
+                deltas[i, j] = (correction - 1.0) * 100.0
+    return hits, errors, deltas
+
+
+@pytest.mark.parametrize("weighted", [False, True])
+@pytest.mark.parametrize("version", [MathVersion.V1_0_0, MathVersion.V2_0_0])
+def test_analyze_afr_matches_per_row_binning(weighted, version):
+    """Column-wise binning gives exactly the per-row results."""
+    workflow = AutoTuneWorkflow(use_weighted_binning=weighted, enable_filtering=False)
+    workflow.math_version = version
+    df = _capture()
+    session = workflow.create_session("binning")
+    session.dynoai_data = df
+
+    result = workflow.analyze_afr(session)
+    hits, errors, deltas = _per_row_matrices(workflow, df)
+
+    np.testing.assert_array_equal(result.hit_count_by_zone.values, hits)
+    np.testing.assert_array_equal(result.error_by_zone.values, errors)
+    np.testing.assert_array_equal(result.ve_delta_by_zone.values, deltas)
+
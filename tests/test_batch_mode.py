@@ -0,0 +1,92 @@
+"""Batch mode must produce the same per-run outputs as analyzing files serially."""
+
+import json
+import shutil
+import uuid
+from pathlib import Path
+
+import pytest
+
+import ai_tuner_toolkit_dyno_v1_2 as toolkit
+from dynoai.test_utils import make_synthetic_csv
+
+ROOT = Path(__file__).resolve().parents[1]
+
+
+@pytest.fixture
+def workdir():
+    # The toolkit enforces safe_path, so stay inside the project tree
+    path = ROOT / "temp_selftest" / f"batch_{uuid.uuid4().hex[:8]}"
+    (path / "logs").mkdir(parents=True)
+    yield path
+    shutil.rmtree(path, ignore_errors=True)
+
+
+def output_files(run_dir: Path) -> dict:
+    # Manifests carry run IDs and timestamps; every other output must match
+    return {
+        p.name: p.read_bytes()
+        for p in run_dir.iterdir()
+        if p.is_file() and not p.name.endswith("manifest.json")
+    }
+
+
+def test_batch_matches_serial_runs(workdir: Path):
+    logs = workdir / "logs"
+    for i in range(3):
+        make_synthetic_csv(logs / f"pull{i}.csv", rows=1500)
+    (logs / "broken.csv").write_text("not,a,dyno,log\n1,2,3,4\n")
+    files = toolkit.find_batch_inputs(logs)
+    assert [p.name for p in files] == [
+        "broken.csv",
+        "pull0.csv",
+        "pull1.csv",
+        "pull2.csv",
+    ]
+
+    options = {"clamp": 12.0, "columnar": True}
+    summary = toolkit.run_batch(
+        files, workdir / "out", options, max_workers=2, progress=lambda *_: None
+    )
+
+    assert summary["files_total"] == 4
+    assert summary["files_failed"] == 1
+    assert [r["csv"] for r in summary["runs"]] == [str(p) for p in files]
+    assert not summary["runs"][0]["ok"] and summary["runs"][0]["error"]
+    assert summary["rows_read"] == 4500
+    assert (workdir / "out" / "batch_summary.json").exists()
+
+    for path, run in zip(files[1:], summary["runs"][1:]):
+        run_dir = Path(run["outdir"])
+        assert (run_dir / f"{run['run_id']}.manifest.json").exists()
+        assert run["bins_covered"] > 0
+        manifest = json.loads(
+            (run_dir / f"{run['run_id']}.manifest.json").read_text()
+        )
+        # Union of both cylinders, so never below the front-only count
+        assert run["bins_covered"] >= manifest["stats"]["bins_covered"]
+
+        serial_dir = workdir / "serial" / path.stem
+        toolkit.run_analysis(
+            dict(options, csv=path, outdir=serial_dir), progress=lambda *_: None
+        )
+        assert output_files(run_dir) == output_files(serial_dir)
+
+
+def test_batch_run_dirs_are_unique():
+    files = [Path("a/log.csv"), Path("b/log.csv"), Path("c/other.csv")]
+    dirs = toolkit._batch_run_dirs(files, Path("out"))
+    assert [d.name for d in dirs] == ["log", "log_2", "other"]
+
+
+def test_batch_summary_tolerates_missing_row_counts(workdir: Path, monkeypatch):
+    def fake_item(csv_path, run_outdir, options):
+        rows = None if csv_path.endswith("a.csv") else 10
+        return {"csv": csv_path, "outdir": run_outdir, "ok": True, "rows_read": rows}
+
+    monkeypatch.setattr(toolkit, "_run_batch_item", fake_item)
+    files = [workdir / "logs" / "a.csv", workdir / "logs" / "b.csv"]
+    summary = toolkit.run_batch(
+        files, workdir / "out", max_workers=1, progress=lambda *_: None
+    )
+    assert summary["rows_read"] == 10
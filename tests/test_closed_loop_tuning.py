@@ -4,6 +4,10 @@ Tests for closed-loop tuning orchestrator.
 Quick tests to verify the system works without running full iterations.
 """
 
+import queue
+import threading
+import time
+
 import numpy as np
 import pytest
 
@@ -12,6 +16,7 @@ from api.services.virtual_tuning_session import (
     TuningSessionConfig,
     TuningStatus,
     VirtualTuningOrchestrator,
+    build_sweep_configs,
 )
 
 
@@ -120,6 +125,165 @@ class TestTuningOrchestrator:
         assert session.end_time is not None
 
 
+    @pytest.mark.slow
+    def test_seeded_session_is_reproducible(self):
+        """Seeded sessions run on the stepped simulator give identical results."""
+        results = []
+        for _ in range(2):
+            config = TuningSessionConfig(
+                engine_profile=EngineProfile.m8_114(),
+                base_ve_scenario="lean",
+                max_iterations=1,
+                seed=7,
+            )
+            orchestrator = VirtualTuningOrchestrator()
+            session = orchestrator.run_session(orchestrator.create_session(config))
+
+            assert session.status in (TuningStatus.CONVERGED, TuningStatus.MAX_ITERATIONS)
+            results.append(
+                [(r.max_afr_error, r.peak_hp, r.pull_data_points) for r in session.iterations]
+            )
+
+        assert results[0] == results[1]
+
+
+class TestParameterSweep:
+    """Tests for multi-session parameter sweeps."""
+
+    def test_build_sweep_configs(self):
+        """The grid is the cartesian product of the swept fields."""
+        base = TuningSessionConfig(engine_profile=EngineProfile.m8_114(), max_iterations=3)
+        configs = build_sweep_configs(
+            base,
+            base_ve_error_pct=[-10.0, -5.0],
+            max_correction_per_iteration_pct=[10.0, 15.0, 20.0],
+        )
+
+        assert len(configs) == 6
+        assert [(c.base_ve_error_pct, c.max_correction_per_iteration_pct) for c in configs][:3] == [
+            (-10.0, 10.0),
+            (-10.0, 15.0),
+            (-10.0, 20.0),
+        ]
+        assert all(c.max_iterations == 3 for c in configs)
+
+    def test_build_sweep_configs_rejects_unknown_field(self):
+        base = TuningSessionConfig(engine_profile=EngineProfile.m8_114())
+        with pytest.raises(ValueError):
+            build_sweep_configs(base, not_a_field=[1, 2])
+
+    def test_progress_callback(self):
+        """update_progress notifies the session's progress callback."""
+        orchestrator = VirtualTuningOrchestrator()
+        session = orchestrator.create_session(
+            TuningSessionConfig(engine_profile=EngineProfile.m8_114())
+        )
+        seen = []
+        session.progress_callback = lambda pct, msg: seen.append((pct, msg))
+
+        session.update_progress(42.0, "halfway")
+
+        assert seen == [(42.0, "halfway")]
+        assert session.progress_pct == 42.0
+
+    @pytest.mark.slow
+    @pytest.mark.parametrize("max_workers", [1, 2])
+    def test_run_sweep(self, max_workers):
+        """Sweeps return one comparison row per config, in input order."""
+        base = TuningSessionConfig(
+            engine_profile=EngineProfile.m8_114(), max_iterations=1, seed=3
+        )
+        configs = build_sweep_configs(base, base_ve_error_pct=[-10.0, -5.0])
+        orchestrator = VirtualTuningOrchestrator()
+
+        table = orchestrator.run_sweep(configs, max_workers=max_workers)
+
+        assert list(table["base_ve_error_pct"]) == [-10.0, -5.0]
+        assert set(table["status"]) <= {"converged", "max_iterations"}
+        assert list(table["iterations"]) == [1, 1]
+        assert table["final_max_afr_error"].notna().all()
+        assert not table["oscillation"].any()
+        for session_id in table["session_id"]:
+            session = orchestrator.get_session(session_id)
+            assert session.status != TuningStatus.RUNNING
+            assert len(session.iterations) == 1
+
+
+    def test_sweep_session_ids_are_unique(self):
+        base = TuningSessionConfig(engine_profile=EngineProfile.m8_114(), seed=3)
+        orchestrator = VirtualTuningOrchestrator()
+
+        sessions = [orchestrator.create_session(c) for c in [base] * 5]
+
+        assert len({s.session_id for s in sessions}) == 5
+        assert len(orchestrator.sessions) == 5
+
+    def test_sweep_sessions_run_on_first_report(self):
+        """Queued sweep sessions stay INITIALIZING until their worker reports."""
+        orchestrator = VirtualTuningOrchestrator()
+        config = TuningSessionConfig(engine_profile=EngineProfile.m8_114())
+        sessions = [orchestrator.create_session(config) for _ in range(2)]
+        reports = queue.Queue()
+        reports.put((0, 0, 0.0, "Started"))
+
+        orchestrator._forward_sweep_progress(reports, sessions)
+
+        assert sessions[0].status == TuningStatus.RUNNING
+        assert sessions[1].status == TuningStatus.INITIALIZING
+
+    def test_stopped_session_does_not_start(self):
+        orchestrator = VirtualTuningOrchestrator()
+        session = orchestrator.create_session(
+            TuningSessionConfig(engine_profile=EngineProfile.m8_114())
+        )
+
+        assert orchestrator.stop_session(session.session_id)
+        orchestrator.run_session(session)
+
+        assert session.status == TuningStatus.STOPPED
+        assert session.iterations == []
+
+    @pytest.mark.slow
+    def test_stop_reaches_sweep_worker(self):
+        """Stopping a running sweep session stops its worker's loop."""
+        base = TuningSessionConfig(
+            engine_profile=EngineProfile.m8_114(),
+            max_iterations=30,
+            convergence_threshold_afr=0.0,
+            oscillation_detection_enabled=False,
+            seed=3,
+        )
+        configs = build_sweep_configs(base, base_ve_error_pct=[-10.0, -5.0])
+        orchestrator = VirtualTuningOrchestrator()
+        result = {}
+        sweep = threading.Thread(
+            target=lambda: result.update(
+                table=orchestrator.run_sweep(configs, max_workers=2)
+            )
+        )
+        sweep.start()
+
+        deadline = time.monotonic() + 120
+        target = None
+        while target is None and time.monotonic() < deadline:
+            with orchestrator._lock:
+                running = [
+                    s for s in orchestrator.sessions.values()
+                    if s.status == TuningStatus.RUNNING and s.current_iteration >= 1
+                ]
+            target = running[0] if running else None
+            time.sleep(0.05)
+        assert target is not None
+        assert orchestrator.stop_session(target.session_id)
+        sweep.join(timeout=300)
+
+        assert not sweep.is_alive()
+        assert target.status == TuningStatus.STOPPED
+        assert len(target.iterations) < base.max_iterations
+        row = result["table"].set_index("session_id").loc[target.session_id]
+        assert row["status"] == "stopped"
+
+
 class TestTuningSessionConfig:
     """Tests for TuningSessionConfig."""
 
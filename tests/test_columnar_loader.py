@@ -0,0 +1,90 @@
+"""Columnar (RecordBatch) loaders must match the row-dict loaders exactly."""
+
+import uuid
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+import ai_tuner_toolkit_dyno_v1_2 as toolkit
+from dynoai.test_utils import make_synthetic_csv
+
+ROOT = Path(__file__).resolve().parents[1]
+
+
+@pytest.fixture
+def workdir():
+    # Loaders enforce safe_path, so stay inside the project tree
+    path = ROOT / "temp_selftest" / f"columnar_{uuid.uuid4().hex[:8]}"
+    path.mkdir(parents=True)
+    yield path
+    for child in path.iterdir():
+        child.unlink()
+    path.rmdir()
+
+
+def assert_batches_equal(a: toolkit.RecordBatch, b: toolkit.RecordBatch) -> None:
+    assert len(a) == len(b)
+    for name in toolkit.RECORD_FIELDS:
+        assert np.array_equal(a[name], b[name], equal_nan=True), name
+
+
+def test_winpep_columns_match_rows(workdir: Path):
+    csv_path = workdir / "winpep.csv"
+    make_synthetic_csv(csv_path, rows=2000)
+
+    rows = toolkit.load_winpep_csv(csv_path)
+    batch = toolkit.load_winpep_columns(csv_path)
+
+    assert_batches_equal(toolkit.RecordBatch.from_records(rows), batch)
+
+
+def test_generic_columns_apply_lambda_and_hp_fallbacks(workdir: Path):
+    csv_path = workdir / "generic.csv"
+    csv_path.write_text(
+        "Engine Speed,MAP (kPa),Horsepower,Desired AFR,AFR Measured,"
+        "Lambda Desired,Lambda Front\n"
+        # invalid AFR sentinel -> lambda fallback for both cmd and meas
+        "3000,80,60,5.1,5.1,0.95,0.90\n"
+        # torque derived from HP, AFRs valid
+        "3500,90,70,13.0,12.5,,\n"
+        # out of gating range, dropped
+        "9000,80,60,13.0,12.5,,\n"
+        # no HP/torque, dropped
+        "3000,80,,13.0,12.5,,\n"
+        # unparseable values become missing
+        "4000,85,75,abc,nan,1.5,0.8\n"
+    )
+
+    rows = toolkit.load_generic_csv(csv_path)
+    batch = toolkit.load_generic_columns(csv_path)
+
+    assert len(batch) == 3
+    assert_batches_equal(toolkit.RecordBatch.from_records(rows), batch)
+
+
+@pytest.mark.parametrize("cyl", ["f", "r"])
+def test_downstream_stages_accept_batches(workdir: Path, cyl: str):
+    csv_path = workdir / "winpep.csv"
+    make_synthetic_csv(csv_path, rows=2000)
+    rows = toolkit.load_winpep_csv(csv_path)
+    batch = toolkit.load_winpep_columns(csv_path)
+
+    from_rows = toolkit.dyno_bin_aggregate(rows, cyl=cyl)
+    from_batch = toolkit.dyno_bin_aggregate(batch, cyl=cyl)
+    assert repr(from_rows) == repr(from_batch)
+
+    grid, knock, iat, coverage = from_rows[0], from_rows[1], from_rows[2], from_rows[3]
+    args = dict(
+        afr_err_f=grid,
+        afr_err_r=grid,
+        ve_delta_grid=grid,
+        knock_f=knock,
+        iat_f=iat,
+        knock_r=knock,
+        iat_r=iat,
+        coverage=coverage,
+    )
+    assert toolkit.anomaly_diagnostics(rows, **args) == toolkit.anomaly_diagnostics(
+        batch, **args
+    )
@@ -0,0 +1,128 @@
+"""The NumPy dyno_bin_aggregate path must be bit-identical to the scalar loop."""
+
+import random
+import uuid
+from pathlib import Path
+
+import pytest
+
+import ai_tuner_toolkit_dyno_v1_2 as toolkit
+from dynoai.test_utils import make_synthetic_csv
+
+ROOT = Path(__file__).resolve().parents[1]
+
+
+def random_records(count: int, seed: int = 7):
+    """Records that exercise every gating branch and bin midpoint ties."""
+    rnd = random.Random(seed)
+
+    def maybe(value, p_none=0.1):
+        return None if rnd.random() < p_none else value
+
+    recs = []
+    for _ in range(count):
+        # Snap some RPM/MAP values onto exact bin midpoints to test tie-breaking
+        rpm = rnd.choice([rnd.uniform(1200, 7000), 1750.0, 3250.0])
+        kpa = rnd.choice([rnd.uniform(5, 115), 42.5, 87.5])
+        cmd = maybe(rnd.uniform(8, 19))
+        meas = maybe(rnd.uniform(8, 19))
+        err = None
+        if cmd is not None and meas is not None:
+            err = (cmd - meas) / meas * 100.0
+        recs.append(
+            {
+                "rpm": rpm,
+                "kpa": kpa,
+                "tq": rnd.uniform(-5, 120),
+                "hp": rnd.uniform(-5, 120),
+                "tps": maybe(rnd.uniform(-10, 110)),
+                "iat": maybe(rnd.uniform(0, 320)),
+                "batt": maybe(rnd.uniform(11, 15)),
+                "afr_cmd_f": cmd,
+                "afr_cmd_r": cmd,
+                "afr_meas_f": meas,
+                "afr_meas_r": meas,
+                "afr_err_f_pct": err,
+                "afr_err_r_pct": maybe(err),
+                "knock_f": maybe(rnd.choice([0.0, rnd.uniform(0, 4)])),
+                "knock_r": maybe(rnd.uniform(0, 4)),
+            }
+        )
+    return recs
+
+
+@pytest.mark.parametrize("cyl", ["f", "r"])
+@pytest.mark.parametrize("use_hp_weight", [False, True])
+def test_vectorized_matches_scalar_bit_for_bit(cyl: str, use_hp_weight: bool):
+    recs = random_records(5000)
+
+    scalar = toolkit.dyno_bin_aggregate(recs, cyl=cyl, use_hp_weight=use_hp_weight)
+    vector = toolkit.dyno_bin_aggregate(
+        recs, cyl=cyl, use_hp_weight=use_hp_weight, vectorized=True
+    )
+
+    # repr() round-trips floats exactly, so this is a bit-level comparison
+    assert repr(vector) == repr(scalar)
+
+
+def test_vectorized_diagnostics_counters():
+    recs = random_records(2000, seed=11)
+
+    *_, diag_scalar, _, _ = toolkit.dyno_bin_aggregate(recs)
+    *_, diag_vector, _, _ = toolkit.dyno_bin_aggregate(recs, vectorized=True)
+
+    assert diag_vector == diag_scalar
+    assert diag_vector["total_records_processed"] == 2000
+    assert diag_vector["accepted_wb"] > 0
+    for key in (
+        "no_requested_afr",
+        "bad_afr_or_request_afr",
+        "temp_out_of_range",
+        "map_out_of_range",
+        "tps_out_of_range",
+    ):
+        assert diag_vector[key] > 0, key
+
+
+def test_vectorized_matches_scalar_on_columnar_log():
+    workdir = ROOT / "temp_selftest" / f"agg_{uuid.uuid4().hex[:8]}"
+    workdir.mkdir(parents=True)
+    csv_path = workdir / "winpep.csv"
+    try:
+        make_synthetic_csv(csv_path, rows=3000)
+        batch = toolkit.load_winpep_columns(csv_path)
+        for cyl in ("f", "r"):
+            assert repr(toolkit.dyno_bin_aggregate(batch, cyl=cyl)) == repr(
+                toolkit.dyno_bin_aggregate(batch, cyl=cyl, vectorized=True)
+            )
+    finally:
+        csv_path.unlink(missing_ok=True)
+        workdir.rmdir()
+
+
+def test_vectorized_handles_empty_input():
+    grid, knock, iat, coverage, diag, tq, hp = toolkit.dyno_bin_aggregate(
+        [], vectorized=True
+    )
+    assert all(v is None for row in grid for v in row)
+    assert all(v == 0 for row in coverage for v in row)
+    assert diag["accepted_wb"] == 0
+
+
+@pytest.mark.parametrize("vectorized", [False, True])
+def test_concurrent_calls_match_serial(vectorized: bool):
+    from concurrent.futures import ThreadPoolExecutor
+
+    inputs = [(random_records(2000, seed=seed), cyl) for seed in range(4) for cyl in "fr"]
+    serial = [
+        toolkit.dyno_bin_aggregate(recs, cyl, vectorized=vectorized)
+        for recs, cyl in inputs
+    ]
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        concurrent = list(
+            pool.map(
+                lambda job: toolkit.dyno_bin_aggregate(job[0], job[1], vectorized=vectorized),
+                inputs,
+            )
+        )
+    assert concurrent == serial
@@ -0,0 +1,156 @@
+"""
+Tests for data source adapters.
+
+Tests cover:
+- JetDrive sample aggregation into time windows
+- Streaming window aggregator reductions and slot resolution
+"""
+
+import random
+from dataclasses import dataclass
+
+import numpy as np
+import pytest
+
+from api.services.ingestion.adapters import (
+    JetDriveAdapter,
+    StreamingWindowAggregator,
+)
+
+
+@dataclass
+class Sample:
+    channel_name: str
+    timestamp_ms: int
+    value: float
+
+
+def reference_aggregate(samples, time_window_ms=50):
+    """The sort-and-rebuild aggregation the streaming path replaced."""
+    adapter = JetDriveAdapter()
+    sorted_samples = sorted(samples, key=lambda s: s.timestamp_ms)
+    results = []
+    window_start = sorted_samples[0].timestamp_ms
+    window_values = {}
+    for sample in sorted_samples:
+        if sample.timestamp_ms - window_start >= time_window_ms:
+            results.append(adapter.make_point(window_start, window_values))
+            window_start = sample.timestamp_ms
+            window_values = {}
+        window_values[adapter.standard_name(sample.channel_name)] = sample.value
+    results.append(adapter.make_point(window_start, window_values))
+    return results
+
+
+CHANNELS = ["Digital RPM 1", "Torque", "Air/Fuel Ratio 1", "MAP kPa", "Humidity"]
+
+
+def make_samples(count, seed=0):
+    rng = random.Random(seed)
+    ts = 1000
+    samples = []
+    for _ in range(count):
+        ts += rng.choice([0, 1, 5, 20])
+        samples.append(Sample(rng.choice(CHANNELS), ts, rng.uniform(0, 100)))
+    return samples
+
+
+class TestAggregateSamples:
+    """Tests for JetDriveAdapter.aggregate_samples."""
+
+    def test_empty(self):
+        assert JetDriveAdapter().aggregate_samples([]) == []
+
+    def test_matches_reference(self):
+        samples = make_samples(500)
+        result = JetDriveAdapter().aggregate_samples(samples)
+        expected = reference_aggregate(samples)
+        assert [p.to_dict() for p in result] == [p.to_dict() for p in expected]
+
+    def test_unsorted_input_is_sorted(self):
+        samples = make_samples(200, seed=1)
+        shuffled = samples[:]
+        random.Random(2).shuffle(shuffled)
+        result = JetDriveAdapter().aggregate_samples(shuffled)
+        assert [p.timestamp_ms for p in result] == [
+            p.timestamp_ms for p in reference_aggregate(samples)
+        ]
+
+    def test_repeated_calls_are_independent(self):
+        adapter = JetDriveAdapter()
+        samples = make_samples(100)
+        first = [p.to_dict() for p in adapter.aggregate_samples(samples)]
+        second = [p.to_dict() for p in adapter.aggregate_samples(samples)]
+        assert first == second
+
+    def test_reductions(self):
+        samples = [
+            Sample("Digital RPM 1", 0, 3000.0),
+            Sample("Digital RPM 1", 10, 3300.0),
+            Sample("Torque", 20, 80.0),
+            Sample("Torque", 30, 70.0),
+        ]
+        (point,) = JetDriveAdapter().aggregate_samples(
+            samples, reductions={"rpm": "mean", "torque": "max"}
+        )
+        assert point.rpm == pytest.approx(3150.0)
+        assert point.torque == 80.0
+
+
+class TestStreamingWindowAggregator:
+    """Tests for the streaming window aggregator."""
+
+    def test_emits_on_window_boundary(self):
+        aggregator = StreamingWindowAggregator(window_ms=50)
+        rpm = aggregator.slot_for("Digital RPM 1")
+        assert aggregator.add(1000, rpm, 3000.0) is None
+        assert aggregator.add(1049, rpm, 3050.0) is None
+
+        point = aggregator.add(1050, rpm, 3100.0)
+        assert point.timestamp_ms == 1000
+        assert point.rpm == 3050.0
+
+        point = aggregator.flush()
+        assert point.timestamp_ms == 1050
+        assert point.rpm == 3100.0
+        assert aggregator.flush() is None
+
+    def test_unmapped_channel_has_no_slot(self):
+        aggregator = StreamingWindowAggregator()
+        assert aggregator.slot_for("Humidity") == -1
+        assert aggregator.slot_for("Engine RPM") == aggregator.slot_for("Digital RPM 1")
+
+    @pytest.mark.parametrize(
+        "reduction,expected", [("last", 2.0), ("mean", 4.0), ("min", 2.0), ("max", 7.0)]
+    )
+    def test_reductions(self, reduction, expected):
+        aggregator = StreamingWindowAggregator(reductions={"afr": reduction})
+        slot = aggregator.slot_for("Air/Fuel Ratio 1")
+        for ts, value in ((0, 3.0), (10, 7.0), (20, 2.0)):
+            aggregator.add(ts, slot, value)
+        assert aggregator.flush().afr == pytest.approx(expected)
+
+    @pytest.mark.parametrize("reduction", StreamingWindowAggregator.REDUCTIONS)
+    def test_reduce_matches_streaming(self, reduction):
+        aggregator = StreamingWindowAggregator(
+            reductions={name: reduction for name in StreamingWindowAggregator.SLOTS}
+        )
+        rng = np.random.default_rng(0)
+        slots = rng.integers(-1, len(StreamingWindowAggregator.SLOTS), 200)
+        values = rng.uniform(0, 100, 200)
+        for slot, value in zip(slots.tolist(), values.tolist()):
+            aggregator.add(0, slot, value)
+        streamed = aggregator.flush().to_dict()
+
+        reduced = aggregator.reduce(slots, values)
+        assert set(reduced) == {
+            StreamingWindowAggregator.SLOTS[s] for s in set(slots.tolist()) if s >= 0
+        }
+        for name, value in reduced.items():
+            assert streamed[name] == pytest.approx(value)
+
+    def test_invalid_reduction(self):
+        with pytest.raises(ValueError):
+            StreamingWindowAggregator(reductions={"rpm": "median"})
+        with pytest.raises(ValueError):
+            StreamingWindowAggregator(reductions={"boost": "mean"})
@@ -21,6 +21,7 @@ import pytest
 from api.services.ingestion.config import QueueSettings
 from api.services.ingestion.queue import (
     IngestionQueue,
+    LatencyHistogram,
     QueueItem,
     QueuePriority,
     QueueStats,
@@ -354,6 +355,134 @@ class TestQueueBatchOperations:
         assert len(processed) == 20
         assert len(queue) == 0
 
+    def test_drain_pops_in_priority_order(self):
+        """Test drain returns up to max_items in priority order."""
+        queue = IngestionQueue()
+        queue.enqueue("test", {"value": "low"}, priority=QueuePriority.LOW)
+        queue.enqueue("test", {"value": "high"}, priority=QueuePriority.HIGH)
+        queue.enqueue("test", {"value": "normal"})
+
+        items = queue.drain(max_items=2)
+
+        assert [item.data["value"] for item in items] == ["high", "normal"]
+        assert len(queue) == 1
+        assert queue.get_stats().current_size == 1
+
+    def test_drain_waits_for_first_item(self):
+        """Test drain with max_wait blocks until an item arrives."""
+        queue = IngestionQueue()
+        assert queue.drain(max_wait=0.05) == []
+
+        timer = threading.Timer(0.05, queue.enqueue, args=("test", {"value": 1}))
+        timer.start()
+        try:
+            items = queue.drain(max_wait=2.0)
+        finally:
+            timer.join()
+
+        assert [item.data["value"] for item in items] == [1]
+
+    def test_process_many(self):
+        """Test batch processor gets all items in one call."""
+        queue = IngestionQueue()
+        for i in range(5):
+            queue.enqueue("test", {"value": i})
+
+        calls = []
+
+        def processor(items: list[QueueItem]) -> list[bool]:
+            calls.append([item.data["value"] for item in items])
+            return [True] * len(items)
+
+        assert queue.process_many(processor) == 5
+        assert calls == [[0, 1, 2, 3, 4]]
+        assert queue.get_stats().total_processed == 5
+
+    def test_process_many_retries_failed_items_individually(self):
+        """Test per-item failures in a batch are retried or dead-lettered."""
+        queue = IngestionQueue()
+        for i in range(4):
+            queue.enqueue("test", {"value": i})
+        # Item 3 has no retries left
+        next(i for i in queue._queue.queue if i.data["value"] == 3).max_retries = 1
+
+        def processor(items: list[QueueItem]) -> list[bool]:
+            return [item.data["value"] % 2 == 0 for item in items]
+
+        assert queue.process_many(processor) == 2
+        requeued = queue.drain()
+        assert [item.data["value"] for item in requeued] == [1]
+        assert requeued[0].retry_count == 1
+        assert requeued[0].priority == QueuePriority.LOW
+        dead = queue.get_dead_letter_items()
+        assert [item.data["value"] for item in dead] == [3]
+
+    def test_process_many_processor_exception_fails_batch(self):
+        """Test a raising batch processor fails every item with the error."""
+        queue = IngestionQueue()
+        for i in range(3):
+            queue.enqueue("test", {"value": i})
+
+        def processor(items: list[QueueItem]) -> list[bool]:
+            raise RuntimeError("boom")
+
+        assert queue.process_many(processor) == 0
+        requeued = queue.drain()
+        assert len(requeued) == 3
+        assert all(item.error == "boom" for item in requeued)
+
+    def test_process_many_wrong_result_count_fails_batch(self):
+        """Test a mismatched result list is treated as a failed batch."""
+        queue = IngestionQueue()
+        for i in range(3):
+            queue.enqueue("test", {"value": i})
+
+        assert queue.process_many(lambda items: [True]) == 0
+        assert len(queue) == 3
+
+    def test_drain_queue_batch(self):
+        """Test draining entire queue with a batch processor."""
+        queue = IngestionQueue(settings=QueueSettings(batch_size=8))
+        for i in range(20):
+            queue.enqueue("test", {"value": i})
+
+        sizes = []
+
+        def processor(items: list[QueueItem]) -> list[bool]:
+            sizes.append(len(items))
+            return [True] * len(items)
+
+        count = drain_queue(queue, processor, timeout_sec=5.0, batch=True)
+
+        assert count == 20
+        assert sizes == [8, 8, 4]
+
+
+class TestLatencyHistogram:
+    """Tests for the fixed-size latency histogram."""
+
+    def test_empty(self):
+        histogram = LatencyHistogram()
+        assert histogram.mean_ms == 0.0
+        assert histogram.quantile_ms(0.5) == 0.0
+
+    def test_mean_and_quantiles(self):
+        histogram = LatencyHistogram()
+        for _ in range(90):
+            histogram.record(1.0)
+        histogram.record(100.0, count=10)
+
+        assert histogram.count == 100
+        assert histogram.mean_ms == pytest.approx(10.9)
+        assert 1.0 <= histogram.quantile_ms(0.5) < 2.0
+        assert 100.0 <= histogram.quantile_ms(0.99) < 200.0
+
+    def test_memory_is_fixed(self):
+        histogram = LatencyHistogram()
+        for i in range(10000):
+            histogram.record(float(i))
+        assert len(histogram._counts) == len(LatencyHistogram.BOUNDS_MS) + 1
+
 
 class TestQueuePersistence:
     """Tests for queue persistence (when enabled)."""
@@ -374,10 +503,11 @@ class TestQueuePersistence:
         # Enqueue item
         queue.enqueue("test", {"value": 1})
 
-        # Check file was created
+        # Item is appended to the segment log, not written as its own file
         persist_path = Path(settings.persist_path)
         assert persist_path.exists()
-        assert len(list(persist_path.glob("*.json"))) == 1
+        assert len(list(persist_path.glob("*.seg"))) == 1
+        assert not [p for p in persist_path.glob("*.json") if p.name != "checkpoint.json"]
 
     def test_persistence_load_on_startup(self, tmp_path):
         """Test items are loaded from disk on startup."""
@@ -397,6 +527,107 @@ class TestQueuePersistence:
         # Should load persisted items
         assert len(queue2) == 2
 
+    def test_processed_items_not_reloaded(self, tmp_path):
+        """Test consumed items are not replayed after restart."""
+        settings = QueueSettings(
+            persist_to_disk=True,
+            persist_path=str(tmp_path / "queue"),
+        )
+        queue1 = IngestionQueue(settings)
+        for i in range(5):
+            queue1.enqueue("test", {"value": i})
+        assert queue1.process_batch(lambda item: True, batch_size=3) == 3
+        queue1.close()
+
+        queue2 = IngestionQueue(settings)
+        values = sorted(queue2.dequeue().data["value"] for _ in range(len(queue2)))
+        assert values == [3, 4]
+
+    def test_dead_letter_reloaded(self, tmp_path):
+        """Test dead letter items survive restart until cleared."""
+        settings = QueueSettings(
+            persist_to_disk=True,
+            persist_path=str(tmp_path / "queue"),
+        )
+        queue1 = IngestionQueue(settings)
+        queue1.enqueue("test", {"value": 1})
+        for _ in range(5):
+            queue1.process_batch(lambda item: False)
+
+        queue2 = IngestionQueue(settings)
+        assert len(queue2) == 0
+        assert len(queue2.get_dead_letter_items()) == 1
+
+        queue2.clear_dead_letter()
+        queue3 = IngestionQueue(settings)
+        assert queue3.get_dead_letter_items() == []
+
+    def test_torn_tail_record_truncated(self, tmp_path):
+        """Test a partially written record is dropped on recovery."""
+        settings = QueueSettings(
+            persist_to_disk=True,
+            persist_path=str(tmp_path / "queue"),
+        )
+        queue1 = IngestionQueue(settings)
+        queue1.enqueue("test", {"value": 1})
+        queue1.enqueue("test", {"value": 2})
+        queue1.close()
+
+        segment = next(Path(settings.persist_path).glob("*.seg"))
+        size = segment.stat().st_size
+        with open(segment, "r+b") as f:
+            f.truncate(size - 3)
+
+        queue2 = IngestionQueue(settings)
+        assert len(queue2) == 1
+        assert queue2.dequeue().data["value"] == 1
+
+        # New records append after the truncated tail
+        queue2.enqueue("test", {"value": 3})
+        queue3 = IngestionQueue(settings)
+        values = sorted(queue3.dequeue().data["value"] for _ in range(len(queue3)))
+        assert values == [1, 3]
+
+    def test_segments_rotate_and_compact(self, tmp_path):
+        """Test consumed segments are deleted and old live items compacted."""
+        settings = QueueSettings(
+            persist_to_disk=True,
+            persist_path=str(tmp_path / "queue"),
+            segment_max_bytes=512,
+            max_segments=3,
+        )
+        queue = IngestionQueue(settings)
+        pinned = queue.enqueue("test", {"value": "pinned"}, priority=QueuePriority.LOW)
+
+        for i in range(200):
+            queue.enqueue("test", {"value": i}, priority=QueuePriority.HIGH)
+            queue.process_batch(lambda item: True, batch_size=1)
+        queue.sync()
+
+        persist_path = Path(settings.persist_path)
+        assert len(list(persist_path.glob("*.seg"))) <= settings.max_segments + 1
+
+        restarted = IngestionQueue(settings)
+        assert len(restarted) == 1
+        assert restarted.dequeue().id == pinned
+
+    def test_legacy_files_migrated(self, tmp_path):
+        """Test items persisted as one JSON file each are moved into the log."""
+        import json
+
+        persist_path = tmp_path / "queue"
+        persist_path.mkdir()
+        item = QueueItem(id="legacy-1", source="test", data={"value": 1})
+        (persist_path / "legacy-1.json").write_text(json.dumps(item.to_dict()))
+
+        settings = QueueSettings(persist_to_disk=True, persist_path=str(persist_path))
+        queue1 = IngestionQueue(settings)
+        assert len(queue1) == 1
+        assert not (persist_path / "legacy-1.json").exists()
+
+        queue2 = IngestionQueue(settings)
+        assert queue2.dequeue().id == "legacy-1"
+
 
 class TestQueueThreadSafety:
     """Tests for thread safety."""
@@ -379,6 +379,129 @@ class TestSimulatorBehavior:
         assert max(hps) > 0.5, f"Expected decel loss HP > 0, got max={max(hps)}"
 
 
+class TestSteppedMode:
+    """Tests for the headless stepped (simulated clock) mode."""
+
+    def test_run_pull_completes_without_sleeping(self, monkeypatch):
+        """A stepped pull runs to idle without sleeping or reading the clock."""
+        sim = DynoSimulator(SimulatorConfig(seed=1))
+        sim.start_stepped()
+
+        def no_wall_clock():
+            raise AssertionError("stepped mode read the wall clock")
+
+        monkeypatch.setattr(time, "time", no_wall_clock)
+        monkeypatch.setattr(time, "sleep", lambda _: no_wall_clock())
+        pull_data = sim.run_pull(timeout_sec=1000.0)
+        monkeypatch.undo()
+
+        assert sim.state == SimState.IDLE
+        assert len(pull_data) > 0
+        profile = sim.config.profile
+        assert max(p["Engine RPM"] for p in pull_data) >= profile.redline_rpm * 0.98
+        # Timestamps come from the simulated clock, one update apart
+        dt = 1.0 / sim.config.update_rate_hz
+        assert pull_data[1]["timestamp"] - pull_data[0]["timestamp"] == pytest.approx(dt)
+
+    def test_seeded_pulls_are_reproducible(self):
+        """Same seed, same pull data."""
+        runs = []
+        for _ in range(2):
+            sim = DynoSimulator(SimulatorConfig(seed=42))
+            sim.start_stepped()
+            sim.step(25)
+            runs.append(sim.run_pull(timeout_sec=1000.0))
+        assert runs[0] == runs[1]
+
+        sim = DynoSimulator(SimulatorConfig(seed=43))
+        sim.start_stepped()
+        sim.step(25)
+        assert sim.run_pull(timeout_sec=1000.0) != runs[0]
+
+    def test_run_pull_timeout(self):
+        """A pull that cannot finish in the simulated budget raises."""
+        sim = DynoSimulator(SimulatorConfig(seed=1))
+        sim.start_stepped()
+        with pytest.raises(TimeoutError):
+            sim.run_pull(timeout_sec=1.0)
+
+    def test_step_requires_stepped_start(self):
+        """step() is only valid on a simulator started with start_stepped()."""
+        sim = DynoSimulator(SimulatorConfig())
+        with pytest.raises(RuntimeError):
+            sim.step()
+
+
+class TestBatchPull:
+    """Tests for whole-pull array simulation."""
+
+    def test_array_helpers_match_scalar(self):
+        """Vectorized VE, pumping loss and target AFR match the per-tick methods."""
+        sim = DynoSimulator(SimulatorConfig())
+        rpm = np.linspace(300, 6500, 57)
+        for tps in (0.0, 3.0, 35.0, 79.9, 80.0, 100.0):
+            ve = sim._volumetric_efficiency_array(rpm, tps)
+            pumping = sim._pumping_losses_array(rpm, tps)
+            target = sim._target_afr_array(rpm, tps)
+            for i, r in enumerate(rpm):
+                assert ve[i] == pytest.approx(sim._get_volumetric_efficiency(r, tps))
+                assert pumping[i] == pytest.approx(sim._get_pumping_losses(r, tps))
+                assert target[i] == pytest.approx(sim._get_target_afr(r, tps))
+
+    def test_matches_stepped_pull(self):
+        """The batch pull follows the same RPM trajectory as a stepped pull."""
+        sim = DynoSimulator(SimulatorConfig(seed=3))
+        trace = sim.simulate_pull_arrays(max_duration_sec=1000.0)
+
+        stepped = DynoSimulator(SimulatorConfig(seed=3))
+        stepped.start_stepped()
+        pull_data = stepped.run_pull(timeout_sec=1000.0)
+
+        assert set(trace) == set(pull_data[0])
+        assert len(trace["Engine RPM"]) == len(pull_data)
+        for column in ("Engine RPM", "Torque", "Horsepower", "TPS", "IAT F"):
+            expected = np.array([row[column] for row in pull_data])
+            np.testing.assert_allclose(trace[column], expected, rtol=1e-6, atol=1e-3)
+        # Noisy channels agree statistically
+        afr = np.array([row["AFR Meas F"] for row in pull_data])
+        assert trace["AFR Meas F"].mean() == pytest.approx(afr.mean(), abs=0.05)
+
+    def test_seeded_and_stateless(self):
+        """Same seed, same trace; the simulator's own state is untouched."""
+        sim = DynoSimulator(SimulatorConfig())
+        first = sim.simulate_pull_arrays(seed=5, max_duration_sec=1000.0)
+        second = sim.simulate_pull_arrays(seed=5, max_duration_sec=1000.0)
+        for column in first:
+            np.testing.assert_array_equal(first[column], second[column])
+
+        assert sim.state == SimState.STOPPED
+        assert sim.physics.rpm == sim.config.profile.idle_rpm
+        assert sim.get_pull_data() == []
+
+    def test_virtual_ecu_lean_table(self):
+        """With a lean VE table in the ECU, the measured AFR runs lean."""
+        from api.services.virtual_ecu import (
+            VirtualECU,
+            create_afr_target_table,
+            create_baseline_ve_table,
+            create_intentionally_wrong_ve_table,
+        )
+
+        baseline = create_baseline_ve_table()
+        lean = create_intentionally_wrong_ve_table(baseline, -10.0, 0.0, seed=1)
+        ecu = VirtualECU(lean, lean, create_afr_target_table())
+        sim = DynoSimulator(SimulatorConfig(seed=1), virtual_ecu=ecu)
+
+        trace = sim.simulate_pull_arrays(max_duration_sec=1000.0)
+        assert (trace["AFR Meas F"] > trace["AFR Target"]).mean() > 0.9
+
+    def test_timeout(self):
+        """A pull that cannot reach redline in the budget raises."""
+        sim = DynoSimulator(SimulatorConfig())
+        with pytest.raises(TimeoutError):
+            sim.simulate_pull_arrays(max_duration_sec=1.0)
+
+
 class TestDifferentProfiles:
     """Test different engine profiles."""
 
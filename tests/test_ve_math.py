@@ -17,11 +17,14 @@ import math
 import random
 from typing import List, Tuple
 
+import numpy as np
+
 from dynoai.core.ve_math import (
     MathVersion,
     MathConfig,
     calculate_ve_correction,
     calculate_ve_correction_batch,
+    calculate_ve_correction_array,
     get_default_config,
     get_legacy_config,
     compare_versions,
@@ -543,6 +546,62 @@ class TestBatchProcessing:
         
         with pytest.raises(AFRValidationError):
             calculate_ve_correction_batch(measured, targets)
+    
+    def test_batch_none_entries(self):
+        """None entries are skipped or raise like the scalar function."""
+        results = calculate_ve_correction_batch(
+            [14.0, None, 13.0], [13.0, 13.0, 13.0], skip_invalid=True
+        )
+        assert results == [calculate_ve_correction(14.0, 13.0), None, 1.0]
+        
+        with pytest.raises(AFRValidationError, match="None"):
+            calculate_ve_correction_batch([14.0, None], [13.0, 13.0])
+
+
+class TestArrayCalculation:
+    """Tests for the vectorized calculate_ve_correction_array."""
+    
+    @pytest.mark.parametrize("config", [
+        get_default_config(),
+        get_legacy_config(),
+        MathConfig(max_correction_pct=3.0, afr_min=10.0, afr_max=18.0),
+    ])
+    @pytest.mark.parametrize("clamp", [True, False])
+    def test_bit_identical_to_scalar(self, config, clamp):
+        """Every entry matches calculate_ve_correction exactly."""
+        rng = np.random.default_rng(42)
+        measured = rng.uniform(8.0, 21.0, 5000)
+        targets = rng.uniform(8.5, 20.5, 5000)
+        measured[::100] = np.nan
+        
+        corrections, valid = calculate_ve_correction_array(
+            measured, targets, config=config, clamp=clamp
+        )
+        
+        for m, t, c, ok in zip(measured.tolist(), targets.tolist(), corrections, valid):
+            try:
+                expected = calculate_ve_correction(m, t, config=config, clamp=clamp)
+            except AFRValidationError:
+                assert not ok
+                assert np.isnan(c)
+            else:
+                assert ok
+                assert c == expected
+    
+    def test_broadcast_target(self):
+        """A scalar target broadcasts against a measured array."""
+        corrections, valid = calculate_ve_correction_array(
+            np.array([[14.0, 12.0], [13.0, 25.0]]), 13.0, version=MathVersion.V1_0_0
+        )
+        assert corrections.shape == (2, 2)
+        assert valid.tolist() == [[True, True], [True, False]]
+        assert corrections[0, 1] == calculate_ve_correction(
+            12.0, 13.0, version=MathVersion.V1_0_0
+        )
+    
+    def test_unknown_version_raises(self):
+        with pytest.raises(VEMathError):
+            calculate_ve_correction_array([14.0], [13.0], version="3.0.0")
 
 
 # =============================================================================
@@ -14,6 +14,7 @@ import numpy as np
 import pytest
 
 from api.services.virtual_ecu import (
+    DEFAULT_LOOKUP_TABLE_STEPS,
     VirtualECU,
     create_afr_target_table,
     create_baseline_ve_table,
@@ -231,6 +232,97 @@ class TestVirtualECU:
         assert abs((ve_r / ve_f) - (0.80 / 0.85)) < 0.05
 
 
+    def test_array_lookups_match_scalar(self):
+        """Array lookups agree with the scalar methods point by point."""
+        rpm = np.array([1000, 1750, 3000, 4321, 6500, 7000])
+        map_kpa = np.array([15, 25, 55, 80, 100, 110])
+        actual_ve = np.linspace(0.6, 1.0, len(rpm))
+
+        ve = self.ecu.lookup_ve_array(rpm, map_kpa, "rear")
+        afr = self.ecu.lookup_target_afr_array(rpm, map_kpa)
+        resulting = self.ecu.calculate_resulting_afr_array(
+            rpm, map_kpa, actual_ve, "front"
+        )
+
+        for i in range(len(rpm)):
+            assert ve[i] == pytest.approx(self.ecu.lookup_ve(rpm[i], map_kpa[i], "rear"))
+            assert afr[i] == pytest.approx(self.ecu.lookup_target_afr(rpm[i], map_kpa[i]))
+            assert resulting[i] == pytest.approx(
+                self.ecu.calculate_resulting_afr(rpm[i], map_kpa[i], actual_ve[i], "front")
+            )
+
+    def test_array_lookups_broadcast(self):
+        """A scalar MAP broadcasts against an RPM array."""
+        rpm = np.array([[2000, 3000], [4000, 5000]])
+        ve = self.ecu.lookup_ve_array(rpm, 80, "front")
+        assert ve.shape == (2, 2)
+        assert ve[1, 0] == pytest.approx(self.ecu.lookup_ve(4000, 80, "front"))
+
+    def test_air_mass_array(self):
+        """Array air mass matches the scalar calculation."""
+        map_kpa = np.array([20.0, 55.0, 100.0])
+        air = self.ecu.calculate_air_mass_mg_array(3000, map_kpa)
+        for i, m in enumerate(map_kpa):
+            assert air[i] == pytest.approx(self.ecu.calculate_air_mass_mg(3000, m))
+
+    def test_lookup_tables_match_interpolators(self):
+        """Fine-grid lookups reproduce the interpolators, including extrapolation."""
+        ve_front = create_intentionally_wrong_ve_table(self.ve_table, seed=1)
+        tables = dict(
+            ve_table_front=ve_front,
+            ve_table_rear=self.ve_table,
+            afr_target_table=self.afr_table,
+        )
+        reference = VirtualECU(**tables)
+        ecu = VirtualECU(**tables, lookup_table_steps=DEFAULT_LOOKUP_TABLE_STEPS)
+
+        rng = np.random.default_rng(0)
+        rpm = rng.uniform(1000, 7000, 500)
+        map_kpa = rng.uniform(15, 105, 500)
+        actual_ve = rng.uniform(0.6, 1.0, 500)
+
+        for cylinder in ("front", "rear"):
+            np.testing.assert_allclose(
+                ecu.lookup_ve_array(rpm, map_kpa, cylinder),
+                reference.lookup_ve_array(rpm, map_kpa, cylinder),
+                rtol=1e-9,
+            )
+            np.testing.assert_allclose(
+                ecu.calculate_resulting_afr_array(rpm, map_kpa, actual_ve, cylinder),
+                reference.calculate_resulting_afr_array(rpm, map_kpa, actual_ve, cylinder),
+                rtol=1e-9,
+            )
+        np.testing.assert_allclose(
+            ecu.lookup_target_afr_array(rpm, map_kpa),
+            reference.lookup_target_afr_array(rpm, map_kpa),
+            rtol=1e-9,
+        )
+        for r, m, v in zip(rpm[:50], map_kpa[:50], actual_ve[:50]):
+            assert ecu.calculate_resulting_afr(r, m, v, "front") == pytest.approx(
+                reference.calculate_resulting_afr(r, m, v, "front"), rel=1e-9
+            )
+
+    def test_build_lookup_tables_after_edit(self):
+        """Rebuilding the lookup tables picks up in-place table edits."""
+        ve_table = self.ve_table.copy()
+        ecu = VirtualECU(
+            ve_table_front=ve_table,
+            ve_table_rear=ve_table,
+            afr_target_table=self.afr_table,
+        )
+        ecu.build_lookup_tables()
+        before = ecu.lookup_ve(4000, 80, "front")
+
+        ve_table[:] = ve_table * 1.1
+        ecu.build_lookup_tables()
+
+        assert ecu.lookup_ve(4000, 80, "front") == pytest.approx(before * 1.1)
+
+    def test_lookup_table_rejects_bad_steps(self):
+        with pytest.raises(ValueError):
+            self.ecu.build_lookup_tables(rpm_step=0.0)
+
+
 class TestHelperFunctions:
     """Tests for helper functions."""
 